@@ -13,281 +13,244 @@ Modüller:
 - aritmetik_anuite: Aritmetik dizi şeklinde değişen taksitler
 - cabuklas_anuite: Çabuklaştırılmış anüiteler
 - yardimci: Faiz çevrimleri ve yardımcı fonksiyonlar
+- tablo: Sütunlu (dizi tabanlı) amortisman tablosu
+- nakit_akisi: Dizi tabanlı nakit akışı (NakitAkisi)
+- cozucu: anuite_hesapla için tip/bilinmeyen çözücü kaydı
+- izleme: İsteğe bağlı çağrı sayaçları, çözücü histogramları ve Prometheus çıktısı
+- faktor_tablosu: Önceden hesaplanmış, bellek eşlemeli faktör tabloları
+- onbellek: İsteğe bağlı, sınırlı ve iş parçacığı güvenli LRU faktör önbelleği
+- sozlesme: Ortak kuvvetleri bir kez hesaplayan anüite sözleşmesi (AnuiteSozlesmesi)
+- hizli: Girdi kontrolü yapmayan ham çekirdekler ve toplu doğrulama (dogrula)
+- turev: Dual sayılarla tek değerlendirmede tam türev ve duyarlılıklar
+
+İsteğe bağlı:
+- np: NumPy dizileriyle çalışan vektörel sürümler (import anuiteler.np)
+
+Alt modüller ve kısa isimler (ds_bd_hesapla, geo_faiz_hesapla, ...) ilk
+erişimde yüklenir (PEP 562); `import anuiteler` yalnızca bu dosyayı okur.
 """
 
+from importlib import import_module as _import_module
+
 __version__ = "1.0.0"
 __author__ = "Zeynep İbiş"
 
 # ============================================================
-# TEK ÖDEME MODÜLÜ
-# ============================================================
-from . import tek_odeme
-
-# Tek ödeme fonksiyonları
-from .tek_odeme import (
-    bugunku_deger as tek_odeme_bd,
-    gelecek_deger as tek_odeme_gd,
-    faiz_orani_hesapla as tek_odeme_faiz,
-    sure_hesapla as tek_odeme_sure,
-    iskonto_faktoru_hesapla,
-    birikim_faktoru_hesapla
-)
-
-# ============================================================
-# DEVRE SONU ANÜİTE MODÜLÜ
-# ============================================================
-from . import devre_sonu_anuite
-
-# Devre sonu fonksiyonları - Bugünkü Değer
-from .devre_sonu_anuite import (
-    bugunku_deger_hesapla as ds_bd_hesapla,
-    odeme_bugunku_degerden as ds_odeme_bd,
-    sure_bugunku_degerden as ds_sure_bd,
-    faiz_bugunku_degerden as ds_faiz_bd,
-)
-
-# Devre sonu fonksiyonları - Gelecek Değer
-from .devre_sonu_anuite import (
-    gelecek_deger_hesapla as ds_gd_hesapla,
-    odeme_gelecek_degerden as ds_odeme_gd,
-    sure_gelecek_degerden as ds_sure_gd,
-    faiz_gelecek_degerden as ds_faiz_gd,
-)
-
-# Devre sonu faktörler
-from .devre_sonu_anuite import (
-    pesin_deger_faktoru as ds_pesin_faktor,
-    gelecek_deger_faktoru as ds_gelecek_faktor,
-    anuite_tablosu_olustur as ds_tablo
-)
-
-# ============================================================
-# DEVRE BAŞI ANÜİTE MODÜLÜ
-# ============================================================
-from . import devre_basi_anuite
-
-# Devre başı fonksiyonları - Bugünkü Değer
-from .devre_basi_anuite import (
-    bugunku_deger_hesapla as db_bd_hesapla,
-    odeme_bugunku_degerden as db_odeme_bd,
-    sure_bugunku_degerden as db_sure_bd,
-    faiz_bugunku_degerden as db_faiz_bd,
-)
-
-# Devre başı fonksiyonları - Gelecek Değer
-from .devre_basi_anuite import (
-    gelecek_deger_hesapla as db_gd_hesapla,
-    odeme_gelecek_degerden as db_odeme_gd,
-    sure_gelecek_degerden as db_sure_gd,
-    faiz_gelecek_degerden as db_faiz_gd,
-)
-
-# Devre başı faktörler
-from .devre_basi_anuite import (
-    pesin_deger_faktoru as db_pesin_faktor,
-    gelecek_deger_faktoru as db_gelecek_faktor,
-    anuite_tablosu_olustur as db_tablo
-)
-
-# ============================================================
-# SÜREKLİ ANÜİTE MODÜLÜ
+# GECİKMELİ YÜKLEME (PEP 562)
 # ============================================================
-from . import surekli_anuite
-
-from .surekli_anuite import (
-    bugunku_deger_devre_sonu as surekli_ds_bd,
-    odeme_devre_sonu as surekli_ds_odeme,
-    faiz_devre_sonu as surekli_ds_faiz,
-    bugunku_deger_devre_basi as surekli_db_bd,
-    odeme_devre_basi as surekli_db_odeme,
-    faiz_devre_basi as surekli_db_faiz,
-    ertelenmis_surekli_anuite
-)
-
-# ============================================================
-# ERTELENMİŞ ANÜİTE MODÜLÜ (YENİ!)
-# ============================================================
-from . import ertelenmis_anuite
-
-# Ertelenmiş anüite - Devre Sonu
-from .ertelenmis_anuite import (
-    bugunku_deger_devre_sonu as ert_ds_bd,
-    gelecek_deger_devre_sonu as ert_ds_gd,
-    taksit_hesapla_bd_devre_sonu as ert_ds_taksit_bd,
-    taksit_hesapla_gd_devre_sonu as ert_ds_taksit_gd,
-)
-
-# Ertelenmiş anüite - Devre Başı
-from .ertelenmis_anuite import (
-    bugunku_deger_devre_basi as ert_db_bd,
-    gelecek_deger_devre_basi as ert_db_gd,
-    taksit_hesapla_bd_devre_basi as ert_db_taksit_bd,
-)
-
-# Ertelenmiş anüite - Ters Formüller
-from .ertelenmis_anuite import (
-    gecikme_suresi_hesapla_bd as ert_gecikme_hesapla,
-    faiz_orani_hesapla_bd as ert_faiz_hesapla,
-    sure_hesapla_bd as ert_sure_hesapla,
-)
-
-# Çabuklaştırılmış Ertelenmiş
-from .ertelenmis_anuite import (
-    bugunku_deger_cabuklas_ertekenmis as ert_cabuklas_bd,
-)
-
-# ============================================================
-# GEOMETRİK ANÜİTE MODÜLÜ (YENİ!)
-# ============================================================
-from . import geometrik_anuite
-
-# Geometrik - Devre Sonu
-from .geometrik_anuite import (
-    bugunku_deger_devre_sonu as geo_ds_bd,
-    gelecek_deger_devre_sonu as geo_ds_gd,
-)
 
-# Geometrik - Devre Başı
-from .geometrik_anuite import (
-    bugunku_deger_devre_basi as geo_db_bd,
-    gelecek_deger_devre_basi as geo_db_gd,
-)
-
-# Geometrik - Ters Formüller
-from .geometrik_anuite import (
-    ilk_taksit_hesapla_bd as geo_ilk_taksit_bd,
-    ilk_taksit_hesapla_gd as geo_ilk_taksit_gd,
-    faiz_orani_hesapla_bd as geo_faiz_hesapla,
-    sure_hesapla_gd as geo_sure_hesapla,
-)
-
-# ============================================================
-# ARİTMETİK ANÜİTE MODÜLÜ (YENİ!)
-# ============================================================
-from . import aritmetik_anuite
-
-# Aritmetik - Devre Sonu
-from .aritmetik_anuite import (
-    bugunku_deger_devre_sonu as arit_ds_bd,
-    gelecek_deger_devre_sonu as arit_ds_gd,
-    ilk_taksit_hesapla_bd_devre_sonu as arit_ds_ilk_taksit_bd,
-    ilk_taksit_hesapla_gd_devre_sonu as arit_ds_ilk_taksit_gd,
-    degisim_hesapla_bd_devre_sonu as arit_ds_degisim,
-)
-
-# Aritmetik - Devre Başı
-from .aritmetik_anuite import (
-    bugunku_deger_devre_basi as arit_db_bd,
-    gelecek_deger_devre_basi as arit_db_gd,
-    ilk_taksit_hesapla_bd_devre_basi as arit_db_ilk_taksit_bd,
-)
-
-# Aritmetik - Ters Formüller
-from .aritmetik_anuite import (
-    faiz_orani_hesapla_bd as arit_faiz_hesapla,
-    sure_hesapla_bd as arit_sure_hesapla,
-)
-
-# ============================================================
-# ÇABUKLAŞTIRILMIŞ ANÜİTE MODÜLÜ (YENİ!)
-# ============================================================
-from . import cabuklas_anuite
-
-# Çabuklaştırılmış - Devre Sonu
-from .cabuklas_anuite import (
-    bugunku_deger_devre_sonu as cab_ds_bd,
-    gelecek_deger_devre_sonu as cab_ds_gd,
-)
-
-# Çabuklaştırılmış - Devre Başı
-from .cabuklas_anuite import (
-    bugunku_deger_devre_basi as cab_db_bd,
-    gelecek_deger_devre_basi as cab_db_gd,
-)
-
-# Çabuklaştırılmış - Ters Formüller
-from .cabuklas_anuite import (
-    taksit_hesapla_bd as cab_taksit_bd,
-    taksit_hesapla_gd as cab_taksit_gd,
-    cabuklas_suresi_hesapla_bd as cab_sure_hesapla,
-    faiz_orani_hesapla_bd as cab_faiz_hesapla,
-    sure_hesapla_bd as cab_donem_hesapla,
+# İlk erişimde içe aktarılan alt modüller
+_ALT_MODULLER = (
+    'tek_odeme',
+    'tablo',
+    'nakit_akisi',
+    'devre_sonu_anuite',
+    'devre_basi_anuite',
+    'surekli_anuite',
+    'ertelenmis_anuite',
+    'geometrik_anuite',
+    'aritmetik_anuite',
+    'cabuklas_anuite',
+    'yardimci',
+    'cozucu',
+    'izleme',
+    'faktor_tablosu',
+    'onbellek',
+    'sozlesme',
+    'hizli',
+    'turev',
 )
 
-# ============================================================
-# YARDIMCI FONKSİYONLAR
-# ============================================================
-from . import yardimci
-
-from .yardimci import (
-    efektif_faiz_orani,
-    nominal_faiz_orani,
-    surekli_faiz_orani,
-    efektif_from_surekli,
-    faizden_iskonto_orani,
-    iskontodan_faiz_orani,
-    iskonto_faktoru,
-    birikim_faktoru,
-    toplam_odeme_hesapla,
-    toplam_faiz_hesapla,
-    ortalama_vade_hesapla,
-    reel_faiz_orani,
-    nominal_from_reel,
-    yillik_aylik_cevir,
-    aylik_yillik_cevir,
-    gunluk_yillik_cevir,
-    yillik_gunluk_cevir
-)
+# Kısa isim -> (alt modül, alt modüldeki isim)
+_ISIMLER = {
+    # TEK ÖDEME MODÜLÜ
+    # Tek ödeme fonksiyonları
+    'tek_odeme_bd': ('tek_odeme', 'bugunku_deger'),
+    'tek_odeme_gd': ('tek_odeme', 'gelecek_deger'),
+    'tek_odeme_faiz': ('tek_odeme', 'faiz_orani_hesapla'),
+    'tek_odeme_sure': ('tek_odeme', 'sure_hesapla'),
+    'iskonto_faktoru_hesapla': ('tek_odeme', 'iskonto_faktoru_hesapla'),
+    'birikim_faktoru_hesapla': ('tek_odeme', 'birikim_faktoru_hesapla'),
+
+    # HIZLI ERİŞİM
+    'anuite_hesapla': ('cozucu', 'anuite_hesapla'),
+
+    # AMORTİSMAN TABLOSU
+    'AnuiteTablosu': ('tablo', 'AnuiteTablosu'),
+
+    # NAKİT AKIŞI
+    'NakitAkisi': ('nakit_akisi', 'NakitAkisi'),
+
+    # SÖZLEŞME
+    'AnuiteSozlesmesi': ('sozlesme', 'AnuiteSozlesmesi'),
+
+    # KÖK BULMA
+    'sicak_baslangic': ('_kok', 'sicak_baslangic'),
+
+    # OTOMATİK TÜREV
+    'DualSayi': ('turev', 'DualSayi'),
+    'turev_al': ('turev', 'turev_al'),
+    'duyarliliklar': ('turev', 'duyarliliklar'),
+
+    # FAKTÖR TABLOSU
+    'FaktorTablosu': ('faktor_tablosu', 'FaktorTablosu'),
+    'faktor_tablosu_olustur': ('faktor_tablosu', 'faktor_tablosu_olustur'),
+
+    # DEVRE SONU ANÜİTE MODÜLÜ
+    # Devre sonu fonksiyonları - Bugünkü Değer
+    'ds_bd_hesapla': ('devre_sonu_anuite', 'bugunku_deger_hesapla'),
+    'ds_odeme_bd': ('devre_sonu_anuite', 'odeme_bugunku_degerden'),
+    'ds_sure_bd': ('devre_sonu_anuite', 'sure_bugunku_degerden'),
+    'ds_faiz_bd': ('devre_sonu_anuite', 'faiz_bugunku_degerden'),
+    # Devre sonu fonksiyonları - Gelecek Değer
+    'ds_gd_hesapla': ('devre_sonu_anuite', 'gelecek_deger_hesapla'),
+    'ds_odeme_gd': ('devre_sonu_anuite', 'odeme_gelecek_degerden'),
+    'ds_sure_gd': ('devre_sonu_anuite', 'sure_gelecek_degerden'),
+    'ds_faiz_gd': ('devre_sonu_anuite', 'faiz_gelecek_degerden'),
+    # Devre sonu faktörler
+    'ds_pesin_faktor': ('devre_sonu_anuite', 'pesin_deger_faktoru'),
+    'ds_gelecek_faktor': ('devre_sonu_anuite', 'gelecek_deger_faktoru'),
+    'ds_faktor_serisi': ('devre_sonu_anuite', 'faktor_serisi'),
+    'ds_tablo': ('devre_sonu_anuite', 'anuite_tablosu_olustur'),
+    'ds_tablo_akisi': ('devre_sonu_anuite', 'anuite_tablosu_akisi'),
+    'ds_donem_satiri': ('devre_sonu_anuite', 'donem_satiri_hesapla'),
+    'ds_kalan_bakiye': ('devre_sonu_anuite', 'kalan_bakiye_hesapla'),
+    'ds_donem_faizi': ('devre_sonu_anuite', 'donem_faizi_hesapla'),
+    'ds_donem_anaparasi': ('devre_sonu_anuite', 'donem_anaparasi_hesapla'),
+    'ds_kumulatif_faiz': ('devre_sonu_anuite', 'kumulatif_faiz_hesapla'),
+    'ds_kumulatif_anapara': ('devre_sonu_anuite', 'kumulatif_anapara_hesapla'),
+
+    # DEVRE BAŞI ANÜİTE MODÜLÜ
+    # Devre başı fonksiyonları - Bugünkü Değer
+    'db_bd_hesapla': ('devre_basi_anuite', 'bugunku_deger_hesapla'),
+    'db_odeme_bd': ('devre_basi_anuite', 'odeme_bugunku_degerden'),
+    'db_sure_bd': ('devre_basi_anuite', 'sure_bugunku_degerden'),
+    'db_faiz_bd': ('devre_basi_anuite', 'faiz_bugunku_degerden'),
+    # Devre başı fonksiyonları - Gelecek Değer
+    'db_gd_hesapla': ('devre_basi_anuite', 'gelecek_deger_hesapla'),
+    'db_odeme_gd': ('devre_basi_anuite', 'odeme_gelecek_degerden'),
+    'db_sure_gd': ('devre_basi_anuite', 'sure_gelecek_degerden'),
+    'db_faiz_gd': ('devre_basi_anuite', 'faiz_gelecek_degerden'),
+    # Devre başı faktörler
+    'db_pesin_faktor': ('devre_basi_anuite', 'pesin_deger_faktoru'),
+    'db_gelecek_faktor': ('devre_basi_anuite', 'gelecek_deger_faktoru'),
+    'db_tablo': ('devre_basi_anuite', 'anuite_tablosu_olustur'),
+    'db_tablo_akisi': ('devre_basi_anuite', 'anuite_tablosu_akisi'),
+    'db_donem_satiri': ('devre_basi_anuite', 'donem_satiri_hesapla'),
+    'db_kalan_bakiye': ('devre_basi_anuite', 'kalan_bakiye_hesapla'),
+    'db_donem_faizi': ('devre_basi_anuite', 'donem_faizi_hesapla'),
+    'db_donem_anaparasi': ('devre_basi_anuite', 'donem_anaparasi_hesapla'),
+    'db_kumulatif_faiz': ('devre_basi_anuite', 'kumulatif_faiz_hesapla'),
+    'db_kumulatif_anapara': ('devre_basi_anuite', 'kumulatif_anapara_hesapla'),
+
+    # SÜREKLİ ANÜİTE MODÜLÜ
+    'surekli_ds_bd': ('surekli_anuite', 'bugunku_deger_devre_sonu'),
+    'surekli_ds_odeme': ('surekli_anuite', 'odeme_devre_sonu'),
+    'surekli_ds_faiz': ('surekli_anuite', 'faiz_devre_sonu'),
+    'surekli_db_bd': ('surekli_anuite', 'bugunku_deger_devre_basi'),
+    'surekli_db_odeme': ('surekli_anuite', 'odeme_devre_basi'),
+    'surekli_db_faiz': ('surekli_anuite', 'faiz_devre_basi'),
+    'ertelenmis_surekli_anuite': ('surekli_anuite', 'ertelenmis_surekli_anuite'),
+
+    # ERTELENMİŞ ANÜİTE MODÜLÜ
+    # Ertelenmiş anüite - Devre Sonu
+    'ert_ds_bd': ('ertelenmis_anuite', 'bugunku_deger_devre_sonu'),
+    'ert_ds_gd': ('ertelenmis_anuite', 'gelecek_deger_devre_sonu'),
+    'ert_ds_taksit_bd': ('ertelenmis_anuite', 'taksit_hesapla_bd_devre_sonu'),
+    'ert_ds_taksit_gd': ('ertelenmis_anuite', 'taksit_hesapla_gd_devre_sonu'),
+    # Ertelenmiş anüite - Devre Başı
+    'ert_db_bd': ('ertelenmis_anuite', 'bugunku_deger_devre_basi'),
+    'ert_db_gd': ('ertelenmis_anuite', 'gelecek_deger_devre_basi'),
+    'ert_db_taksit_bd': ('ertelenmis_anuite', 'taksit_hesapla_bd_devre_basi'),
+    # Ertelenmiş anüite - Ters Formüller
+    'ert_gecikme_hesapla': ('ertelenmis_anuite', 'gecikme_suresi_hesapla_bd'),
+    'ert_faiz_hesapla': ('ertelenmis_anuite', 'faiz_orani_hesapla_bd'),
+    'ert_sure_hesapla': ('ertelenmis_anuite', 'sure_hesapla_bd'),
+    # Çabuklaştırılmış Ertelenmiş
+    'ert_cabuklas_bd': ('ertelenmis_anuite', 'bugunku_deger_cabuklas_ertelenmis'),
+
+    # GEOMETRİK ANÜİTE MODÜLÜ
+    # Geometrik - Devre Sonu
+    'geo_ds_bd': ('geometrik_anuite', 'bugunku_deger_devre_sonu'),
+    'geo_ds_gd': ('geometrik_anuite', 'gelecek_deger_devre_sonu'),
+    # Geometrik - Devre Başı
+    'geo_db_bd': ('geometrik_anuite', 'bugunku_deger_devre_basi'),
+    'geo_db_gd': ('geometrik_anuite', 'gelecek_deger_devre_basi'),
+    # Geometrik - Ters Formüller
+    'geo_ilk_taksit_bd': ('geometrik_anuite', 'ilk_taksit_hesapla_bd'),
+    'geo_ilk_taksit_gd': ('geometrik_anuite', 'ilk_taksit_hesapla_gd'),
+    'geo_faiz_hesapla': ('geometrik_anuite', 'faiz_orani_hesapla_bd'),
+    'geo_sure_hesapla': ('geometrik_anuite', 'sure_hesapla_gd'),
+
+    # ARİTMETİK ANÜİTE MODÜLÜ
+    # Aritmetik - Devre Sonu
+    'arit_ds_bd': ('aritmetik_anuite', 'bugunku_deger_devre_sonu'),
+    'arit_ds_gd': ('aritmetik_anuite', 'gelecek_deger_devre_sonu'),
+    'arit_ds_ilk_taksit_bd': ('aritmetik_anuite', 'ilk_taksit_hesapla_bd_devre_sonu'),
+    'arit_ds_ilk_taksit_gd': ('aritmetik_anuite', 'ilk_taksit_hesapla_gd_devre_sonu'),
+    'arit_ds_degisim': ('aritmetik_anuite', 'degisim_hesapla_bd_devre_sonu'),
+    # Aritmetik - Devre Başı
+    'arit_db_bd': ('aritmetik_anuite', 'bugunku_deger_devre_basi'),
+    'arit_db_gd': ('aritmetik_anuite', 'gelecek_deger_devre_basi'),
+    'arit_db_ilk_taksit_bd': ('aritmetik_anuite', 'ilk_taksit_hesapla_bd_devre_basi'),
+    # Aritmetik - Ters Formüller
+    'arit_faiz_hesapla': ('aritmetik_anuite', 'faiz_orani_hesapla_bd'),
+    'arit_sure_hesapla': ('aritmetik_anuite', 'sure_hesapla_bd'),
+
+    # ÇABUKLAŞTIRILMIŞ ANÜİTE MODÜLÜ
+    # Çabuklaştırılmış - Devre Sonu
+    'cab_ds_bd': ('cabuklas_anuite', 'bugunku_deger_devre_sonu'),
+    'cab_ds_gd': ('cabuklas_anuite', 'gelecek_deger_devre_sonu'),
+    # Çabuklaştırılmış - Devre Başı
+    'cab_db_bd': ('cabuklas_anuite', 'bugunku_deger_devre_basi'),
+    'cab_db_gd': ('cabuklas_anuite', 'gelecek_deger_devre_basi'),
+    # Çabuklaştırılmış - Ters Formüller
+    'cab_taksit_bd': ('cabuklas_anuite', 'taksit_hesapla_bd'),
+    'cab_taksit_gd': ('cabuklas_anuite', 'taksit_hesapla_gd'),
+    'cab_sure_hesapla': ('cabuklas_anuite', 'cabuklas_suresi_hesapla_bd'),
+    'cab_faiz_hesapla': ('cabuklas_anuite', 'faiz_orani_hesapla_bd'),
+    'cab_donem_hesapla': ('cabuklas_anuite', 'sure_hesapla_bd'),
+
+    # YARDIMCI FONKSİYONLAR
+    'efektif_faiz_orani': ('yardimci', 'efektif_faiz_orani'),
+    'nominal_faiz_orani': ('yardimci', 'nominal_faiz_orani'),
+    'surekli_faiz_orani': ('yardimci', 'surekli_faiz_orani'),
+    'efektif_from_surekli': ('yardimci', 'efektif_from_surekli'),
+    'faizden_iskonto_orani': ('yardimci', 'faizden_iskonto_orani'),
+    'iskontodan_faiz_orani': ('yardimci', 'iskontodan_faiz_orani'),
+    'iskonto_faktoru': ('yardimci', 'iskonto_faktoru'),
+    'birikim_faktoru': ('yardimci', 'birikim_faktoru'),
+    'toplam_odeme_hesapla': ('yardimci', 'toplam_odeme_hesapla'),
+    'toplam_faiz_hesapla': ('yardimci', 'toplam_faiz_hesapla'),
+    'ortalama_vade_hesapla': ('yardimci', 'ortalama_vade_hesapla'),
+    'reel_faiz_orani': ('yardimci', 'reel_faiz_orani'),
+    'nominal_from_reel': ('yardimci', 'nominal_from_reel'),
+    'yillik_aylik_cevir': ('yardimci', 'yillik_aylik_cevir'),
+    'aylik_yillik_cevir': ('yardimci', 'aylik_yillik_cevir'),
+    'gunluk_yillik_cevir': ('yardimci', 'gunluk_yillik_cevir'),
+    'yillik_gunluk_cevir': ('yardimci', 'yillik_gunluk_cevir'),
+    'risk_olcumleri': ('yardimci', 'risk_olcumleri'),
+    'ic_verim_orani': ('yardimci', 'ic_verim_orani'),
+    'ic_verim_orani_ayrintili': ('yardimci', 'ic_verim_orani_ayrintili'),
+}
+
+
+def __getattr__(ad):
+    if ad in _ISIMLER:
+        modul, ozgun_ad = _ISIMLER[ad]
+        deger = getattr(_import_module('.' + modul, __name__), ozgun_ad)
+    elif ad in _ALT_MODULLER:
+        deger = _import_module('.' + ad, __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {ad!r}")
+    
+    # Sonraki erişimler __getattr__'a uğramadan modül sözlüğünden gelir
+    globals()[ad] = deger
+    return deger
 
-# ============================================================
-# HIZLI ERİŞİM FONKSİYONLARI
-# ============================================================
 
-def anuite_hesapla(odeme=None, bugunku_deger=None, gelecek_deger=None, n=None, i=None, tip='devre_sonu'):
-    import warnings
-    
-    # Kaç değer verilmiş?
-    verilen = sum([
-        odeme is not None,
-        bugunku_deger is not None,
-        gelecek_deger is not None,
-        n is not None,
-        i is not None
-    ])
-    
-    if verilen < 3:
-        raise ValueError("En az 3 parametre gerekli!")
-    
-    if tip == 'devre_sonu':
-        if odeme is None and bugunku_deger is not None and n is not None and i is not None:
-            odeme = ds_odeme_bd(bugunku_deger, n, i)
-        elif bugunku_deger is None and odeme is not None and n is not None and i is not None:
-            bugunku_deger = ds_bd_hesapla(odeme, n, i)
-        elif n is None and bugunku_deger is not None and odeme is not None and i is not None:
-            n = ds_sure_bd(bugunku_deger, odeme, i)
-        elif i is None and bugunku_deger is not None and odeme is not None and n is not None:
-            i = ds_faiz_bd(bugunku_deger, odeme, n)
-        else:
-            warnings.warn("Bu kombinasyon henüz desteklenmiyor")
-    
-    elif tip == 'devre_basi':
-        if odeme is None and bugunku_deger is not None and n is not None and i is not None:
-            odeme = db_odeme_bd(bugunku_deger, n, i)
-        elif bugunku_deger is None and odeme is not None and n is not None and i is not None:
-            bugunku_deger = db_bd_hesapla(odeme, n, i)
-        elif n is None and bugunku_deger is not None and odeme is not None and i is not None:
-            n = db_sure_bd(bugunku_deger, odeme, i)
-        elif i is None and bugunku_deger is not None and odeme is not None and n is not None:
-            i = db_faiz_bd(bugunku_deger, odeme, n)
-    
-    return {
-        'odeme': odeme,
-        'bugunku_deger': bugunku_deger,
-        'gelecek_deger': gelecek_deger,
-        'n': n,
-        'i': i,
-        'tip': tip
-    }
+def __dir__():
+    return sorted(set(globals()) | set(_ALT_MODULLER) | set(_ISIMLER))
 
 
 __all__ = [
@@ -301,9 +264,27 @@ __all__ = [
     'aritmetik_anuite',
     'cabuklas_anuite',
     'yardimci',
+    'tablo',
+    'nakit_akisi',
+    'cozucu',
+    'izleme',
+    'faktor_tablosu',
+    'onbellek',
+    'sozlesme',
+    'hizli',
+    'turev',
     
     # Hızlı erişim
     'anuite_hesapla',
+    'AnuiteTablosu',
+    'NakitAkisi',
+    'AnuiteSozlesmesi',
+    'sicak_baslangic',
+    'DualSayi',
+    'turev_al',
+    'duyarliliklar',
+    'FaktorTablosu',
+    'faktor_tablosu_olustur',
     
     # Tek ödeme
     'tek_odeme_bd',
@@ -324,7 +305,15 @@ __all__ = [
     'ds_faiz_gd',
     'ds_pesin_faktor',
     'ds_gelecek_faktor',
+    'ds_faktor_serisi',
     'ds_tablo',
+    'ds_tablo_akisi',
+    'ds_donem_satiri',
+    'ds_kalan_bakiye',
+    'ds_donem_faizi',
+    'ds_donem_anaparasi',
+    'ds_kumulatif_faiz',
+    'ds_kumulatif_anapara',
     
     # Devre başı
     'db_bd_hesapla',
@@ -338,6 +327,13 @@ __all__ = [
     'db_pesin_faktor',
     'db_gelecek_faktor',
     'db_tablo',
+    'db_tablo_akisi',
+    'db_donem_satiri',
+    'db_kalan_bakiye',
+    'db_donem_faizi',
+    'db_donem_anaparasi',
+    'db_kumulatif_faiz',
+    'db_kumulatif_anapara',
     
     # Sürekli anüite
     'surekli_ds_bd',
@@ -412,4 +408,7 @@ __all__ = [
     'aylik_yillik_cevir',
     'gunluk_yillik_cevir',
     'yillik_gunluk_cevir',
+    'risk_olcumleri',
+    'ic_verim_orani',
+    'ic_verim_orani_ayrintili',
 ]
\ No newline at end of file
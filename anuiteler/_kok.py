@@ -0,0 +1,727 @@
+"""
+GÜVENLİ KÖK BULMA ÇEKİRDEĞİ
+
+Analitik türevli Halley/Newton adımı; işaret değişimi bulunduğunda adımlar
+bu aralıkta (bracket) tutulur, aralık dışına çıkan veya yeterince
+ilerlemeyen adımlar ikiye bölme (bisection) ile değiştirilir.
+
+Fonksiyon her değerlendirmede (f, f', f'') üçlüsünü tek geçişte döndürür;
+f'' None ise adım Newton adımına iner. `birikim_turevleri`, değişken taksitli
+anüitelerin analitik türevleri için ortak s(n,t) çekirdeğidir.
+
+`tamsayi_kok` süre (n) çözücülerinin çekirdeğidir: kökü tamsayılarda üstel ve
+ikili aramayla iki ardışık tamsayı arasına sıkıştırır, yalnızca kök kesirliyse
+bu aralıkta guvenli_kok ile inceltir.
+
+Faiz çözücüleri (devre sonu/başı, ertelenmiş, çabuklaştırılmış, geometrik,
+aritmetik, IRR) `kok_bul` üzerinden çalışır: yöntem seçimi ('halley',
+'newton', 'brent', 'ikiye_bolme'), türevli yöntem yakınsamazsa aralık arama
+ve Brent yedeği, `sicak_tahmin` / `sonuclandir` ile sıcak başlangıç, izleme
+kaydı ve yakınsamama hatası tek yerdedir. `pesin_turevleri` a(n,i)'yi ve
+(1+i)^k ile çarpılmış biçimlerini (ä, ertelenmiş, çabuklaştırılmış) türevleriyle
+verir. `pesin_tahmini` / `birikim_tahmini` bu faktörler için seri
+tersinmesinden kapalı form başlangıç tahminleridir.
+"""
+
+import math
+import threading
+from contextlib import contextmanager
+
+from . import izleme as _izleme
+
+# Açık varsayılan (sicak_tahmin) ve kapalı form tahmin kullanılamadığında
+# aralık aramasının ilk pencere genişliği
+VARSAYILAN_TAHMIN = 0.1
+
+YONTEMLER = ('halley', 'newton', 'brent', 'ikiye_bolme')
+
+# sicak_baslangic blokları iş parçacığına özgüdür; _ACIK_BLOK > 0 değilse
+# çözücüler iş parçacığı yereline hiç bakmaz
+_YEREL = threading.local()
+_ACIK_BLOK = 0
+_KILIT = threading.Lock()
+
+
+def guvenli_kok(fonksiyon, tahmin, tolerans=1e-6, max_iter=100, alt_sinir=None, aralik=None):
+    """
+    Halley/Newton + ikiye bölme ile f(x) = 0 kökünü bulur
+
+    Args:
+        fonksiyon: fonksiyon(x) -> (f, f', f'') ; f'' None olabilir
+        tahmin: Başlangıç tahmini
+        tolerans: |f| < tolerans (f' küçükse düz bölgede kalan Newton adımı
+            da |f/f'| < tolerans) veya işaret değişimi aralığı tolerans'tan
+            darsa durur. |adım| < tolerans tek başına yetmez: artık büyükse
+            kalan adım yönünde tolerans uzağında işaret değişimi aranır,
+            yoksa yakınsamamış döner (durağan nokta)
+        max_iter: Maksimum iterasyon sayısı
+        alt_sinir: Tanım aralığının alt sınırı (dahil değil); adımlar bu
+            sınırın altına inmez, sınıra yarı yarıya yaklaşır
+        aralik: (a, f(a), b, f(b)) ; işaret değişimi bilinen başlangıç aralığı
+
+    Returns:
+        {'kok', 'iterasyon', 'degerlendirme', 'artik', 'yakinsadi',
+         'ikiye_bolme'} anahtarlı sözlük (hata fırlatmaz)
+    """
+    x = tahmin
+    f, f1, f2 = fonksiyon(x)
+    degerlendirme = 1
+    ikiye_bolme = 0
+    zorla_bol = False
+
+    if aralik is not None:
+        a, fa, b, fb = aralik
+        if a > b:
+            a, fa, b, fb = b, fb, a, fa
+        if not a < x < b:
+            x = (a + b) / 2
+            f, f1, f2 = fonksiyon(x)
+            degerlendirme += 1
+    else:
+        a = fa = b = fb = None
+
+    for iterasyon in range(1, max_iter + 1):
+        if _yakin(f, f1, tolerans):
+            return _sonuc(x, iterasyon - 1, degerlendirme, f, True, ikiye_bolme)
+
+        # Halley adımı: Newton adımı / (1 - newton·f'' / (2f')); payda
+        # pozitif değilse (eğrilik adımı ters çeviriyorsa) Newton adımı
+        adim = None
+        if f1 and math.isfinite(f1):
+            adim = f / f1
+            if f2 is not None:
+                payda = 1 - 0.5 * adim * f2 / f1
+                if payda > 0 and math.isfinite(payda):
+                    adim /= payda
+
+        x_yeni = None if adim is None else x - adim
+
+        if a is not None:
+            if zorla_bol or x_yeni is None or not a < x_yeni < b:
+                x_yeni = (a + b) / 2
+                ikiye_bolme += 1
+        elif x_yeni is None:
+            break
+        elif alt_sinir is not None and x_yeni <= alt_sinir:
+            x_yeni = (x + alt_sinir) / 2
+
+        f_yeni, f1, f2 = fonksiyon(x_yeni)
+        degerlendirme += 1
+
+        if not math.isfinite(f_yeni):
+            if a is not None or alt_sinir is None:
+                break
+            # Tanım sınırına çok yaklaşıldı (taşma); geri çekil
+            x_yeni = (x + x_yeni) / 2
+            f_yeni, f1, f2 = fonksiyon(x_yeni)
+            degerlendirme += 1
+            if not math.isfinite(f_yeni):
+                break
+
+        # İşaret değişimi bulunduysa aralığı kur veya daralt
+        if a is None:
+            if (f_yeni < 0) != (f < 0):
+                a, fa, b, fb = (x, f, x_yeni, f_yeni) if x < x_yeni else (x_yeni, f_yeni, x, f)
+        elif (f_yeni < 0) == (fa < 0):
+            a, fa = x_yeni, f_yeni
+        else:
+            b, fb = x_yeni, f_yeni
+
+        adim_boyu = abs(x_yeni - x)
+
+        # Yeterince ilerlemeyen veya sönen adımdan sonra bir kez ikiye böl
+        zorla_bol = a is not None and (abs(f_yeni) > 0.5 * abs(f) or adim_boyu < tolerans)
+
+        x, f = x_yeni, f_yeni
+
+        if _yakin(f, f1, tolerans):
+            return _sonuc(x, iterasyon, degerlendirme, f, True, ikiye_bolme)
+        if a is not None and b - a < tolerans:
+            return _sonuc(x, iterasyon, degerlendirme, f, True, ikiye_bolme)
+        if adim_boyu < tolerans and a is None:
+            # Adım söndü ama artık büyük: kök kalan Newton adımı yönünde
+            # tolerans içindeyse işaret değişir. Durağan nokta civarında
+            # Halley adımı f' ile birlikte söner; bu yakınsama sayılmaz.
+            if not (f1 and math.isfinite(f1)):
+                break
+            f_yoklama = _deger(fonksiyon, x - math.copysign(tolerans, f / f1))
+            degerlendirme += 1
+            if (f_yoklama < 0) != (f < 0):
+                return _sonuc(x, iterasyon, degerlendirme, f, True, ikiye_bolme)
+            break
+    else:
+        iterasyon = max_iter
+
+    return _sonuc(x, iterasyon, degerlendirme, f, False, ikiye_bolme)
+
+
+def _yakin(f, f1, tolerans):
+    """|f| < tolerans ve (0 < |f'| < 1 ise) kalan Newton adımı |f/f'| < tolerans"""
+    return abs(f) < tolerans * min(1.0, abs(f1) or 1.0)
+
+
+def brent_kok(fonksiyon, a, b, tolerans=1e-6, max_iter=100, fa=None, fb=None):
+    """
+    Brent yöntemi: ters ikinci derece interpolasyon / kiriş / ikiye bölme
+
+    Türev kullanmaz; [a, b] aralığında işaret değişimi olduğu sürece her
+    zaman yakınsar. fonksiyon guvenli_kok ile aynı üçlüyü döndürür, yalnızca
+    f kullanılır.
+
+    Args:
+        fonksiyon: fonksiyon(x) -> (f, f', f'')
+        a, b: İşaret değişimi olan aralık
+        tolerans: |f| < tolerans veya aralık yarı genişliği < tolerans
+        max_iter: Maksimum iterasyon sayısı
+        fa, fb: Biliniyorsa f(a), f(b) (yeniden hesaplanmaz)
+
+    Returns:
+        guvenli_kok ile aynı anahtarlı sözlük; ikiye_bolme, interpolasyon
+        yerine ikiye bölünen adım sayısıdır (hata fırlatmaz)
+    """
+    degerlendirme = 0
+    if fa is None:
+        fa = fonksiyon(a)[0]
+        degerlendirme += 1
+    if fb is None:
+        fb = fonksiyon(b)[0]
+        degerlendirme += 1
+    if not (fa <= 0 <= fb or fb <= 0 <= fa):
+        return _sonuc(b, 0, degerlendirme, fb, False, 0)
+
+    c, fc = b, fb
+    d = e = b - a
+    ikiye_bolme = 0
+
+    for iterasyon in range(1, max_iter + 1):
+        if (fb > 0 and fc > 0) or (fb < 0 and fc < 0):
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        esik = 2e-16 * abs(b) + 0.5 * tolerans
+        orta = 0.5 * (c - b)
+        if abs(fb) < tolerans or abs(orta) <= esik:
+            return _sonuc(b, iterasyon - 1, degerlendirme, fb, True, ikiye_bolme)
+
+        if abs(e) >= esik and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                p, q = 2 * orta * s, 1 - s
+            else:
+                q, r = fa / fc, fb / fc
+                p = s * (2 * orta * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2 * p < min(3 * orta * q - abs(esik * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = orta
+                ikiye_bolme += 1
+        else:
+            d = e = orta
+            ikiye_bolme += 1
+
+        a, fa = b, fb
+        b += d if abs(d) > esik else math.copysign(esik, orta)
+        fb = fonksiyon(b)[0]
+        degerlendirme += 1
+
+    return _sonuc(b, max_iter, degerlendirme, fb, False, ikiye_bolme)
+
+
+def ikiye_bolme_kok(fonksiyon, a, b, tolerans=1e-6, max_iter=100, fa=None, fb=None):
+    """
+    Yalın ikiye bölme; brent_kok ile aynı girdi ve sonuç düzeni
+
+    Her adımda aralık yarıya iner; yakınsama doğrusal ama koşulsuzdur.
+    """
+    degerlendirme = 0
+    if fa is None:
+        fa = fonksiyon(a)[0]
+        degerlendirme += 1
+    if fb is None:
+        fb = fonksiyon(b)[0]
+        degerlendirme += 1
+    if not (fa <= 0 <= fb or fb <= 0 <= fa):
+        return _sonuc(b, 0, degerlendirme, fb, False, 0)
+
+    x, f = (a, fa) if abs(fa) < abs(fb) else (b, fb)
+    for iterasyon in range(1, max_iter + 1):
+        if abs(f) < tolerans or abs(b - a) < 2 * tolerans:
+            return _sonuc(x, iterasyon - 1, degerlendirme, f, True, iterasyon - 1)
+        x = (a + b) / 2
+        f = fonksiyon(x)[0]
+        degerlendirme += 1
+        if (f < 0) == (fa < 0):
+            a, fa = x, f
+        else:
+            b = x
+
+    return _sonuc(x, max_iter, degerlendirme, f, abs(f) < tolerans, max_iter)
+
+
+def aralik_ara(fonksiyon, a, b, max_iter=60):
+    """
+    a'dan yukarı, genişliği her adımda ikiye katlanan pencerelerle işaret
+    değişimi arar; değer tanımsız (NaN, taşma) olursa durur. a'da f
+    tanımsızsa a'nın hemen içinden başlanır.
+
+    Returns:
+        ((a, f(a), b, f(b)), değerlendirme sayısı); bulunamazsa aralık None
+    """
+    fa = _deger(fonksiyon, a)
+    degerlendirme = 1
+    if not math.isfinite(fa):
+        # a tanım sınırının kendisi olabilir (ör. i = -1): hemen içinden başla
+        a += (b - a) * 1e-9
+        fa = _deger(fonksiyon, a)
+        degerlendirme += 1
+    fb = _deger(fonksiyon, b)
+    degerlendirme += 1
+    genislik = b - a
+
+    for _ in range(max_iter):
+        if not (math.isfinite(fa) and math.isfinite(fb)):
+            break
+        if (fa < 0) != (fb < 0):
+            return (a, fa, b, fb), degerlendirme
+        genislik *= 2
+        a, fa = b, fb
+        b = a + genislik
+        fb = _deger(fonksiyon, b)
+        degerlendirme += 1
+
+    return None, degerlendirme
+
+
+def _deger(fonksiyon, x):
+    """f(x); tanım dışında (sıfıra bölme, taşma) NaN"""
+    try:
+        return fonksiyon(x)[0]
+    except (ZeroDivisionError, OverflowError):
+        return math.nan
+
+
+def kok_bul(fonksiyon, tahmin, tolerans=1e-6, max_iter=100, alt_sinir=None, aralik=None,
+            yontem='halley'):
+    """
+    Paket çözücülerinin ortak kök bulma girişi
+
+    'halley' ve 'newton' guvenli_kok ile (newton f''yi yok sayar) çalışır.
+    Aralık verilmemişse ve türevli yöntem yakınsamazsa, sonlu alt_sinir'den
+    yukarı aralık aranır ve Brent ile çözülür. tahmin None ise (kapalı form
+    tahmin kullanılamadıysa) türevli adım atlanır, doğrudan bu aralık araması
+    yapılır. 'brent' ve 'ikiye_bolme' işaret değişimi olan bir aralık ister.
+
+    Args:
+        fonksiyon: fonksiyon(x) -> (f, f', f'')
+        tahmin: Başlangıç tahmini (aralıklı yöntemlerde kullanılmaz); None
+            ise aralık verilmişse orta noktası, yoksa alt_sinir gereklidir
+        tolerans, max_iter, alt_sinir: guvenli_kok ile aynı
+        aralik: (a, f(a), b, f(b)) ; işaret değişimi bilinen aralık
+        yontem: 'halley', 'newton', 'brent' veya 'ikiye_bolme'
+
+    Returns:
+        guvenli_kok ile aynı anahtarlı sözlük (hata fırlatmaz)
+    """
+    if yontem in ('brent', 'ikiye_bolme'):
+        if aralik is None:
+            raise ValueError("Brent ve ikiye bölme için aralık (a, f(a), b, f(b)) gereklidir.")
+        a, fa, b, fb = aralik
+        cozucu = brent_kok if yontem == 'brent' else ikiye_bolme_kok
+        return cozucu(fonksiyon, a, b, tolerans, max_iter, fa, fb)
+
+    if yontem == 'newton':
+        turevli = fonksiyon
+
+        def fonksiyon(x):
+            f, f1, _ = turevli(x)
+            return f, f1, None
+    elif yontem != 'halley':
+        raise ValueError(f"Bilinmeyen yöntem: {yontem} (seçenekler: {', '.join(YONTEMLER)})")
+
+    if tahmin is None:
+        if aralik is not None:
+            tahmin = (aralik[0] + aralik[2]) / 2
+        elif alt_sinir is None:
+            raise ValueError("Tahmin verilmediğinde alt sınır veya aralık gereklidir.")
+        else:
+            # Güvenilir başlangıç yok: durağan bir noktadan Newton'a girmek
+            # yerine önce alt sınırdan aralık ara. İşaret değişimi yoksa (iki
+            # kök aynı pencerede, teğete yakın kök) türevli yöntem sınırdan
+            # uzak bir noktadan denenir; yanlış yakınsamayı guvenli_kok eler
+            ust = alt_sinir + VARSAYILAN_TAHMIN
+            yedek = _aralikla_coz(fonksiyon, alt_sinir, ust, tolerans, max_iter)
+            if yedek['yakinsadi']:
+                return yedek
+            sonuc = _sinirli_kok(fonksiyon, ust, tolerans, max_iter, alt_sinir)
+            return _birlestir(sonuc, yedek)
+
+    if alt_sinir is None or aralik is not None:
+        return guvenli_kok(fonksiyon, tahmin, tolerans, max_iter, alt_sinir, aralik)
+
+    sonuc = _sinirli_kok(fonksiyon, tahmin, tolerans, max_iter, alt_sinir)
+    if sonuc['yakinsadi']:
+        return sonuc
+
+    # Yedek: alt sınırdan yukarı işaret değişimi ara, Brent ile çöz
+    ust = alt_sinir + max(tahmin - alt_sinir, tolerans)
+    yedek = _aralikla_coz(fonksiyon, alt_sinir, ust, tolerans, max_iter)
+    return _birlestir(yedek, sonuc) if yedek['yakinsadi'] else _birlestir(sonuc, yedek)
+
+
+def _sinirli_kok(fonksiyon, tahmin, tolerans, max_iter, alt_sinir):
+    """guvenli_kok; alt sınıra yığılıp artığı büyük kalan sonuç yakınsamamış sayılır"""
+    sonuc = guvenli_kok(fonksiyon, tahmin, tolerans, max_iter, alt_sinir)
+
+    # Kök yoksa veya adımlar yanlış yöne gittiyse alt sınıra yığılır; adım
+    # küçüldüğü için yakınsamış görünse de artık büyüktür
+    if sonuc['kok'] - alt_sinir <= tolerans and not abs(sonuc['artik']) < tolerans:
+        sonuc['yakinsadi'] = False
+    return sonuc
+
+
+def _aralikla_coz(fonksiyon, alt_sinir, ust, tolerans, max_iter):
+    """alt_sinir'den yukarı işaret değişimi arar, bulursa Brent ile çözer"""
+    bulunan, degerlendirme = aralik_ara(fonksiyon, alt_sinir, ust)
+    if bulunan is None:
+        return _sonuc(alt_sinir, 0, degerlendirme, math.nan, False, 0)
+
+    a, fa, b, fb = bulunan
+    sonuc = brent_kok(fonksiyon, a, b, tolerans, max_iter, fa, fb)
+    sonuc['degerlendirme'] += degerlendirme
+    return sonuc
+
+
+def _birlestir(sonuc, onceki):
+    """sonuc'a önceki denemenin iterasyon ve değerlendirme sayılarını ekler"""
+    for anahtar in ('iterasyon', 'degerlendirme', 'ikiye_bolme'):
+        sonuc[anahtar] += onceki[anahtar]
+    return sonuc
+
+
+@contextmanager
+def sicak_baslangic():
+    """
+    Blok içinde tahmin verilmeyen çözücüler, aynı çözücünün bir önceki
+    kökünden başlar (sıcak başlangıç)
+
+    Ardışık veya toplu çözümlerde komşu sözleşmeler benzerse iterasyon sayısı
+    düşer. Kayıtlar iş parçacığına özgüdür ve blok bitince silinir.
+
+        with sicak_baslangic():
+            oranlar = [ds_faiz_bd(bd, odeme, n) for bd, odeme, n in kayitlar]
+
+    Yields:
+        {çözücü adı: son kök} sözlüğü
+    """
+    global _ACIK_BLOK
+    onceki = getattr(_YEREL, 'kokler', None)
+    _YEREL.kokler = {}
+    with _KILIT:
+        _ACIK_BLOK += 1
+    try:
+        yield _YEREL.kokler
+    finally:
+        with _KILIT:
+            _ACIK_BLOK -= 1
+        _YEREL.kokler = onceki
+
+
+def sicak_tahmin(ad, tahmin, varsayilan=VARSAYILAN_TAHMIN):
+    """Verilen tahmin; yoksa sıcak başlangıçtaki son kök; o da yoksa varsayilan"""
+    if tahmin is not None:
+        return tahmin
+    if _ACIK_BLOK:
+        kokler = getattr(_YEREL, 'kokler', None)
+        if kokler:
+            return kokler.get(ad, varsayilan)
+    return varsayilan
+
+
+def sonuclandir(ad, sonuc, max_iter, hata=True):
+    """
+    Çözücü sonucunu izlemeye kaydeder, sıcak başlangıç için kökü saklar
+
+    Args:
+        ad: Çözücü adı ('devre_sonu_anuite.faiz_bugunku_degerden' gibi)
+        sonuc: kok_bul sonuç sözlüğü
+        max_iter: Hata mesajı için iterasyon sınırı
+        hata: False ise yakınsamayan sonuç da hata fırlatmadan döner
+
+    Returns:
+        Kök
+
+    Raises:
+        ValueError: Yakınsama sağlanamadıysa (hata=True)
+    """
+    if _izleme.ETKIN:
+        _izleme.cozum_kaydet(ad, sonuc['iterasyon'], sonuc['artik'], sonuc['yakinsadi'],
+                             sonuc['degerlendirme'])
+
+    if not sonuc['yakinsadi']:
+        if hata:
+            raise ValueError(f"Yakınsama sağlanamadı ({max_iter} iterasyonda).")
+        return sonuc['kok']
+
+    if _ACIK_BLOK:
+        kokler = getattr(_YEREL, 'kokler', None)
+        if kokler is not None:
+            kokler[ad] = sonuc['kok']
+    return sonuc['kok']
+
+
+def tamsayi_kok(fonksiyon, tahmin=1, tolerans=1e-6, max_iter=100):
+    """
+    n'de artan f(n) = 0 denkleminin n > 0 kökü
+
+    Tamsayılarda üstel (tahmin, 2·tahmin, ...) ve ikili arama ile f(k) < 0 <= f(k+1)
+    olan k bulunur; kök tamsayıysa doğrudan döner, değilse [k, k+1] aralığında
+    guvenli_kok ile inceltilir. Değerlendirme sayısı yaklaşık 2·log2(n) +
+    birkaç Newton adımıdır. f aralıktaki eğimine bölünerek ölçeklenir; bu
+    yüzden tolerans f'nin büyüklüğünden bağımsız olarak n cinsindendir.
+
+    Args:
+        fonksiyon: fonksiyon(n) -> (f, f', f''); gerçel n >= 0 için tanımlı,
+            f(0) < 0 (f'' None olabilir)
+        tahmin: Üstel aramanın ilk üst sınırı
+        tolerans: n cinsinden tolerans (|f / f'| < tolerans)
+        max_iter: Arama adımı ve Newton iterasyonu üst sınırı (ayrı ayrı)
+
+    Returns:
+        guvenli_kok ile aynı anahtarlı sözlük; iterasyon arama adımlarını da
+        içerir (hata fırlatmaz)
+    """
+    alt, f_alt = 0, fonksiyon(0)[0]
+    ust = max(1, math.ceil(tahmin))
+    f_ust, f1_ust = fonksiyon(ust)[:2]
+    degerlendirme = 2
+    adim = 0
+    
+    # Üstel arama: f(ust) >= 0 olana kadar üst sınırı ikiye katla
+    while not f_ust >= 0:
+        if abs(f_ust) < tolerans * abs(f1_ust):
+            return _sonuc(float(ust), adim, degerlendirme, f_ust, True, 0)
+        if f_ust != f_ust or adim >= max_iter:
+            return _sonuc(float(ust), adim, degerlendirme, f_ust, False, 0)
+        alt, f_alt = ust, f_ust
+        ust *= 2
+        f_ust, f1_ust = fonksiyon(ust)[:2]
+        degerlendirme += 1
+        adim += 1
+    
+    # İkili arama: ardışık iki tamsayıya daralt
+    while ust - alt > 1:
+        orta = (alt + ust) // 2
+        f_orta = fonksiyon(orta)[0]
+        degerlendirme += 1
+        adim += 1
+        if f_orta < 0:
+            alt, f_alt = orta, f_orta
+        else:
+            ust, f_ust = orta, f_orta
+    
+    egim = f_ust - f_alt
+    if not math.isfinite(egim):
+        return _sonuc(float(ust), adim, degerlendirme, f_ust, False, 0)
+    if abs(f_ust) < tolerans * egim:
+        return _sonuc(float(ust), adim, degerlendirme, f_ust, True, 0)
+    if alt and abs(f_alt) < tolerans * egim:
+        return _sonuc(float(alt), adim, degerlendirme, f_alt, True, 0)
+    
+    # Kesirli kök: kiriş noktasından başlayıp [alt, ust] içinde Newton
+    def olcekli(n):
+        f, f1, f2 = fonksiyon(n)
+        return f / egim, f1 / egim, None if f2 is None else f2 / egim
+    
+    kiris = alt - f_alt / egim
+    sonuc = guvenli_kok(olcekli, kiris, tolerans, max_iter,
+                        aralik=(alt, f_alt / egim, ust, f_ust / egim))
+    sonuc['artik'] *= egim
+    sonuc['iterasyon'] += adim
+    sonuc['degerlendirme'] += degerlendirme
+    return sonuc
+
+
+def birikim_turevleri(t, n):
+    """
+    s(n,t) = ((1+t)^n - 1) / t ve t'ye göre ilk iki türevi
+
+    s her zaman expm1/log1p ile (t → 0'da sadeleşme kaybı olmadan), türevler
+    |t| < 1e-5 iken seri açılımından hesaplanır. Taşmada (inf, inf, inf),
+    t <= -1 için NaN üçlüsü döner (guvenli_kok bunları geri çekilme sinyali
+    olarak kullanır).
+
+    Args:
+        t: Oran (t > -1)
+        n: Dönem sayısı
+
+    Returns:
+        (s, ds/dt, d²s/dt²)
+    """
+    if t <= -1:
+        return math.nan, math.nan, math.nan
+    
+    x = 1.0 + t
+    try:
+        q = x ** (n - 1)                # (1+t)^(n-1)
+    except OverflowError:
+        return math.inf, math.inf, math.inf
+    birikim = q * x
+    
+    if abs(birikim - 1) > 0.01:
+        s = (birikim - 1) / t
+    elif t:
+        s = math.expm1(n * math.log1p(t)) / t
+    else:
+        s = float(n)
+    
+    if abs(t) < 1e-5:
+        c2 = n * (n - 1) / 2
+        c3 = c2 * (n - 2) / 3
+        c4 = c3 * (n - 3) / 4
+        return s, c2 + t * (2 * c3 + 3 * c4 * t), 2 * c3 + 6 * c4 * t
+    
+    s1 = (n * q - s) / t
+    s2 = (n * (n - 1) * q / x - 2 * s1) / t
+    return s, s1, s2
+
+
+def pesin_turevleri(i, n, us=0):
+    """
+    (1+i)^us × a(n,i) ve i'ye göre ilk iki türevi
+
+    a(n,i) = (1 - (1+i)^-n) / i = -s(-n,i) olduğundan birikim_turevleri'nden
+    gelir (i → 0'da sadeleşme kaybı yok). us = 1 devre başı ä(n,i), us = -m
+    m dönem ertelenmiş, us = c çabuklaştırılmış anüite faktörüdür.
+
+    Returns:
+        (f, df/di, d²f/di²)
+    """
+    if n * i > 0.01:
+        # Sadeleşme kaybı yok: a = (1-q)/i, q = v^n, d(n·v^(n+1))/di = -n(n+1)·v^(n+2)
+        v = 1 / (1 + i)
+        q = v ** n
+        f = (1 - q) / i
+        f1 = (n * q * v - f) / i
+        f2 = (-n * (n + 1) * q * v * v - 2 * f1) / i
+    else:
+        s, s1, s2 = birikim_turevleri(i, -n)
+        f, f1, f2 = -s, -s1, -s2
+
+    if not us:
+        return f, f1, f2
+    return kuvvetle_carp(i, us, f, f1, f2)
+
+
+def kuvvetle_carp(i, us, f, f1, f2):
+    """(1+i)^us × f ve türevleri (f, f', f'' verilmişken çarpım kuralı)"""
+    x = 1.0 + i
+    w = x ** us
+    w1 = us * w / x
+    w2 = (us - 1) * w1 / x
+    return w * f, w1 * f + w * f1, w2 * f + 2 * w1 * f1 + w * f2
+
+
+# ============================================================
+# KAPALI FORM BAŞLANGIÇ TAHMİNLERİ
+# ============================================================
+
+def pesin_tahmini(hedef, n, us=0):
+    """
+    (1+i)^us × a(n,i) = hedef denkleminin yaklaşık kökü (Newton başlangıcı)
+
+    1/a(n,i) ≈ (1 + (n+1)/2·i + (n²-1)/12·i²) / n serisi (1+i)^-us ile
+    çarpılıp ikinci derecede kesilir ve ikinci dereceden denklem çözülür.
+    Seri n·i büyüdükçe bozulur; n·i > 1 ise i = (1+i)^us (1 - v^n) / hedef
+    sabit nokta adımı bir kez uygulanır (büyük n·i'de v^n küçük olduğundan
+    bu adım daraltandır).
+
+    Args:
+        hedef: BD / taksit
+        n: Dönem sayısı
+        us: pesin_turevleri ile aynı
+
+    Returns:
+        Pozitif tahmin; formül pozitif bir değer vermezse None (sabit bir
+        oran, örneğin çabuklaştırılmış anüitenin durağan noktası, Newton'u
+        yanlış yere götürebilir; çözücü bunun yerine aralık arar)
+    """
+    p = 1 / hedef
+    b = (n + 1) / 2 - us
+    a = (n * n - 1) / 12 - us * (n + 1) / 2 + us * (us + 1) / 2
+    c = 1 - n * p
+    ayirtac = b * b - 4 * a * c
+    if ayirtac < 0:
+        return None
+    payda = b + math.sqrt(ayirtac)
+    if payda <= 0:
+        return None
+    i = -2 * c / payda              # küçük kök, a → 0'da da kararlı
+    
+    if n * i > 1:
+        x = 1 + i
+        i = p * x ** us * (1 - x ** -n)
+    return i if i > 0 else None
+
+
+def birikim_tahmini(hedef, n, us=0, alt_sinir=0):
+    """
+    (1+i)^us × s(n,i) = hedef denkleminin yaklaşık kökü (Newton başlangıcı)
+
+    1/s(n,i) ≈ (1 - (n-1)/2·i + (n²-1)/12·i²) / n serisinin küçük kökü (kök
+    yoksa parabolün tepe noktası); |n·i| > 1 ise (1+i)^n = 1 + i·hedef
+    denkleminde üç sabit nokta adımı (pozitif oranda kök alarak, negatif
+    oranda kuvvet alarak; iki yönde de daraltan biçim). us ≠ 0 için hedef
+    bulunan oranla (1+i)^us'a bölünüp bir kez yeniden çözülür.
+
+    Args:
+        hedef: GD / taksit
+        n: Dönem sayısı
+        us: pesin_turevleri ile aynı
+        alt_sinir: Kabul edilen en küçük tahmin (dahil değil); -1 verilirse
+            hedef < n için negatif oran da döner
+
+    Returns:
+        Tahmin; formül alt_sinir'den büyük bir değer vermezse None
+    """
+    b = (n - 1) / 2
+    a = (n * n - 1) / 12
+    c = 1 - n / hedef
+    ayirtac = b * b - 4 * a * c
+    if ayirtac >= 0:
+        payda = b + math.sqrt(ayirtac)
+        if payda <= 0:
+            return None
+        i = 2 * c / payda
+    else:
+        i = b / (2 * a)             # seri kökü yok: parabolün tepe noktası
+    
+    if n * i > 1:
+        for _ in range(3):
+            i = (1 + i * hedef) ** (1 / n) - 1
+    elif n * i < -1 and hedef > 1 and i > -1:
+        # Negatif oranda kök alan adım ıraksar; kuvvet alan adım daraltandır
+        for _ in range(3):
+            i = ((1 + i) ** n - 1) / hedef
+    if not i > alt_sinir:
+        return None
+    if us:
+        return birikim_tahmini(hedef / (1 + i) ** us, n, 0, alt_sinir)
+    return i
+
+
+def _sonuc(kok, iterasyon, degerlendirme, artik, yakinsadi, ikiye_bolme):
+    return {
+        'kok': kok,
+        'iterasyon': iterasyon,
+        'degerlendirme': degerlendirme,
+        'artik': artik,
+        'yakinsadi': yakinsadi,
+        'ikiye_bolme': ikiye_bolme,
+    }
@@ -16,6 +16,11 @@ Taksitlerin değişimi: Taksitler devreden devreye değişim miktarı b olmak ü
 
 import math
 
+from . import izleme as _izleme
+from . import onbellek as _onbellek
+from ._kok import (birikim_tahmini, birikim_turevleri, kok_bul, sicak_tahmin, sonuclandir,
+                   tamsayi_kok)
+
 
 # ============================================================================
 # DEVRE SONU ÖDEMELİ ARİTMETİK ANÜİTE
@@ -28,7 +33,7 @@ def bugunku_deger_devre_sonu(ilk_taksit, degisim, i, n):
         raise ValueError("Dönem sayısı sıfırdan büyük olmalıdır.")
     
     # BD = (a + b/i) × [(1+i)^n - 1] / i - b.n / i
-    birinci_terim = (ilk_taksit + degisim / i) * ((1 + i) ** n - 1) / i
+    birinci_terim = (ilk_taksit + degisim / i) * (_onbellek.birikim(i, n) - 1) / i
     ikinci_terim = (degisim * n) / i
     
     return birinci_terim - ikinci_terim
@@ -36,7 +41,7 @@ def bugunku_deger_devre_sonu(ilk_taksit, degisim, i, n):
 
 def gelecek_deger_devre_sonu(ilk_taksit, degisim, i, n):
     bd = bugunku_deger_devre_sonu(ilk_taksit, degisim, i, n)
-    return bd * ((1 + i) ** n)
+    return bd * _onbellek.birikim(i, n)
 
 
 def ilk_taksit_hesapla_bd_devre_sonu(bugunku_deger, degisim, i, n):
@@ -48,7 +53,7 @@ def ilk_taksit_hesapla_bd_devre_sonu(bugunku_deger, degisim, i, n):
         raise ValueError("Dönem sayısı sıfırdan büyük olmalıdır.")
     
     sol = bugunku_deger + (degisim * n) / i
-    carpan = i / ((1 + i) ** n - 1)
+    carpan = i / (_onbellek.birikim(i, n) - 1)
     
     return sol * carpan - degisim / i
 
@@ -57,7 +62,7 @@ def ilk_taksit_hesapla_gd_devre_sonu(gelecek_deger, degisim, i, n):
     if gelecek_deger <= 0:
         raise ValueError("Gelecek değer sıfırdan büyük olmalıdır.")
     
-    bugunku_deger = gelecek_deger / ((1 + i) ** n)
+    bugunku_deger = gelecek_deger / _onbellek.birikim(i, n)
     return ilk_taksit_hesapla_bd_devre_sonu(bugunku_deger, degisim, i, n)
 
 
@@ -69,7 +74,7 @@ def degisim_hesapla_bd_devre_sonu(bugunku_deger, ilk_taksit, i, n):
     if n <= 0:
         raise ValueError("Dönem sayısı sıfırdan büyük olmalıdır.")
     
-    anuite_faktoru = ((1 + i) ** n - 1) / i
+    anuite_faktoru = (_onbellek.birikim(i, n) - 1) / i
     sol = bugunku_deger - ilk_taksit * anuite_faktoru
     sag_parantez = anuite_faktoru - n
     
@@ -89,7 +94,7 @@ def bugunku_deger_devre_basi(ilk_taksit, degisim, i, n):
     if n <= 0:
         raise ValueError("Dönem sayısı sıfırdan büyük olmalıdır.")
     
-    birinci_terim = (ilk_taksit + degisim / i) * ((1 + i) ** n - 1) / i
+    birinci_terim = (ilk_taksit + degisim / i) * (_onbellek.birikim(i, n) - 1) / i
     ikinci_terim = ((1 + i) * degisim * n) / i
     
     return (1 + i) * (birinci_terim - ikinci_terim)
@@ -97,7 +102,7 @@ def bugunku_deger_devre_basi(ilk_taksit, degisim, i, n):
 
 def gelecek_deger_devre_basi(ilk_taksit, degisim, i, n):
     bd = bugunku_deger_devre_basi(ilk_taksit, degisim, i, n)
-    return bd * ((1 + i) ** n) / (1 + i)
+    return bd * _onbellek.birikim(i, n) / (1 + i)
 
 
 def ilk_taksit_hesapla_bd_devre_basi(bugunku_deger, degisim, i, n):
@@ -109,82 +114,134 @@ def ilk_taksit_hesapla_bd_devre_basi(bugunku_deger, degisim, i, n):
 # TERS FORMÜLLER (i VE n HESAPLAMA)
 # ============================================================================
 
+def _bd_turevleri(ilk_taksit, degisim, i, n, devre_basi=False):
+    """
+    BD(i), BD'(i), BD''(i) tek geçişte (bugunku_deger_devre_* ile aynı formül)
+
+    Devre sonu: BD = a.s + b.h, h = (s - n) / i; devre başı: (1+i)(BD - b.n)
+    """
+    if i <= 0:
+        return math.nan, math.nan, math.nan
+    
+    s, s1, s2 = birikim_turevleri(i, n)
+    if not math.isfinite(s):
+        return s, s1, s2
+    
+    if i < 1e-5:
+        # h = C(n,2) + C(n,3).i + C(n,4).i² + ...
+        c2 = n * (n - 1) / 2
+        c3 = c2 * (n - 2) / 3
+        c4 = c3 * (n - 3) / 4
+        h, h1, h2 = c2 + i * (c3 + c4 * i), c3 + 2 * c4 * i, 2 * c4
+    else:
+        h = (s - n) / i
+        h1 = (s1 - h) / i
+        h2 = (s2 - 2 * h1) / i
+    
+    f = ilk_taksit * s + degisim * h
+    f1 = ilk_taksit * s1 + degisim * h1
+    f2 = ilk_taksit * s2 + degisim * h2
+    
+    if devre_basi:
+        u = f - degisim * n
+        return (1 + i) * u, u + (1 + i) * f1, 2 * f1 + (1 + i) * f2
+    
+    return f, f1, f2
+
+
+def _faiz_coz(bugunku_deger, ilk_taksit, degisim, n, devre_basi, tahmin, tolerans, maks_iterasyon):
+    """BD(i) = bugunku_deger için güvenli Halley çözümü (i > 0)"""
+    def fonksiyon(i):
+        f, f1, f2 = _bd_turevleri(ilk_taksit, degisim, i, n, devre_basi)
+        return f - bugunku_deger, f1, f2
+    
+    sonuc = kok_bul(fonksiyon, tahmin, tolerans, maks_iterasyon, alt_sinir=0)
+    
+    # Kök yoksa adımlar i = 0 sınırına yığılır; bu yakınsama sayılmaz
+    if sonuc['kok'] <= tolerans:
+        sonuc['yakinsadi'] = False
+    
+    return sonuc
+
+
 def faiz_orani_hesapla_bd(bugunku_deger, ilk_taksit, degisim, n, devre_basi=False, 
-                          tahmin=0.1, tolerans=1e-6, maks_iterasyon=100):
-    i = tahmin
+                          tahmin=None, tolerans=1e-6, maks_iterasyon=100):
+    """Analitik türevli Halley/Newton + ikiye bölme ile faiz oranı (BD'den)"""
+    if bugunku_deger <= 0:
+        raise ValueError("Bugünkü değer sıfırdan büyük olmalıdır.")
+    if n <= 0:
+        raise ValueError("Dönem sayısı sıfırdan büyük olmalıdır.")
+    ad = 'aritmetik_anuite.faiz_orani_hesapla_bd'
+    tahmin = sicak_tahmin(ad, tahmin, None)
+    if tahmin is None:
+        # BD = a.s + b.h; ödemelerin ortalaması kadar sabit taksitle s(n,i).
+        # Tahmin yoksa (None) kok_bul alt sınırdan aralık arar
+        esdeger = ilk_taksit + degisim * (n - 1) / 2
+        if esdeger > 0:
+            tahmin = birikim_tahmini(bugunku_deger / esdeger, n, 1 if devre_basi else 0)
+    elif tahmin <= 0:
+        raise ValueError("Tahmin sıfırdan büyük olmalıdır.")
     
-    for _ in range(maks_iterasyon):
-        if devre_basi:
-            bd_hesaplanan = bugunku_deger_devre_basi(ilk_taksit, degisim, i, n)
-        else:
-            bd_hesaplanan = bugunku_deger_devre_sonu(ilk_taksit, degisim, i, n)
-        
-        f = bd_hesaplanan - bugunku_deger
-        
-        # Sayısal türev
-        delta = 1e-8
-        if devre_basi:
-            bd_delta = bugunku_deger_devre_basi(ilk_taksit, degisim, i + delta, n)
-        else:
-            bd_delta = bugunku_deger_devre_sonu(ilk_taksit, degisim, i + delta, n)
-        
-        f_turev = (bd_delta - bd_hesaplanan) / delta
-        
-        if abs(f_turev) < 1e-10:
-            raise ValueError("Türev sıfıra çok yakın, iterasyon durdu.")
-        
-        i_yeni = i - f / f_turev
-        
-        if i_yeni <= 0:
-            i_yeni = 0.01
-        
-        if abs(i_yeni - i) < tolerans:
-            return i_yeni
-        
-        i = i_yeni
-    
-    raise ValueError(f"Yakınsama sağlanamadı ({maks_iterasyon} iterasyonda).")
+    sonuc = _faiz_coz(bugunku_deger, ilk_taksit, degisim, n, devre_basi, tahmin, tolerans,
+                      maks_iterasyon)
+    return sonuclandir(ad, sonuc, maks_iterasyon)
+
+
+def _bd_sure_turevleri(ilk_taksit, degisim, i, n, devre_basi=False):
+    """BD(n), dBD/dn, d²BD/dn² (gerçel n; bugunku_deger_devre_* ile aynı formül)"""
+    ln_x = math.log1p(i)
+    us = n * ln_x
+    birikim = math.exp(us) if us < 700 else math.inf
+    
+    # s = ((1+i)^n - 1) / i, h = (s - n) / i
+    s = (birikim - 1) / i
+    s1 = birikim * ln_x / i
+    s2 = s1 * ln_x
+    
+    f = ilk_taksit * s + degisim * (s - n) / i
+    f1 = ilk_taksit * s1 + degisim * (s1 - 1) / i
+    f2 = ilk_taksit * s2 + degisim * s2 / i
+    
+    if devre_basi:
+        return (1 + i) * (f - degisim * n), (1 + i) * (f1 - degisim), (1 + i) * f2
+    
+    return f, f1, f2
 
 
 def sure_hesapla_bd(bugunku_deger, ilk_taksit, degisim, i, devre_basi=False,
                     tahmin=5, tolerans=1e-6, maks_iterasyon=100):
-    n = tahmin
+    """
+    Süre hesaplama (BD'den)
+
+    degisim = 0 ise kapalı form; aksi halde tamsayı üstel/ikili arama ve
+    gerekirse [k, k+1] içinde Newton (BD'nin n'de artan olduğu varsayılır).
+    """
+    if bugunku_deger <= 0:
+        raise ValueError("Bugünkü değer sıfırdan büyük olmalıdır.")
+    if i <= 0:
+        raise ValueError("Faiz oranı sıfırdan büyük olmalıdır.")
     
-    for _ in range(maks_iterasyon):
-        n_int = int(max(1, n))
-        
-        if devre_basi:
-            bd_hesaplanan = bugunku_deger_devre_basi(ilk_taksit, degisim, i, n_int)
-        else:
-            bd_hesaplanan = bugunku_deger_devre_sonu(ilk_taksit, degisim, i, n_int)
-        
-        f = bd_hesaplanan - bugunku_deger
-        
-        # Sayısal türev
-        delta = 0.1
-        n_delta = int(max(1, n + delta))
-        
+    if degisim == 0:
+        if ilk_taksit <= 0:
+            raise ValueError("İlk taksit sıfırdan büyük olmalıdır.")
         if devre_basi:
-            bd_delta = bugunku_deger_devre_basi(ilk_taksit, degisim, i, n_delta)
-        else:
-            bd_delta = bugunku_deger_devre_sonu(ilk_taksit, degisim, i, n_delta)
-        
-        f_turev = (bd_delta - bd_hesaplanan) / delta
-        
-        if abs(f_turev) < 1e-10:
-            raise ValueError("Türev sıfıra çok yakın, iterasyon durdu.")
-        
-        n_yeni = n - f / f_turev
-        
-        if n_yeni < 1:
-            n_yeni = 1
-        
-        if abs(n_yeni - n) < tolerans:
-            return n_yeni
-        
-        n = n_yeni
-    
-    raise ValueError(f"Yakınsama sağlanamadı ({maks_iterasyon} iterasyonda).")
+            bugunku_deger = bugunku_deger / (1 + i)
+        return math.log1p(bugunku_deger * i / ilk_taksit) / math.log1p(i)
+    
+    def fonksiyon(n):
+        f, f1, f2 = _bd_sure_turevleri(ilk_taksit, degisim, i, n, devre_basi)
+        return f - bugunku_deger, f1, f2
+    
+    sonuc = tamsayi_kok(fonksiyon, tahmin, tolerans, maks_iterasyon)
+    
+    if _izleme.ETKIN:
+        _izleme.cozum_kaydet('aritmetik_anuite.sure_hesapla_bd', sonuc['iterasyon'],
+                             sonuc['artik'], sonuc['yakinsadi'], sonuc['degerlendirme'])
+    
+    if not sonuc['yakinsadi']:
+        raise ValueError("Bu bugünkü değer hiçbir sürede elde edilemez.")
+    
+    return sonuc['kok']
 
 
 # ============================================================================
@@ -220,4 +277,4 @@ def ilk_taksit_hesapla_gd(gelecek_deger, degisim, i, n, devre_basi=False):
 
 def degisim_hesapla_bd(bugunku_deger, ilk_taksit, i, n, devre_basi=False):
     """Genel değişim hesaplama"""
-    return degisim_hesapla_bd_devre_sonu(bugunku_deger, ilk_taksit, i, n)
\ No newline at end of file
+    return degisim_hesapla_bd_devre_sonu(bugunku_deger, ilk_taksit, i, n)
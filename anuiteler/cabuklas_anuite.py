@@ -10,6 +10,9 @@ Not: c = çabuklaştırma süresi (gecikme süresi)
 
 import math
 
+from . import onbellek as _onbellek
+from ._kok import kok_bul, pesin_tahmini, pesin_turevleri, sicak_tahmin, sonuclandir
+
 
 def bugunku_deger_devre_sonu(taksit, i, n, c):
     if i <= 0:
@@ -22,15 +25,16 @@ def bugunku_deger_devre_sonu(taksit, i, n, c):
         raise ValueError("Taksit tutarı negatif olamaz.")
     
     # Normal devre sonu anüite × (1+i)^c
-    anuite_faktoru = ((1 + i) ** n - 1) / (((1 + i) ** n) * i)
-    cabuklas_faktoru = (1 + i) ** c
+    birikim = _onbellek.birikim(i, n)
+    anuite_faktoru = (birikim - 1) / (birikim * i)
+    cabuklas_faktoru = _onbellek.birikim(i, c)
     
     return taksit * cabuklas_faktoru * anuite_faktoru
 
 
 def gelecek_deger_devre_sonu(taksit, i, n, c):
     bd = bugunku_deger_devre_sonu(taksit, i, n, c)
-    return bd * ((1 + i) ** n)
+    return bd * _onbellek.birikim(i, n)
 
 
 def bugunku_deger_devre_basi(taksit, i, n, c):
@@ -50,7 +54,7 @@ def bugunku_deger_devre_basi(taksit, i, n, c):
 
 def gelecek_deger_devre_basi(taksit, i, n, c):
     bd = bugunku_deger_devre_basi(taksit, i, n, c)
-    return bd * ((1 + i) ** n) / (1 + i)
+    return bd * _onbellek.birikim(i, n) / (1 + i)
 
 
 def taksit_hesapla_bd(bugunku_deger, i, n, c, devre_basi=False):
@@ -63,8 +67,9 @@ def taksit_hesapla_bd(bugunku_deger, i, n, c, devre_basi=False):
     if bugunku_deger < 0:
         raise ValueError("Bugünkü değer negatif olamaz.")
     
-    anuite_faktoru = ((1 + i) ** n - 1) / (((1 + i) ** n) * i)
-    cabuklas_faktoru = (1 + i) ** c
+    birikim = _onbellek.birikim(i, n)
+    anuite_faktoru = (birikim - 1) / (birikim * i)
+    cabuklas_faktoru = _onbellek.birikim(i, c)
     
     if devre_basi:
         cabuklas_faktoru *= (1 + i)
@@ -82,7 +87,7 @@ def taksit_hesapla_gd(gelecek_deger, i, n, c, devre_basi=False):
     if gelecek_deger < 0:
         raise ValueError("Gelecek değer negatif olamaz.")
     
-    bugunku_deger = gelecek_deger / ((1 + i) ** n)
+    bugunku_deger = gelecek_deger / _onbellek.birikim(i, n)
     return taksit_hesapla_bd(bugunku_deger, i, n, c, devre_basi)
 
 
@@ -96,7 +101,8 @@ def cabuklas_suresi_hesapla_bd(bugunku_deger, taksit, i, n, devre_basi=False):
     if bugunku_deger <= 0:
         raise ValueError("Bugünkü değer sıfırdan büyük olmalıdır.")
     
-    anuite_faktoru = ((1 + i) ** n - 1) / (((1 + i) ** n) * i)
+    birikim = _onbellek.birikim(i, n)
+    anuite_faktoru = (birikim - 1) / (birikim * i)
     
     if devre_basi:
         # BD / (a × (1+i) × anuite_faktoru) = (1+i)^c
@@ -113,7 +119,13 @@ def cabuklas_suresi_hesapla_bd(bugunku_deger, taksit, i, n, devre_basi=False):
     return math.log(bugunku_deger / carpan) / math.log(1 + i)
 
 
-def faiz_orani_hesapla_bd(bugunku_deger, taksit, n, c, tahmin=0.1, tolerans=1e-6, maks_iterasyon=100):
+def faiz_orani_hesapla_bd(bugunku_deger, taksit, n, c, tahmin=None, tolerans=1e-6, maks_iterasyon=100):
+    """
+    Analitik türevli Halley + Brent yedeği ile faiz oranı (devre sonu BD'den)
+
+    c büyükse BD(i) monoton değildir; tahmine en yakın kök döner, yedek
+    aralık araması i = 0'dan yukarı ilk kökü bulur.
+    """
     if taksit <= 0:
         raise ValueError("Taksit tutarı sıfırdan büyük olmalıdır.")
     if n <= 0:
@@ -123,50 +135,38 @@ def faiz_orani_hesapla_bd(bugunku_deger, taksit, n, c, tahmin=0.1, tolerans=1e-6
     if bugunku_deger <= 0:
         raise ValueError("Bugünkü değer sıfırdan büyük olmalıdır.")
     
-    i = tahmin
-    
-    for _ in range(maks_iterasyon):
-        bd_hesaplanan = bugunku_deger_devre_sonu(taksit, i, n, c)
-        f = bd_hesaplanan - bugunku_deger
-        
-        # Sayısal türev
-        delta = 1e-8
-        bd_delta = bugunku_deger_devre_sonu(taksit, i + delta, n, c)
-        f_turev = (bd_delta - bd_hesaplanan) / delta
-        
-        i_yeni = i - f / f_turev
-        
-        if i_yeni <= 0:
-            i_yeni = 0.01
-        
-        if abs(i_yeni - i) < tolerans:
-            return i_yeni
-        
-        i = i_yeni
-    
-    raise ValueError(f"Yakınsama sağlanamadı ({maks_iterasyon} iterasyonda).")
+    hedef = bugunku_deger / taksit
+    
+    def fonksiyon(i):
+        f, f1, f2 = pesin_turevleri(i, n, c)
+        return f - hedef, f1, f2
+    
+    ad = 'cabuklas_anuite.faiz_orani_hesapla_bd'
+    tahmin = sicak_tahmin(ad, tahmin, None)
+    if tahmin is None:
+        tahmin = pesin_tahmini(hedef, n, c)
+    sonuc = kok_bul(fonksiyon, tahmin, tolerans, maks_iterasyon, alt_sinir=0)
+    return sonuclandir(ad, sonuc, maks_iterasyon)
 
 
 def sure_hesapla_bd(bugunku_deger, taksit, i, c, tahmin=5, tolerans=1e-6, maks_iterasyon=100):
-    n = tahmin
-    
-    for _ in range(maks_iterasyon):
-        bd_hesaplanan = bugunku_deger_devre_sonu(taksit, i, int(n), c)
-        f = bd_hesaplanan - bugunku_deger
-        
-        # Sayısal türev
-        delta = 0.1
-        bd_delta = bugunku_deger_devre_sonu(taksit, i, int(n + delta), c)
-        f_turev = (bd_delta - bd_hesaplanan) / delta
-        
-        n_yeni = n - f / f_turev
-        
-        if n_yeni < 1:
-            n_yeni = 1
-        
-        if abs(n_yeni - n) < tolerans:
-            return n_yeni
-        
-        n = n_yeni
-    
-    raise ValueError(f"Yakınsama sağlanamadı ({maks_iterasyon} iterasyonda).")
\ No newline at end of file
+    """
+    Süre hesaplama (devre sonu BD'den), kapalı form
+
+    v^n = 1 - BD·i / [a·(1+i)^c]; tahmin, tolerans ve maks_iterasyon geriye
+    uyumluluk için tutulur, kullanılmaz.
+    """
+    if bugunku_deger <= 0:
+        raise ValueError("Bugünkü değer sıfırdan büyük olmalıdır.")
+    if taksit <= 0:
+        raise ValueError("Taksit tutarı sıfırdan büyük olmalıdır.")
+    if i <= 0:
+        raise ValueError("Faiz oranı sıfırdan büyük olmalıdır.")
+    if c < 0:
+        raise ValueError("Çabuklaştırma süresi negatif olamaz.")
+    
+    oran = bugunku_deger * i / (taksit * _onbellek.birikim(i, c))
+    if oran >= 1:
+        raise ValueError("Bu bugünkü değer hiçbir sürede elde edilemez.")
+    
+    return -math.log1p(-oran) / math.log1p(i)
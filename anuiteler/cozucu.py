@@ -0,0 +1,290 @@
+"""
+ANÜİTE ÇÖZÜCÜ KAYDI
+
+`anuite_hesapla` için her anüite tipinin (devre sonu/başı, sürekli,
+ertelenmiş, geometrik, aritmetik, çabuklaştırılmış) hangi bilinmeyeni hangi
+fonksiyonla ve hangi girdilerden çözdüğünü tutan kayıt.
+
+Bilinen değişken kümesi (imza) için çözüm planı bir kez kurulur ve
+önbelleğe alınır; sonraki çağrılar yalnızca planın adımlarını çalıştırır.
+
+Değişken adları tüm tiplerde ortaktır:
+- odeme: taksit / ilk taksit
+- bugunku_deger, gelecek_deger, n, i
+- m: gecikme süresi (ertelenmiş)
+- c: çabuklaştırma süresi (çabuklaştırılmış)
+- r: artış oranı (geometrik)
+- degisim: dönemsel değişim tutarı (aritmetik)
+"""
+
+import warnings
+from functools import partial
+from operator import itemgetter
+
+from . import (
+    aritmetik_anuite as _arit,
+    cabuklas_anuite as _cab,
+    devre_basi_anuite as _db,
+    devre_sonu_anuite as _ds,
+    ertelenmis_anuite as _ert,
+    geometrik_anuite as _geo,
+    surekli_anuite as _sur,
+)
+
+_DEGISKENLER = ('odeme', 'bugunku_deger', 'gelecek_deger', 'n', 'i', 'm', 'c', 'r', 'degisim')
+
+# tip -> tipin kullandığı değişkenler
+_TIPLER = {}
+
+# tip -> [(çıktı, fonksiyon, girdiler), ...] ; sıra öncelik sırasıdır
+_COZUCULER = {}
+
+# (tip, boş değişkenler maskesi) -> (adımlar, eksik_kaldi) ; adım:
+# (çıktı, fonksiyon, girdileri değer sözlüğünden demet olarak alan itemgetter)
+_PLANLAR = {}
+
+# anuiteler.np.cozucu'nun (NumPy fonksiyonlarına çevrilmiş) plan önbelleği
+_TOPLU_PLANLAR = {}
+
+
+def _planlari_temizle():
+    _PLANLAR.clear()
+    _TOPLU_PLANLAR.clear()
+
+
+def tip_kaydet(tip, degiskenler):
+    """Yeni bir anüite tipini değişkenleriyle kaydeder"""
+    bilinmeyen = set(degiskenler) - set(_DEGISKENLER)
+    if bilinmeyen:
+        raise ValueError(f"Bilinmeyen değişken(ler): {', '.join(sorted(bilinmeyen))}")
+
+    _TIPLER[tip] = tuple(degiskenler)
+    _COZUCULER.setdefault(tip, [])
+    _planlari_temizle()
+
+
+def cozucu_kaydet(tip, cikti, fonksiyon, girdiler):
+    """
+    Bir tip için `cikti = fonksiyon(*girdiler)` çözücüsünü kaydeder
+
+    Args:
+        tip: Kayıtlı anüite tipi
+        cikti: Çözülen değişkenin adı
+        fonksiyon: Girdileri sırasıyla konumsal olarak alan fonksiyon
+        girdiler: Girdi değişkenlerinin adları
+
+    Returns:
+        None (aynı tip için önbellekteki planlar geçersiz olur)
+    """
+    if tip not in _TIPLER:
+        raise ValueError(f"Bilinmeyen anüite tipi: {tip}")
+    if cikti not in _TIPLER[tip] or not set(girdiler) <= set(_TIPLER[tip]):
+        raise ValueError(f"Değişkenler '{tip}' tipinde tanımlı değil.")
+
+    _COZUCULER[tip].append((cikti, fonksiyon, tuple(girdiler)))
+    _planlari_temizle()
+
+
+def desteklenen_tipler():
+    """Kayıtlı anüite tiplerinin listesi"""
+    return list(_TIPLER)
+
+
+def _alici(girdiler):
+    """Değer sözlüğünden girdileri her zaman demet olarak döndüren fonksiyon"""
+    if len(girdiler) == 1:
+        ad = girdiler[0]
+        return lambda degerler: (degerler[ad],)
+    return itemgetter(*girdiler)
+
+
+def _plan_olustur(tip, bilinenler, donustur=None):
+    """
+    Bilinen değişkenlerden ileri zincirleme ile çözüm planı kurar
+
+    donustur verilirse plana giren her fonksiyon donustur(fonksiyon) ile
+    değiştirilir (ör. NumPy karşılığı).
+    """
+    if tip not in _TIPLER:
+        raise ValueError(f"Bilinmeyen anüite tipi: {tip}")
+
+    degiskenler = _TIPLER[tip]
+    bilinen = {ad for ad in bilinenler if ad in degiskenler}
+
+    # BD ve GD ayrı iki denklem verir; sürekli anüitenin yalnızca BD'si vardır
+    denklem_sayisi = 2 if 'gelecek_deger' in degiskenler else 1
+    en_az = len(degiskenler) - denklem_sayisi
+    if len(bilinen) < en_az:
+        raise ValueError(f"En az {en_az} parametre gerekli!")
+
+    adimlar = []
+    ilerledi = True
+    while ilerledi:
+        ilerledi = False
+        for cikti, fonksiyon, girdiler in _COZUCULER[tip]:
+            if cikti not in bilinen and bilinen.issuperset(girdiler):
+                if donustur is not None:
+                    fonksiyon = donustur(fonksiyon)
+                adimlar.append((cikti, fonksiyon, _alici(girdiler)))
+                bilinen.add(cikti)
+                ilerledi = True
+
+    return tuple(adimlar), len(bilinen) < len(degiskenler)
+
+
+def anuite_hesapla(odeme=None, bugunku_deger=None, gelecek_deger=None, n=None, i=None,
+                   tip='devre_sonu', m=None, c=None, r=None, degisim=None):
+    """
+    Verilen değerlerden eksik anüite değişkenlerini hesaplar
+
+    Args:
+        odeme: Dönemsel ödeme (geometrik/aritmetik için ilk taksit)
+        bugunku_deger: Bugünkü değer
+        gelecek_deger: Gelecek değer
+        n: Dönem sayısı
+        i: Dönemsel faiz oranı
+        tip: Anüite tipi (bkz. `desteklenen_tipler()`)
+        m: Gecikme süresi (ertelenmiş)
+        c: Çabuklaştırma süresi (çabuklaştırılmış)
+        r: Artış oranı (geometrik)
+        degisim: Dönemsel değişim tutarı (aritmetik)
+
+    Returns:
+        Tüm değişkenleri ve tipi içeren sözlük; çözülemeyen değişkenler None
+    """
+    degerler = {
+        'odeme': odeme,
+        'bugunku_deger': bugunku_deger,
+        'gelecek_deger': gelecek_deger,
+        'n': n,
+        'i': i,
+        'm': m,
+        'c': c,
+        'r': r,
+        'degisim': degisim,
+    }
+
+    anahtar = (tip, odeme is None, bugunku_deger is None, gelecek_deger is None, n is None,
+               i is None, m is None, c is None, r is None, degisim is None)
+    plan = _PLANLAR.get(anahtar)
+    if plan is None:
+        bilinenler = [ad for ad, bos in zip(_DEGISKENLER, anahtar[1:]) if not bos]
+        plan = _PLANLAR[anahtar] = _plan_olustur(tip, bilinenler)
+
+    adimlar, eksik_kaldi = plan
+    for cikti, fonksiyon, al in adimlar:
+        degerler[cikti] = fonksiyon(*al(degerler))
+
+    if eksik_kaldi:
+        warnings.warn("Bu kombinasyon henüz desteklenmiyor")
+
+    degerler['tip'] = tip
+    return degerler
+
+
+# ============================================================
+# KAYITLAR
+# ============================================================
+# Kapalı formlar önce, iteratif çözücüler sonra kaydedilir; plan aynı
+# değişkeni çözebilen ilk kayıtlı fonksiyonu kullanır.
+
+_TEMEL = ('odeme', 'bugunku_deger', 'gelecek_deger', 'n', 'i')
+
+for _tip, _modul in (('devre_sonu', _ds), ('devre_basi', _db)):
+    tip_kaydet(_tip, _TEMEL)
+    cozucu_kaydet(_tip, 'odeme', _modul.odeme_bugunku_degerden, ('bugunku_deger', 'n', 'i'))
+    cozucu_kaydet(_tip, 'odeme', _modul.odeme_gelecek_degerden, ('gelecek_deger', 'n', 'i'))
+    cozucu_kaydet(_tip, 'bugunku_deger', _modul.bugunku_deger_hesapla, ('odeme', 'n', 'i'))
+    cozucu_kaydet(_tip, 'gelecek_deger', _modul.gelecek_deger_hesapla, ('odeme', 'n', 'i'))
+    cozucu_kaydet(_tip, 'n', _modul.sure_bugunku_degerden, ('bugunku_deger', 'odeme', 'i'))
+    cozucu_kaydet(_tip, 'n', _modul.sure_gelecek_degerden, ('gelecek_deger', 'odeme', 'i'))
+    cozucu_kaydet(_tip, 'i', _modul.faiz_bugunku_degerden, ('bugunku_deger', 'odeme', 'n'))
+    cozucu_kaydet(_tip, 'i', _modul.faiz_gelecek_degerden, ('gelecek_deger', 'odeme', 'n'))
+
+# Sürekli anüite (n → ∞, gelecek değer yok)
+for _tip, _bd, _odeme, _faiz in (
+        ('surekli', _sur.bugunku_deger_devre_sonu, _sur.odeme_devre_sonu, _sur.faiz_devre_sonu),
+        ('surekli_devre_basi', _sur.bugunku_deger_devre_basi, _sur.odeme_devre_basi,
+         _sur.faiz_devre_basi)):
+    tip_kaydet(_tip, ('odeme', 'bugunku_deger', 'i'))
+    cozucu_kaydet(_tip, 'bugunku_deger', _bd, ('odeme', 'i'))
+    cozucu_kaydet(_tip, 'odeme', _odeme, ('bugunku_deger', 'i'))
+    cozucu_kaydet(_tip, 'i', _faiz, ('bugunku_deger', 'odeme'))
+
+# Ertelenmiş anüite
+for _tip, _devre_basi in (('ertelenmis', False), ('ertelenmis_devre_basi', True)):
+    tip_kaydet(_tip, _TEMEL + ('m',))
+    if _devre_basi:
+        cozucu_kaydet(_tip, 'odeme', _ert.taksit_hesapla_bd_devre_basi, ('bugunku_deger', 'i', 'n', 'm'))
+        cozucu_kaydet(_tip, 'bugunku_deger', _ert.bugunku_deger_devre_basi, ('odeme', 'i', 'n', 'm'))
+        cozucu_kaydet(_tip, 'gelecek_deger', _ert.gelecek_deger_devre_basi, ('odeme', 'i', 'n'))
+    else:
+        cozucu_kaydet(_tip, 'odeme', _ert.taksit_hesapla_bd_devre_sonu, ('bugunku_deger', 'i', 'n', 'm'))
+        cozucu_kaydet(_tip, 'odeme', _ert.taksit_hesapla_gd_devre_sonu, ('gelecek_deger', 'i', 'n'))
+        cozucu_kaydet(_tip, 'bugunku_deger', _ert.bugunku_deger_devre_sonu, ('odeme', 'i', 'n', 'm'))
+        cozucu_kaydet(_tip, 'gelecek_deger', _ert.gelecek_deger_devre_sonu, ('odeme', 'i', 'n', 'm'))
+    cozucu_kaydet(_tip, 'm', partial(_ert.gecikme_suresi_hesapla_bd, devre_basi=_devre_basi),
+                  ('bugunku_deger', 'odeme', 'i', 'n'))
+    cozucu_kaydet(_tip, 'i', partial(_ert.faiz_orani_hesapla_bd, devre_basi=_devre_basi),
+                  ('bugunku_deger', 'odeme', 'n', 'm'))
+    cozucu_kaydet(_tip, 'n', partial(_ert.sure_hesapla_bd, devre_basi=_devre_basi),
+                  ('bugunku_deger', 'odeme', 'i', 'm'))
+
+# Geometrik anüite (i ve n çözücüleri yalnızca devre sonu)
+for _tip, _devre_basi in (('geometrik', False), ('geometrik_devre_basi', True)):
+    tip_kaydet(_tip, _TEMEL + ('r',))
+    _bd, _gd = ((_geo.bugunku_deger_devre_basi, _geo.gelecek_deger_devre_basi) if _devre_basi
+                else (_geo.bugunku_deger_devre_sonu, _geo.gelecek_deger_devre_sonu))
+    cozucu_kaydet(_tip, 'odeme', partial(_geo.ilk_taksit_hesapla_bd, devre_basi=_devre_basi),
+                  ('bugunku_deger', 'i', 'r', 'n'))
+    cozucu_kaydet(_tip, 'odeme', partial(_geo.ilk_taksit_hesapla_gd, devre_basi=_devre_basi),
+                  ('gelecek_deger', 'i', 'r', 'n'))
+    cozucu_kaydet(_tip, 'bugunku_deger', _bd, ('odeme', 'i', 'r', 'n'))
+    cozucu_kaydet(_tip, 'gelecek_deger', _gd, ('odeme', 'i', 'r', 'n'))
+    if not _devre_basi:
+        cozucu_kaydet(_tip, 'i', _geo.faiz_orani_hesapla_bd, ('bugunku_deger', 'odeme', 'r', 'n'))
+        cozucu_kaydet(_tip, 'n', _geo.sure_hesapla_gd, ('gelecek_deger', 'odeme', 'i', 'r'))
+
+# Aritmetik anüite (GD'den ilk taksit ve değişim çözücüleri yalnızca devre sonu)
+tip_kaydet('aritmetik', _TEMEL + ('degisim',))
+cozucu_kaydet('aritmetik', 'odeme', _arit.ilk_taksit_hesapla_bd_devre_sonu,
+              ('bugunku_deger', 'degisim', 'i', 'n'))
+cozucu_kaydet('aritmetik', 'odeme', _arit.ilk_taksit_hesapla_gd_devre_sonu,
+              ('gelecek_deger', 'degisim', 'i', 'n'))
+cozucu_kaydet('aritmetik', 'degisim', _arit.degisim_hesapla_bd_devre_sonu,
+              ('bugunku_deger', 'odeme', 'i', 'n'))
+cozucu_kaydet('aritmetik', 'bugunku_deger', _arit.bugunku_deger_devre_sonu,
+              ('odeme', 'degisim', 'i', 'n'))
+cozucu_kaydet('aritmetik', 'gelecek_deger', _arit.gelecek_deger_devre_sonu,
+              ('odeme', 'degisim', 'i', 'n'))
+
+# ilk_taksit_hesapla_bd_devre_basi, bugunku_deger_devre_basi'nin tersi
+# olmadığından (BD'den ilk taksit geri elde edilmiyor) kaydedilmez
+tip_kaydet('aritmetik_devre_basi', _TEMEL + ('degisim',))
+cozucu_kaydet('aritmetik_devre_basi', 'bugunku_deger', _arit.bugunku_deger_devre_basi,
+              ('odeme', 'degisim', 'i', 'n'))
+cozucu_kaydet('aritmetik_devre_basi', 'gelecek_deger', _arit.gelecek_deger_devre_basi,
+              ('odeme', 'degisim', 'i', 'n'))
+
+for _tip, _devre_basi in (('aritmetik', False), ('aritmetik_devre_basi', True)):
+    cozucu_kaydet(_tip, 'i', partial(_arit.faiz_orani_hesapla_bd, devre_basi=_devre_basi),
+                  ('bugunku_deger', 'odeme', 'degisim', 'n'))
+    cozucu_kaydet(_tip, 'n', partial(_arit.sure_hesapla_bd, devre_basi=_devre_basi),
+                  ('bugunku_deger', 'odeme', 'degisim', 'i'))
+
+# Çabuklaştırılmış anüite (i ve n çözücüleri yalnızca devre sonu)
+for _tip, _devre_basi in (('cabuklas', False), ('cabuklas_devre_basi', True)):
+    tip_kaydet(_tip, _TEMEL + ('c',))
+    _bd, _gd = ((_cab.bugunku_deger_devre_basi, _cab.gelecek_deger_devre_basi) if _devre_basi
+                else (_cab.bugunku_deger_devre_sonu, _cab.gelecek_deger_devre_sonu))
+    cozucu_kaydet(_tip, 'odeme', partial(_cab.taksit_hesapla_bd, devre_basi=_devre_basi),
+                  ('bugunku_deger', 'i', 'n', 'c'))
+    cozucu_kaydet(_tip, 'bugunku_deger', _bd, ('odeme', 'i', 'n', 'c'))
+    cozucu_kaydet(_tip, 'gelecek_deger', _gd, ('odeme', 'i', 'n', 'c'))
+    cozucu_kaydet(_tip, 'c', partial(_cab.cabuklas_suresi_hesapla_bd, devre_basi=_devre_basi),
+                  ('bugunku_deger', 'odeme', 'i', 'n'))
+    if not _devre_basi:
+        cozucu_kaydet(_tip, 'i', _cab.faiz_orani_hesapla_bd, ('bugunku_deger', 'odeme', 'n', 'c'))
+        cozucu_kaydet(_tip, 'n', _cab.sure_hesapla_bd, ('bugunku_deger', 'odeme', 'i', 'c'))
+
+del _tip, _modul, _devre_basi, _bd, _gd, _odeme, _faiz
@@ -13,6 +13,12 @@ Temel Formüller:
 """
 
 import math
+from array import array
+
+from . import onbellek as _onbellek
+from ._kok import (birikim_tahmini, birikim_turevleri, kok_bul, pesin_tahmini, pesin_turevleri,
+                   sicak_tahmin, sonuclandir)
+from .tablo import AnuiteTablosu, SabitSutun
 
 
 def pesin_deger_faktoru(i, n):
@@ -21,6 +27,8 @@ def pesin_deger_faktoru(i, n):
         raise ValueError("Faiz oranı sıfırdan büyük olmalıdır.")
     if n <= 0:
         raise ValueError("Dönem sayısı sıfırdan büyük olmalıdır.")
+    if _onbellek.ETKIN:
+        return _onbellek.faktor('pesin_devre_basi', i, n)
     
     v = 1 / (1 + i)
     a_ni = (1 - v**n) / i
@@ -33,6 +41,8 @@ def gelecek_deger_faktoru(i, n):
         raise ValueError("Faiz oranı sıfırdan büyük olmalıdır.")
     if n <= 0:
         raise ValueError("Dönem sayısı sıfırdan büyük olmalıdır.")
+    if _onbellek.ETKIN:
+        return _onbellek.faktor('gelecek_devre_basi', i, n)
     
     s_ni = ((1 + i)**n - 1) / i
     return s_ni * (1 + i)
@@ -74,36 +84,32 @@ def sure_bugunku_degerden(bugunku_deger, odeme, i):
     return math.log(hedef) / math.log(v)
 
 
-def faiz_bugunku_degerden(bugunku_deger, odeme, n, tahmin=0.10, tolerans=1e-6, max_iter=100):
-    """Newton-Raphson ile faiz oranı hesaplama"""
+def faiz_bugunku_degerden(bugunku_deger, odeme, n, tahmin=None, tolerans=1e-6, max_iter=100):
+    """
+    Faiz oranı (BD'den): ä(n,i) = BD/a, analitik türevli Halley + Brent yedeği
+
+    ä(n,i) = (1+i)·a(n,i), i > 0'da n'den 1'e azalır; kök yalnızca
+    1 < BD/a < n iken vardır.
+    """
     if n <= 0:
         raise ValueError("Dönem sayısı sıfırdan büyük olmalıdır.")
     if odeme <= 0:
         raise ValueError("Ödeme tutarı sıfırdan büyük olmalıdır.")
     
     hedef = bugunku_deger / odeme
+    if not 1 < hedef < n:
+        raise ValueError("Bu bugünkü değeri veren pozitif bir faiz oranı yok.")
     
-    i = tahmin
-    for _ in range(max_iter):
-        v = 1 / (1 + i)
-        a_ni = (1 - v**n) / i
-        a_due = a_ni * (1 + i)
-        
-        f = a_due - hedef
-        
-        if abs(f) < tolerans:
-            return i
-        
-        # Türev
-        da_di = (n * v**(n+1) / (1+i) - (1 - v**n) / (i**2)) / i
-        da_due_di = da_di * (1+i) + a_ni
-        
-        i = i - f / da_due_di
-        
-        if i < 0.0001:
-            i = 0.0001
+    def fonksiyon(i):
+        f, f1, f2 = pesin_turevleri(i, n, 1)
+        return f - hedef, f1, f2
     
-    return i
+    ad = 'devre_basi_anuite.faiz_bugunku_degerden'
+    tahmin = sicak_tahmin(ad, tahmin, None)
+    if tahmin is None:
+        tahmin = pesin_tahmini(hedef, n, 1)
+    sonuc = kok_bul(fonksiyon, tahmin, tolerans, max_iter, alt_sinir=0)
+    return sonuclandir(ad, sonuc, max_iter)
 
 
 # ============================================================
@@ -141,35 +147,35 @@ def sure_gelecek_degerden(gelecek_deger, odeme, i):
     return math.log(hedef) / math.log(1 + i)
 
 
-def faiz_gelecek_degerden(gelecek_deger, odeme, n, tahmin=0.10, tolerans=1e-6, max_iter=100):
-    """Newton-Raphson ile faiz oranı hesaplama (GD'den)"""
+def faiz_gelecek_degerden(gelecek_deger, odeme, n, tahmin=None, tolerans=1e-6, max_iter=100):
+    """
+    Faiz oranı (GD'den): ln s̈(n,i) = ln(GD/a), analitik türevli Halley + Brent yedeği
+
+    s̈(n,i) = (1+i)·s(n,i), i > 0'da n'den artar; kök yalnızca GD/a > n iken vardır.
+    """
     if n <= 0:
         raise ValueError("Dönem sayısı sıfırdan büyük olmalıdır.")
     if odeme <= 0:
         raise ValueError("Ödeme tutarı sıfırdan büyük olmalıdır.")
     
     hedef = gelecek_deger / odeme
+    if not hedef > n:
+        raise ValueError("Bu gelecek değeri veren pozitif bir faiz oranı yok.")
+    ln_hedef = math.log(hedef)
     
-    i = tahmin
-    for _ in range(max_iter):
-        s_ni = ((1 + i)**n - 1) / i
-        s_due = s_ni * (1 + i)
-        
-        f = s_due - hedef
-        
-        if abs(f) < tolerans:
-            return i
-        
-        # Türev
-        ds_di = (n * (1+i)**(n-1) / i - ((1+i)**n - 1) / i**2)
-        ds_due_di = ds_di * (1+i) + s_ni
-        
-        i = i - f / ds_due_di
-        
-        if i < 0.0001:
-            i = 0.0001
+    # ln s̈ = ln(1+i) + ln s(n,i)
+    def fonksiyon(i):
+        s, s1, s2 = birikim_turevleri(i, n)
+        egim = s1 / s
+        x = 1 / (1 + i)
+        return math.log1p(i) + math.log(s) - ln_hedef, x + egim, s2 / s - egim * egim - x * x
     
-    return i
+    ad = 'devre_basi_anuite.faiz_gelecek_degerden'
+    tahmin = sicak_tahmin(ad, tahmin, None)
+    if tahmin is None:
+        tahmin = birikim_tahmini(hedef, n, 1)
+    sonuc = kok_bul(fonksiyon, tahmin, tolerans, max_iter, alt_sinir=0)
+    return sonuclandir(ad, sonuc, max_iter)
 
 
 # ============================================================
@@ -206,12 +212,12 @@ def sure_hesapla_gd(gelecek_deger, odeme, i):
     return sure_gelecek_degerden(gelecek_deger, odeme, i)
 
 
-def faiz_hesapla_bd(bugunku_deger, odeme, n, tahmin=0.10, tolerans=1e-6, max_iter=100):
+def faiz_hesapla_bd(bugunku_deger, odeme, n, tahmin=None, tolerans=1e-6, max_iter=100):
     """BD'den faiz (alternatif isim)"""
     return faiz_bugunku_degerden(bugunku_deger, odeme, n, tahmin, tolerans, max_iter)
 
 
-def faiz_hesapla_gd(gelecek_deger, odeme, n, tahmin=0.10, tolerans=1e-6, max_iter=100):
+def faiz_hesapla_gd(gelecek_deger, odeme, n, tahmin=None, tolerans=1e-6, max_iter=100):
     """GD'den faiz (alternatif isim)"""
     return faiz_gelecek_degerden(gelecek_deger, odeme, n, tahmin, tolerans, max_iter)
 
@@ -221,26 +227,104 @@ def faiz_hesapla_gd(gelecek_deger, odeme, n, tahmin=0.10, tolerans=1e-6, max_ite
 # ============================================================
 
 def anuite_tablosu_olustur(odeme, n, i):
-    """Amortisman tablosu oluşturur (Devre Başı)"""
-    bd = bugunku_deger_hesapla(odeme, n, i)
-    kalan = bd
-    tablo = []
+    """Amortisman tablosu oluşturur (Devre Başı, sütunlu AnuiteTablosu)"""
+    bugunku_deger_hesapla(odeme, n, i)
+    return _tablo(odeme, n, i, 1 / (1 + i))
+
+
+def _tablo(odeme, n, i, v):
+    """Sütunlu tablo (kontrolsüz)"""
+    # Ödeme sonrası bakiye a × a(n-k, i), dönem sonu bakiye a × ä(n-k, i):
+    # faiz = a × (1 - v^(n-k)), kalan = faiz × (1+i) / i
+    faiz = array('d', [odeme * (1 - v ** j) for j in range(n - 1, -1, -1)])
+    kalan = array('d', [f * (1 + i) / i for f in faiz])
+    odemeler = SabitSutun(odeme, n)
+    
+    return AnuiteTablosu(range(1, n + 1), odemeler, faiz, odemeler, kalan)
+
+
+def _aralik_kontrol(odeme, n, i, baslangic, bitis):
+    _donem_kontrol(odeme, n, i, baslangic)
+    if not baslangic <= bitis <= n:
+        raise ValueError("Bitiş dönemi başlangıç dönemi ile n arasında olmalıdır.")
+
+
+def kumulatif_faiz_hesapla(odeme, n, i, baslangic, bitis):
+    """baslangic..bitis dönemlerinde işleyen faiz: a × [m - v^(n-b) × ä(m, i)], m = b-a+1"""
+    _aralik_kontrol(odeme, n, i, baslangic, bitis)
+    v = 1 / (1 + i)
+    m = bitis - baslangic + 1
+    return odeme * (m - v ** (n - bitis) * (1 - v ** m) * (1 + i) / i)
+
+
+def kumulatif_anapara_hesapla(odeme, n, i, baslangic, bitis):
+    """baslangic..bitis dönemlerinin anapara payı (tablodaki gibi ödemelerin tamamı)"""
+    _aralik_kontrol(odeme, n, i, baslangic, bitis)
+    return odeme * (bitis - baslangic + 1)
+
+
+def anuite_tablosu_akisi(odeme, n, i, baslangic=1):
+    """
+    Amortisman tablosunu dönem dönem üretir (Devre Başı, sabit bellek)
     
-    for donem in range(1, n + 1):
-        # Devre başında ödeme yapılıyor
-        kalan = kalan - odeme
-        faiz = kalan * i
-        kalan = kalan + faiz
-        
-        tablo.append({
-            'donem': donem,
-            'odeme': odeme,
-            'faiz': faiz,
-            'anapara': odeme,
-            'kalan': max(0, kalan)
-        })
+    baslangic. dönemden itibaren satır sözlükleri verir; açılış bakiyesi
+    önceki satırlar tekrarlanmadan kapalı formdan (a × ä(n-k+1, i)) bulunur.
+    """
+    bugunku_deger_hesapla(odeme, n, i)
+    if baslangic < 1:
+        raise ValueError("Başlangıç dönemi 1'den küçük olamaz.")
     
-    return tablo
+    return _tablo_akisi(odeme, n, i, baslangic)
+
+
+def _tablo_akisi(odeme, n, i, baslangic):
+    v = 1 / (1 + i)
+    
+    for donem in range(baslangic, n + 1):
+        yield _donem_satiri(odeme, n, i, v, donem)
+
+
+def _donem_satiri(odeme, n, i, v, k):
+    """k. dönem satırı (kontrolsüz, kapalı form)"""
+    faiz = odeme * (1 - v ** (n - k))
+    
+    return {
+        'donem': k,
+        'odeme': odeme,
+        'faiz': faiz,
+        'anapara': odeme,
+        'kalan': faiz * (1 + i) / i
+    }
+
+
+def _donem_kontrol(odeme, n, i, k, alt_sinir=1):
+    bugunku_deger_hesapla(odeme, n, i)
+    if not alt_sinir <= k <= n:
+        raise ValueError(f"Dönem {alt_sinir} ile n arasında olmalıdır.")
+
+
+def donem_satiri_hesapla(odeme, n, i, k):
+    """k. dönemin tablo satırı (Devre Başı, tablo oluşturmadan, O(1))"""
+    _donem_kontrol(odeme, n, i, k)
+    return _donem_satiri(odeme, n, i, 1 / (1 + i), k)
+
+
+def kalan_bakiye_hesapla(odeme, n, i, k):
+    """k. dönem sonu bakiyesi: a × ä(n-k, i) (k = 0 için BD)"""
+    _donem_kontrol(odeme, n, i, k, alt_sinir=0)
+    return odeme * (1 - (1 / (1 + i)) ** (n - k)) * (1 + i) / i
+
+
+def donem_faizi_hesapla(odeme, n, i, k):
+    """k. dönemde işleyen faiz: a × (1 - v^(n-k))"""
+    _donem_kontrol(odeme, n, i, k)
+    return odeme * (1 - (1 / (1 + i)) ** (n - k))
+
+
+def donem_anaparasi_hesapla(odeme, n, i, k):
+    """k. dönemin anapara payı (tablodaki gibi dönem başı ödemenin tamamı)"""
+    _donem_kontrol(odeme, n, i, k)
+    return odeme
 
 
 def toplam_odenen_hesapla(odeme, n):
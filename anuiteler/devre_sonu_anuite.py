@@ -15,6 +15,14 @@ Burada:
 """
 
 import math
+from array import array
+from itertools import accumulate, repeat
+from operator import mul
+
+from . import onbellek as _onbellek
+from ._kok import (birikim_tahmini, birikim_turevleri, kok_bul, pesin_tahmini, pesin_turevleri,
+                   sicak_tahmin, sonuclandir)
+from .tablo import AnuiteTablosu, SabitSutun
 
 
 def pesin_deger_faktoru(i, n):
@@ -23,6 +31,8 @@ def pesin_deger_faktoru(i, n):
         raise ValueError("Faiz oranı sıfırdan büyük olmalıdır.")
     if n <= 0:
         raise ValueError("Dönem sayısı sıfırdan büyük olmalıdır.")
+    if _onbellek.ETKIN:
+        return _onbellek.faktor('pesin', i, n)
     
     v = 1 / (1 + i)
     return (1 - v**n) / i
@@ -34,10 +44,43 @@ def gelecek_deger_faktoru(i, n):
         raise ValueError("Faiz oranı sıfırdan büyük olmalıdır.")
     if n <= 0:
         raise ValueError("Dönem sayısı sıfırdan büyük olmalıdır.")
+    if _onbellek.ETKIN:
+        return _onbellek.faktor('gelecek', i, n)
     
     return ((1 + i)**n - 1) / i
 
 
+def faktor_serisi(i, n_max):
+    """
+    n = 1..n_max için a(n,i), s(n,i), ä(n,i), s̈(n,i) tek geçişte
+
+    v^n = v^(n-1)·v, a(n) = a(n-1) + v^n ve s(n) = s(n-1) + (1+i)^(n-1)
+    yinelemeleriyle O(n_max); her n için ayrı üs alma ve kontrol yapılmaz.
+
+    Returns:
+        'pesin', 'gelecek', 'pesin_devre_basi', 'gelecek_devre_basi'
+        anahtarlı sözlük; değerler array('d'), k. öğe n = k+1 içindir
+    """
+    if i <= 0:
+        raise ValueError("Faiz oranı sıfırdan büyük olmalıdır.")
+    if n_max < 1 or n_max != int(n_max):
+        raise ValueError("Dönem sayısı pozitif bir tamsayı olmalıdır.")
+    
+    n_max = int(n_max)
+    birikim = 1 + i
+    v = 1 / birikim
+    
+    pesin = array('d', accumulate(accumulate(repeat(v, n_max), mul)))
+    gelecek = array('d', accumulate(accumulate(repeat(birikim, n_max - 1), mul, initial=1.0)))
+    
+    return {
+        'pesin': pesin,
+        'gelecek': gelecek,
+        'pesin_devre_basi': array('d', map(mul, pesin, repeat(birikim))),
+        'gelecek_devre_basi': array('d', map(mul, gelecek, repeat(birikim))),
+    }
+
+
 # ============================================================
 # BUGÜNKÜ DEĞER HESAPLAMALARI (BD = a × a(n,i))
 # ============================================================
@@ -70,34 +113,33 @@ def sure_bugunku_degerden(bugunku_deger, odeme, i):
     return math.log(hedef) / math.log(v)
 
 
-def faiz_bugunku_degerden(bugunku_deger, odeme, n, tahmin=0.10, tolerans=1e-6, max_iter=100):
-    """Newton-Raphson ile faiz oranı hesaplama"""
+def faiz_bugunku_degerden(bugunku_deger, odeme, n, tahmin=None, tolerans=1e-6, max_iter=100):
+    """
+    Faiz oranı (BD'den): a(n,i) = BD/a, analitik türevli Halley + Brent yedeği
+
+    a(n,i), i > 0'da n'den 0'a azalır; kök yalnızca 0 < BD/a < n iken vardır.
+    tahmin None ise sıcak başlangıçtaki son kök veya seri tersinmesinden
+    kapalı form tahmin (pesin_tahmini) kullanılır.
+    """
     if n <= 0:
         raise ValueError("Dönem sayısı sıfırdan büyük olmalıdır.")
     if odeme <= 0:
         raise ValueError("Ödeme tutarı sıfırdan büyük olmalıdır.")
     
     hedef = bugunku_deger / odeme
+    if not 0 < hedef < n:
+        raise ValueError("Bu bugünkü değeri veren pozitif bir faiz oranı yok.")
+    
+    def fonksiyon(i):
+        f, f1, f2 = pesin_turevleri(i, n)
+        return f - hedef, f1, f2
     
-    i = tahmin
-    for _ in range(max_iter):
-        v = 1 / (1 + i)
-        a_ni = (1 - v**n) / i
-        
-        f = a_ni - hedef
-        
-        if abs(f) < tolerans:
-            return i
-        
-        # Türev: da/di
-        da_di = (n * v**(n+1) / (1+i) - (1 - v**n) / (i**2)) / i
-        
-        i = i - f / da_di
-        
-        if i < 0.0001:
-            i = 0.0001
-    
-    return i
+    ad = 'devre_sonu_anuite.faiz_bugunku_degerden'
+    tahmin = sicak_tahmin(ad, tahmin, None)
+    if tahmin is None:
+        tahmin = pesin_tahmini(hedef, n)
+    sonuc = kok_bul(fonksiyon, tahmin, tolerans, max_iter, alt_sinir=0)
+    return sonuclandir(ad, sonuc, max_iter)
 
 
 # ============================================================
@@ -131,33 +173,35 @@ def sure_gelecek_degerden(gelecek_deger, odeme, i):
     return math.log(hedef) / math.log(1 + i)
 
 
-def faiz_gelecek_degerden(gelecek_deger, odeme, n, tahmin=0.10, tolerans=1e-6, max_iter=100):
-    """Newton-Raphson ile faiz oranı hesaplama (GD'den)"""
+def faiz_gelecek_degerden(gelecek_deger, odeme, n, tahmin=None, tolerans=1e-6, max_iter=100):
+    """
+    Faiz oranı (GD'den): ln s(n,i) = ln(GD/a), analitik türevli Halley + Brent yedeği
+
+    s(n,i), i > 0'da n'den artar; kök yalnızca GD/a > n iken vardır.
+    """
     if n <= 0:
         raise ValueError("Dönem sayısı sıfırdan büyük olmalıdır.")
     if odeme <= 0:
         raise ValueError("Ödeme tutarı sıfırdan büyük olmalıdır.")
     
     hedef = gelecek_deger / odeme
+    if not hedef > n:
+        raise ValueError("Bu gelecek değeri veren pozitif bir faiz oranı yok.")
+    ln_hedef = math.log(hedef)
+    
+    # ln s(n,i) - ln hedef: s üstel büyüdüğünden logaritması Newton için
+    # neredeyse doğrusaldır
+    def fonksiyon(i):
+        s, s1, s2 = birikim_turevleri(i, n)
+        egim = s1 / s
+        return math.log(s) - ln_hedef, egim, s2 / s - egim * egim
     
-    i = tahmin
-    for _ in range(max_iter):
-        s_ni = ((1 + i)**n - 1) / i
-        
-        f = s_ni - hedef
-        
-        if abs(f) < tolerans:
-            return i
-        
-        # Türev: ds/di
-        ds_di = (n * (1+i)**(n-1) / i - ((1+i)**n - 1) / i**2)
-        
-        i = i - f / ds_di
-        
-        if i < 0.0001:
-            i = 0.0001
-    
-    return i
+    ad = 'devre_sonu_anuite.faiz_gelecek_degerden'
+    tahmin = sicak_tahmin(ad, tahmin, None)
+    if tahmin is None:
+        tahmin = birikim_tahmini(hedef, n)
+    sonuc = kok_bul(fonksiyon, tahmin, tolerans, max_iter, alt_sinir=0)
+    return sonuclandir(ad, sonuc, max_iter)
 
 
 # ============================================================
@@ -194,12 +238,12 @@ def sure_hesapla_gd(gelecek_deger, odeme, i):
     return sure_gelecek_degerden(gelecek_deger, odeme, i)
 
 
-def faiz_hesapla_bd(bugunku_deger, odeme, n, tahmin=0.10, tolerans=1e-6, max_iter=100):
+def faiz_hesapla_bd(bugunku_deger, odeme, n, tahmin=None, tolerans=1e-6, max_iter=100):
     """BD'den faiz (alternatif isim)"""
     return faiz_bugunku_degerden(bugunku_deger, odeme, n, tahmin, tolerans, max_iter)
 
 
-def faiz_hesapla_gd(gelecek_deger, odeme, n, tahmin=0.10, tolerans=1e-6, max_iter=100):
+def faiz_hesapla_gd(gelecek_deger, odeme, n, tahmin=None, tolerans=1e-6, max_iter=100):
     """GD'den faiz (alternatif isim)"""
     return faiz_gelecek_degerden(gelecek_deger, odeme, n, tahmin, tolerans, max_iter)
 
@@ -209,25 +253,105 @@ def faiz_hesapla_gd(gelecek_deger, odeme, n, tahmin=0.10, tolerans=1e-6, max_ite
 # ============================================================
 
 def anuite_tablosu_olustur(odeme, n, i):
-    """Amortisman tablosu oluşturur"""
-    bd = bugunku_deger_hesapla(odeme, n, i)
-    kalan = bd
-    tablo = []
-    
-    for donem in range(1, n + 1):
-        faiz = kalan * i
-        anapara = odeme - faiz
-        kalan = kalan - anapara
-        
-        tablo.append({
-            'donem': donem,
-            'odeme': odeme,
-            'faiz': faiz,
-            'anapara': anapara,
-            'kalan': max(0, kalan)
-        })
-    
-    return tablo
+    """Amortisman tablosu oluşturur (sütunlu AnuiteTablosu)"""
+    bugunku_deger_hesapla(odeme, n, i)
+    return _tablo(odeme, n, i, 1 / (1 + i))
+
+
+def _tablo(odeme, n, i, v):
+    """Sütunlu tablo (kontrolsüz)"""
+    # k. dönem başındaki bakiye = a × a(n-k+1, i) olduğundan:
+    # anapara = a × v^(n-k+1), faiz = a - anapara, kalan = a × (1 - v^(n-k)) / i
+    iskonto = [v ** j for j in range(n, -1, -1)]
+    
+    anapara = array('d', [odeme * v_j for v_j in iskonto[:-1]])
+    faiz = array('d', [odeme - a for a in anapara])
+    kalan = array('d', [odeme * (1 - v_j) / i for v_j in iskonto[1:]])
+    
+    return AnuiteTablosu(range(1, n + 1), SabitSutun(odeme, n), faiz, anapara, kalan)
+
+
+def _aralik_kontrol(odeme, n, i, baslangic, bitis):
+    _donem_kontrol(odeme, n, i, baslangic)
+    if not baslangic <= bitis <= n:
+        raise ValueError("Bitiş dönemi başlangıç dönemi ile n arasında olmalıdır.")
+
+
+def kumulatif_anapara_hesapla(odeme, n, i, baslangic, bitis):
+    """baslangic..bitis dönemlerinde ödenen anapara: a × v^(n-b) × a(b-a+1, i)"""
+    _aralik_kontrol(odeme, n, i, baslangic, bitis)
+    v = 1 / (1 + i)
+    return odeme * v ** (n - bitis) * (1 - v ** (bitis - baslangic + 1)) / i
+
+
+def kumulatif_faiz_hesapla(odeme, n, i, baslangic, bitis):
+    """baslangic..bitis dönemlerinde ödenen faiz (O(1), tablo oluşturmadan)"""
+    anapara = kumulatif_anapara_hesapla(odeme, n, i, baslangic, bitis)
+    return odeme * (bitis - baslangic + 1) - anapara
+
+
+def anuite_tablosu_akisi(odeme, n, i, baslangic=1):
+    """
+    Amortisman tablosunu dönem dönem üretir (sabit bellek)
+    
+    baslangic. dönemden itibaren satır sözlükleri verir; açılış bakiyesi
+    önceki satırlar tekrarlanmadan kapalı formdan (a × a(n-k+1, i)) bulunur.
+    """
+    bugunku_deger_hesapla(odeme, n, i)
+    if baslangic < 1:
+        raise ValueError("Başlangıç dönemi 1'den küçük olamaz.")
+    
+    return _tablo_akisi(odeme, n, i, baslangic)
+
+
+def _tablo_akisi(odeme, n, i, baslangic):
+    v = 1 / (1 + i)
+    
+    for donem in range(baslangic, n + 1):
+        yield _donem_satiri(odeme, n, i, v, donem)
+
+
+def _donem_satiri(odeme, n, i, v, k):
+    """k. dönem satırı (kontrolsüz, kapalı form)"""
+    anapara = odeme * v ** (n - k + 1)
+    
+    return {
+        'donem': k,
+        'odeme': odeme,
+        'faiz': odeme - anapara,
+        'anapara': anapara,
+        'kalan': odeme * (1 - v ** (n - k)) / i
+    }
+
+
+def _donem_kontrol(odeme, n, i, k, alt_sinir=1):
+    bugunku_deger_hesapla(odeme, n, i)
+    if not alt_sinir <= k <= n:
+        raise ValueError(f"Dönem {alt_sinir} ile n arasında olmalıdır.")
+
+
+def donem_satiri_hesapla(odeme, n, i, k):
+    """k. dönemin tablo satırı (tablo oluşturmadan, O(1))"""
+    _donem_kontrol(odeme, n, i, k)
+    return _donem_satiri(odeme, n, i, 1 / (1 + i), k)
+
+
+def kalan_bakiye_hesapla(odeme, n, i, k):
+    """k. ödemeden sonra kalan bakiye: a × a(n-k, i) (k = 0 için BD)"""
+    _donem_kontrol(odeme, n, i, k, alt_sinir=0)
+    return odeme * (1 - (1 / (1 + i)) ** (n - k)) / i
+
+
+def donem_faizi_hesapla(odeme, n, i, k):
+    """k. ödemenin faiz payı: a × (1 - v^(n-k+1))"""
+    _donem_kontrol(odeme, n, i, k)
+    return odeme * (1 - (1 / (1 + i)) ** (n - k + 1))
+
+
+def donem_anaparasi_hesapla(odeme, n, i, k):
+    """k. ödemenin anapara payı: a × v^(n-k+1)"""
+    _donem_kontrol(odeme, n, i, k)
+    return odeme * (1 / (1 + i)) ** (n - k + 1)
 
 
 def toplam_odenen_hesapla(odeme, n):
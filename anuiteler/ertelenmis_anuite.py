@@ -23,6 +23,9 @@ ERTELENMİŞ (GECİKTİRİLMİŞ) ANÜİTE HESAPLAMALARI
 
 import math
 
+from . import onbellek as _onbellek
+from ._kok import kok_bul, pesin_tahmini, pesin_turevleri, sicak_tahmin, sonuclandir
+
 
 # ============================================================================
 # DEVRE SONU ÖDEMELİ ERTELENMİŞ ANÜİTE
@@ -38,8 +41,8 @@ def bugunku_deger_devre_sonu(taksit, i, n, m):
     if taksit < 0:
         raise ValueError("Taksit tutarı negatif olamaz.")
     
-    pay = (1 + i) ** n - 1
-    payda = ((1 + i) ** (n + m)) * i
+    pay = _onbellek.birikim(i, n) - 1
+    payda = _onbellek.birikim(i, n + m) * i
     
     return taksit * (pay / payda)
 
@@ -51,7 +54,7 @@ def gelecek_deger_devre_sonu(taksit, i, n, m):
         raise ValueError("Taksit sayısı sıfırdan büyük olmalıdır.")
     
     # Erteleme GD'yi etkilemez, sadece BD'yi etkiler
-    return taksit * ((1 + i) ** n - 1) / i
+    return taksit * (_onbellek.birikim(i, n) - 1) / i
 
 
 def taksit_hesapla_bd_devre_sonu(bugunku_deger, i, n, m):
@@ -64,8 +67,8 @@ def taksit_hesapla_bd_devre_sonu(bugunku_deger, i, n, m):
     if bugunku_deger < 0:
         raise ValueError("Bugünkü değer negatif olamaz.")
     
-    payda = (1 + i) ** n - 1
-    pay = ((1 + i) ** (n + m)) * i
+    payda = _onbellek.birikim(i, n) - 1
+    pay = _onbellek.birikim(i, n + m) * i
     
     return bugunku_deger * (pay / payda)
 
@@ -78,7 +81,7 @@ def taksit_hesapla_gd_devre_sonu(gelecek_deger, i, n):
     if gelecek_deger < 0:
         raise ValueError("Gelecek değer negatif olamaz.")
     
-    return gelecek_deger * i / ((1 + i) ** n - 1)
+    return gelecek_deger * i / (_onbellek.birikim(i, n) - 1)
 
 
 # ============================================================================
@@ -111,7 +114,7 @@ def gelecek_deger_devre_basi(taksit, i, n):
     if n <= 0:
         raise ValueError("Taksit sayısı sıfırdan büyük olmalıdır.")
     
-    return taksit * (1 + i) * ((1 + i) ** n - 1) / i
+    return taksit * (1 + i) * (_onbellek.birikim(i, n) - 1) / i
 
 
 def taksit_hesapla_bd_devre_basi(bugunku_deger, i, n, m):
@@ -144,7 +147,7 @@ def bugunku_deger_cabuklas_ertelenmis(taksit, i, n, m, c):
         raise ValueError("Çabuklaştırma süresi negatif olamaz.")
     
     bd_ertekenmis = bugunku_deger_devre_sonu(taksit, i, n, m)
-    return bd_ertekenmis * ((1 + i) ** c)
+    return bd_ertekenmis * _onbellek.birikim(i, c)
 
 
 # ============================================================================
@@ -164,7 +167,7 @@ def gecikme_suresi_hesapla_bd(bugunku_deger, taksit, i, n, devre_basi=False):
     if devre_basi:
         bugunku_deger = bugunku_deger / (1 + i)
     
-    pay = taksit * ((1 + i) ** n - 1)
+    pay = taksit * (_onbellek.birikim(i, n) - 1)
     payda = bugunku_deger * i
     
     if payda <= 0:
@@ -180,7 +183,12 @@ def gecikme_suresi_hesapla_bd(bugunku_deger, taksit, i, n, devre_basi=False):
 
 
 def faiz_orani_hesapla_bd(bugunku_deger, taksit, n, m, devre_basi=False,
-                          tahmin=0.1, tolerans=1e-6, maks_iterasyon=100):
+                          tahmin=None, tolerans=1e-6, maks_iterasyon=100):
+    """
+    Analitik türevli Halley + Brent yedeği ile faiz oranı (BD'den)
+
+    BD/a, i > 0'da n'den azalır; kök yalnızca BD/a < n iken vardır.
+    """
     if taksit <= 0:
         raise ValueError("Taksit tutarı sıfırdan büyük olmalıdır.")
     if n <= 0:
@@ -190,80 +198,49 @@ def faiz_orani_hesapla_bd(bugunku_deger, taksit, n, m, devre_basi=False,
     if bugunku_deger <= 0:
         raise ValueError("Bugünkü değer sıfırdan büyük olmalıdır.")
     
-    i = tahmin
+    hedef = bugunku_deger / taksit
+    if hedef >= n:
+        raise ValueError("Bu bugünkü değeri veren pozitif bir faiz oranı yok.")
     
-    for _ in range(maks_iterasyon):
-        if devre_basi:
-            bd_hesaplanan = bugunku_deger_devre_basi(taksit, i, n, m)
-        else:
-            bd_hesaplanan = bugunku_deger_devre_sonu(taksit, i, n, m)
-        
-        f = bd_hesaplanan - bugunku_deger
-        
-        # Sayısal türev
-        delta = 1e-8
-        if devre_basi:
-            bd_delta = bugunku_deger_devre_basi(taksit, i + delta, n, m)
-        else:
-            bd_delta = bugunku_deger_devre_sonu(taksit, i + delta, n, m)
-        
-        f_turev = (bd_delta - bd_hesaplanan) / delta
-        
-        if abs(f_turev) < 1e-10:
-            raise ValueError("Türev sıfıra çok yakın.")
-        
-        i_yeni = i - f / f_turev
-        
-        if i_yeni <= 0:
-            i_yeni = 0.01
-        
-        if abs(i_yeni - i) < tolerans:
-            return i_yeni
-        
-        i = i_yeni
+    us = (1 if devre_basi else 0) - m
     
-    raise ValueError(f"Yakınsama sağlanamadı ({maks_iterasyon} iterasyonda).")
+    def fonksiyon(i):
+        f, f1, f2 = pesin_turevleri(i, n, us)
+        return f - hedef, f1, f2
+    
+    ad = 'ertelenmis_anuite.faiz_orani_hesapla_bd'
+    tahmin = sicak_tahmin(ad, tahmin, None)
+    if tahmin is None:
+        tahmin = pesin_tahmini(hedef, n, us)
+    sonuc = kok_bul(fonksiyon, tahmin, tolerans, maks_iterasyon, alt_sinir=0)
+    return sonuclandir(ad, sonuc, maks_iterasyon)
 
 
 def sure_hesapla_bd(bugunku_deger, taksit, i, m, devre_basi=False,
                     tahmin=5, tolerans=1e-6, maks_iterasyon=100):
-    n = tahmin
+    """
+    Taksit sayısı hesaplama (BD'den), kapalı form
+
+    v^n = 1 - BD·i·(1+i)^m / a (devre başında BD önce (1+i)'ye bölünür);
+    tahmin, tolerans ve maks_iterasyon geriye uyumluluk için tutulur.
+    """
+    if bugunku_deger <= 0:
+        raise ValueError("Bugünkü değer sıfırdan büyük olmalıdır.")
+    if taksit <= 0:
+        raise ValueError("Taksit tutarı sıfırdan büyük olmalıdır.")
+    if i <= 0:
+        raise ValueError("Faiz oranı sıfırdan büyük olmalıdır.")
+    if m < 0:
+        raise ValueError("Gecikme süresi negatif olamaz.")
+    
+    if devre_basi:
+        bugunku_deger = bugunku_deger / (1 + i)
     
-    for _ in range(maks_iterasyon):
-        n_int = int(max(1, n))
-        
-        if devre_basi:
-            bd_hesaplanan = bugunku_deger_devre_basi(taksit, i, n_int, m)
-        else:
-            bd_hesaplanan = bugunku_deger_devre_sonu(taksit, i, n_int, m)
-        
-        f = bd_hesaplanan - bugunku_deger
-        
-        # Sayısal türev
-        delta = 0.1
-        n_delta = int(max(1, n + delta))
-        
-        if devre_basi:
-            bd_delta = bugunku_deger_devre_basi(taksit, i, n_delta, m)
-        else:
-            bd_delta = bugunku_deger_devre_sonu(taksit, i, n_delta, m)
-        
-        f_turev = (bd_delta - bd_hesaplanan) / delta
-        
-        if abs(f_turev) < 1e-10:
-            raise ValueError("Türev sıfıra çok yakın.")
-        
-        n_yeni = n - f / f_turev
-        
-        if n_yeni < 1:
-            n_yeni = 1
-        
-        if abs(n_yeni - n) < tolerans:
-            return n_yeni
-        
-        n = n_yeni
+    oran = bugunku_deger * i * _onbellek.birikim(i, m) / taksit
+    if oran >= 1:
+        raise ValueError("Bu bugünkü değer hiçbir sürede elde edilemez.")
     
-    raise ValueError(f"Yakınsama sağlanamadı ({maks_iterasyon} iterasyonda).")
+    return -math.log1p(-oran) / math.log1p(i)
 
 
 # ============================================================================
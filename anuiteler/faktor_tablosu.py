@@ -0,0 +1,296 @@
+"""
+ÖNCEDEN HESAPLANMIŞ FAKTÖR TABLOLARI (bellek eşlemeli dosya)
+
+Sabit bir faiz ızgarası (ör. 1 baz puan adım) ve n = 1..N için a(n,i),
+s(n,i), v^m (erteleme) ve (1+i) (devre başı çarpanı) değerlerini tek bir
+ikili dosyaya yazar. `FaktorTablosu` dosyayı salt okunur `mmap` ile açar:
+aynı dosyayı açan süreçler işletim sisteminin sayfa önbelleğindeki tek kopyayı
+paylaşır, açılışta veri kopyalanmaz veya çözümlenmez.
+
+Arama O(1)'dir: ızgara indeksi (i - baslangic) / adim'dan, değer sabit
+ofsetten okunur. `interpolasyon=True` ile ızgara dışındaki oranlar komşu iki
+ızgara değeri arasında doğrusal olarak bulunur.
+
+Dosya düzeni (little-endian):
+    0   başlık (64 bayt): sihirli sözcük, sürüm, oran sayısı R, n_max N,
+        baslangic, adim
+    64  (1+i)            R adet float64
+        a(n,i)           R × (N+1) float64 (n = 0..N)
+        s(n,i)           R × (N+1) float64
+        v^m              R × (N+1) float64 (m = 0..N)
+
+Kullanım:
+    python -m anuiteler.faktor_tablosu faktorler.bin --bitis 0.25 --n-max 480
+
+    tablo = FaktorTablosu('faktorler.bin')
+    tablo.pesin_deger_faktoru(0.0125, 360)
+    tablo.pesin_deger_faktoru(0.01234, 360, devre_basi=True, m=6, interpolasyon=True)
+"""
+
+import argparse
+import math
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+_SIHIRLI = b'ANUITBL\x00'
+_SURUM = 1
+_BASLIK = struct.Struct('<8sIIIdd')
+_BASLIK_BOYUTU = 64
+_TABLO_SAYISI = 3
+_BOLUMLER = ('carpan', 'pesin', 'gelecek', 'iskonto')
+
+
+# ============================================================
+# TABLO OLUŞTURMA
+# ============================================================
+
+def _izgara_orani(baslangic, adim, k):
+    """k. ızgara oranı; ondalık girilen oranlarla bire bir eşleşsin diye yuvarlanır"""
+    return round(baslangic + k * adim, 12)
+
+
+def faktor_tablosu_olustur(dosya, baslangic=0.0001, bitis=0.25, adim=0.0001, n_max=480):
+    """
+    Faktör tablosu dosyasını oluşturur
+
+    Değerler devre_sonu_anuite.pesin_deger_faktoru / gelecek_deger_faktoru ile
+    aynı formüllerle hesaplanır (ızgara oranlarında sonuçlar bire bir aynıdır).
+    Dosya önce geçici bir ada yazılıp yerine taşınır; dosyayı açık tutan
+    süreçler eski kopyayı görmeye devam eder.
+
+    Args:
+        dosya: Yazılacak dosya yolu
+        baslangic: İlk ızgara oranı (> 0)
+        bitis: Son ızgara oranı (dahil)
+        adim: Izgara adımı (ör. 0.0001 = 1 baz puan)
+        n_max: En büyük dönem sayısı
+
+    Returns:
+        Yazılan bayt sayısı
+    """
+    if baslangic <= 0:
+        raise ValueError("Başlangıç faiz oranı sıfırdan büyük olmalıdır.")
+    if adim <= 0:
+        raise ValueError("Izgara adımı sıfırdan büyük olmalıdır.")
+    if bitis < baslangic:
+        raise ValueError("Bitiş oranı başlangıç oranından küçük olamaz.")
+    if n_max < 1 or n_max != int(n_max):
+        raise ValueError("n_max pozitif bir tamsayı olmalıdır.")
+
+    n_max = int(n_max)
+    oran_sayisi = int(round((bitis - baslangic) / adim)) + 1
+    oranlar = [_izgara_orani(baslangic, adim, k) for k in range(oran_sayisi)]
+    donemler = range(n_max + 1)
+
+    gecici = f"{dosya}.{os.getpid()}.tmp"
+    with open(gecici, 'wb') as cikti:
+        cikti.write(_BASLIK.pack(_SIHIRLI, _SURUM, oran_sayisi, n_max, baslangic, adim)
+                    .ljust(_BASLIK_BOYUTU, b'\x00'))
+        _yaz(cikti, array('d', [1 + i for i in oranlar]))
+
+        for i in oranlar:
+            v = 1 / (1 + i)
+            _yaz(cikti, array('d', [(1 - v**n) / i for n in donemler]))
+        for i in oranlar:
+            _yaz(cikti, array('d', [((1 + i)**n - 1) / i for n in donemler]))
+        for i in oranlar:
+            v = 1 / (1 + i)
+            _yaz(cikti, array('d', [v**m for m in donemler]))
+
+        boyut = cikti.tell()
+
+    os.replace(gecici, dosya)
+    return boyut
+
+
+def _yaz(cikti, satir):
+    """float64 satırını little-endian yazar"""
+    if sys.byteorder != 'little':
+        satir.byteswap()
+    satir.tofile(cikti)
+
+
+# ============================================================
+# BELLEK EŞLEMELİ TABLO
+# ============================================================
+
+class FaktorTablosu:
+    """Bellek eşlemeli, salt okunur faktör tablosu"""
+
+    __slots__ = ('dosya', 'oran_sayisi', 'n_max', 'baslangic', 'adim',
+                 '_mmap', '_veri', '_sutun', '_bolumler', '_tolerans')
+
+    def __init__(self, dosya):
+        self.dosya = os.fspath(dosya)
+
+        with open(self.dosya, 'rb') as girdi:
+            self._mmap = mmap.mmap(girdi.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mmap) < _BASLIK_BOYUTU:
+            self._mmap.close()
+            raise ValueError("Geçerli bir faktör tablosu dosyası değil.")
+
+        sihirli, surum, oran_sayisi, n_max, baslangic, adim = _BASLIK.unpack_from(self._mmap)
+        if sihirli != _SIHIRLI or surum != _SURUM:
+            self._mmap.close()
+            raise ValueError("Geçerli bir faktör tablosu dosyası değil.")
+
+        sutun = n_max + 1
+        beklenen = _BASLIK_BOYUTU + 8 * oran_sayisi * (1 + _TABLO_SAYISI * sutun)
+        if len(self._mmap) != beklenen:
+            self._mmap.close()
+            raise ValueError("Faktör tablosu dosyası eksik veya bozuk.")
+
+        self.oran_sayisi = oran_sayisi
+        self.n_max = n_max
+        self.baslangic = baslangic
+        self.adim = adim
+        self._sutun = sutun
+        # Izgara eşleşmesi için 1e-12'lik oran toleransı, indeks biriminde
+        self._tolerans = 1e-12 / adim
+        # (1+i), a(n,i), s(n,i), v^m bölümlerinin float64 ofsetleri
+        self._bolumler = (0,) + tuple(oran_sayisi * (1 + k * sutun) for k in range(_TABLO_SAYISI))
+
+        if sys.byteorder == 'little':
+            self._veri = memoryview(self._mmap)[_BASLIK_BOYUTU:].cast('d')
+        else:
+            # Big-endian makinelerde tek seferlik kopya
+            self._veri = array('d', self._mmap[_BASLIK_BOYUTU:])
+            self._veri.byteswap()
+
+    def _konum(self, i, interpolasyon):
+        """Izgara indeksi k ve k+1 komşusunun ağırlığı"""
+        t = (i - self.baslangic) / self.adim
+        k = round(t)
+
+        if 0 <= k < self.oran_sayisi:
+            if abs(t - k) <= self._tolerans:
+                return k, 0.0
+            if not interpolasyon:
+                raise ValueError("Faiz oranı tablo ızgarasında değil "
+                                 "(interpolasyon=True ile ara değer alınabilir).")
+
+        k = math.floor(t)
+        if not (interpolasyon and 0 <= k < self.oran_sayisi - 1):
+            raise ValueError("Faiz oranı tablo aralığı dışında.")
+        return k, t - k
+
+    def _donem(self, n, alt=1):
+        """n'yi [alt, n_max] aralığında tamsayıya çevirir"""
+        if not alt <= n <= self.n_max or n != int(n):
+            raise ValueError(f"Dönem sayısı {alt} ile {self.n_max} arasında "
+                             "bir tamsayı olmalıdır.")
+        return int(n)
+
+    def _deger(self, bolum, k, n, devre_basi, m):
+        """k. ızgara oranında değer, devre başı ve erteleme çarpanlarıyla"""
+        veri = self._veri
+        sonuc = veri[bolum + k * self._sutun + n]
+        if devre_basi:
+            sonuc *= veri[self._bolumler[0] + k]
+        if m:
+            sonuc *= veri[self._bolumler[3] + k * self._sutun + m]
+        return sonuc
+
+    def _oku(self, bolum, i, n, devre_basi, m, interpolasyon):
+        """Izgarada (gerekirse iki komşu arasında doğrusal) değer"""
+        k, agirlik = self._konum(i, interpolasyon)
+        if not (agirlik or devre_basi or m):
+            return self._veri[bolum + k * self._sutun + n]
+
+        sonuc = self._deger(bolum, k, n, devre_basi, m)
+        if agirlik:
+            sonuc += agirlik * (self._deger(bolum, k + 1, n, devre_basi, m) - sonuc)
+        return sonuc
+
+    def pesin_deger_faktoru(self, i, n, devre_basi=False, m=0, interpolasyon=False):
+        """a(n,i) (devre başında ä(n,i)); m > 0 ise v^m ile ertelenmiş"""
+        n = self._donem(n)
+        m = self._donem(m, alt=0)
+        return self._oku(self._bolumler[1], i, n, devre_basi, m, interpolasyon)
+
+    def gelecek_deger_faktoru(self, i, n, devre_basi=False, interpolasyon=False):
+        """s(n,i) (devre başında s̈(n,i))"""
+        n = self._donem(n)
+        return self._oku(self._bolumler[2], i, n, devre_basi, 0, interpolasyon)
+
+    def erteleme_faktoru(self, i, m, interpolasyon=False):
+        """v^m: m dönem ertelemenin iskonto çarpanı"""
+        m = self._donem(m, alt=0)
+        return self._oku(self._bolumler[3], i, m, False, 0, interpolasyon)
+
+    def devre_basi_carpani(self, i, interpolasyon=False):
+        """(1+i): devre sonu faktöründen devre başına geçiş çarpanı"""
+        k, agirlik = self._konum(i, interpolasyon)
+        veri, carpan = self._veri, self._bolumler[0]
+        return veri[carpan + k] + agirlik * (veri[carpan + k + 1] - veri[carpan + k]) \
+            if agirlik else veri[carpan + k]
+
+    def bolum(self, ad):
+        """
+        Bir bölümün kopyasız, düz float64 görünümü
+
+        Args:
+            ad: 'carpan' ((1+i), R öğe), 'pesin', 'gelecek' veya 'iskonto'
+                (satır satır R × (n_max+1) öğe)
+
+        Returns:
+            memoryview (big-endian makinelerde dizi dilimi)
+        """
+        try:
+            k = _BOLUMLER.index(ad)
+        except ValueError:
+            raise ValueError(f"Bilinmeyen tablo bölümü: {ad}") from None
+        uzunluk = self.oran_sayisi if k == 0 else self.oran_sayisi * self._sutun
+        return self._veri[self._bolumler[k]:self._bolumler[k] + uzunluk]
+
+    def kapat(self):
+        """Bellek eşlemesini kapatır"""
+        if isinstance(self._veri, memoryview):
+            self._veri.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *hata):
+        self.kapat()
+
+    def __reduce__(self):
+        # Süreçlere veri değil dosya yolu gönderilir; alıcı aynı dosyayı eşler
+        return FaktorTablosu, (self.dosya,)
+
+    def __repr__(self):
+        bitis = _izgara_orani(self.baslangic, self.adim, self.oran_sayisi - 1)
+        return (f"FaktorTablosu({self.dosya!r}, oranlar={self.baslangic}..{bitis}, "
+                f"adim={self.adim}, n_max={self.n_max})")
+
+
+# ============================================================
+# KOMUT SATIRI
+# ============================================================
+
+def main(argv=None):
+    ayristirici = argparse.ArgumentParser(description="anüite faktör tablosu dosyası oluşturur")
+    ayristirici.add_argument('dosya', help="yazılacak dosya")
+    ayristirici.add_argument('--baslangic', type=float, default=0.0001,
+                             help="ilk ızgara oranı (varsayılan: 0.0001)")
+    ayristirici.add_argument('--bitis', type=float, default=0.25,
+                             help="son ızgara oranı, dahil (varsayılan: 0.25)")
+    ayristirici.add_argument('--adim', type=float, default=0.0001,
+                             help="ızgara adımı (varsayılan: 0.0001 = 1 baz puan)")
+    ayristirici.add_argument('--n-max', type=int, default=480,
+                             help="en büyük dönem sayısı (varsayılan: 480)")
+    secenekler = ayristirici.parse_args(argv)
+
+    boyut = faktor_tablosu_olustur(secenekler.dosya, secenekler.baslangic, secenekler.bitis,
+                                   secenekler.adim, secenekler.n_max)
+    print(f"{secenekler.dosya}: {boyut / 2**20:.1f} MiB")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -10,6 +10,11 @@ Geometrik Dizi Formülleri:
 
 import math
 
+from . import izleme as _izleme
+from . import onbellek as _onbellek
+from ._kok import (birikim_tahmini, birikim_turevleri, kok_bul, sicak_tahmin, sonuclandir,
+                   tamsayi_kok)
+
 
 def bugunku_deger_devre_sonu(ilk_taksit, i, r, n):
     if n <= 0:
@@ -19,16 +24,17 @@ def bugunku_deger_devre_sonu(ilk_taksit, i, r, n):
     
     # i = r özel durumu
     if abs(i - r) < 1e-10:
-        return n * ilk_taksit * ((1 + i) ** (n - 1))
+        return n * ilk_taksit * _onbellek.birikim(i, n - 1)
     
     # Genel durum: i ≠ r
     if i <= -1:
         raise ValueError("Faiz oranı -1'den büyük olmalıdır.")
     
-    pay = (1 + i) ** n - (1 + r) ** n
-    payda = ((1 + i) ** n) * (i - r)
+    birikim = _onbellek.birikim(i, n)
+    pay = birikim - _onbellek.birikim(r, n)
+    payda = birikim * (i - r)
     
-    return ilk_taksit * ((1 + i) ** n) * (pay / payda)
+    return ilk_taksit * birikim * (pay / payda)
 
 
 def gelecek_deger_devre_sonu(ilk_taksit, i, r, n):
@@ -45,7 +51,7 @@ def gelecek_deger_devre_sonu(ilk_taksit, i, r, n):
     if i <= -1:
         raise ValueError("Faiz oranı -1'den büyük olmalıdır.")
     
-    pay = (1 + i) ** n - (1 + r) ** n
+    pay = _onbellek.birikim(i, n) - _onbellek.birikim(r, n)
     payda = i - r
     
     return ilk_taksit * (pay / payda)
@@ -72,11 +78,12 @@ def ilk_taksit_hesapla_bd(bugunku_deger, i, r, n, devre_basi=False):
     
     # i = r özel durumu
     if abs(i - r) < 1e-10:
-        return bugunku_deger / (n * ((1 + i) ** (n - 1)))
+        return bugunku_deger / (n * _onbellek.birikim(i, n - 1))
     
     # Genel durum
-    pay = ((1 + i) ** n) * (i - r)
-    payda = ((1 + i) ** n) * (((1 + i) ** n - (1 + r) ** n))
+    birikim = _onbellek.birikim(i, n)
+    pay = birikim * (i - r)
+    payda = birikim * (birikim - _onbellek.birikim(r, n))
     
     return bugunku_deger * (pay / payda)
 
@@ -95,58 +102,121 @@ def ilk_taksit_hesapla_gd(gelecek_deger, i, r, n, devre_basi=False):
         return gelecek_deger / n
     
     # Genel durum
-    payda = (1 + i) ** n - (1 + r) ** n
+    payda = _onbellek.birikim(i, n) - _onbellek.birikim(r, n)
     pay = i - r
     
     return gelecek_deger * pay / payda
 
 
-def faiz_orani_hesapla_bd(bugunku_deger, ilk_taksit, r, n, tahmin=0.1, tolerans=1e-6, maks_iterasyon=100):
-    i = tahmin
-    
-    for _ in range(maks_iterasyon):
-        # i = r kontrolü
-        if abs(i - r) < 1e-10:
-            i = r + 0.01  # r'den uzaklaştır
-        
-        bd_hesaplanan = bugunku_deger_devre_sonu(ilk_taksit, i, r, n)
-        f = bd_hesaplanan - bugunku_deger
-        
-        # Sayısal türev
-        delta = 1e-8
-        bd_delta = bugunku_deger_devre_sonu(ilk_taksit, i + delta, r, n)
-        f_turev = (bd_delta - bd_hesaplanan) / delta
-        
-        i_yeni = i - f / f_turev
-        
-        if abs(i_yeni - i) < tolerans:
-            return i_yeni
-        
-        i = i_yeni
-    
-    raise ValueError(f"Yakınsama sağlanamadı ({maks_iterasyon} iterasyonda).")
+def _bd_turevleri(ilk_taksit, i, r, n):
+    """
+    Devre sonu BD(i), BD'(i), BD''(i) tek geçişte
+
+    BD = a × [(1+i)^n - (1+r)^n] / (i-r) = a.(1+r)^(n-1) × s(n,t),
+    t = (i-r)/(1+r); i = r civarında sadeleşme kaybı olmaz.
+    """
+    x = 1 + r
+    s, s1, s2 = birikim_turevleri((i - r) / x, n)
+    carpan = ilk_taksit * x ** (n - 1)
+    
+    return carpan * s, carpan * s1 / x, carpan * s2 / (x * x)
+
+
+def _faiz_coz(hedef, r, n, tahmin, tolerans, maks_iterasyon):
+    """BD/a = hedef için güvenli Halley çözümü (guvenli_kok sonuç sözlüğü)"""
+    def fonksiyon(i):
+        f, f1, f2 = _bd_turevleri(1.0, i, r, n)
+        return f - hedef, f1, f2
+    
+    return kok_bul(fonksiyon, tahmin, tolerans, maks_iterasyon, alt_sinir=-1)
+
+
+def faiz_orani_hesapla_bd(bugunku_deger, ilk_taksit, r, n, tahmin=None, tolerans=1e-6, maks_iterasyon=100):
+    """Analitik türevli Halley/Newton + ikiye bölme ile faiz oranı (devre sonu BD'den)"""
+    if bugunku_deger <= 0:
+        raise ValueError("Bugünkü değer sıfırdan büyük olmalıdır.")
+    if ilk_taksit <= 0:
+        raise ValueError("İlk taksit sıfırdan büyük olmalıdır.")
+    if n <= 1:
+        raise ValueError("Faiz oranı için dönem sayısı 1'den büyük olmalıdır.")
+    ad = 'geometrik_anuite.faiz_orani_hesapla_bd'
+    tahmin = sicak_tahmin(ad, tahmin, None)
+    if r <= -1 or (tahmin is not None and tahmin <= -1):
+        raise ValueError("Artış oranı ve tahmin -1'den büyük olmalıdır.")
+    
+    # BD, i'de artandır ve i → -1 iken a.(1+r)^(n-1)'e iner
+    hedef = bugunku_deger / ilk_taksit
+    if hedef <= (1 + r) ** (n - 1):
+        raise ValueError("Bu bugünkü değeri veren bir faiz oranı yok (i > -1).")
+    
+    if tahmin is None:
+        # BD/a = (1+r)^(n-1) s(n,t), t = (i-r)/(1+r); tahmin yoksa (None)
+        # kok_bul alt sınırdan aralık arar
+        x = 1 + r
+        t = birikim_tahmini(hedef / x ** (n - 1), n, alt_sinir=-1)
+        if t is not None:
+            tahmin = r + x * t
+    
+    sonuc = _faiz_coz(hedef, r, n, tahmin, tolerans, maks_iterasyon)
+    return sonuclandir(ad, sonuc, maks_iterasyon)
+
+
+def _ustel(n, ln_x):
+    """(1+x)^n = exp(n·ln(1+x)); taşmada inf"""
+    us = n * ln_x
+    return math.exp(us) if us < 700 else math.inf
+
+
+def _gd_sure_turevleri(ilk_taksit, i, r, n):
+    """Devre sonu GD(n), dGD/dn, d²GD/dn² (i ≠ r, gerçel n)"""
+    ln_x, ln_y = math.log1p(i), math.log1p(r)
+    x_n, y_n = _ustel(n, ln_x), _ustel(n, ln_y)
+    carpan = ilk_taksit / (i - r)
+    
+    return (carpan * (x_n - y_n),
+            carpan * (x_n * ln_x - y_n * ln_y),
+            carpan * (x_n * ln_x * ln_x - y_n * ln_y * ln_y))
 
 
 def sure_hesapla_gd(gelecek_deger, ilk_taksit, i, r, tahmin=5, tolerans=1e-6, maks_iterasyon=100):
-    n = tahmin
-    
-    for _ in range(maks_iterasyon):
-        gd_hesaplanan = gelecek_deger_devre_sonu(ilk_taksit, i, r, int(n))
-        f = gd_hesaplanan - gelecek_deger
-        
-        # Sayısal türev
-        delta = 0.1
-        gd_delta = gelecek_deger_devre_sonu(ilk_taksit, i, r, int(n + delta))
-        f_turev = (gd_delta - gd_hesaplanan) / delta
-        
-        n_yeni = n - f / f_turev
-        
-        if n_yeni < 1:
-            n_yeni = 1
-        
-        if abs(n_yeni - n) < tolerans:
-            return n_yeni
-        
-        n = n_yeni
-    
-    raise ValueError(f"Yakınsama sağlanamadı ({maks_iterasyon} iterasyonda).")
\ No newline at end of file
+    """
+    Süre hesaplama (devre sonu GD'den)
+
+    i = r, r = 0 veya i = 0 ise kapalı form; aksi halde GD(n) n'de artan
+    olduğundan tamsayı üstel/ikili arama ve gerekirse [k, k+1] içinde Newton.
+    """
+    if gelecek_deger <= 0:
+        raise ValueError("Gelecek değer sıfırdan büyük olmalıdır.")
+    if ilk_taksit <= 0:
+        raise ValueError("İlk taksit sıfırdan büyük olmalıdır.")
+    if i <= -1 or r <= -1:
+        raise ValueError("Faiz ve artış oranı -1'den büyük olmalıdır.")
+    
+    hedef = gelecek_deger / ilk_taksit
+    
+    # i = r: GD = n.a
+    if abs(i - r) < 1e-10:
+        return hedef
+    
+    # r = 0 veya i = 0: GD = a.s(n, diğer oran)
+    if r == 0 or i == 0:
+        oran = i or r
+        ic = 1 + hedef * oran
+        if ic <= 0:
+            raise ValueError("Bu gelecek değere hiçbir sürede ulaşılamaz.")
+        return math.log(ic) / math.log1p(oran)
+    
+    def fonksiyon(n):
+        gd, gd1, gd2 = _gd_sure_turevleri(1.0, i, r, n)
+        return gd - hedef, gd1, gd2
+    
+    sonuc = tamsayi_kok(fonksiyon, tahmin, tolerans, maks_iterasyon)
+    
+    if _izleme.ETKIN:
+        _izleme.cozum_kaydet('geometrik_anuite.sure_hesapla_gd', sonuc['iterasyon'],
+                             sonuc['artik'], sonuc['yakinsadi'], sonuc['degerlendirme'])
+    
+    if not sonuc['yakinsadi']:
+        raise ValueError("Bu gelecek değere hiçbir sürede ulaşılamaz.")
+    
+    return sonuc['kok']
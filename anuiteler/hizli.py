@@ -0,0 +1,343 @@
+"""
+KONTROLSÜZ HIZLI ÇEKİRDEKLER
+
+Kapalı formdaki anüite fonksiyonlarının girdi kontrolü yapmayan ham
+formülleri. İsimler paket düzeyindeki kısa isimlerle aynıdır
+(`anuiteler.ds_bd_hesapla` → `hizli.ds_bd_hesapla`); ifadeler modüllerdekiyle
+aynı sırada yazıldığından sonuçlar bire bir aynıdır.
+
+Kontrol yapılmadığından geçersiz girdide ValueError yerine anlamsız bir
+sonuç, ZeroDivisionError veya karmaşık sayı dönebilir. Önceden doğrulanmış
+veriler için tasarlanmıştır: girdi grubu bir kez `dogrula` ile kontrol
+edilir, iç döngüde yalnızca çekirdekler çağrılır. Faktör önbelleği
+(`onbellek`) bu çekirdeklerde kullanılmaz.
+
+Kullanım:
+    from itertools import compress
+    from anuiteler import hizli
+
+    maske = hizli.dogrula(odeme=odemeler, n=vadeler, i=oranlar)['gecerli']
+    for odeme, n, i in compress(zip(odemeler, vadeler, oranlar), maske):
+        bd = hizli.ds_bd_hesapla(odeme, n, i)
+"""
+
+from functools import reduce as _reduce
+from itertools import repeat as _repeat
+from operator import and_ as _and, le as _le, lt as _lt
+
+
+# ============================================================
+# TOPLU DOĞRULAMA
+# ============================================================
+
+# Sütun adı -> (alt sınır, sınır hariç mi); anüite modüllerinin kontrolleri
+KURALLAR = {
+    'i': (0, True),
+    'n': (0, True),
+    't': (0, False),
+    'm': (0, False),
+    'c': (0, False),
+    'erteleme_suresi': (0, False),
+    'odeme': (0, False),
+    'taksit': (0, False),
+    'ilk_taksit': (0, False),
+    'bugunku_deger': (0, False),
+    'gelecek_deger': (0, False),
+}
+
+
+def _maske(deger, alt, haric, uzunluk):
+    karsilastir = _lt if haric else _le
+    if getattr(deger, 'ndim', 0):
+        # NumPy dizisi: tek vektörel karşılaştırma, maske de dizi olur
+        if len(deger) != uzunluk:
+            raise ValueError("Tüm sütunlar aynı uzunlukta olmalıdır.")
+        return karsilastir(alt, deger)
+    if not hasattr(deger, '__len__'):
+        return [karsilastir(alt, deger)] * uzunluk
+    if len(deger) != uzunluk:
+        raise ValueError("Tüm sütunlar aynı uzunlukta olmalıdır.")
+    return list(map(karsilastir, _repeat(alt, uzunluk), deger))
+
+
+def dogrula(kurallar=None, **sutunlar):
+    """
+    Girdi grubunu bir kez kontrol eder, satır maskeleri döndürür
+
+    Args:
+        kurallar: Sütun adı -> (alt sınır, sınır hariç mi) (None: KURALLAR)
+        **sutunlar: Sütun adı -> değer dizisi veya tüm satırlar için tek değer;
+            NaN içeren satırlar geçersiz sayılır
+
+    Returns:
+        {'gecerli': [...], <sütun>: [...]} sözlüğü; her sütunun maskesi o
+        sütunun kuralını sağlayan satırlarda True, 'gecerli' tüm sütunların
+        birleşimi. Sütunlardan biri NumPy dizisiyse 'gecerli' ve o sütunların
+        maskeleri bool dizisidir (karşılaştırmalar vektörel yapılır)
+    """
+    kurallar = KURALLAR if kurallar is None else kurallar
+    for ad in sutunlar:
+        if ad not in kurallar:
+            raise ValueError(f"Bilinmeyen sütun: {ad}")
+
+    uzunluklar = [len(d) for d in sutunlar.values() if hasattr(d, '__len__')]
+    uzunluk = uzunluklar[0] if uzunluklar else 1
+
+    maskeler = {ad: _maske(deger, *kurallar[ad], uzunluk) for ad, deger in sutunlar.items()}
+    diziler = [m for m in maskeler.values() if not isinstance(m, list)]
+    if diziler:
+        gecerli = _reduce(_and, maskeler.values(), diziler[0])
+    else:
+        gecerli = [True] * uzunluk
+        for maske in maskeler.values():
+            gecerli = list(map(_and, gecerli, maske))
+    maskeler['gecerli'] = gecerli
+    return maskeler
+
+
+# ============================================================
+# TEK ÖDEME
+# ============================================================
+
+def tek_odeme_bd(gelecek_deger, i, t):
+    v = 1 / (1 + i)
+    return gelecek_deger * (v ** t)
+
+
+def tek_odeme_gd(bugunku_deger, i, t):
+    return bugunku_deger * ((1 + i) ** t)
+
+
+def iskonto_faktoru(i, n=1):
+    return (1 + i) ** (-n)
+
+
+def birikim_faktoru(i, n=1):
+    return (1 + i) ** n
+
+
+# ============================================================
+# DEVRE SONU / DEVRE BAŞI
+# ============================================================
+
+def ds_pesin_faktor(i, n):
+    v = 1 / (1 + i)
+    return (1 - v**n) / i
+
+
+def ds_gelecek_faktor(i, n):
+    return ((1 + i)**n - 1) / i
+
+
+def db_pesin_faktor(i, n):
+    return (1 - (1 / (1 + i))**n) / i * (1 + i)
+
+
+def db_gelecek_faktor(i, n):
+    return ((1 + i)**n - 1) / i * (1 + i)
+
+
+# İç döngü çekirdekleri: faktör fonksiyonu çağrılmadan tek ifadede
+
+def ds_bd_hesapla(odeme, n, i):
+    return odeme * ((1 - (1 / (1 + i))**n) / i)
+
+
+def ds_odeme_bd(bugunku_deger, n, i):
+    return bugunku_deger / ((1 - (1 / (1 + i))**n) / i)
+
+
+def ds_gd_hesapla(odeme, n, i):
+    return odeme * (((1 + i)**n - 1) / i)
+
+
+def ds_odeme_gd(gelecek_deger, n, i):
+    return gelecek_deger / (((1 + i)**n - 1) / i)
+
+
+def db_bd_hesapla(odeme, n, i):
+    return odeme * ((1 - (1 / (1 + i))**n) / i * (1 + i))
+
+
+def db_odeme_bd(bugunku_deger, n, i):
+    return bugunku_deger / ((1 - (1 / (1 + i))**n) / i * (1 + i))
+
+
+def db_gd_hesapla(odeme, n, i):
+    return odeme * (((1 + i)**n - 1) / i * (1 + i))
+
+
+def db_odeme_gd(gelecek_deger, n, i):
+    return gelecek_deger / (((1 + i)**n - 1) / i * (1 + i))
+
+
+# ============================================================
+# SÜREKLİ
+# ============================================================
+
+def surekli_ds_bd(odeme, i):
+    return odeme / i
+
+
+def surekli_ds_odeme(bugunku_deger, i):
+    return bugunku_deger * i
+
+
+def surekli_db_bd(odeme, i):
+    return odeme * (1 + i) / i
+
+
+def surekli_db_odeme(bugunku_deger, i):
+    return bugunku_deger * i / (1 + i)
+
+
+def ertelenmis_surekli_anuite(odeme, i, erteleme_suresi):
+    v = 1 / (1 + i)
+    return odeme / i * (v ** erteleme_suresi)
+
+
+# ============================================================
+# ERTELENMİŞ
+# ============================================================
+
+def ert_ds_bd(taksit, i, n, m):
+    return taksit * (((1 + i) ** n - 1) / (((1 + i) ** (n + m)) * i))
+
+
+def ert_ds_gd(taksit, i, n, m):
+    return taksit * ((1 + i) ** n - 1) / i
+
+
+def ert_ds_taksit_bd(bugunku_deger, i, n, m):
+    return bugunku_deger * ((((1 + i) ** (n + m)) * i) / ((1 + i) ** n - 1))
+
+
+def ert_ds_taksit_gd(gelecek_deger, i, n):
+    return gelecek_deger * i / ((1 + i) ** n - 1)
+
+
+def ert_db_bd(taksit, i, n, m):
+    return taksit * (((1 + i) ** n - 1) / (((1 + i) ** (n + m)) * i)) * (1 + i)
+
+
+def ert_db_gd(taksit, i, n):
+    return taksit * (1 + i) * ((1 + i) ** n - 1) / i
+
+
+def ert_db_taksit_bd(bugunku_deger, i, n, m):
+    return ert_ds_taksit_bd(bugunku_deger / (1 + i), i, n, m)
+
+
+def ert_cabuklas_bd(taksit, i, n, m, c):
+    return taksit * (((1 + i) ** n - 1) / (((1 + i) ** (n + m)) * i)) * ((1 + i) ** c)
+
+
+# ============================================================
+# GEOMETRİK
+# ============================================================
+
+def geo_ds_bd(ilk_taksit, i, r, n):
+    if abs(i - r) < 1e-10:
+        return n * ilk_taksit * ((1 + i) ** (n - 1))
+    pay = (1 + i) ** n - (1 + r) ** n
+    payda = ((1 + i) ** n) * (i - r)
+    return ilk_taksit * ((1 + i) ** n) * (pay / payda)
+
+
+def geo_ds_gd(ilk_taksit, i, r, n):
+    if abs(i - r) < 1e-10:
+        return n * ilk_taksit
+    return ilk_taksit * (((1 + i) ** n - (1 + r) ** n) / (i - r))
+
+
+def geo_db_bd(ilk_taksit, i, r, n):
+    return geo_ds_bd(ilk_taksit, i, r, n) * (1 + i)
+
+
+def geo_db_gd(ilk_taksit, i, r, n):
+    return geo_ds_gd(ilk_taksit, i, r, n) * (1 + i)
+
+
+def geo_ilk_taksit_bd(bugunku_deger, i, r, n, devre_basi=False):
+    if devre_basi:
+        bugunku_deger = bugunku_deger / (1 + i)
+    if abs(i - r) < 1e-10:
+        return bugunku_deger / (n * ((1 + i) ** (n - 1)))
+    pay = ((1 + i) ** n) * (i - r)
+    payda = ((1 + i) ** n) * (((1 + i) ** n - (1 + r) ** n))
+    return bugunku_deger * (pay / payda)
+
+
+def geo_ilk_taksit_gd(gelecek_deger, i, r, n, devre_basi=False):
+    if devre_basi:
+        gelecek_deger = gelecek_deger / (1 + i)
+    if abs(i - r) < 1e-10:
+        return gelecek_deger / n
+    return gelecek_deger * (i - r) / ((1 + i) ** n - (1 + r) ** n)
+
+
+# ============================================================
+# ARİTMETİK
+# ============================================================
+
+def arit_ds_bd(ilk_taksit, degisim, i, n):
+    birinci_terim = (ilk_taksit + degisim / i) * ((1 + i) ** n - 1) / i
+    return birinci_terim - (degisim * n) / i
+
+
+def arit_ds_gd(ilk_taksit, degisim, i, n):
+    return arit_ds_bd(ilk_taksit, degisim, i, n) * ((1 + i) ** n)
+
+
+def arit_ds_ilk_taksit_bd(bugunku_deger, degisim, i, n):
+    sol = bugunku_deger + (degisim * n) / i
+    return sol * (i / ((1 + i) ** n - 1)) - degisim / i
+
+
+def arit_ds_ilk_taksit_gd(gelecek_deger, degisim, i, n):
+    return arit_ds_ilk_taksit_bd(gelecek_deger / ((1 + i) ** n), degisim, i, n)
+
+
+def arit_db_bd(ilk_taksit, degisim, i, n):
+    birinci_terim = (ilk_taksit + degisim / i) * ((1 + i) ** n - 1) / i
+    return (1 + i) * (birinci_terim - ((1 + i) * degisim * n) / i)
+
+
+def arit_db_gd(ilk_taksit, degisim, i, n):
+    return arit_db_bd(ilk_taksit, degisim, i, n) * ((1 + i) ** n) / (1 + i)
+
+
+def arit_db_ilk_taksit_bd(bugunku_deger, degisim, i, n):
+    return arit_ds_ilk_taksit_bd(bugunku_deger / (1 + i), degisim, i, n)
+
+
+# ============================================================
+# ÇABUKLAŞTIRILMIŞ
+# ============================================================
+
+def cab_ds_bd(taksit, i, n, c):
+    return taksit * ((1 + i) ** c) * (((1 + i) ** n - 1) / (((1 + i) ** n) * i))
+
+
+def cab_ds_gd(taksit, i, n, c):
+    return cab_ds_bd(taksit, i, n, c) * ((1 + i) ** n)
+
+
+def cab_db_bd(taksit, i, n, c):
+    return cab_ds_bd(taksit, i, n, c) * (1 + i)
+
+
+def cab_db_gd(taksit, i, n, c):
+    return cab_db_bd(taksit, i, n, c) * ((1 + i) ** n) / (1 + i)
+
+
+def cab_taksit_bd(bugunku_deger, i, n, c, devre_basi=False):
+    anuite_faktoru = ((1 + i) ** n - 1) / (((1 + i) ** n) * i)
+    cabuklas_faktoru = (1 + i) ** c
+    if devre_basi:
+        cabuklas_faktoru *= (1 + i)
+    return bugunku_deger / (cabuklas_faktoru * anuite_faktoru)
+
+
+def cab_taksit_gd(gelecek_deger, i, n, c, devre_basi=False):
+    return cab_taksit_bd(gelecek_deger / ((1 + i) ** n), i, n, c, devre_basi)
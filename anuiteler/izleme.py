@@ -0,0 +1,348 @@
+"""
+İSTEĞE BAĞLI İZLEME (çağrı sayaçları, süreler, çözücü histogramları)
+
+Kapalıyken (varsayılan) maliyeti yoktur: fonksiyonlar sarmalanmaz, iteratif
+çözücüler çıkışta yalnızca `ETKIN` bayrağını okur.
+
+`etkinlestir()` henüz yüklenmemiş alt modülleri (ve NumPy kuruluysa
+`anuiteler.np`'yi) yükler, açık fonksiyonlarını süre ve çağrı sayısı tutan
+sarmalayıcılarla değiştirir (paket kısa isimleri ve `cozucu` kaydı dahil);
+`devre_disi_birak()` özgün fonksiyonları geri koyar.
+Etkinleştirmeden önce `from anuiteler import f` ile alınmış referanslar
+sarmalanmaz. Süreler kapsayıcıdır (iç çağrıların süresi dahil).
+
+Çözücüler (faiz_*, faiz_orani_hesapla_bd, tamsayı aramalı sure_hesapla_*,
+ic_verim_orani ve `anuiteler.np` toplu çözücüleri) her çözümde iterasyon
+ve fonksiyon değerlendirme sayısını, |artık| değerini ve yakınsayıp
+yakınsamadığını kaydeder; kapalı formla çözülen süreler kaydedilmez.
+
+Kullanım:
+    from anuiteler import izleme
+
+    izleme.etkinlestir()
+    ...
+    izleme.anlik_goruntu()      # sözlük
+    izleme.prometheus_metni()   # Prometheus metin biçimi
+    izleme.devre_disi_birak()
+"""
+
+import functools
+import math
+import sys
+import threading
+from bisect import bisect_left
+from functools import partial
+from importlib import import_module
+from time import perf_counter
+
+ETKIN = False
+
+# Histogram kova üst sınırları (dahil); son kova +Inf
+ITERASYON_KOVALARI = (1, 2, 3, 5, 8, 13, 21, 34, 55, 100)
+ARTIK_KOVALARI = (1e-12, 1e-10, 1e-8, 1e-6, 1e-4, 1e-2, 1.0)
+
+_KILIT = threading.Lock()
+
+# ad -> [çağrı, hata, süre]
+_CAGRILAR = {}
+
+# ad -> {'iterasyon': [kova sayıları], 'iterasyon_toplam', 'artik': [...],
+#        'artik_toplam', 'degerlendirme', 'cozum', 'yakinsamayan'}
+_COZUMLER = {}
+
+# sarmalayıcı -> özgün fonksiyon (devre dışı bırakırken geri koymak için)
+_OZGUNLER = {}
+
+
+# ============================================================
+# AÇMA / KAPAMA
+# ============================================================
+
+def etkinlestir():
+    """İzlemeyi açar; tüm alt modülleri yükleyip açık fonksiyonlarını sarmalar"""
+    global ETKIN
+
+    with _KILIT:
+        if ETKIN:
+            return
+        _alt_modulleri_yukle()
+        esleme = {}
+        for modul in _izlenen_moduller():
+            for ad, deger in list(vars(modul).items()):
+                if (not ad.startswith('_') and callable(deger) and not isinstance(deger, type)
+                        and getattr(deger, '__module__', None) == modul.__name__):
+                    esleme[deger] = _sarmala(_kisa_ad(modul.__name__) + '.' + ad, deger)
+
+        _degistir(esleme)
+        _OZGUNLER.update({sarmalayici: ozgun for ozgun, sarmalayici in esleme.items()})
+        ETKIN = True
+
+
+def devre_disi_birak():
+    """İzlemeyi kapatır ve özgün fonksiyonları geri koyar (kayıtlar silinmez)"""
+    global ETKIN
+
+    with _KILIT:
+        if not ETKIN:
+            return
+        _degistir(dict(_OZGUNLER))
+        _OZGUNLER.clear()
+        ETKIN = False
+
+
+def sifirla():
+    """Tüm sayaç ve histogramları sıfırlar"""
+    with _KILIT:
+        for sayac in _CAGRILAR.values():
+            sayac[:] = [0, 0, 0.0]
+        _COZUMLER.clear()
+
+
+def _alt_modulleri_yukle():
+    """Gecikmeli yüklenen alt modülleri içe aktarır; sonradan yüklenen modül sarmalanmaz"""
+    paket = __name__.rsplit('.', 1)[0]
+    for ad in sys.modules[paket]._ALT_MODULLER:
+        import_module(paket + '.' + ad)
+    try:
+        import_module(paket + '.np')
+    except ImportError:
+        pass
+
+
+def _izlenen_moduller():
+    paket = __name__.rsplit('.', 1)[0]
+    moduller = []
+    for ad, modul in list(sys.modules.items()):
+        if (modul is not None and ad.startswith(paket + '.')
+                and ad.rsplit('.', 1)[1] not in ('izleme', 'onbellek', '_ortak', '_newton', '_kok')):
+            moduller.append(modul)
+    return moduller
+
+
+def _kisa_ad(modul_adi):
+    return modul_adi.split('.', 1)[1]
+
+
+def _sarmala(ad, fonksiyon):
+    sayac = _CAGRILAR.setdefault(ad, [0, 0, 0.0])
+
+    @functools.wraps(fonksiyon)
+    def sarmalayici(*args, **kwargs):
+        baslangic = perf_counter()
+        try:
+            return fonksiyon(*args, **kwargs)
+        except Exception:
+            with _KILIT:
+                sayac[1] += 1
+            raise
+        finally:
+            sure = perf_counter() - baslangic
+            with _KILIT:
+                sayac[0] += 1
+                sayac[2] += sure
+
+    return sarmalayici
+
+
+def _degistir(esleme):
+    """Paket modüllerindeki ve cozucu kaydındaki referansları eslemeye göre değiştirir"""
+    def yeni(deger):
+        if isinstance(deger, partial) and deger.func in esleme:
+            return partial(esleme[deger.func], *deger.args, **deger.keywords)
+        return esleme.get(deger, deger) if _hashlenebilir(deger) else deger
+
+    paket = __name__.rsplit('.', 1)[0]
+    for ad, modul in list(sys.modules.items()):
+        if modul is None or not (ad == paket or ad.startswith(paket + '.')):
+            continue
+        ad_alani = vars(modul)
+        for isim, deger in list(ad_alani.items()):
+            degisen = yeni(deger)
+            if degisen is not deger:
+                ad_alani[isim] = degisen
+
+    cozucu = sys.modules.get(paket + '.cozucu')
+    if cozucu is not None:
+        for kayitlar in cozucu._COZUCULER.values():
+            kayitlar[:] = [(cikti, yeni(fonksiyon), girdiler) for cikti, fonksiyon, girdiler in kayitlar]
+        cozucu._planlari_temizle()
+
+
+def _hashlenebilir(deger):
+    try:
+        hash(deger)
+    except TypeError:
+        return False
+    return True
+
+
+# ============================================================
+# ÇÖZÜCÜ KAYITLARI
+# ============================================================
+
+def _cozum_girdisi(ad):
+    girdi = _COZUMLER.get(ad)
+    if girdi is None:
+        girdi = _COZUMLER[ad] = {
+            'iterasyon': [0] * (len(ITERASYON_KOVALARI) + 1),
+            'iterasyon_toplam': 0,
+            'artik': [0] * (len(ARTIK_KOVALARI) + 1),
+            'artik_toplam': 0.0,
+            'degerlendirme': 0,
+            'cozum': 0,
+            'yakinsamayan': 0,
+        }
+    return girdi
+
+
+def cozum_kaydet(ad, iterasyon, artik, yakinsadi, degerlendirme=None):
+    """
+    Bir çözümün iterasyon sayısını ve artığını histograma ekler
+
+    Args:
+        ad: Çözücü adı ('devre_sonu_anuite.faiz_bugunku_degerden' gibi)
+        iterasyon: Yapılan iterasyon sayısı
+        artik: Son artık (mutlak değeri kaydedilir)
+        yakinsadi: Çözücü yakınsadı mı
+        degerlendirme: Fonksiyon değerlendirme sayısı (None: iterasyon + 1)
+    """
+    artik = abs(artik)
+    sonlu = math.isfinite(artik)
+    kova = bisect_left(ARTIK_KOVALARI, artik) if sonlu else len(ARTIK_KOVALARI)
+    with _KILIT:
+        girdi = _cozum_girdisi(ad)
+        girdi['iterasyon'][bisect_left(ITERASYON_KOVALARI, iterasyon)] += 1
+        girdi['iterasyon_toplam'] += iterasyon
+        girdi['degerlendirme'] += iterasyon + 1 if degerlendirme is None else degerlendirme
+        girdi['artik'][kova] += 1
+        if sonlu:
+            girdi['artik_toplam'] += artik
+        girdi['cozum'] += 1
+        girdi['yakinsamayan'] += not yakinsadi
+
+
+def toplu_cozum_kaydet(ad, iterasyonlar, artiklar, yakinsadi):
+    """
+    cozum_kaydet'in NumPy dizileri için toplu sürümü
+
+    Artığı NaN olan satırlar (geçersiz olduğu için hiç çözülmeyenler) atlanır.
+    Toplu Newton her satırı iterasyon başına bir kez ve başlangıçta bir kez
+    değerlendirdiğinden değerlendirme sayısı iterasyon + 1 alınır.
+    """
+    import numpy as np
+
+    cozulen = ~np.isnan(np.ravel(artiklar))
+    iterasyonlar = np.ravel(iterasyonlar)[cozulen]
+    artiklar = np.abs(np.ravel(artiklar)[cozulen])
+    yakinsadi = np.ravel(yakinsadi)[cozulen]
+
+    sonlu = np.isfinite(artiklar)
+    iterasyon_kovalari = np.bincount(np.searchsorted(ITERASYON_KOVALARI, iterasyonlar),
+                                     minlength=len(ITERASYON_KOVALARI) + 1)
+    artik_kovalari = np.bincount(np.where(sonlu, np.searchsorted(ARTIK_KOVALARI, artiklar),
+                                          len(ARTIK_KOVALARI)),
+                                 minlength=len(ARTIK_KOVALARI) + 1)
+
+    with _KILIT:
+        girdi = _cozum_girdisi(ad)
+        for k, sayi in enumerate(iterasyon_kovalari.tolist()):
+            girdi['iterasyon'][k] += sayi
+        for k, sayi in enumerate(artik_kovalari.tolist()):
+            girdi['artik'][k] += sayi
+        girdi['iterasyon_toplam'] += int(iterasyonlar.sum())
+        girdi['degerlendirme'] += int(iterasyonlar.sum()) + int(iterasyonlar.size)
+        girdi['artik_toplam'] += float(artiklar[sonlu].sum())
+        girdi['cozum'] += int(iterasyonlar.size)
+        girdi['yakinsamayan'] += int(np.size(yakinsadi) - np.count_nonzero(yakinsadi))
+
+
+# ============================================================
+# DIŞA AKTARMA
+# ============================================================
+
+def anlik_goruntu():
+    """
+    Kayıtların kopyası
+
+    Returns:
+        {'etkin', 'fonksiyonlar': {ad: {'cagri', 'hata', 'sure_s'}},
+         'cozuculer': {ad: {'cozum', 'yakinsamayan', 'degerlendirme',
+                            'iterasyon', 'artik'}}}
+        Histogramlar {'kovalar': {üst sınır: sayı}, 'toplam': ...} biçimindedir;
+        son kovanın üst sınırı float('inf')
+    """
+    with _KILIT:
+        fonksiyonlar = {
+            ad: {'cagri': cagri, 'hata': hata, 'sure_s': sure}
+            for ad, (cagri, hata, sure) in _CAGRILAR.items() if cagri
+        }
+        cozuculer = {
+            ad: {
+                'cozum': girdi['cozum'],
+                'yakinsamayan': girdi['yakinsamayan'],
+                'degerlendirme': girdi['degerlendirme'],
+                'iterasyon': _histogram(ITERASYON_KOVALARI, girdi['iterasyon'],
+                                        girdi['iterasyon_toplam']),
+                'artik': _histogram(ARTIK_KOVALARI, girdi['artik'], girdi['artik_toplam']),
+            }
+            for ad, girdi in _COZUMLER.items()
+        }
+
+    return {'etkin': ETKIN, 'fonksiyonlar': fonksiyonlar, 'cozuculer': cozuculer}
+
+
+def _histogram(sinirlar, sayilar, toplam):
+    return {
+        'kovalar': dict(zip(sinirlar + (float('inf'),), sayilar)),
+        'toplam': toplam,
+    }
+
+
+def prometheus_metni(onek='anuiteler'):
+    """
+    Kayıtları Prometheus metin biçiminde (exposition format 0.0.4) döndürür
+
+    Sayaç (counter) adları OpenMetrics gereği `_total` ile biter.
+    """
+    goruntu = anlik_goruntu()
+    satirlar = []
+
+    def baslik(ad, tur, aciklama):
+        satirlar.append(f"# HELP {onek}_{ad} {aciklama}")
+        satirlar.append(f"# TYPE {onek}_{ad} {tur}")
+
+    fonksiyonlar = sorted(goruntu['fonksiyonlar'].items())
+    for metrik, anahtar, aciklama in (
+            ('cagri_total', 'cagri', "Fonksiyon çağrı sayısı"),
+            ('hata_total', 'hata', "Hata fırlatan çağrı sayısı"),
+            ('sure_saniye_total', 'sure_s', "Toplam (kapsayıcı) çalışma süresi")):
+        baslik(metrik, 'counter', aciklama)
+        for ad, deger in fonksiyonlar:
+            satirlar.append(f'{onek}_{metrik}{{fonksiyon="{ad}"}} {_sayi(deger[anahtar])}')
+
+    cozuculer = sorted(goruntu['cozuculer'].items())
+    for metrik, anahtar, aciklama in (
+            ('cozucu_yakinsamayan_total', 'yakinsamayan', "Yakınsamayan çözüm sayısı"),
+            ('cozucu_degerlendirme_total', 'degerlendirme', "Fonksiyon değerlendirme sayısı")):
+        baslik(metrik, 'counter', aciklama)
+        for ad, girdi in cozuculer:
+            satirlar.append(f'{onek}_{metrik}{{cozucu="{ad}"}} {girdi[anahtar]}')
+
+    for metrik, anahtar, aciklama in (
+            ('cozucu_iterasyon', 'iterasyon', "Çözüm başına iterasyon sayısı"),
+            ('cozucu_artik', 'artik', "Çözüm sonundaki mutlak artık")):
+        baslik(metrik, 'histogram', aciklama)
+        for ad, girdi in cozuculer:
+            birikimli = 0
+            for sinir, sayi in girdi[anahtar]['kovalar'].items():
+                birikimli += sayi
+                le = '+Inf' if sinir == float('inf') else _sayi(sinir)
+                satirlar.append(f'{onek}_{metrik}_bucket{{cozucu="{ad}",le="{le}"}} {birikimli}')
+            satirlar.append(f'{onek}_{metrik}_sum{{cozucu="{ad}"}} {_sayi(girdi[anahtar]["toplam"])}')
+            satirlar.append(f'{onek}_{metrik}_count{{cozucu="{ad}"}} {girdi["cozum"]}')
+
+    return '\n'.join(satirlar) + '\n'
+
+
+def _sayi(deger):
+    return repr(float(deger)) if isinstance(deger, float) else str(deger)
@@ -0,0 +1,70 @@
+"""
+DİZİ TABANLI NAKİT AKIŞI
+
+Dönem ve tutarları `(dönem, tutar)` demetleri yerine iki bitişik
+`array('d')` içinde tutar. Akış başına 16 bayt yer kaplar (demet listesinde
+demet + iki sayı nesnesi için ~100 bayt).
+
+Son kullanılan faiz oranı için iskonto faktörleri (v^t) saklanır; aynı oranla
+yapılan NPV/duration/convexity çağrıları v^t'yi yeniden hesaplamaz.
+
+yardimci modülündeki nakit akışı fonksiyonları (`net_bugunku_deger`,
+`risk_olcumleri`, `macaulay_duration`, `convexity`, `dv01`,
+`ic_verim_orani` ...) demet listesi yerine NakitAkisi de kabul eder.
+"""
+
+from array import array
+
+
+class NakitAkisi:
+    """Paralel dizilerle tutulan nakit akışı"""
+
+    __slots__ = ('donemler', 'tutarlar', '_iskonto_orani', '_iskonto')
+
+    def __init__(self, donemler, tutarlar):
+        self.donemler = array('d', donemler)
+        self.tutarlar = array('d', tutarlar)
+
+        if len(self.donemler) != len(self.tutarlar):
+            raise ValueError("Dönem ve tutar sayıları eşit olmalıdır.")
+
+        self._iskonto_orani = None
+        self._iskonto = None
+
+    @classmethod
+    def listeden(cls, nakit_akislari):
+        """[(dönem, tutar), ...] listesinden NakitAkisi oluşturur"""
+        akis = cls((), ())
+        for donem, tutar in nakit_akislari:
+            akis.donemler.append(donem)
+            akis.tutarlar.append(tutar)
+        return akis
+
+    def iskonto_faktorleri(self, faiz_orani):
+        """v^t dizisi (son kullanılan oran için önbellekten)"""
+        if faiz_orani != self._iskonto_orani:
+            v = 1 / (1 + faiz_orani)
+            self._iskonto = array('d', [v ** donem for donem in self.donemler])
+            self._iskonto_orani = faiz_orani
+        return self._iskonto
+
+    def __len__(self):
+        return len(self.donemler)
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return NakitAkisi(self.donemler[k], self.tutarlar[k])
+        return self.donemler[k], self.tutarlar[k]
+
+    def __iter__(self):
+        return zip(self.donemler, self.tutarlar)
+
+    def __repr__(self):
+        return f"NakitAkisi(akis_sayisi={len(self)})"
+
+
+def nakit_akisi_olarak(nakit_akislari):
+    """NakitAkisi ise aynen, değilse demet listesinden dönüştürerek döndürür"""
+    if isinstance(nakit_akislari, NakitAkisi):
+        return nakit_akislari
+    return NakitAkisi.listeden(nakit_akislari)
@@ -0,0 +1,331 @@
+"""
+ANÜİTELER - NumPy Arka Ucu (isteğe bağlı)
+
+Kapalı formdaki tüm anüite fonksiyonlarının NumPy dizileriyle çalışan
+sürümleri. İmzalar skaler modüllerle aynıdır; girdiler yayınlanır (broadcast)
+ve sonuç numpy.ma.MaskedArray olarak döner. Skaler sürümde ValueError
+fırlatacak satırlar hata yerine maskelenir (ve değerleri NaN olur).
+
+Kullanım:
+    import anuiteler.np as anp
+
+    bd = anp.ds_bd_hesapla(odeme=odemeler, n=vadeler, i=0.01)
+    gecersiz = bd.mask
+
+Kurulum:
+    pip install anuite-ve-faiz-hesaplamalari[numpy]
+"""
+
+try:
+    import numpy  # noqa: F401
+except ImportError as hata:  # pragma: no cover
+    raise ImportError(
+        "anuiteler.np için NumPy gereklidir: "
+        "pip install anuite-ve-faiz-hesaplamalari[numpy]"
+    ) from hata
+
+# ============================================================
+# TEK ÖDEME MODÜLÜ
+# ============================================================
+from . import tek_odeme
+
+from .tek_odeme import (
+    bugunku_deger as tek_odeme_bd,
+    gelecek_deger as tek_odeme_gd,
+    faiz_orani_hesapla as tek_odeme_faiz,
+    sure_hesapla as tek_odeme_sure,
+    iskonto_faktoru_hesapla,
+    birikim_faktoru_hesapla
+)
+
+# ============================================================
+# DEVRE SONU ANÜİTE MODÜLÜ
+# ============================================================
+from . import devre_sonu_anuite
+
+from .devre_sonu_anuite import (
+    bugunku_deger_hesapla as ds_bd_hesapla,
+    odeme_bugunku_degerden as ds_odeme_bd,
+    sure_bugunku_degerden as ds_sure_bd,
+    faiz_bugunku_degerden as ds_faiz_bd,
+    gelecek_deger_hesapla as ds_gd_hesapla,
+    odeme_gelecek_degerden as ds_odeme_gd,
+    sure_gelecek_degerden as ds_sure_gd,
+    faiz_gelecek_degerden as ds_faiz_gd,
+    pesin_deger_faktoru as ds_pesin_faktor,
+    gelecek_deger_faktoru as ds_gelecek_faktor,
+    faktor_serisi as ds_faktor_serisi,
+    donem_satiri_hesapla as ds_donem_satiri,
+    kalan_bakiye_hesapla as ds_kalan_bakiye,
+    donem_faizi_hesapla as ds_donem_faizi,
+    donem_anaparasi_hesapla as ds_donem_anaparasi,
+    kumulatif_faiz_hesapla as ds_kumulatif_faiz,
+    kumulatif_anapara_hesapla as ds_kumulatif_anapara,
+    yillik_ozet_hesapla as ds_yillik_ozet,
+)
+
+# ============================================================
+# DEVRE BAŞI ANÜİTE MODÜLÜ
+# ============================================================
+from . import devre_basi_anuite
+
+from .devre_basi_anuite import (
+    bugunku_deger_hesapla as db_bd_hesapla,
+    odeme_bugunku_degerden as db_odeme_bd,
+    sure_bugunku_degerden as db_sure_bd,
+    faiz_bugunku_degerden as db_faiz_bd,
+    gelecek_deger_hesapla as db_gd_hesapla,
+    odeme_gelecek_degerden as db_odeme_gd,
+    sure_gelecek_degerden as db_sure_gd,
+    faiz_gelecek_degerden as db_faiz_gd,
+    pesin_deger_faktoru as db_pesin_faktor,
+    gelecek_deger_faktoru as db_gelecek_faktor,
+    donem_satiri_hesapla as db_donem_satiri,
+    kalan_bakiye_hesapla as db_kalan_bakiye,
+    donem_faizi_hesapla as db_donem_faizi,
+    donem_anaparasi_hesapla as db_donem_anaparasi,
+    kumulatif_faiz_hesapla as db_kumulatif_faiz,
+    kumulatif_anapara_hesapla as db_kumulatif_anapara,
+    yillik_ozet_hesapla as db_yillik_ozet,
+)
+
+# ============================================================
+# SÜREKLİ ANÜİTE MODÜLÜ
+# ============================================================
+from . import surekli_anuite
+
+from .surekli_anuite import (
+    bugunku_deger_devre_sonu as surekli_ds_bd,
+    odeme_devre_sonu as surekli_ds_odeme,
+    faiz_devre_sonu as surekli_ds_faiz,
+    bugunku_deger_devre_basi as surekli_db_bd,
+    odeme_devre_basi as surekli_db_odeme,
+    faiz_devre_basi as surekli_db_faiz,
+    ertelenmis_surekli_anuite
+)
+
+# ============================================================
+# ERTELENMİŞ ANÜİTE MODÜLÜ
+# ============================================================
+from . import ertelenmis_anuite
+
+from .ertelenmis_anuite import (
+    bugunku_deger_devre_sonu as ert_ds_bd,
+    gelecek_deger_devre_sonu as ert_ds_gd,
+    taksit_hesapla_bd_devre_sonu as ert_ds_taksit_bd,
+    taksit_hesapla_gd_devre_sonu as ert_ds_taksit_gd,
+    bugunku_deger_devre_basi as ert_db_bd,
+    gelecek_deger_devre_basi as ert_db_gd,
+    taksit_hesapla_bd_devre_basi as ert_db_taksit_bd,
+    gecikme_suresi_hesapla_bd as ert_gecikme_hesapla,
+    bugunku_deger_cabuklas_ertelenmis as ert_cabuklas_bd,
+    sure_hesapla_bd as ert_sure_hesapla,
+)
+
+# ============================================================
+# GEOMETRİK ANÜİTE MODÜLÜ
+# ============================================================
+from . import geometrik_anuite
+
+from .geometrik_anuite import (
+    bugunku_deger_devre_sonu as geo_ds_bd,
+    gelecek_deger_devre_sonu as geo_ds_gd,
+    bugunku_deger_devre_basi as geo_db_bd,
+    gelecek_deger_devre_basi as geo_db_gd,
+    ilk_taksit_hesapla_bd as geo_ilk_taksit_bd,
+    ilk_taksit_hesapla_gd as geo_ilk_taksit_gd,
+    faiz_orani_hesapla_bd as geo_faiz_hesapla,
+    sure_hesapla_gd as geo_sure_hesapla,
+)
+
+# ============================================================
+# ARİTMETİK ANÜİTE MODÜLÜ
+# ============================================================
+from . import aritmetik_anuite
+
+from .aritmetik_anuite import (
+    bugunku_deger_devre_sonu as arit_ds_bd,
+    gelecek_deger_devre_sonu as arit_ds_gd,
+    ilk_taksit_hesapla_bd_devre_sonu as arit_ds_ilk_taksit_bd,
+    ilk_taksit_hesapla_gd_devre_sonu as arit_ds_ilk_taksit_gd,
+    degisim_hesapla_bd_devre_sonu as arit_ds_degisim,
+    bugunku_deger_devre_basi as arit_db_bd,
+    gelecek_deger_devre_basi as arit_db_gd,
+    ilk_taksit_hesapla_bd_devre_basi as arit_db_ilk_taksit_bd,
+    faiz_orani_hesapla_bd as arit_faiz_hesapla,
+    sure_hesapla_bd as arit_sure_hesapla,
+)
+
+# ============================================================
+# ÇABUKLAŞTIRILMIŞ ANÜİTE MODÜLÜ
+# ============================================================
+from . import cabuklas_anuite
+
+from .cabuklas_anuite import (
+    bugunku_deger_devre_sonu as cab_ds_bd,
+    gelecek_deger_devre_sonu as cab_ds_gd,
+    bugunku_deger_devre_basi as cab_db_bd,
+    gelecek_deger_devre_basi as cab_db_gd,
+    taksit_hesapla_bd as cab_taksit_bd,
+    taksit_hesapla_gd as cab_taksit_gd,
+    cabuklas_suresi_hesapla_bd as cab_sure_hesapla,
+    sure_hesapla_bd as cab_donem_hesapla,
+)
+
+# ============================================================
+# YARDIMCI FONKSİYONLAR
+# ============================================================
+from . import yardimci
+
+from .yardimci import (
+    risk_olcumleri,
+    ic_verim_orani_toplu,
+    ic_verim_orani_toplu_ayrintili,
+)
+
+# ============================================================
+# FAKTÖR TABLOSU (bellek eşlemeli)
+# ============================================================
+from . import faktor_tablosu
+
+from .faktor_tablosu import (
+    pesin_deger_faktoru as tablo_pesin_faktor,
+    gelecek_deger_faktoru as tablo_gelecek_faktor,
+    erteleme_faktoru as tablo_erteleme_faktor,
+)
+
+# ============================================================
+# TOPLU ANÜİTE ÇÖZÜCÜ
+# ============================================================
+from . import cozucu
+
+from .cozucu import anuite_hesapla_toplu
+
+
+__all__ = [
+    # Modüller
+    'tek_odeme',
+    'devre_sonu_anuite',
+    'devre_basi_anuite',
+    'surekli_anuite',
+    'ertelenmis_anuite',
+    'geometrik_anuite',
+    'aritmetik_anuite',
+    'cabuklas_anuite',
+    'yardimci',
+    'cozucu',
+    'faktor_tablosu',
+
+    # Toplu çözücü
+    'anuite_hesapla_toplu',
+
+    # Tek ödeme
+    'tek_odeme_bd',
+    'tek_odeme_gd',
+    'tek_odeme_faiz',
+    'tek_odeme_sure',
+    'iskonto_faktoru_hesapla',
+    'birikim_faktoru_hesapla',
+
+    # Devre sonu
+    'ds_bd_hesapla',
+    'ds_odeme_bd',
+    'ds_sure_bd',
+    'ds_faiz_bd',
+    'ds_gd_hesapla',
+    'ds_odeme_gd',
+    'ds_sure_gd',
+    'ds_faiz_gd',
+    'ds_pesin_faktor',
+    'ds_gelecek_faktor',
+    'ds_faktor_serisi',
+    'ds_donem_satiri',
+    'ds_kalan_bakiye',
+    'ds_donem_faizi',
+    'ds_donem_anaparasi',
+    'ds_kumulatif_faiz',
+    'ds_kumulatif_anapara',
+    'ds_yillik_ozet',
+
+    # Devre başı
+    'db_bd_hesapla',
+    'db_odeme_bd',
+    'db_sure_bd',
+    'db_faiz_bd',
+    'db_gd_hesapla',
+    'db_odeme_gd',
+    'db_sure_gd',
+    'db_faiz_gd',
+    'db_pesin_faktor',
+    'db_gelecek_faktor',
+    'db_donem_satiri',
+    'db_kalan_bakiye',
+    'db_donem_faizi',
+    'db_donem_anaparasi',
+    'db_kumulatif_faiz',
+    'db_kumulatif_anapara',
+    'db_yillik_ozet',
+
+    # Sürekli anüite
+    'surekli_ds_bd',
+    'surekli_ds_odeme',
+    'surekli_ds_faiz',
+    'surekli_db_bd',
+    'surekli_db_odeme',
+    'surekli_db_faiz',
+    'ertelenmis_surekli_anuite',
+
+    # Ertelenmiş anüite
+    'ert_ds_bd',
+    'ert_ds_gd',
+    'ert_ds_taksit_bd',
+    'ert_ds_taksit_gd',
+    'ert_db_bd',
+    'ert_db_gd',
+    'ert_db_taksit_bd',
+    'ert_gecikme_hesapla',
+    'ert_cabuklas_bd',
+    'ert_sure_hesapla',
+
+    # Geometrik anüite
+    'geo_ds_bd',
+    'geo_ds_gd',
+    'geo_db_bd',
+    'geo_db_gd',
+    'geo_ilk_taksit_bd',
+    'geo_ilk_taksit_gd',
+    'geo_faiz_hesapla',
+    'geo_sure_hesapla',
+
+    # Aritmetik anüite
+    'arit_ds_bd',
+    'arit_ds_gd',
+    'arit_ds_ilk_taksit_bd',
+    'arit_ds_ilk_taksit_gd',
+    'arit_ds_degisim',
+    'arit_db_bd',
+    'arit_db_gd',
+    'arit_db_ilk_taksit_bd',
+    'arit_faiz_hesapla',
+    'arit_sure_hesapla',
+
+    # Çabuklaştırılmış anüite
+    'cab_ds_bd',
+    'cab_ds_gd',
+    'cab_db_bd',
+    'cab_db_gd',
+    'cab_taksit_bd',
+    'cab_taksit_gd',
+    'cab_sure_hesapla',
+    'cab_donem_hesapla',
+
+    # Faktör tablosu
+    'tablo_pesin_faktor',
+    'tablo_gelecek_faktor',
+    'tablo_erteleme_faktor',
+
+    # Yardımcı
+    'risk_olcumleri',
+    'ic_verim_orani_toplu',
+    'ic_verim_orani_toplu_ayrintili',
+]
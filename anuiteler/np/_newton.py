@@ -0,0 +1,271 @@
+"""
+Toplu (vektörel) Newton-Raphson çekirdeği
+
+Tüm satırlar aynı anda iterasyona sokulur. Yakınsayan satırlar aktif kümeden
+çıkarılır; sonraki iterasyonlar yalnızca kalan satırlar üzerinde hesaplanır.
+Her satır kendi iterasyon sayısını ve son artığını (residual) taşır.
+"""
+
+import numpy as np
+
+from .._kok import VARSAYILAN_TAHMIN
+
+
+def toplu_newton(fonksiyon, tahmin, gecersiz, tolerans=1e-6, max_iter=100, alt_sinir=None):
+    """
+    Düzleştirilmiş (1-B) satırlar üzerinde toplu Newton-Raphson
+
+    Args:
+        fonksiyon: fonksiyon(x, indeks) -> (f, f') ; indeks aktif satırların
+            düz dizideki konumlarıdır, parametreler bununla seçilir
+        tahmin: Başlangıç tahminleri (1-B dizi)
+        gecersiz: Hiç çözülmeyecek satırlar için True olan boolean dizi
+        tolerans: |f| < tolerans olduğunda satır yakınsamış sayılır
+        max_iter: Maksimum iterasyon sayısı
+        alt_sinir: Verilirse her adımdan sonra x bu değerin altına inmez
+
+    Returns:
+        {'kok', 'iterasyon', 'artik', 'yakinsadi'} anahtarlı sözlük
+    """
+    x = np.array(tahmin, dtype=float)
+    iterasyon = np.zeros(x.shape, dtype=np.int64)
+    artik = np.full(x.shape, np.nan)
+    yakinsadi = np.zeros(x.shape, dtype=bool)
+
+    aktif = np.flatnonzero(~gecersiz)
+
+    with np.errstate(all='ignore'):
+        for _ in range(max_iter):
+            if aktif.size == 0:
+                break
+
+            f, f_turev = fonksiyon(x[aktif], aktif)
+            artik[aktif] = f
+
+            bitti = np.abs(f) < tolerans
+            yakinsadi[aktif[bitti]] = True
+
+            devam = ~bitti & np.isfinite(f) & (f_turev != 0)
+            aktif = aktif[devam]
+
+            x_yeni = x[aktif] - f[devam] / f_turev[devam]
+            if alt_sinir is not None:
+                x_yeni = np.maximum(x_yeni, alt_sinir)
+
+            x[aktif] = x_yeni
+            iterasyon[aktif] += 1
+
+    return {
+        'kok': x,
+        'iterasyon': iterasyon,
+        'artik': artik,
+        'yakinsadi': yakinsadi,
+    }
+
+
+def toplu_tamsayi_kok(fonksiyon, gecersiz, tahmin=1, tolerans=1e-6, max_iter=100):
+    """
+    n'de artan f(n) = 0 denklemlerinin satır bazında n > 0 kökü
+
+    Skaler `_kok.tamsayi_kok`'un toplu karşılığı: tüm satırlar birlikte
+    tamsayılarda üstel, sonra ikili aramaya girer; kökü kesirli olan satırlar
+    [k, k+1] içine kırpılmış Newton adımlarıyla inceltilir. Tolerans n
+    cinsindendir (f aralıktaki eğimine bölünür).
+
+    Args:
+        fonksiyon: fonksiyon(n, indeks) -> (f, f') ; f(0) < 0
+        gecersiz: Hiç çözülmeyecek satırlar için True olan boolean dizi
+        tahmin: Üstel aramanın ilk üst sınırı (skaler veya dizi)
+        tolerans: n cinsinden tolerans
+        max_iter: Arama adımı ve Newton iterasyonu üst sınırı (ayrı ayrı)
+
+    Returns:
+        {'kok', 'iterasyon', 'artik', 'yakinsadi'} anahtarlı sözlük
+    """
+    satir = gecersiz.size
+    alt = np.zeros(satir)
+    ust = np.maximum(1.0, np.ceil(np.broadcast_to(np.asarray(tahmin, dtype=float), satir)))
+    f_alt = np.full(satir, np.nan)
+    f_ust = np.full(satir, np.nan)
+    kok = np.full(satir, np.nan)
+    iterasyon = np.zeros(satir, dtype=np.int64)
+    artik = np.full(satir, np.nan)
+    yakinsadi = np.zeros(satir, dtype=bool)
+
+    aktif = np.flatnonzero(~gecersiz)
+
+    with np.errstate(all='ignore'):
+        f_alt[aktif] = fonksiyon(alt[aktif], aktif)[0]
+        f_ust[aktif] = fonksiyon(ust[aktif], aktif)[0]
+
+        # Üstel arama: f(ust) >= 0 olana kadar üst sınırı ikiye katla
+        arama = aktif[f_ust[aktif] < 0]
+        for _ in range(max_iter):
+            if arama.size == 0:
+                break
+            alt[arama], f_alt[arama] = ust[arama], f_ust[arama]
+            ust[arama] *= 2
+            f_ust[arama] = fonksiyon(ust[arama], arama)[0]
+            iterasyon[arama] += 1
+            arama = arama[f_ust[arama] < 0]
+
+        # Sınır bulunamayan (veya NaN veren) satırlar çözümsüz kalır
+        aktif = aktif[f_ust[aktif] >= 0]
+
+        # İkili arama: ardışık iki tamsayıya daralt
+        arama = aktif[ust[aktif] - alt[aktif] > 1]
+        while arama.size:
+            orta = np.floor((alt[arama] + ust[arama]) / 2)
+            f_orta = fonksiyon(orta, arama)[0]
+            sol = f_orta < 0
+            alt[arama[sol]], f_alt[arama[sol]] = orta[sol], f_orta[sol]
+            ust[arama[~sol]], f_ust[arama[~sol]] = orta[~sol], f_orta[~sol]
+            iterasyon[arama] += 1
+            arama = arama[ust[arama] - alt[arama] > 1]
+
+        egim = f_ust - f_alt
+        artik[aktif] = f_ust[aktif]
+
+        # Tamsayı kökler
+        for sinir, f_sinir in ((alt, f_alt), (ust, f_ust)):
+            tam = (np.abs(f_sinir[aktif]) < tolerans * egim[aktif]) & (sinir[aktif] > 0)
+            kok[aktif[tam]] = sinir[aktif[tam]]
+            artik[aktif[tam]] = f_sinir[aktif[tam]]
+            yakinsadi[aktif[tam]] = True
+            aktif = aktif[~tam]
+
+        # Kesirli kökler: kiriş noktasından [alt, ust] içinde Newton
+        x = alt[aktif] - f_alt[aktif] / egim[aktif]
+        for _ in range(max_iter):
+            if aktif.size == 0:
+                break
+            f, f_turev = fonksiyon(x, aktif)
+            artik[aktif] = f
+            x_yeni = np.clip(x - f / f_turev, alt[aktif], ust[aktif])
+
+            bitti = (np.abs(f) < tolerans * egim[aktif]) | (np.abs(x_yeni - x) < tolerans)
+            kok[aktif[bitti]] = np.where(np.isfinite(x_yeni[bitti]), x_yeni[bitti], x[bitti])
+            yakinsadi[aktif[bitti]] = True
+
+            devam = ~bitti & np.isfinite(f)
+            aktif, x = aktif[devam], x_yeni[devam]
+            iterasyon[aktif] += 1
+
+    return {
+        'kok': kok,
+        'iterasyon': iterasyon,
+        'artik': artik,
+        'yakinsadi': yakinsadi,
+    }
+
+
+def birikim_turevleri(t, n):
+    """
+    s(n,t) = ((1+t)^n - 1) / t ve ds/dt (skaler `_kok.birikim_turevleri` karşılığı)
+
+    |t| < 1e-5 satırlarında türev seri açılımından hesaplanır; t <= -1 NaN verir.
+    """
+    us = n * np.log1p(t)
+    s = np.where(t == 0, n, np.expm1(us) / t)
+
+    c2 = n * (n - 1) / 2
+    c3 = c2 * (n - 2) / 3
+    c4 = c3 * (n - 3) / 4
+    seri = c2 + t * (2 * c3 + 3 * c4 * t)
+    s1 = np.where(np.abs(t) < 1e-5, seri, (n * np.exp(us) / (1 + t) - s) / t)
+
+    return s, s1
+
+
+def pesin_tahmini(hedef, n, us=0):
+    """
+    (1+i)^us × a(n,i) = hedef için kapalı form başlangıç (skaler
+    `_kok.pesin_tahmini` karşılığı); skalerin None verdiği satırlarda
+    VARSAYILAN_TAHMIN (toplu Newton sonlu başlangıç ister ve yalnızca
+    |f| < tolerans'ta durduğundan yanlış kök kabul etmez)
+    """
+    with np.errstate(all='ignore'):
+        p = 1 / hedef
+        b = (n + 1) / 2 - us
+        a = (n * n - 1) / 12 - us * (n + 1) / 2 + us * (us + 1) / 2
+        c = 1 - n * p
+        payda = b + np.sqrt(b * b - 4 * a * c)
+        i = np.where(payda > 0, -2 * c / payda, np.nan)
+
+        x = 1 + i
+        i = np.where(n * i > 1, p * x ** us * (1 - x ** -n), i)
+    return np.where(i > 0, i, VARSAYILAN_TAHMIN)
+
+
+def birikim_tahmini(hedef, n, us=0, alt_sinir=0):
+    """
+    (1+i)^us × s(n,i) = hedef için kapalı form başlangıç (skaler
+    `_kok.birikim_tahmini` karşılığı); skalerin None verdiği satırlarda
+    VARSAYILAN_TAHMIN
+    """
+    with np.errstate(all='ignore'):
+        b = (n - 1) / 2
+        a = (n * n - 1) / 12
+        c = 1 - n / hedef
+        ayirtac = b * b - 4 * a * c
+        payda = b + np.sqrt(ayirtac)
+        i = np.where(ayirtac >= 0, np.where(payda > 0, 2 * c / payda, np.nan), b / (2 * a))
+
+        duz = n * i > 1
+        ters = (n * i < -1) & (hedef > 1) & (i > -1)
+        for _ in range(3):
+            i = np.where(duz, (1 + i * hedef) ** (1 / n) - 1,
+                         np.where(ters, ((1 + i) ** n - 1) / hedef, i))
+        i = np.where(i > alt_sinir, i, np.nan)
+        if np.any(us):
+            i = birikim_tahmini(hedef / (1 + i) ** us, n, 0, alt_sinir)
+    return np.where(i > alt_sinir, i, VARSAYILAN_TAHMIN)
+
+
+def oran_coz(cekirdek, deger, odeme, n, tahmin=None, tolerans=1e-6, max_iter=100,
+             tahminci=None):
+    """
+    deger / odeme = faktör(n, i) denklemini satır bazında i için çözer
+
+    Args:
+        cekirdek: cekirdek(i, n, hedef) -> (faktör - hedef, d(faktör)/di)
+        deger: BD veya GD dizisi
+        odeme: Dönemsel ödeme dizisi
+        n: Dönem sayısı dizisi
+        tahmin: Başlangıç tahmini (skaler veya dizi); None ise tahminci
+        tolerans: Artık (çekirdeğin ilk dönüş değeri) için yakınsama toleransı
+        max_iter: Maksimum iterasyon sayısı
+        tahminci: tahminci(hedef, n) -> satır bazında kapalı form başlangıç
+            (None ise VARSAYILAN_TAHMIN)
+
+    Returns:
+        {'i', 'iterasyon', 'artik', 'yakinsadi'} anahtarlı sözlük
+        (girdilerin yayınlanmış şeklinde diziler)
+    """
+    kapali_form = tahmin is None and tahminci is not None
+    deger, odeme, n, tahmin = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float)
+          for x in (deger, odeme, n, VARSAYILAN_TAHMIN if tahmin is None else tahmin))
+    )
+    sekil = deger.shape
+
+    n = n.ravel()
+    odeme = odeme.ravel()
+    with np.errstate(all='ignore'):
+        hedef = deger.ravel() / odeme
+    tahmin = tahminci(hedef, n) if kapali_form else tahmin.ravel()
+
+    gecersiz = (n <= 0) | (odeme <= 0)
+
+    def fonksiyon(i, indeks):
+        return cekirdek(i, n[indeks], hedef[indeks])
+
+    sonuc = toplu_newton(fonksiyon, tahmin, gecersiz, tolerans, max_iter, alt_sinir=0.0001)
+    sonuc['kok'][gecersiz] = np.nan
+
+    return {
+        'i': sonuc['kok'].reshape(sekil),
+        'iterasyon': sonuc['iterasyon'].reshape(sekil),
+        'artik': sonuc['artik'].reshape(sekil),
+        'yakinsadi': sonuc['yakinsadi'].reshape(sekil),
+    }
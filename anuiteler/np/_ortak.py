@@ -0,0 +1,51 @@
+"""
+NumPy arka ucu için ortak yardımcılar
+
+Skaler modüllerdeki `if ...: raise ValueError` kontrolleri dizilerde satır
+bazında çalışmaz. Buradaki çekirdekler hata fırlatmak yerine (değer, geçersiz)
+çifti döndürür; `vektorel` dekoratörü bu çifti maskeli diziye çevirir.
+"""
+
+import functools
+
+import numpy as np
+
+
+def dizi(x):
+    """Girdiyi float64 NumPy dizisine çevirir (kopyalamadan, mümkünse)"""
+    return np.asarray(x, dtype=float)
+
+
+def maskele(deger, gecersiz):
+    """
+    Geçersiz satırları NaN yapıp maskeli dizi döndürür
+
+    Args:
+        deger: Hesaplanan değerler
+        gecersiz: Geçersiz satırlar için True olan boolean dizi
+
+    Returns:
+        numpy.ma.MaskedArray (geçersiz satırlar maskeli ve NaN)
+    """
+    deger = np.asarray(deger, dtype=float)
+    gecersiz = np.asarray(gecersiz, dtype=bool)
+
+    if gecersiz.shape != deger.shape:
+        deger, gecersiz = np.broadcast_arrays(deger, gecersiz)
+        gecersiz = gecersiz.copy()
+
+    if gecersiz.any():
+        deger = np.where(gecersiz, np.nan, deger)
+
+    return np.ma.masked_array(deger, mask=gecersiz, copy=False)
+
+
+def vektorel(fonksiyon):
+    """(değer, geçersiz) döndüren çekirdeği maskeli dizi döndüren fonksiyona çevirir"""
+    @functools.wraps(fonksiyon)
+    def sarmalayici(*args, **kwargs):
+        with np.errstate(all='ignore'):
+            deger, gecersiz = fonksiyon(*args, **kwargs)
+        return maskele(deger, gecersiz)
+
+    return sarmalayici
@@ -0,0 +1,329 @@
+"""
+ARİTMETİK DİZİ ŞEKLİNDE DEĞİŞEN TAKSİTLER (ANÜİTELER) - NumPy sürümü
+
+anuiteler.aritmetik_anuite ile aynı imzalar. Girdiler yayınlanır (broadcast),
+geçersiz satırlar hata yerine maske ile bildirilir.
+
+faiz_orani_hesapla_bd tüm satırları analitik türevli toplu Newton'a sokar;
+yakınsamayan satırlar skaler güvenli çözücüyle yeniden çözülür.
+sure_hesapla_bd degisim = 0 satırlarında kapalı formdur, kalanları toplu
+tamsayı aramasıyla çözer.
+"""
+
+import math
+
+import numpy as np
+
+from .. import izleme as _izleme
+from .. import aritmetik_anuite as _arit
+from .._kok import VARSAYILAN_TAHMIN
+from ._newton import birikim_tahmini, birikim_turevleri, toplu_newton, toplu_tamsayi_kok
+from ._ortak import dizi, maskele, vektorel
+
+
+def _bd_devre_sonu(ilk_taksit, degisim, i, n):
+    """BD = (a + b/i) × [(1+i)^n - 1] / i - b.n / i (kontrolsüz)"""
+    birinci_terim = (ilk_taksit + degisim / i) * ((1 + i) ** n - 1) / i
+    ikinci_terim = (degisim * n) / i
+
+    return birinci_terim - ikinci_terim
+
+
+def _ilk_taksit_devre_sonu(bugunku_deger, degisim, i, n):
+    """BD'den ilk taksit çekirdeği (kontrolsüz)"""
+    sol = bugunku_deger + (degisim * n) / i
+    carpan = i / ((1 + i) ** n - 1)
+
+    return sol * carpan - degisim / i
+
+
+# ============================================================================
+# DEVRE SONU ÖDEMELİ ARİTMETİK ANÜİTE
+# ============================================================================
+
+@vektorel
+def bugunku_deger_devre_sonu(ilk_taksit, degisim, i, n):
+    ilk_taksit, degisim, i, n = dizi(ilk_taksit), dizi(degisim), dizi(i), dizi(n)
+    return _bd_devre_sonu(ilk_taksit, degisim, i, n), (i <= 0) | (n <= 0)
+
+
+@vektorel
+def gelecek_deger_devre_sonu(ilk_taksit, degisim, i, n):
+    ilk_taksit, degisim, i, n = dizi(ilk_taksit), dizi(degisim), dizi(i), dizi(n)
+
+    bd = _bd_devre_sonu(ilk_taksit, degisim, i, n)
+    return bd * (1 + i) ** n, (i <= 0) | (n <= 0)
+
+
+@vektorel
+def ilk_taksit_hesapla_bd_devre_sonu(bugunku_deger, degisim, i, n):
+    bugunku_deger, degisim, i, n = dizi(bugunku_deger), dizi(degisim), dizi(i), dizi(n)
+
+    gecersiz = (bugunku_deger <= 0) | (i <= 0) | (n <= 0)
+    return _ilk_taksit_devre_sonu(bugunku_deger, degisim, i, n), gecersiz
+
+
+@vektorel
+def ilk_taksit_hesapla_gd_devre_sonu(gelecek_deger, degisim, i, n):
+    gelecek_deger, degisim, i, n = dizi(gelecek_deger), dizi(degisim), dizi(i), dizi(n)
+
+    bugunku_deger = gelecek_deger / (1 + i) ** n
+    gecersiz = (gelecek_deger <= 0) | (i <= 0) | (n <= 0)
+    return _ilk_taksit_devre_sonu(bugunku_deger, degisim, i, n), gecersiz
+
+
+@vektorel
+def degisim_hesapla_bd_devre_sonu(bugunku_deger, ilk_taksit, i, n):
+    bugunku_deger, ilk_taksit, i, n = dizi(bugunku_deger), dizi(ilk_taksit), dizi(i), dizi(n)
+
+    anuite_faktoru = ((1 + i) ** n - 1) / i
+    sol = bugunku_deger - ilk_taksit * anuite_faktoru
+    sag_parantez = anuite_faktoru - n
+
+    gecersiz = (bugunku_deger <= 0) | (i <= 0) | (n <= 0) | (np.abs(sag_parantez) < 1e-10)
+    return (sol * i) / sag_parantez, gecersiz
+
+
+# ============================================================================
+# DEVRE BAŞI ÖDEMELİ ARİTMETİK ANÜİTE
+# ============================================================================
+
+@vektorel
+def bugunku_deger_devre_basi(ilk_taksit, degisim, i, n):
+    ilk_taksit, degisim, i, n = dizi(ilk_taksit), dizi(degisim), dizi(i), dizi(n)
+
+    birinci_terim = (ilk_taksit + degisim / i) * ((1 + i) ** n - 1) / i
+    ikinci_terim = ((1 + i) * degisim * n) / i
+    return (1 + i) * (birinci_terim - ikinci_terim), (i <= 0) | (n <= 0)
+
+
+@vektorel
+def gelecek_deger_devre_basi(ilk_taksit, degisim, i, n):
+    ilk_taksit, degisim, i, n = dizi(ilk_taksit), dizi(degisim), dizi(i), dizi(n)
+
+    birinci_terim = (ilk_taksit + degisim / i) * ((1 + i) ** n - 1) / i
+    ikinci_terim = ((1 + i) * degisim * n) / i
+    return (birinci_terim - ikinci_terim) * (1 + i) ** n, (i <= 0) | (n <= 0)
+
+
+@vektorel
+def ilk_taksit_hesapla_bd_devre_basi(bugunku_deger, degisim, i, n):
+    bugunku_deger, degisim, i, n = dizi(bugunku_deger), dizi(degisim), dizi(i), dizi(n)
+
+    bd_devre_sonu = bugunku_deger / (1 + i)
+    gecersiz = (bd_devre_sonu <= 0) | (i <= 0) | (n <= 0)
+    return _ilk_taksit_devre_sonu(bd_devre_sonu, degisim, i, n), gecersiz
+
+
+# ============================================================================
+# GERİYE UYUMLULUK İÇİN EKSİK FONKSİYONLAR
+# ============================================================================
+
+def bugunku_deger(ilk_taksit, degisim, i, n, devre_basi=False):
+    """Genel bugünkü değer hesaplama (devre sonu/başı otomatik)"""
+    if devre_basi:
+        return bugunku_deger_devre_basi(ilk_taksit, degisim, i, n)
+    return bugunku_deger_devre_sonu(ilk_taksit, degisim, i, n)
+
+
+def gelecek_deger(ilk_taksit, degisim, i, n, devre_basi=False):
+    """Genel gelecek değer hesaplama (devre sonu/başı otomatik)"""
+    if devre_basi:
+        return gelecek_deger_devre_basi(ilk_taksit, degisim, i, n)
+    return gelecek_deger_devre_sonu(ilk_taksit, degisim, i, n)
+
+
+def ilk_taksit_hesapla_bd(bugunku_deger, degisim, i, n, devre_basi=False):
+    """Genel ilk taksit hesaplama (BD'den)"""
+    if devre_basi:
+        return ilk_taksit_hesapla_bd_devre_basi(bugunku_deger, degisim, i, n)
+    return ilk_taksit_hesapla_bd_devre_sonu(bugunku_deger, degisim, i, n)
+
+
+def ilk_taksit_hesapla_gd(gelecek_deger, degisim, i, n, devre_basi=False):
+    """Genel ilk taksit hesaplama (GD'den)"""
+    return ilk_taksit_hesapla_gd_devre_sonu(gelecek_deger, degisim, i, n)
+
+
+def degisim_hesapla_bd(bugunku_deger, ilk_taksit, i, n, devre_basi=False):
+    """Genel değişim hesaplama"""
+    return degisim_hesapla_bd_devre_sonu(bugunku_deger, ilk_taksit, i, n)
+
+
+# ============================================================================
+# FAİZ ORANI (toplu Newton + satır bazında geri dönüş)
+# ============================================================================
+
+def _faiz_hedef(i, ilk_taksit, degisim, n, devre_basi, bugunku_deger):
+    """ln BD(i) - ln BD ve türevi; BD = a.s + b.h, h = (s - n) / i (i <= 0 satırları NaN)"""
+    i = np.where(i > 0, i, np.nan)
+    s, s1 = birikim_turevleri(i, n)
+
+    c2 = n * (n - 1) / 2
+    c3 = c2 * (n - 2) / 3
+    c4 = c3 * (n - 3) / 4
+    kucuk = i < 1e-5
+    h = np.where(kucuk, c2 + i * (c3 + c4 * i), (s - n) / i)
+    h1 = np.where(kucuk, c3 + 2 * c4 * i, (s1 - h) / i)
+
+    f = ilk_taksit * s + degisim * h
+    f1 = ilk_taksit * s1 + degisim * h1
+
+    if devre_basi:
+        # Devre başı: (1+i)(BD - b.n)
+        u = f - degisim * n
+        f, f1 = (1 + i) * u, u + (1 + i) * f1
+
+    return np.log(f / bugunku_deger), f1 / f
+
+
+def faiz_orani_hesapla_bd_ayrintili(bugunku_deger, ilk_taksit, degisim, n, devre_basi=False,
+                                    tahmin=None, tolerans=1e-6, maks_iterasyon=100):
+    """
+    Birçok aritmetik anüitenin faiz oranı (BD'den)
+
+    Tüm satırlar logaritmik artıkla (ln BD(i) - ln BD) aynı anda Newton
+    iterasyonuna girer; yakınsamayan satırlar skaler
+    `aritmetik_anuite.faiz_orani_hesapla_bd`'nin güvenli Halley çekirdeğiyle
+    tek tek yeniden çözülür.
+
+    Returns:
+        {'i', 'iterasyon', 'artik', 'yakinsadi', 'geri_donus'} anahtarlı
+        sözlük; geçersiz veya pozitif kökü olmayan satırlarda i NaN'dır
+    """
+    kapali_form = tahmin is None
+    bugunku_deger, ilk_taksit, degisim, n, tahmin = np.broadcast_arrays(
+        *(dizi(x) for x in (bugunku_deger, ilk_taksit, degisim, n,
+                            VARSAYILAN_TAHMIN if kapali_form else tahmin))
+    )
+    sekil = bugunku_deger.shape
+    bugunku_deger, ilk_taksit, degisim, n, tahmin = (
+        x.ravel() for x in (bugunku_deger, ilk_taksit, degisim, n, tahmin)
+    )
+    if kapali_form:
+        # BD = a.s + b.h; ödemelerin ortalaması kadar sabit taksitle s(n,i)
+        esdeger = ilk_taksit + degisim * (n - 1) / 2
+        with np.errstate(all='ignore'):
+            tahmin = np.where(esdeger > 0,
+                              birikim_tahmini(bugunku_deger / esdeger, n, 1 if devre_basi else 0),
+                              VARSAYILAN_TAHMIN)
+
+    gecersiz = ((bugunku_deger <= 0) | (n <= 0) | (tahmin <= 0)
+                | ~np.isfinite(ilk_taksit) | ~np.isfinite(degisim))
+
+    def fonksiyon(i, indeks):
+        return _faiz_hedef(i, ilk_taksit[indeks], degisim[indeks], n[indeks], devre_basi,
+                           bugunku_deger[indeks])
+
+    sonuc = toplu_newton(fonksiyon, tahmin, gecersiz, tolerans, maks_iterasyon)
+    oran, yakinsadi = sonuc['kok'], sonuc['yakinsadi']
+    geri_donus = ~yakinsadi & ~gecersiz
+
+    for k in np.flatnonzero(geri_donus):
+        tek = _arit._faiz_coz(bugunku_deger[k], ilk_taksit[k], degisim[k], n[k], devre_basi,
+                              tahmin[k], tolerans, maks_iterasyon)
+        oran[k] = tek['kok']
+        sonuc['artik'][k] = math.log1p(tek['artik'] / bugunku_deger[k])
+        sonuc['iterasyon'][k] += tek['iterasyon']
+        yakinsadi[k] = tek['yakinsadi']
+
+    # Newton i <= 0 bölgesine yakınsamış olabilir; skaler sürüm gibi reddedilir
+    yakinsadi &= oran > 0
+    oran[~yakinsadi] = np.nan
+
+    if _izleme.ETKIN:
+        _izleme.toplu_cozum_kaydet('np.aritmetik_anuite.faiz_orani_hesapla_bd',
+                                   sonuc['iterasyon'], sonuc['artik'], yakinsadi)
+
+    return {
+        'i': oran.reshape(sekil),
+        'iterasyon': sonuc['iterasyon'].reshape(sekil),
+        'artik': sonuc['artik'].reshape(sekil),
+        'yakinsadi': yakinsadi.reshape(sekil),
+        'geri_donus': geri_donus.reshape(sekil),
+    }
+
+
+def faiz_orani_hesapla_bd(bugunku_deger, ilk_taksit, degisim, n, devre_basi=False, tahmin=None,
+                          tolerans=1e-6, maks_iterasyon=100):
+    """Toplu Newton ile faiz oranı (geçersiz/yakınsamayan satırlar maskeli)"""
+    sonuc = faiz_orani_hesapla_bd_ayrintili(bugunku_deger, ilk_taksit, degisim, n, devre_basi,
+                                            tahmin, tolerans, maks_iterasyon)
+    return maskele(sonuc['i'], ~sonuc['yakinsadi'])
+
+
+# ============================================================================
+# SÜRE (kapalı form + toplu tamsayı araması)
+# ============================================================================
+
+def _bd_sure_turevleri(ilk_taksit, degisim, i, n, devre_basi):
+    """BD(n) ve n'ye göre türevi (gerçel n; bugunku_deger_devre_* ile aynı formül)"""
+    ln_x = np.log1p(i)
+    birikim = np.exp(n * ln_x)
+    s = (birikim - 1) / i
+    s1 = birikim * ln_x / i
+
+    f = ilk_taksit * s + degisim * (s - n) / i
+    f1 = ilk_taksit * s1 + degisim * (s1 - 1) / i
+
+    if devre_basi:
+        return (1 + i) * (f - degisim * n), (1 + i) * (f1 - degisim)
+
+    return f, f1
+
+
+def sure_hesapla_bd_ayrintili(bugunku_deger, ilk_taksit, degisim, i, devre_basi=False,
+                              tahmin=5, tolerans=1e-6, maks_iterasyon=100):
+    """
+    Birçok aritmetik anüitenin süresi (BD'den)
+
+    degisim = 0 olan satırlar kapalı formla, kalanlar toplu tamsayı
+    üstel/ikili arama ve [k, k+1] içinde Newton ile çözülür.
+
+    Returns:
+        {'n', 'iterasyon', 'artik', 'yakinsadi'} anahtarlı sözlük; geçersiz
+        veya çözümsüz satırlarda n NaN'dır (kapalı form satırlarında artık NaN)
+    """
+    bugunku_deger, ilk_taksit, degisim, i, tahmin = np.broadcast_arrays(
+        *(dizi(x) for x in (bugunku_deger, ilk_taksit, degisim, i, tahmin))
+    )
+    sekil = bugunku_deger.shape
+    bugunku_deger, ilk_taksit, degisim, i, tahmin = (
+        x.ravel() for x in (bugunku_deger, ilk_taksit, degisim, i, tahmin)
+    )
+
+    with np.errstate(all='ignore'):
+        gecersiz = ((bugunku_deger <= 0) | ~(i > 0) | ~np.isfinite(ilk_taksit)
+                    | ~np.isfinite(degisim))
+        kapali = ~gecersiz & (degisim == 0)
+
+        indirgenmis = bugunku_deger / (1 + i) if devre_basi else bugunku_deger
+        sure = np.log1p(indirgenmis * i / ilk_taksit) / np.log1p(i)
+
+    def fonksiyon(n, indeks):
+        f, f1 = _bd_sure_turevleri(ilk_taksit[indeks], degisim[indeks], i[indeks], n, devre_basi)
+        return f - bugunku_deger[indeks], f1
+
+    sonuc = toplu_tamsayi_kok(fonksiyon, gecersiz | kapali, tahmin, tolerans, maks_iterasyon)
+    sure = np.where(kapali, sure, sonuc['kok'])
+    yakinsadi = np.where(kapali, (ilk_taksit > 0) & np.isfinite(sure), sonuc['yakinsadi'])
+    sure[~yakinsadi] = np.nan
+
+    if _izleme.ETKIN:
+        _izleme.toplu_cozum_kaydet('np.aritmetik_anuite.sure_hesapla_bd',
+                                   sonuc['iterasyon'], sonuc['artik'], sonuc['yakinsadi'])
+
+    return {
+        'n': sure.reshape(sekil),
+        'iterasyon': sonuc['iterasyon'].reshape(sekil),
+        'artik': sonuc['artik'].reshape(sekil),
+        'yakinsadi': yakinsadi.reshape(sekil),
+    }
+
+
+def sure_hesapla_bd(bugunku_deger, ilk_taksit, degisim, i, devre_basi=False, tahmin=5,
+                    tolerans=1e-6, maks_iterasyon=100):
+    """Kapalı form veya toplu tamsayı aramasıyla süre (çözümsüz satırlar maskeli)"""
+    sonuc = sure_hesapla_bd_ayrintili(bugunku_deger, ilk_taksit, degisim, i, devre_basi,
+                                      tahmin, tolerans, maks_iterasyon)
+    return maskele(sonuc['n'], ~sonuc['yakinsadi'])
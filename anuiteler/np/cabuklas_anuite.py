@@ -0,0 +1,95 @@
+"""
+ÇABUKLAŞTIRILMIŞ ANÜİTE HESAPLAMALARI - NumPy sürümü
+
+anuiteler.cabuklas_anuite ile aynı imzalar. Girdiler yayınlanır (broadcast),
+geçersiz satırlar hata yerine maske ile bildirilir.
+
+sure_hesapla_bd kapalı formdur; iteratif faiz_orani_hesapla_bd burada yer almaz.
+"""
+
+import numpy as np
+
+from ._ortak import dizi, vektorel
+
+
+def _anuite_faktoru(i, n):
+    """[(1+i)^n - 1] / [(1+i)^n × i] çekirdeği (kontrolsüz)"""
+    return ((1 + i) ** n - 1) / (((1 + i) ** n) * i)
+
+
+def _gecersiz(tutar, i, n, c):
+    return (i <= 0) | (n <= 0) | (c < 0) | (tutar < 0)
+
+
+@vektorel
+def bugunku_deger_devre_sonu(taksit, i, n, c):
+    taksit, i, n, c = dizi(taksit), dizi(i), dizi(n), dizi(c)
+
+    bd = taksit * (1 + i) ** c * _anuite_faktoru(i, n)
+    return bd, _gecersiz(taksit, i, n, c)
+
+
+@vektorel
+def gelecek_deger_devre_sonu(taksit, i, n, c):
+    taksit, i, n, c = dizi(taksit), dizi(i), dizi(n), dizi(c)
+
+    bd = taksit * (1 + i) ** c * _anuite_faktoru(i, n)
+    return bd * (1 + i) ** n, _gecersiz(taksit, i, n, c)
+
+
+@vektorel
+def bugunku_deger_devre_basi(taksit, i, n, c):
+    taksit, i, n, c = dizi(taksit), dizi(i), dizi(n), dizi(c)
+
+    bd = taksit * (1 + i) ** (c + 1) * _anuite_faktoru(i, n)
+    return bd, _gecersiz(taksit, i, n, c)
+
+
+@vektorel
+def gelecek_deger_devre_basi(taksit, i, n, c):
+    taksit, i, n, c = dizi(taksit), dizi(i), dizi(n), dizi(c)
+
+    bd = taksit * (1 + i) ** (c + 1) * _anuite_faktoru(i, n)
+    return bd * (1 + i) ** n / (1 + i), _gecersiz(taksit, i, n, c)
+
+
+@vektorel
+def taksit_hesapla_bd(bugunku_deger, i, n, c, devre_basi=False):
+    bugunku_deger, i, n, c = dizi(bugunku_deger), dizi(i), dizi(n), dizi(c)
+
+    cabuklas_faktoru = (1 + i) ** (c + 1) if devre_basi else (1 + i) ** c
+    taksit = bugunku_deger / (cabuklas_faktoru * _anuite_faktoru(i, n))
+    return taksit, _gecersiz(bugunku_deger, i, n, c)
+
+
+@vektorel
+def taksit_hesapla_gd(gelecek_deger, i, n, c, devre_basi=False):
+    gelecek_deger, i, n, c = dizi(gelecek_deger), dizi(i), dizi(n), dizi(c)
+
+    cabuklas_faktoru = (1 + i) ** (c + 1) if devre_basi else (1 + i) ** c
+    bugunku_deger = gelecek_deger / (1 + i) ** n
+    taksit = bugunku_deger / (cabuklas_faktoru * _anuite_faktoru(i, n))
+    return taksit, _gecersiz(gelecek_deger, i, n, c)
+
+
+@vektorel
+def cabuklas_suresi_hesapla_bd(bugunku_deger, taksit, i, n, devre_basi=False):
+    bugunku_deger, taksit, i, n = dizi(bugunku_deger), dizi(taksit), dizi(i), dizi(n)
+
+    carpan = taksit * _anuite_faktoru(i, n)
+    if devre_basi:
+        carpan = carpan * (1 + i)
+
+    gecersiz = (taksit <= 0) | (i <= 0) | (n <= 0) | (bugunku_deger <= 0) | (carpan <= 0)
+    return np.log(bugunku_deger / carpan) / np.log1p(i), gecersiz
+
+
+@vektorel
+def sure_hesapla_bd(bugunku_deger, taksit, i, c, tahmin=5, tolerans=1e-6, maks_iterasyon=100):
+    bugunku_deger, taksit, i, c = dizi(bugunku_deger), dizi(taksit), dizi(i), dizi(c)
+
+    # v^n = 1 - BD·i / [a·(1+i)^c]
+    oran = bugunku_deger * i / (taksit * (1 + i) ** c)
+
+    gecersiz = (bugunku_deger <= 0) | (taksit <= 0) | (i <= 0) | (c < 0) | ~(oran < 1)
+    return -np.log1p(-oran) / np.log1p(i), gecersiz
@@ -0,0 +1,147 @@
+"""
+TOPLU ANÜİTE ÇÖZÜCÜ - NumPy sürümü
+
+`anuite_hesapla`'nın sütunlar üzerinde çalışan sürümü. Her sütunda NaN veya
+None o satır için bilinmeyeni gösterir; satırlar eksik değişken kümesine
+(ve tipe) göre gruplanır, her grup skaler `cozucu` kaydındaki planın NumPy
+karşılıklarıyla tek seferde çözülür. Sonuç sütunları girdi sırasındadır.
+
+NumPy karşılığı olmayan çözücüler (ör. çabuklaştırılmış `faiz_orani_hesapla_bd`)
+yalnızca o grubun satırlarında skaler fonksiyonla satır satır, sıcak
+başlangıçla (her satır bir öncekinin kökünden) çalıştırılır.
+"""
+
+from functools import partial
+from importlib import import_module
+
+import numpy as np
+
+from .. import cozucu as _cozucu
+from .._kok import sicak_baslangic
+from ._ortak import dizi, maskele
+
+_HATALAR = (ValueError, ZeroDivisionError, OverflowError)
+
+
+def anuite_hesapla_toplu(odeme=None, bugunku_deger=None, gelecek_deger=None, n=None, i=None,
+                         tip='devre_sonu', m=None, c=None, r=None, degisim=None):
+    """
+    Sütun sütun verilen kayıtlarda eksik anüite değişkenlerini hesaplar
+
+    Args:
+        odeme, bugunku_deger, gelecek_deger, n, i, m, c, r, degisim:
+            Sütunlar (liste veya dizi; NaN/None bilinmeyen), tüm satırlar için
+            ortak skaler ya da None (sütun tümüyle bilinmiyor)
+        tip: Anüite tipi; tek bir tip veya satır başına tip sütunu
+
+    Returns:
+        Değişken adı -> maskeli dizi sözlüğü (girdi sırasıyla); çözülemeyen,
+        geçersiz veya tipte tanımlı olmayan değerler maskelenir
+    """
+    girdiler = (odeme, bugunku_deger, gelecek_deger, n, i, m, c, r, degisim)
+    sutunlar = [None if x is None else dizi(np.where(_bos_mu(x), np.nan, x)) for x in girdiler]
+    satir_sayisi = np.broadcast_shapes(*(s.shape for s in sutunlar if s is not None), np.shape(tip))
+    if len(satir_sayisi) > 1:
+        raise ValueError("Sütunlar tek boyutlu olmalıdır.")
+
+    satir_sayisi = satir_sayisi[0] if satir_sayisi else 1
+    degerler = {
+        ad: np.full(satir_sayisi, np.nan) if s is None else np.array(np.broadcast_to(s, satir_sayisi))
+        for ad, s in zip(_cozucu._DEGISKENLER, sutunlar)
+    }
+
+    tipler, tip_kodu = np.unique(np.broadcast_to(np.asarray(tip, dtype=object), satir_sayisi)
+                                 .astype(str), return_inverse=True)
+    for ad in tipler:
+        if ad not in _cozucu._TIPLER:
+            raise ValueError(f"Bilinmeyen anüite tipi: {ad}")
+
+    # Grup anahtarı: tip kodu ve bilinmeyen değişkenlerin bit maskesi
+    bos = np.stack([np.isnan(degerler[ad]) for ad in _cozucu._DEGISKENLER], axis=1)
+    anahtar = tip_kodu.astype(np.int64) << len(_cozucu._DEGISKENLER)
+    anahtar |= bos @ (1 << np.arange(len(_cozucu._DEGISKENLER)))
+
+    gruplar, ilk, grup_kodu = np.unique(anahtar, return_index=True, return_inverse=True)
+    sira = np.argsort(grup_kodu, kind='stable')
+    sinirlar = np.cumsum(np.bincount(grup_kodu, minlength=gruplar.size))[:-1]
+
+    for satirlar, k in zip(np.split(sira, sinirlar), ilk):
+        plan = _plan(tipler[tip_kodu[k]], bos[k])
+        if not plan:
+            continue
+        grup = {ad: sutun[satirlar] for ad, sutun in degerler.items()}
+        with np.errstate(all='ignore'):
+            for cikti, fonksiyon, al in plan:
+                grup[cikti] = dizi(fonksiyon(*al(grup)))
+        for cikti, _, _ in plan:
+            degerler[cikti][satirlar] = grup[cikti]
+
+    return {ad: maskele(sutun, np.isnan(sutun)) for ad, sutun in degerler.items()}
+
+
+def _bos_mu(x):
+    """None öğelerini (nesne dizilerinde) bilinmeyen olarak işaretler"""
+    x = np.asarray(x, dtype=object) if not isinstance(x, np.ndarray) else x
+    if x.dtype != object:
+        return np.zeros(x.shape, dtype=bool)
+    return np.equal(x, None)
+
+
+def _plan(tip, bos):
+    """Tip ve bilinmeyen maskesi için NumPy planı (önbellekli; kurulamıyorsa ())"""
+    anahtar = (tip,) + tuple(bos.tolist())
+    plan = _cozucu._TOPLU_PLANLAR.get(anahtar)
+    if plan is None:
+        bilinenler = [ad for ad, b in zip(_cozucu._DEGISKENLER, bos) if not b]
+        try:
+            plan = _cozucu._plan_olustur(tip, bilinenler, donustur=_np_karsiligi)[0]
+        except ValueError:
+            # Yeterli parametre yok; grubun satırları çözümsüz kalır
+            plan = ()
+        _cozucu._TOPLU_PLANLAR[anahtar] = plan
+    return plan
+
+
+def _np_karsiligi(fonksiyon):
+    """Skaler çözücünün anuiteler.np karşılığı; yoksa satır satır sarmalayıcı"""
+    if isinstance(fonksiyon, partial):
+        karsilik = _np_karsiligi(fonksiyon.func)
+        if isinstance(karsilik, _SatirSatir):
+            return _SatirSatir(fonksiyon)
+        return partial(karsilik, *fonksiyon.args, **fonksiyon.keywords)
+
+    modul_adi = getattr(fonksiyon, '__module__', '') or ''
+    if modul_adi.startswith('anuiteler.') and not modul_adi.startswith('anuiteler.np.'):
+        try:
+            modul = import_module('anuiteler.np.' + modul_adi.rsplit('.', 1)[1])
+        except ImportError:
+            modul = None
+        karsilik = getattr(modul, fonksiyon.__name__, None)
+        if karsilik is not None:
+            return karsilik
+
+    return _SatirSatir(fonksiyon)
+
+
+class _SatirSatir:
+    """Skaler fonksiyonu dizilere satır satır uygular; hata veren satırlar NaN"""
+
+    __slots__ = ('fonksiyon',)
+
+    def __init__(self, fonksiyon):
+        self.fonksiyon = fonksiyon
+
+    def __call__(self, *girdiler):
+        girdiler = np.broadcast_arrays(*(dizi(g) for g in girdiler))
+        sonuc = np.full(girdiler[0].shape, np.nan)
+        gecerli = np.logical_and.reduce([np.isfinite(g) for g in girdiler])
+
+        # Ardışık satırların iteratif çözücüleri bir önceki kökten başlar
+        with sicak_baslangic():
+            for k in np.flatnonzero(gecerli):
+                try:
+                    sonuc[k] = self.fonksiyon(*(float(g[k]) for g in girdiler))
+                except _HATALAR:
+                    pass
+
+        return sonuc
@@ -0,0 +1,309 @@
+"""
+DEVRE BAŞI ÖDEMELİ ANÜİTELER (Annuity-Due) - NumPy sürümü
+
+anuiteler.devre_basi_anuite ile aynı imzalar. Girdiler yayınlanır (broadcast),
+geçersiz satırlar hata yerine maske ile bildirilir.
+
+Faiz oranı çözücüleri tüm satırları aynı anda iterasyona sokan toplu
+Newton-Raphson kullanır; yakınsamayan satırlar maskelenir.
+"""
+
+import numpy as np
+
+from .. import izleme as _izleme
+from ._newton import birikim_tahmini, oran_coz, pesin_tahmini
+from ._ortak import dizi, maskele, vektorel
+from .devre_sonu_anuite import (
+    _a_ni, _a_ni_hedef, _aralik_gecersiz, _donem_gecersiz, _s_ni, _s_ni_turev
+)
+
+
+def _a_due(i, n):
+    """ä(n,i) çekirdeği (kontrolsüz)"""
+    return _a_ni(i, n) * (1 + i)
+
+
+def _s_due(i, n):
+    """s̈(n,i) çekirdeği (kontrolsüz)"""
+    return _s_ni(i, n) * (1 + i)
+
+
+def _a_due_hedef(i, n, hedef):
+    """ä(n,i) - hedef ve dä/di (Newton çekirdeği)"""
+    a_ni, da_di = _a_ni_hedef(i, n, 0)
+    return a_ni * (1 + i) - hedef, da_di * (1 + i) + a_ni
+
+
+def _s_due_hedef(i, n, hedef):
+    """ln s̈(n,i) - ln hedef ve türevi (Newton çekirdeği)"""
+    s_ni, ds_di = _s_ni_turev(i, n)
+    return np.log(s_ni * (1 + i) / hedef), ds_di / s_ni + 1 / (1 + i)
+
+
+@vektorel
+def pesin_deger_faktoru(i, n):
+    """Peşin değer faktörü: ä(n,i)"""
+    i, n = dizi(i), dizi(n)
+    return _a_due(i, n), (i <= 0) | (n <= 0)
+
+
+@vektorel
+def gelecek_deger_faktoru(i, n):
+    """Gelecek değer faktörü: s̈(n,i)"""
+    i, n = dizi(i), dizi(n)
+    return _s_due(i, n), (i <= 0) | (n <= 0)
+
+
+# ============================================================
+# BUGÜNKÜ DEĞER HESAPLAMALARI (BD = a × ä(n,i))
+# ============================================================
+
+@vektorel
+def bugunku_deger_hesapla(odeme, n, i):
+    """BD = a × ä(n,i)"""
+    odeme, n, i = dizi(odeme), dizi(n), dizi(i)
+    return odeme * _a_due(i, n), (i <= 0) | (n <= 0)
+
+
+@vektorel
+def odeme_bugunku_degerden(bugunku_deger, n, i):
+    """a = BD / ä(n,i)"""
+    bugunku_deger, n, i = dizi(bugunku_deger), dizi(n), dizi(i)
+    return bugunku_deger / _a_due(i, n), (i <= 0) | (n <= 0)
+
+
+@vektorel
+def sure_bugunku_degerden(bugunku_deger, odeme, i):
+    """n hesaplama: BD/a = ä(n,i)"""
+    bugunku_deger, odeme, i = dizi(bugunku_deger), dizi(odeme), dizi(i)
+    hedef = 1 - i * bugunku_deger / (odeme * (1 + i))
+
+    gecersiz = (odeme <= 0) | (i <= 0) | (hedef <= 0)
+    return -np.log(hedef) / np.log1p(i), gecersiz
+
+
+def faiz_bugunku_degerden_ayrintili(bugunku_deger, odeme, n, tahmin=None, tolerans=1e-6,
+                                    max_iter=100):
+    """
+    Toplu Newton-Raphson ile faiz oranı hesaplama
+
+    Returns:
+        {'i', 'iterasyon', 'artik', 'yakinsadi'} anahtarlı sözlük; her satırın
+        kendi iterasyon sayısı ve son artığı (ä(n,i) - BD/a) ile birlikte
+    """
+    sonuc = oran_coz(_a_due_hedef, bugunku_deger, odeme, n, tahmin, tolerans, max_iter,
+                     tahminci=lambda hedef, n: pesin_tahmini(hedef, n, 1))
+    if _izleme.ETKIN:
+        _izleme.toplu_cozum_kaydet('np.devre_basi_anuite.faiz_bugunku_degerden',
+                                   sonuc['iterasyon'], sonuc['artik'], sonuc['yakinsadi'])
+    return sonuc
+
+
+def faiz_bugunku_degerden(bugunku_deger, odeme, n, tahmin=None, tolerans=1e-6, max_iter=100):
+    """Newton-Raphson ile faiz oranı hesaplama (geçersiz/yakınsamayan satırlar maskeli)"""
+    sonuc = faiz_bugunku_degerden_ayrintili(bugunku_deger, odeme, n, tahmin, tolerans, max_iter)
+    return maskele(sonuc['i'], ~sonuc['yakinsadi'])
+
+
+# ============================================================
+# GELECEK DEĞER HESAPLAMALARI (GD = a × s̈(n,i))
+# ============================================================
+
+@vektorel
+def gelecek_deger_hesapla(odeme, n, i):
+    """GD = a × s̈(n,i)"""
+    odeme, n, i = dizi(odeme), dizi(n), dizi(i)
+    return odeme * _s_due(i, n), (i <= 0) | (n <= 0)
+
+
+@vektorel
+def odeme_gelecek_degerden(gelecek_deger, n, i):
+    """a = GD / s̈(n,i)"""
+    gelecek_deger, n, i = dizi(gelecek_deger), dizi(n), dizi(i)
+    return gelecek_deger / _s_due(i, n), (i <= 0) | (n <= 0)
+
+
+@vektorel
+def sure_gelecek_degerden(gelecek_deger, odeme, i):
+    """n hesaplama: GD/a = s̈(n,i)"""
+    gelecek_deger, odeme, i = dizi(gelecek_deger), dizi(odeme), dizi(i)
+    hedef = 1 + i * gelecek_deger / (odeme * (1 + i))
+
+    gecersiz = (odeme <= 0) | (i <= 0) | (hedef <= 0)
+    return np.log(hedef) / np.log1p(i), gecersiz
+
+
+def faiz_gelecek_degerden_ayrintili(gelecek_deger, odeme, n, tahmin=None, tolerans=1e-6,
+                                   max_iter=100):
+    """
+    Toplu Newton-Raphson ile faiz oranı hesaplama (GD'den)
+
+    Returns:
+        {'i', 'iterasyon', 'artik', 'yakinsadi'} anahtarlı sözlük; artık
+        logaritmiktir: ln s̈(n,i) - ln(GD/a)
+    """
+    sonuc = oran_coz(_s_due_hedef, gelecek_deger, odeme, n, tahmin, tolerans, max_iter,
+                     tahminci=lambda hedef, n: birikim_tahmini(hedef, n, 1))
+    if _izleme.ETKIN:
+        _izleme.toplu_cozum_kaydet('np.devre_basi_anuite.faiz_gelecek_degerden',
+                                   sonuc['iterasyon'], sonuc['artik'], sonuc['yakinsadi'])
+    return sonuc
+
+
+def faiz_gelecek_degerden(gelecek_deger, odeme, n, tahmin=None, tolerans=1e-6, max_iter=100):
+    """Newton-Raphson ile faiz oranı hesaplama (GD'den, yakınsamayan satırlar maskeli)"""
+    sonuc = faiz_gelecek_degerden_ayrintili(gelecek_deger, odeme, n, tahmin, tolerans, max_iter)
+    return maskele(sonuc['i'], ~sonuc['yakinsadi'])
+
+
+# ============================================================
+# KISA İSİMLER
+# ============================================================
+
+def bugunku_deger(odeme, n, i):
+    """Genel BD fonksiyonu (kısa isim)"""
+    return bugunku_deger_hesapla(odeme, n, i)
+
+
+def gelecek_deger(odeme, n, i):
+    """Genel GD fonksiyonu (kısa isim)"""
+    return gelecek_deger_hesapla(odeme, n, i)
+
+
+def odeme_hesapla_bd(bugunku_deger, n, i):
+    """BD'den ödeme (alternatif isim)"""
+    return odeme_bugunku_degerden(bugunku_deger, n, i)
+
+
+def odeme_hesapla_gd(gelecek_deger, n, i):
+    """GD'den ödeme (alternatif isim)"""
+    return odeme_gelecek_degerden(gelecek_deger, n, i)
+
+
+def sure_hesapla_bd(bugunku_deger, odeme, i):
+    """BD'den süre (alternatif isim)"""
+    return sure_bugunku_degerden(bugunku_deger, odeme, i)
+
+
+def sure_hesapla_gd(gelecek_deger, odeme, i):
+    """GD'den süre (alternatif isim)"""
+    return sure_gelecek_degerden(gelecek_deger, odeme, i)
+
+
+def faiz_hesapla_bd(bugunku_deger, odeme, n, tahmin=None, tolerans=1e-6, max_iter=100):
+    """BD'den faiz (alternatif isim)"""
+    return faiz_bugunku_degerden(bugunku_deger, odeme, n, tahmin, tolerans, max_iter)
+
+
+def faiz_hesapla_gd(gelecek_deger, odeme, n, tahmin=None, tolerans=1e-6, max_iter=100):
+    """GD'den faiz (alternatif isim)"""
+    return faiz_gelecek_degerden(gelecek_deger, odeme, n, tahmin, tolerans, max_iter)
+
+
+# ============================================================
+# YARDIMCI FONKSİYONLAR
+# ============================================================
+
+@vektorel
+def kalan_bakiye_hesapla(odeme, n, i, k):
+    """k. dönem sonu bakiyesi: a × ä(n-k, i) (k = 0 için BD)"""
+    odeme, n, i, k = dizi(odeme), dizi(n), dizi(i), dizi(k)
+    return odeme * _a_due(i, n - k), _donem_gecersiz(n, i, k, alt_sinir=0)
+
+
+@vektorel
+def donem_faizi_hesapla(odeme, n, i, k):
+    """k. dönemde işleyen faiz: a × (1 - v^(n-k))"""
+    odeme, n, i, k = dizi(odeme), dizi(n), dizi(i), dizi(k)
+    return -odeme * np.expm1(-(n - k) * np.log1p(i)), _donem_gecersiz(n, i, k)
+
+
+@vektorel
+def donem_anaparasi_hesapla(odeme, n, i, k):
+    """k. dönemin anapara payı (tablodaki gibi dönem başı ödemenin tamamı)"""
+    odeme, n, i, k = dizi(odeme), dizi(n), dizi(i), dizi(k)
+    return odeme, _donem_gecersiz(n, i, k)
+
+
+def donem_satiri_hesapla(odeme, n, i, k):
+    """k. dönemin tablo satırı; her anahtar için maskeli dizi döndürür"""
+    faiz = donem_faizi_hesapla(odeme, n, i, k)
+
+    return {
+        'donem': np.ma.masked_array(np.broadcast_to(k, faiz.shape), mask=faiz.mask),
+        'odeme': np.ma.masked_array(np.broadcast_to(odeme, faiz.shape), mask=faiz.mask),
+        'faiz': faiz,
+        'anapara': donem_anaparasi_hesapla(odeme, n, i, k),
+        'kalan': kalan_bakiye_hesapla(odeme, n, i, k),
+    }
+
+
+@vektorel
+def kumulatif_faiz_hesapla(odeme, n, i, baslangic, bitis):
+    """baslangic..bitis dönemlerinde işleyen faiz: a × [m - v^(n-b) × ä(m, i)], m = b-a+1"""
+    odeme, n, i = dizi(odeme), dizi(n), dizi(i)
+    baslangic, bitis = dizi(baslangic), dizi(bitis)
+    m = bitis - baslangic + 1
+
+    deger = odeme * (m - np.exp(-(n - bitis) * np.log1p(i)) * _a_due(i, m))
+    return deger, _aralik_gecersiz(n, i, baslangic, bitis)
+
+
+@vektorel
+def kumulatif_anapara_hesapla(odeme, n, i, baslangic, bitis):
+    """baslangic..bitis dönemlerinin anapara payı (tablodaki gibi ödemelerin tamamı)"""
+    odeme, n, i = dizi(odeme), dizi(n), dizi(i)
+    baslangic, bitis = dizi(baslangic), dizi(bitis)
+    return odeme * (bitis - baslangic + 1), _aralik_gecersiz(n, i, baslangic, bitis)
+
+
+def yillik_ozet_hesapla(odeme, n, i, yil_basina_donem=12):
+    """
+    Portföy için yıllık faiz/anapara özeti (aylık satır üretmeden)
+
+    Returns:
+        {'yil', 'faiz', 'anapara'} anahtarlı sözlük; faiz ve anapara
+        (kredi sayısı, yıl sayısı) şeklinde maskeli dizilerdir. Vadesi dolmuş
+        yıllar ve geçersiz krediler maskelenir.
+    """
+    odeme, n, i = (np.atleast_1d(x) for x in np.broadcast_arrays(dizi(odeme), dizi(n), dizi(i)))
+
+    gecerli_n = n[n > 0]
+    yil_sayisi = int(np.ceil(gecerli_n.max() / yil_basina_donem)) if gecerli_n.size else 0
+    yil = np.arange(1, yil_sayisi + 1)
+
+    baslangic = (yil - 1) * yil_basina_donem + 1
+    bitis = np.minimum(yil * yil_basina_donem, n[:, None])
+
+    return {
+        'yil': yil,
+        'faiz': kumulatif_faiz_hesapla(odeme[:, None], n[:, None], i[:, None], baslangic, bitis),
+        'anapara': kumulatif_anapara_hesapla(odeme[:, None], n[:, None], i[:, None], baslangic, bitis),
+    }
+
+
+@vektorel
+def toplam_odenen_hesapla(odeme, n):
+    """Toplam ödenen tutar"""
+    odeme, n = dizi(odeme), dizi(n)
+    return odeme * n, np.zeros((), dtype=bool)
+
+
+@vektorel
+def toplam_faiz_hesapla(odeme, n, bugunku_deger):
+    """Toplam ödenen faiz"""
+    odeme, n, bugunku_deger = dizi(odeme), dizi(n), dizi(bugunku_deger)
+    return odeme * n - bugunku_deger, np.zeros((), dtype=bool)
+
+
+@vektorel
+def ortalama_sure_hesapla(odeme, n, i):
+    """Ortalama vade (Macaulay duration benzeri) - Devre Başı"""
+    odeme, n, i = dizi(odeme), dizi(n), dizi(i)
+
+    # Ödemeler 0, 1, ..., n-1 zamanlarında: Σ t·v^t / ä(n,i) = (Ia)(n,i) / a(n,i) - 1
+    a_ni = _a_ni(i, n)
+    artan = (a_ni * (1 + i) - n * (1 + i) ** -n) / i
+
+    gecersiz = (i <= 0) | (n <= 0) | (odeme == 0)
+    return artan / a_ni - 1, gecersiz
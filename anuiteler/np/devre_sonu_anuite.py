@@ -0,0 +1,363 @@
+"""
+DEVRE SONU ÖDEMELİ ANÜİTELER (Ordinary Annuity) - NumPy sürümü
+
+anuiteler.devre_sonu_anuite ile aynı imzalar. Girdiler yayınlanır (broadcast),
+geçersiz satırlar hata yerine maske ile bildirilir.
+
+Faiz oranı çözücüleri tüm satırları aynı anda iterasyona sokan toplu
+Newton-Raphson kullanır; yakınsamayan satırlar maskelenir.
+"""
+
+import numpy as np
+
+from .. import izleme as _izleme
+from ._newton import birikim_tahmini, oran_coz, pesin_tahmini
+from ._ortak import dizi, maskele, vektorel
+
+
+def _a_ni(i, n):
+    """a(n,i) çekirdeği (kontrolsüz): (1 - v^n) / i"""
+    # v^n = exp(-n·ln(1+i)); expm1/log1p küçük i'de hassasiyeti korur ve pow'dan hızlıdır
+    return -np.expm1(-n * np.log1p(i)) / i
+
+
+def _s_ni(i, n):
+    """s(n,i) çekirdeği (kontrolsüz): ((1+i)^n - 1) / i"""
+    return np.expm1(n * np.log1p(i)) / i
+
+
+def _a_ni_hedef(i, n, hedef):
+    """a(n,i) - hedef ve da/di (Newton çekirdeği)"""
+    v_n = np.exp(-n * np.log1p(i))
+    a_ni = (1 - v_n) / i
+    return a_ni - hedef, (n * v_n / (1 + i) - a_ni) / i
+
+
+def _s_ni_turev(i, n):
+    """s(n,i) ve ds/di"""
+    birikim = np.exp(n * np.log1p(i))
+    s_ni = (birikim - 1) / i
+    return s_ni, (n * birikim / (1 + i) - s_ni) / i
+
+
+def _s_ni_hedef(i, n, hedef):
+    """ln s(n,i) - ln hedef ve türevi (Newton çekirdeği)"""
+    # s(n,i) büyük vadelerde üstel büyür; logaritmik artık göreli hatadır ve
+    # Newton adımlarının aşırı sıçramasını önler
+    s_ni, ds_di = _s_ni_turev(i, n)
+    return np.log(s_ni / hedef), ds_di / s_ni
+
+
+@vektorel
+def pesin_deger_faktoru(i, n):
+    """Peşin değer faktörü: a(n,i)"""
+    i, n = dizi(i), dizi(n)
+    return _a_ni(i, n), (i <= 0) | (n <= 0)
+
+
+@vektorel
+def gelecek_deger_faktoru(i, n):
+    """Gelecek değer faktörü: s(n,i)"""
+    i, n = dizi(i), dizi(n)
+    return _s_ni(i, n), (i <= 0) | (n <= 0)
+
+
+def faktor_serisi(i, n_max):
+    """
+    Her oran için n = 1..n_max a(n,i), s(n,i), ä(n,i), s̈(n,i) matrisleri
+
+    Son eksen dönemdir: v^n yerinde cumprod, a(n) cumsum ile tek geçişte
+    bulunur; s(n) = a(n) / v^n. i <= 0 olan oranların satırları maskelenir.
+
+    Returns:
+        'pesin', 'gelecek', 'pesin_devre_basi', 'gelecek_devre_basi'
+        anahtarlı sözlük; değerler i.shape + (n_max,) şekilli maskeli diziler
+    """
+    if n_max < 1 or n_max != int(n_max):
+        raise ValueError("Dönem sayısı pozitif bir tamsayı olmalıdır.")
+
+    i = dizi(i)
+    gecersiz = ~(i > 0)
+    birikim = 1 + np.where(gecersiz, 1.0, i)
+
+    carpan = birikim[..., np.newaxis]
+    v_n = np.empty(i.shape + (int(n_max),))
+    v_n[...] = 1 / carpan
+    np.cumprod(v_n, axis=-1, out=v_n)
+
+    pesin = np.cumsum(v_n, axis=-1)
+    gelecek = pesin / v_n
+    gecersiz = gecersiz[..., np.newaxis]
+
+    return {
+        'pesin': maskele(pesin, gecersiz),
+        'gelecek': maskele(gelecek, gecersiz),
+        'pesin_devre_basi': maskele(pesin * carpan, gecersiz),
+        'gelecek_devre_basi': maskele(gelecek * carpan, gecersiz),
+    }
+
+
+# ============================================================
+# BUGÜNKÜ DEĞER HESAPLAMALARI (BD = a × a(n,i))
+# ============================================================
+
+@vektorel
+def bugunku_deger_hesapla(odeme, n, i):
+    """BD = a × a(n,i)"""
+    odeme, n, i = dizi(odeme), dizi(n), dizi(i)
+    return odeme * _a_ni(i, n), (i <= 0) | (n <= 0)
+
+
+@vektorel
+def odeme_bugunku_degerden(bugunku_deger, n, i):
+    """a = BD / a(n,i)"""
+    bugunku_deger, n, i = dizi(bugunku_deger), dizi(n), dizi(i)
+    return bugunku_deger / _a_ni(i, n), (i <= 0) | (n <= 0)
+
+
+@vektorel
+def sure_bugunku_degerden(bugunku_deger, odeme, i):
+    """n hesaplama: BD/a = (1-v^n)/i"""
+    bugunku_deger, odeme, i = dizi(bugunku_deger), dizi(odeme), dizi(i)
+    hedef = 1 - (i * bugunku_deger / odeme)
+
+    gecersiz = (odeme <= 0) | (i <= 0) | (hedef <= 0)
+    return -np.log(hedef) / np.log1p(i), gecersiz
+
+
+def faiz_bugunku_degerden_ayrintili(bugunku_deger, odeme, n, tahmin=None, tolerans=1e-6,
+                                    max_iter=100):
+    """
+    Toplu Newton-Raphson ile faiz oranı hesaplama
+
+    Returns:
+        {'i', 'iterasyon', 'artik', 'yakinsadi'} anahtarlı sözlük; her satırın
+        kendi iterasyon sayısı ve son artığı (a(n,i) - BD/a) ile birlikte
+    """
+    sonuc = oran_coz(_a_ni_hedef, bugunku_deger, odeme, n, tahmin, tolerans, max_iter,
+                     tahminci=pesin_tahmini)
+    if _izleme.ETKIN:
+        _izleme.toplu_cozum_kaydet('np.devre_sonu_anuite.faiz_bugunku_degerden',
+                                   sonuc['iterasyon'], sonuc['artik'], sonuc['yakinsadi'])
+    return sonuc
+
+
+def faiz_bugunku_degerden(bugunku_deger, odeme, n, tahmin=None, tolerans=1e-6, max_iter=100):
+    """Newton-Raphson ile faiz oranı hesaplama (geçersiz/yakınsamayan satırlar maskeli)"""
+    sonuc = faiz_bugunku_degerden_ayrintili(bugunku_deger, odeme, n, tahmin, tolerans, max_iter)
+    return maskele(sonuc['i'], ~sonuc['yakinsadi'])
+
+
+# ============================================================
+# GELECEK DEĞER HESAPLAMALARI (GD = a × s(n,i))
+# ============================================================
+
+@vektorel
+def gelecek_deger_hesapla(odeme, n, i):
+    """GD = a × s(n,i)"""
+    odeme, n, i = dizi(odeme), dizi(n), dizi(i)
+    return odeme * _s_ni(i, n), (i <= 0) | (n <= 0)
+
+
+@vektorel
+def odeme_gelecek_degerden(gelecek_deger, n, i):
+    """a = GD / s(n,i)"""
+    gelecek_deger, n, i = dizi(gelecek_deger), dizi(n), dizi(i)
+    return gelecek_deger / _s_ni(i, n), (i <= 0) | (n <= 0)
+
+
+@vektorel
+def sure_gelecek_degerden(gelecek_deger, odeme, i):
+    """n hesaplama: GD/a = [(1+i)^n - 1]/i"""
+    gelecek_deger, odeme, i = dizi(gelecek_deger), dizi(odeme), dizi(i)
+    hedef = 1 + (i * gelecek_deger / odeme)
+
+    gecersiz = (odeme <= 0) | (i <= 0) | (hedef <= 0)
+    return np.log(hedef) / np.log1p(i), gecersiz
+
+
+def faiz_gelecek_degerden_ayrintili(gelecek_deger, odeme, n, tahmin=None, tolerans=1e-6,
+                                   max_iter=100):
+    """
+    Toplu Newton-Raphson ile faiz oranı hesaplama (GD'den)
+
+    Returns:
+        {'i', 'iterasyon', 'artik', 'yakinsadi'} anahtarlı sözlük; artık
+        logaritmiktir: ln s(n,i) - ln(GD/a)
+    """
+    sonuc = oran_coz(_s_ni_hedef, gelecek_deger, odeme, n, tahmin, tolerans, max_iter,
+                     tahminci=birikim_tahmini)
+    if _izleme.ETKIN:
+        _izleme.toplu_cozum_kaydet('np.devre_sonu_anuite.faiz_gelecek_degerden',
+                                   sonuc['iterasyon'], sonuc['artik'], sonuc['yakinsadi'])
+    return sonuc
+
+
+def faiz_gelecek_degerden(gelecek_deger, odeme, n, tahmin=None, tolerans=1e-6, max_iter=100):
+    """Newton-Raphson ile faiz oranı hesaplama (GD'den, yakınsamayan satırlar maskeli)"""
+    sonuc = faiz_gelecek_degerden_ayrintili(gelecek_deger, odeme, n, tahmin, tolerans, max_iter)
+    return maskele(sonuc['i'], ~sonuc['yakinsadi'])
+
+
+# ============================================================
+# KISA İSİMLER
+# ============================================================
+
+def bugunku_deger(odeme, n, i):
+    """Genel BD fonksiyonu (kısa isim)"""
+    return bugunku_deger_hesapla(odeme, n, i)
+
+
+def gelecek_deger(odeme, n, i):
+    """Genel GD fonksiyonu (kısa isim)"""
+    return gelecek_deger_hesapla(odeme, n, i)
+
+
+def odeme_hesapla_bd(bugunku_deger, n, i):
+    """BD'den ödeme (alternatif isim)"""
+    return odeme_bugunku_degerden(bugunku_deger, n, i)
+
+
+def odeme_hesapla_gd(gelecek_deger, n, i):
+    """GD'den ödeme (alternatif isim)"""
+    return odeme_gelecek_degerden(gelecek_deger, n, i)
+
+
+def sure_hesapla_bd(bugunku_deger, odeme, i):
+    """BD'den süre (alternatif isim)"""
+    return sure_bugunku_degerden(bugunku_deger, odeme, i)
+
+
+def sure_hesapla_gd(gelecek_deger, odeme, i):
+    """GD'den süre (alternatif isim)"""
+    return sure_gelecek_degerden(gelecek_deger, odeme, i)
+
+
+def faiz_hesapla_bd(bugunku_deger, odeme, n, tahmin=None, tolerans=1e-6, max_iter=100):
+    """BD'den faiz (alternatif isim)"""
+    return faiz_bugunku_degerden(bugunku_deger, odeme, n, tahmin, tolerans, max_iter)
+
+
+def faiz_hesapla_gd(gelecek_deger, odeme, n, tahmin=None, tolerans=1e-6, max_iter=100):
+    """GD'den faiz (alternatif isim)"""
+    return faiz_gelecek_degerden(gelecek_deger, odeme, n, tahmin, tolerans, max_iter)
+
+
+# ============================================================
+# YARDIMCI FONKSİYONLAR
+# ============================================================
+
+def _donem_gecersiz(n, i, k, alt_sinir=1):
+    """Dönem fonksiyonları için geçersiz satırlar: i <= 0, n <= 0, k ∉ [alt_sinir, n]"""
+    return (i <= 0) | (n <= 0) | (k < alt_sinir) | (k > n)
+
+
+@vektorel
+def kalan_bakiye_hesapla(odeme, n, i, k):
+    """k. ödemeden sonra kalan bakiye: a × a(n-k, i) (k = 0 için BD)"""
+    odeme, n, i, k = dizi(odeme), dizi(n), dizi(i), dizi(k)
+    return odeme * _a_ni(i, n - k), _donem_gecersiz(n, i, k, alt_sinir=0)
+
+
+@vektorel
+def donem_faizi_hesapla(odeme, n, i, k):
+    """k. ödemenin faiz payı: a × (1 - v^(n-k+1))"""
+    odeme, n, i, k = dizi(odeme), dizi(n), dizi(i), dizi(k)
+    return -odeme * np.expm1(-(n - k + 1) * np.log1p(i)), _donem_gecersiz(n, i, k)
+
+
+@vektorel
+def donem_anaparasi_hesapla(odeme, n, i, k):
+    """k. ödemenin anapara payı: a × v^(n-k+1)"""
+    odeme, n, i, k = dizi(odeme), dizi(n), dizi(i), dizi(k)
+    return odeme * np.exp(-(n - k + 1) * np.log1p(i)), _donem_gecersiz(n, i, k)
+
+
+def donem_satiri_hesapla(odeme, n, i, k):
+    """k. dönemin tablo satırı; her anahtar için maskeli dizi döndürür"""
+    faiz = donem_faizi_hesapla(odeme, n, i, k)
+
+    return {
+        'donem': np.ma.masked_array(np.broadcast_to(k, faiz.shape), mask=faiz.mask),
+        'odeme': np.ma.masked_array(np.broadcast_to(odeme, faiz.shape), mask=faiz.mask),
+        'faiz': faiz,
+        'anapara': donem_anaparasi_hesapla(odeme, n, i, k),
+        'kalan': kalan_bakiye_hesapla(odeme, n, i, k),
+    }
+
+
+def _aralik_gecersiz(n, i, baslangic, bitis):
+    """Kümülatif fonksiyonlar için geçersiz satırlar: 1 <= baslangic <= bitis <= n dışı"""
+    return _donem_gecersiz(n, i, baslangic) | (bitis < baslangic) | (bitis > n)
+
+
+@vektorel
+def kumulatif_anapara_hesapla(odeme, n, i, baslangic, bitis):
+    """baslangic..bitis dönemlerinde ödenen anapara: a × v^(n-b) × a(b-a+1, i)"""
+    odeme, n, i = dizi(odeme), dizi(n), dizi(i)
+    baslangic, bitis = dizi(baslangic), dizi(bitis)
+
+    deger = odeme * np.exp(-(n - bitis) * np.log1p(i)) * _a_ni(i, bitis - baslangic + 1)
+    return deger, _aralik_gecersiz(n, i, baslangic, bitis)
+
+
+@vektorel
+def kumulatif_faiz_hesapla(odeme, n, i, baslangic, bitis):
+    """baslangic..bitis dönemlerinde ödenen faiz"""
+    odeme, n, i = dizi(odeme), dizi(n), dizi(i)
+    baslangic, bitis = dizi(baslangic), dizi(bitis)
+
+    anapara = odeme * np.exp(-(n - bitis) * np.log1p(i)) * _a_ni(i, bitis - baslangic + 1)
+    return odeme * (bitis - baslangic + 1) - anapara, _aralik_gecersiz(n, i, baslangic, bitis)
+
+
+def yillik_ozet_hesapla(odeme, n, i, yil_basina_donem=12):
+    """
+    Portföy için yıllık faiz/anapara özeti (aylık satır üretmeden)
+
+    Returns:
+        {'yil', 'faiz', 'anapara'} anahtarlı sözlük; faiz ve anapara
+        (kredi sayısı, yıl sayısı) şeklinde maskeli dizilerdir. Vadesi dolmuş
+        yıllar ve geçersiz krediler maskelenir.
+    """
+    odeme, n, i = (np.atleast_1d(x) for x in np.broadcast_arrays(dizi(odeme), dizi(n), dizi(i)))
+
+    gecerli_n = n[n > 0]
+    yil_sayisi = int(np.ceil(gecerli_n.max() / yil_basina_donem)) if gecerli_n.size else 0
+    yil = np.arange(1, yil_sayisi + 1)
+
+    baslangic = (yil - 1) * yil_basina_donem + 1
+    bitis = np.minimum(yil * yil_basina_donem, n[:, None])
+
+    return {
+        'yil': yil,
+        'faiz': kumulatif_faiz_hesapla(odeme[:, None], n[:, None], i[:, None], baslangic, bitis),
+        'anapara': kumulatif_anapara_hesapla(odeme[:, None], n[:, None], i[:, None], baslangic, bitis),
+    }
+
+
+@vektorel
+def toplam_odenen_hesapla(odeme, n):
+    """Toplam ödenen tutar"""
+    odeme, n = dizi(odeme), dizi(n)
+    return odeme * n, np.zeros((), dtype=bool)
+
+
+@vektorel
+def toplam_faiz_hesapla(odeme, n, bugunku_deger):
+    """Toplam ödenen faiz"""
+    odeme, n, bugunku_deger = dizi(odeme), dizi(n), dizi(bugunku_deger)
+    return odeme * n - bugunku_deger, np.zeros((), dtype=bool)
+
+
+@vektorel
+def ortalama_sure_hesapla(odeme, n, i):
+    """Ortalama vade (Macaulay duration benzeri)"""
+    odeme, n, i = dizi(odeme), dizi(n), dizi(i)
+
+    # Σ t·v^t = (Ia)(n,i) = [ä(n,i) - n·v^n] / i
+    a_ni = _a_ni(i, n)
+    artan = (a_ni * (1 + i) - n * (1 + i) ** -n) / i
+
+    gecersiz = (i <= 0) | (n <= 0) | (odeme == 0)
+    return artan / a_ni, gecersiz
@@ -0,0 +1,150 @@
+"""
+ERTELENMİŞ (GECİKTİRİLMİŞ) ANÜİTE HESAPLAMALARI - NumPy sürümü
+
+anuiteler.ertelenmis_anuite ile aynı imzalar. Girdiler yayınlanır (broadcast),
+geçersiz satırlar hata yerine maske ile bildirilir.
+
+sure_hesapla_bd kapalı formdur; iteratif faiz_orani_hesapla_bd burada yer almaz.
+"""
+
+import numpy as np
+
+from ._ortak import dizi, vektorel
+
+
+def _bd_faktoru(i, n, m):
+    """[(1+i)^n - 1] / [(1+i)^(n+m) × i] çekirdeği (kontrolsüz)"""
+    return ((1 + i) ** n - 1) / ((1 + i) ** (n + m) * i)
+
+
+# ============================================================================
+# DEVRE SONU ÖDEMELİ ERTELENMİŞ ANÜİTE
+# ============================================================================
+
+@vektorel
+def bugunku_deger_devre_sonu(taksit, i, n, m):
+    taksit, i, n, m = dizi(taksit), dizi(i), dizi(n), dizi(m)
+
+    gecersiz = (i <= 0) | (n <= 0) | (m < 0) | (taksit < 0)
+    return taksit * _bd_faktoru(i, n, m), gecersiz
+
+
+@vektorel
+def gelecek_deger_devre_sonu(taksit, i, n, m):
+    taksit, i, n = dizi(taksit), dizi(i), dizi(n)
+
+    # Erteleme GD'yi etkilemez, sadece BD'yi etkiler
+    return taksit * ((1 + i) ** n - 1) / i, (i <= 0) | (n <= 0)
+
+
+@vektorel
+def taksit_hesapla_bd_devre_sonu(bugunku_deger, i, n, m):
+    bugunku_deger, i, n, m = dizi(bugunku_deger), dizi(i), dizi(n), dizi(m)
+
+    gecersiz = (i <= 0) | (n <= 0) | (m < 0) | (bugunku_deger < 0)
+    return bugunku_deger / _bd_faktoru(i, n, m), gecersiz
+
+
+@vektorel
+def taksit_hesapla_gd_devre_sonu(gelecek_deger, i, n):
+    gelecek_deger, i, n = dizi(gelecek_deger), dizi(i), dizi(n)
+
+    gecersiz = (i <= 0) | (n <= 0) | (gelecek_deger < 0)
+    return gelecek_deger * i / ((1 + i) ** n - 1), gecersiz
+
+
+# ============================================================================
+# DEVRE BAŞI ÖDEMELİ ERTELENMİŞ ANÜİTE
+# ============================================================================
+
+@vektorel
+def bugunku_deger_devre_basi(taksit, i, n, m):
+    taksit, i, n, m = dizi(taksit), dizi(i), dizi(n), dizi(m)
+
+    gecersiz = (i <= 0) | (n <= 0) | (m < 0) | (taksit < 0)
+    return taksit * _bd_faktoru(i, n, m) * (1 + i), gecersiz
+
+
+@vektorel
+def gelecek_deger_devre_basi(taksit, i, n):
+    taksit, i, n = dizi(taksit), dizi(i), dizi(n)
+
+    return taksit * (1 + i) * ((1 + i) ** n - 1) / i, (i <= 0) | (n <= 0)
+
+
+@vektorel
+def taksit_hesapla_bd_devre_basi(bugunku_deger, i, n, m):
+    bugunku_deger, i, n, m = dizi(bugunku_deger), dizi(i), dizi(n), dizi(m)
+
+    gecersiz = (i <= 0) | (n <= 0) | (m < 0) | (bugunku_deger < 0)
+    return bugunku_deger / (_bd_faktoru(i, n, m) * (1 + i)), gecersiz
+
+
+# ============================================================================
+# ÇABUKLAŞTIRILMIŞ ERTELENMİŞ ANÜİTE
+# ============================================================================
+
+@vektorel
+def bugunku_deger_cabuklas_ertelenmis(taksit, i, n, m, c):
+    taksit, i, n, m, c = dizi(taksit), dizi(i), dizi(n), dizi(m), dizi(c)
+
+    gecersiz = (i <= 0) | (n <= 0) | (m < 0) | (c < 0) | (taksit < 0)
+    return taksit * _bd_faktoru(i, n, m) * (1 + i) ** c, gecersiz
+
+
+# ============================================================================
+# TERS FORMÜLLER (KAPALI FORM)
+# ============================================================================
+
+@vektorel
+def gecikme_suresi_hesapla_bd(bugunku_deger, taksit, i, n, devre_basi=False):
+    bugunku_deger, taksit, i, n = dizi(bugunku_deger), dizi(taksit), dizi(i), dizi(n)
+
+    if devre_basi:
+        bugunku_deger = bugunku_deger / (1 + i)
+
+    n_plus_m = np.log(taksit * ((1 + i) ** n - 1) / (bugunku_deger * i)) / np.log1p(i)
+    m = n_plus_m - n
+
+    gecersiz = (taksit <= 0) | (i <= 0) | (n <= 0) | (bugunku_deger <= 0) | ~(m >= 0)
+    return m, gecersiz
+
+
+@vektorel
+def sure_hesapla_bd(bugunku_deger, taksit, i, m, devre_basi=False,
+                    tahmin=5, tolerans=1e-6, maks_iterasyon=100):
+    bugunku_deger, taksit, i, m = dizi(bugunku_deger), dizi(taksit), dizi(i), dizi(m)
+
+    if devre_basi:
+        bugunku_deger = bugunku_deger / (1 + i)
+
+    # v^n = 1 - BD·i·(1+i)^m / a
+    oran = bugunku_deger * i * (1 + i) ** m / taksit
+
+    gecersiz = (bugunku_deger <= 0) | (taksit <= 0) | (i <= 0) | (m < 0) | ~(oran < 1)
+    return -np.log1p(-oran) / np.log1p(i), gecersiz
+
+
+# ============================================================================
+# GERİYE UYUMLULUK FONKSİYONLARI
+# ============================================================================
+
+def bugunku_deger(taksit, i, n, m, devre_basi=False):
+    """Genel bugünkü değer hesaplama (devre sonu/başı otomatik)"""
+    if devre_basi:
+        return bugunku_deger_devre_basi(taksit, i, n, m)
+    return bugunku_deger_devre_sonu(taksit, i, n, m)
+
+
+def gelecek_deger(taksit, i, n, devre_basi=False):
+    """Genel gelecek değer hesaplama (erteleme GD'yi etkilemez)"""
+    if devre_basi:
+        return gelecek_deger_devre_basi(taksit, i, n)
+    return gelecek_deger_devre_sonu(taksit, i, n, m=0)
+
+
+def taksit_hesapla_bd(bugunku_deger, i, n, m, devre_basi=False):
+    """Genel taksit hesaplama (BD'den)"""
+    if devre_basi:
+        return taksit_hesapla_bd_devre_basi(bugunku_deger, i, n, m)
+    return taksit_hesapla_bd_devre_sonu(bugunku_deger, i, n, m)
@@ -0,0 +1,99 @@
+"""
+ÖNCEDEN HESAPLANMIŞ FAKTÖR TABLOLARI - NumPy sürümü
+
+anuiteler.faktor_tablosu.FaktorTablosu ile aynı aramalar, dizilerle. Tablo
+bölümleri bellek eşlemesi üzerinde kopyasız, salt okunur ndarray
+görünümleridir; arama satır başına iki indeksleme (interpolasyonda dört)
+maliyetindedir. Izgarada olmayan (interpolasyon kapalıyken), aralık dışı
+oranlar ve geçersiz dönemler maskelenir.
+"""
+
+import numpy as np
+
+from ._ortak import dizi, vektorel
+
+
+def _gorunum(tablo, ad):
+    """Bölümün düz ndarray görünümü (ızgara satırı k, dönem n → k·(n_max+1) + n)"""
+    return np.frombuffer(tablo.bolum(ad), dtype=float)
+
+
+def _konum(tablo, i, interpolasyon):
+    """Izgara indeksi k, k+1 komşusunun ağırlığı (yoksa None) ve geçersiz satırlar"""
+    t = (i - tablo.baslangic) / tablo.adim
+    k = np.rint(t)
+    gecersiz = ~((np.abs(t - k) <= 1e-12 / tablo.adim) & (k >= 0) & (k < tablo.oran_sayisi))
+
+    agirlik = None
+    if interpolasyon and gecersiz.any():
+        alt = np.floor(t)
+        ara = gecersiz & (alt >= 0) & (alt < tablo.oran_sayisi - 1)
+        agirlik = np.where(ara, t - alt, 0.0)
+        k = np.where(ara, alt, k)
+        gecersiz &= ~ara
+
+    return np.where(gecersiz, 0, k).astype(np.intp), agirlik, gecersiz
+
+
+def _donem(tablo, n, alt):
+    """Tamsayı indeks dizisi ve [alt, n_max] dışı / kesirli satırlar"""
+    gecersiz = ~((n >= alt) & (n <= tablo.n_max) & (n == np.floor(n)))
+    return np.where(gecersiz, alt, n).astype(np.intp), gecersiz
+
+
+def _oku(tablo, ad, i, n, devre_basi, m, interpolasyon):
+    ertelenmis = np.any(m != 0)
+    girdiler = (dizi(i), dizi(n), dizi(m)) if ertelenmis else (dizi(i), dizi(n))
+    girdiler = np.broadcast_arrays(*girdiler)
+    k, agirlik, gecersiz = _konum(tablo, girdiler[0], interpolasyon)
+    n, n_gecersiz = _donem(tablo, girdiler[1], 1)
+    gecersiz |= n_gecersiz
+
+    veri = _gorunum(tablo, ad)
+    carpan = _gorunum(tablo, 'carpan') if devre_basi else None
+    if ertelenmis:
+        m, m_gecersiz = _donem(tablo, girdiler[2], 0)
+        gecersiz |= m_gecersiz
+        iskonto = _gorunum(tablo, 'iskonto')
+    sutun = tablo.n_max + 1
+
+    def deger(k):
+        satir = k * sutun
+        sonuc = veri.take(satir + n)
+        if devre_basi:
+            sonuc *= carpan.take(k)
+        if ertelenmis:
+            sonuc *= iskonto.take(satir + m)
+        return sonuc
+
+    sonuc = deger(k)
+    if agirlik is not None:
+        sonuc += agirlik * (deger(np.minimum(k + 1, tablo.oran_sayisi - 1)) - sonuc)
+
+    return sonuc, gecersiz
+
+
+@vektorel
+def pesin_deger_faktoru(tablo, i, n, devre_basi=False, m=0, interpolasyon=False):
+    return _oku(tablo, 'pesin', i, n, devre_basi, m, interpolasyon)
+
+
+@vektorel
+def gelecek_deger_faktoru(tablo, i, n, devre_basi=False, interpolasyon=False):
+    return _oku(tablo, 'gelecek', i, n, devre_basi, 0, interpolasyon)
+
+
+@vektorel
+def erteleme_faktoru(tablo, i, m, interpolasyon=False):
+    i, m = np.broadcast_arrays(dizi(i), dizi(m))
+    k, agirlik, gecersiz = _konum(tablo, i, interpolasyon)
+    m, m_gecersiz = _donem(tablo, m, 0)
+
+    iskonto = _gorunum(tablo, 'iskonto')
+    sutun = tablo.n_max + 1
+    sonuc = iskonto.take(k * sutun + m)
+    if agirlik is not None:
+        sonuc += agirlik * (iskonto.take(np.minimum(k + 1, tablo.oran_sayisi - 1) * sutun + m)
+                            - sonuc)
+
+    return sonuc, gecersiz | m_gecersiz
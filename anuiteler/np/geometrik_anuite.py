@@ -0,0 +1,252 @@
+"""
+GEOMETRİK DİZİ ŞEKLİNDE DEĞİŞEN TAKSİTLER (ANÜİTELER) - NumPy sürümü
+
+anuiteler.geometrik_anuite ile aynı imzalar. Girdiler yayınlanır (broadcast),
+geçersiz satırlar hata yerine maske ile bildirilir. i = r özel durumu satır
+bazında np.where ile seçilir.
+
+faiz_orani_hesapla_bd tüm satırları analitik türevli toplu Newton'a sokar;
+yakınsamayan satırlar skaler güvenli çözücüyle yeniden çözülür.
+sure_hesapla_gd kapalı form satırlarını np.where ile seçer, kalanları toplu
+tamsayı aramasıyla çözer.
+"""
+
+import math
+
+import numpy as np
+
+from .. import izleme as _izleme
+from .. import geometrik_anuite as _geo
+from .._kok import VARSAYILAN_TAHMIN
+from ._newton import birikim_tahmini, birikim_turevleri, toplu_newton, toplu_tamsayi_kok
+from ._ortak import dizi, maskele, vektorel
+
+
+def _esit(i, r):
+    """i = r özel durumu maskesi"""
+    return np.abs(i - r) < 1e-10
+
+
+def _bd_devre_sonu(ilk_taksit, i, r, n):
+    """Devre sonu BD çekirdeği (kontrolsüz)"""
+    birikim = (1 + i) ** n
+    genel = ilk_taksit * birikim * (((1 + i) ** n - (1 + r) ** n) / (birikim * (i - r)))
+    ozel = n * ilk_taksit * (1 + i) ** (n - 1)
+
+    return np.where(_esit(i, r), ozel, genel)
+
+
+def _gd_devre_sonu(ilk_taksit, i, r, n):
+    """Devre sonu GD çekirdeği (kontrolsüz)"""
+    genel = ilk_taksit * (((1 + i) ** n - (1 + r) ** n) / (i - r))
+    ozel = n * ilk_taksit
+
+    return np.where(_esit(i, r), ozel, genel)
+
+
+def _gecersiz(ilk_taksit, i, r, n):
+    return (n <= 0) | (ilk_taksit < 0) | ((i <= -1) & ~_esit(i, r))
+
+
+@vektorel
+def bugunku_deger_devre_sonu(ilk_taksit, i, r, n):
+    ilk_taksit, i, r, n = dizi(ilk_taksit), dizi(i), dizi(r), dizi(n)
+    return _bd_devre_sonu(ilk_taksit, i, r, n), _gecersiz(ilk_taksit, i, r, n)
+
+
+@vektorel
+def gelecek_deger_devre_sonu(ilk_taksit, i, r, n):
+    ilk_taksit, i, r, n = dizi(ilk_taksit), dizi(i), dizi(r), dizi(n)
+    return _gd_devre_sonu(ilk_taksit, i, r, n), _gecersiz(ilk_taksit, i, r, n)
+
+
+@vektorel
+def bugunku_deger_devre_basi(ilk_taksit, i, r, n):
+    ilk_taksit, i, r, n = dizi(ilk_taksit), dizi(i), dizi(r), dizi(n)
+    return _bd_devre_sonu(ilk_taksit, i, r, n) * (1 + i), _gecersiz(ilk_taksit, i, r, n)
+
+
+@vektorel
+def gelecek_deger_devre_basi(ilk_taksit, i, r, n):
+    ilk_taksit, i, r, n = dizi(ilk_taksit), dizi(i), dizi(r), dizi(n)
+    return _gd_devre_sonu(ilk_taksit, i, r, n) * (1 + i), _gecersiz(ilk_taksit, i, r, n)
+
+
+@vektorel
+def ilk_taksit_hesapla_bd(bugunku_deger, i, r, n, devre_basi=False):
+    bugunku_deger, i, r, n = dizi(bugunku_deger), dizi(i), dizi(r), dizi(n)
+
+    if devre_basi:
+        bugunku_deger = bugunku_deger / (1 + i)
+
+    birikim = (1 + i) ** n
+    genel = bugunku_deger * ((birikim * (i - r)) / (birikim * (birikim - (1 + r) ** n)))
+    ozel = bugunku_deger / (n * (1 + i) ** (n - 1))
+
+    gecersiz = (bugunku_deger <= 0) | (n <= 0) | (i <= -1)
+    return np.where(_esit(i, r), ozel, genel), gecersiz
+
+
+@vektorel
+def ilk_taksit_hesapla_gd(gelecek_deger, i, r, n, devre_basi=False):
+    gelecek_deger, i, r, n = dizi(gelecek_deger), dizi(i), dizi(r), dizi(n)
+
+    if devre_basi:
+        gelecek_deger = gelecek_deger / (1 + i)
+
+    genel = gelecek_deger * (i - r) / ((1 + i) ** n - (1 + r) ** n)
+    ozel = gelecek_deger / n
+
+    gecersiz = (gelecek_deger <= 0) | (n <= 0)
+    return np.where(_esit(i, r), ozel, genel), gecersiz
+
+
+# ============================================================
+# FAİZ ORANI (toplu Newton + satır bazında geri dönüş)
+# ============================================================
+
+def _faiz_hedef(i, r, n, hedef):
+    """ln(BD/a) - ln hedef ve türevi; BD/a = (1+r)^(n-1) × s(n,t), t = (i-r)/(1+r)"""
+    x = 1 + r
+    s, s1 = birikim_turevleri((i - r) / x, n)
+    return np.log(s / hedef) + (n - 1) * np.log(x), s1 / (x * s)
+
+
+def faiz_orani_hesapla_bd_ayrintili(bugunku_deger, ilk_taksit, r, n, tahmin=None, tolerans=1e-6,
+                                    maks_iterasyon=100):
+    """
+    Birçok geometrik anüitenin faiz oranı (devre sonu BD'den)
+
+    Tüm satırlar logaritmik artıkla (ln BD(i) - ln BD) aynı anda Newton
+    iterasyonuna girer; yakınsamayan satırlar skaler
+    `geometrik_anuite.faiz_orani_hesapla_bd`'nin güvenli Halley çekirdeğiyle
+    tek tek yeniden çözülür.
+
+    Returns:
+        {'i', 'iterasyon', 'artik', 'yakinsadi', 'geri_donus'} anahtarlı
+        sözlük; geçersiz veya kökü olmayan satırlarda i NaN'dır
+    """
+    kapali_form = tahmin is None
+    bugunku_deger, ilk_taksit, r, n, tahmin = np.broadcast_arrays(
+        *(dizi(x) for x in (bugunku_deger, ilk_taksit, r, n,
+                            VARSAYILAN_TAHMIN if kapali_form else tahmin))
+    )
+    sekil = bugunku_deger.shape
+    bugunku_deger, ilk_taksit, r, n, tahmin = (
+        x.ravel() for x in (bugunku_deger, ilk_taksit, r, n, tahmin)
+    )
+
+    with np.errstate(all='ignore'):
+        hedef = bugunku_deger / ilk_taksit
+        if kapali_form:
+            x = 1 + r
+            tahmin = r + x * birikim_tahmini(hedef / x ** (n - 1), n, alt_sinir=-1)
+        # BD, i'de artandır ve i → -1 iken a.(1+r)^(n-1)'e iner
+        gecersiz = ((bugunku_deger <= 0) | (ilk_taksit <= 0) | (n <= 1) | (r <= -1)
+                    | (tahmin <= -1) | ~(hedef > (1 + r) ** (n - 1)))
+
+    def fonksiyon(i, indeks):
+        return _faiz_hedef(i, r[indeks], n[indeks], hedef[indeks])
+
+    sonuc = toplu_newton(fonksiyon, tahmin, gecersiz, tolerans, maks_iterasyon)
+    oran, yakinsadi = sonuc['kok'], sonuc['yakinsadi']
+    geri_donus = ~yakinsadi & ~gecersiz
+
+    for k in np.flatnonzero(geri_donus):
+        tek = _geo._faiz_coz(hedef[k], r[k], n[k], tahmin[k], tolerans, maks_iterasyon)
+        oran[k] = tek['kok']
+        sonuc['artik'][k] = math.log1p(tek['artik'] / hedef[k])
+        sonuc['iterasyon'][k] += tek['iterasyon']
+        yakinsadi[k] = tek['yakinsadi']
+
+    oran[~yakinsadi] = np.nan
+
+    if _izleme.ETKIN:
+        _izleme.toplu_cozum_kaydet('np.geometrik_anuite.faiz_orani_hesapla_bd',
+                                   sonuc['iterasyon'], sonuc['artik'], yakinsadi)
+
+    return {
+        'i': oran.reshape(sekil),
+        'iterasyon': sonuc['iterasyon'].reshape(sekil),
+        'artik': sonuc['artik'].reshape(sekil),
+        'yakinsadi': yakinsadi.reshape(sekil),
+        'geri_donus': geri_donus.reshape(sekil),
+    }
+
+
+def faiz_orani_hesapla_bd(bugunku_deger, ilk_taksit, r, n, tahmin=None, tolerans=1e-6,
+                          maks_iterasyon=100):
+    """Toplu Newton ile faiz oranı (geçersiz/yakınsamayan satırlar maskeli)"""
+    sonuc = faiz_orani_hesapla_bd_ayrintili(bugunku_deger, ilk_taksit, r, n, tahmin, tolerans,
+                                            maks_iterasyon)
+    return maskele(sonuc['i'], ~sonuc['yakinsadi'])
+
+
+# ============================================================
+# SÜRE (kapalı form + toplu tamsayı araması)
+# ============================================================
+
+def _gd_sure_turevleri(i, r, n):
+    """GD(n)/a ve n'ye göre türevi (i ≠ r, gerçel n)"""
+    ln_x, ln_y = np.log1p(i), np.log1p(r)
+    x_n, y_n = np.exp(n * ln_x), np.exp(n * ln_y)
+    return (x_n - y_n) / (i - r), (x_n * ln_x - y_n * ln_y) / (i - r)
+
+
+def sure_hesapla_gd_ayrintili(gelecek_deger, ilk_taksit, i, r, tahmin=5, tolerans=1e-6,
+                              maks_iterasyon=100):
+    """
+    Birçok geometrik anüitenin süresi (devre sonu GD'den)
+
+    i = r, r = 0 veya i = 0 olan satırlar kapalı formla, kalanlar GD(n)
+    n'de artan olduğundan toplu tamsayı üstel/ikili arama ve [k, k+1] içinde
+    Newton ile çözülür.
+
+    Returns:
+        {'n', 'iterasyon', 'artik', 'yakinsadi'} anahtarlı sözlük; geçersiz
+        veya çözümsüz satırlarda n NaN'dır (kapalı form satırlarında artık NaN)
+    """
+    gelecek_deger, ilk_taksit, i, r, tahmin = np.broadcast_arrays(
+        *(dizi(x) for x in (gelecek_deger, ilk_taksit, i, r, tahmin))
+    )
+    sekil = gelecek_deger.shape
+    gelecek_deger, ilk_taksit, i, r, tahmin = (
+        x.ravel() for x in (gelecek_deger, ilk_taksit, i, r, tahmin)
+    )
+
+    with np.errstate(all='ignore'):
+        hedef = gelecek_deger / ilk_taksit
+        gecersiz = (gelecek_deger <= 0) | (ilk_taksit <= 0) | ~(i > -1) | ~(r > -1)
+
+        # i = r: GD = n.a ; r = 0 veya i = 0: GD = a.s(n, diğer oran)
+        esit = _esit(i, r)
+        kapali = ~gecersiz & (esit | (r == 0) | (i == 0))
+        oran = np.where(r == 0, i, r)
+        sure = np.where(esit, hedef, np.log(1 + hedef * oran) / np.log1p(oran))
+
+    def fonksiyon(n, indeks):
+        gd, gd1 = _gd_sure_turevleri(i[indeks], r[indeks], n)
+        return gd - hedef[indeks], gd1
+
+    sonuc = toplu_tamsayi_kok(fonksiyon, gecersiz | kapali, tahmin, tolerans, maks_iterasyon)
+    sure = np.where(kapali, sure, sonuc['kok'])
+    yakinsadi = np.where(kapali, np.isfinite(sure), sonuc['yakinsadi'])
+    sure[~yakinsadi] = np.nan
+
+    if _izleme.ETKIN:
+        _izleme.toplu_cozum_kaydet('np.geometrik_anuite.sure_hesapla_gd',
+                                   sonuc['iterasyon'], sonuc['artik'], sonuc['yakinsadi'])
+
+    return {
+        'n': sure.reshape(sekil),
+        'iterasyon': sonuc['iterasyon'].reshape(sekil),
+        'artik': sonuc['artik'].reshape(sekil),
+        'yakinsadi': yakinsadi.reshape(sekil),
+    }
+
+
+def sure_hesapla_gd(gelecek_deger, ilk_taksit, i, r, tahmin=5, tolerans=1e-6, maks_iterasyon=100):
+    """Kapalı form veya toplu tamsayı aramasıyla süre (çözümsüz satırlar maskeli)"""
+    sonuc = sure_hesapla_gd_ayrintili(gelecek_deger, ilk_taksit, i, r, tahmin, tolerans,
+                                      maks_iterasyon)
+    return maskele(sonuc['n'], ~sonuc['yakinsadi'])
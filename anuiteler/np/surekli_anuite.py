@@ -0,0 +1,64 @@
+"""
+SÜREKLİ ANÜİTELER (Perpetuity) - NumPy sürümü
+
+anuiteler.surekli_anuite ile aynı imzalar. Girdiler yayınlanır (broadcast),
+geçersiz satırlar hata yerine maske ile bildirilir.
+"""
+
+from ._ortak import dizi, vektorel
+
+
+# ============================================================
+# DEVRE SONU SÜREKLİ ANÜİTE
+# ============================================================
+
+@vektorel
+def bugunku_deger_devre_sonu(odeme, i):
+    odeme, i = dizi(odeme), dizi(i)
+    return odeme / i, i <= 0
+
+
+@vektorel
+def odeme_devre_sonu(bugunku_deger, i):
+    bugunku_deger, i = dizi(bugunku_deger), dizi(i)
+    return bugunku_deger * i, i <= 0
+
+
+@vektorel
+def faiz_devre_sonu(bugunku_deger, odeme):
+    bugunku_deger, odeme = dizi(bugunku_deger), dizi(odeme)
+    return odeme / bugunku_deger, bugunku_deger <= 0
+
+
+# ============================================================
+# DEVRE BAŞI SÜREKLİ ANÜİTE
+# ============================================================
+
+@vektorel
+def bugunku_deger_devre_basi(odeme, i):
+    odeme, i = dizi(odeme), dizi(i)
+    return odeme * (1 + i) / i, i <= 0
+
+
+@vektorel
+def odeme_devre_basi(bugunku_deger, i):
+    bugunku_deger, i = dizi(bugunku_deger), dizi(i)
+    return bugunku_deger * i / (1 + i), i <= 0
+
+
+@vektorel
+def faiz_devre_basi(bugunku_deger, odeme):
+    bugunku_deger, odeme = dizi(bugunku_deger), dizi(odeme)
+    return odeme / (bugunku_deger - odeme), bugunku_deger <= odeme
+
+
+# ============================================================
+# ERTELENMİŞ SÜREKLİ ANÜİTE
+# ============================================================
+
+@vektorel
+def ertelenmis_surekli_anuite(odeme, i, erteleme_suresi):
+    odeme, i, erteleme_suresi = dizi(odeme), dizi(i), dizi(erteleme_suresi)
+
+    gecersiz = (i <= 0) | (erteleme_suresi < 0)
+    return odeme / i * (1 + i) ** -erteleme_suresi, gecersiz
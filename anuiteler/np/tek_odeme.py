@@ -0,0 +1,56 @@
+"""
+TEK BİR ÖDEMENİN GELECEK VE PEŞİN (BUGÜNKÜ) DEĞER HESAPLAMALARI - NumPy sürümü
+
+anuiteler.tek_odeme ile aynı imzalar. Girdiler yayınlanır (broadcast),
+geçersiz satırlar hata yerine maske ile bildirilir.
+"""
+
+import numpy as np
+
+from ._ortak import dizi, vektorel
+
+
+@vektorel
+def bugunku_deger(gelecek_deger, i, t):
+    gelecek_deger, i, t = dizi(gelecek_deger), dizi(i), dizi(t)
+    gecersiz = (i <= -1) | (t < 0)
+
+    return gelecek_deger * (1 + i) ** -t, gecersiz
+
+
+@vektorel
+def gelecek_deger(bugunku_deger, i, t):
+    bugunku_deger, i, t = dizi(bugunku_deger), dizi(i), dizi(t)
+    gecersiz = (i <= -1) | (t < 0)
+
+    return bugunku_deger * (1 + i) ** t, gecersiz
+
+
+@vektorel
+def faiz_orani_hesapla(bugunku_deger, gelecek_deger, t):
+    bugunku_deger, gelecek_deger, t = dizi(bugunku_deger), dizi(gelecek_deger), dizi(t)
+    gecersiz = (bugunku_deger <= 0) | (gelecek_deger <= 0) | (t <= 0)
+
+    return (gelecek_deger / bugunku_deger) ** (1 / t) - 1, gecersiz
+
+
+@vektorel
+def sure_hesapla(bugunku_deger, gelecek_deger, i):
+    bugunku_deger, gelecek_deger, i = dizi(bugunku_deger), dizi(gelecek_deger), dizi(i)
+    gecersiz = (bugunku_deger <= 0) | (gelecek_deger <= 0) | (i <= -1) | (i == 0)
+
+    return np.log(gelecek_deger / bugunku_deger) / np.log1p(i), gecersiz
+
+
+@vektorel
+def iskonto_faktoru_hesapla(i, t=1):
+    i, t = dizi(i), dizi(t)
+
+    return (1 + i) ** -t, i <= -1
+
+
+@vektorel
+def birikim_faktoru_hesapla(i, t=1):
+    i, t = dizi(i), dizi(t)
+
+    return (1 + i) ** t, i <= -1
@@ -0,0 +1,219 @@
+"""
+YARDIMCI FONKSİYONLAR - NumPy sürümü
+
+Birçok enstrümanın risk ölçülerini tek geçişte hesaplar. Nakit akışları
+(enstrüman, akış) şeklinde iki boyutlu dizilerle verilir; farklı uzunluktaki
+enstrümanlar sıfır tutarla doldurulabilir.
+
+Toplu İç Verim Oranı düzensiz uzunluktaki akışları CSR düzeninde
+(ofsetler, donemler, tutarlar) alır.
+"""
+
+import numpy as np
+
+from .. import izleme as _izleme
+from ..nakit_akisi import NakitAkisi
+from ..yardimci import ic_verim_orani_ayrintili
+from ._newton import toplu_newton
+from ._ortak import dizi, maskele
+
+
+def risk_olcumleri(donemler, tutarlar, faiz_orani):
+    """
+    BD, Macaulay/Modified Duration, Convexity ve DV01 (toplu, tek geçiş)
+
+    Args:
+        donemler: Akış dönemleri; son eksen akışlardır, tutarlar ile yayınlanır
+        tutarlar: Akış tutarları, (..., akış sayısı) şeklinde
+        faiz_orani: Dönemsel faiz oranı; tutarlar.shape[:-1] ile yayınlanır
+
+    Returns:
+        {'bugunku_deger', 'macaulay_duration', 'modified_duration',
+         'convexity', 'dv01'} anahtarlı sözlük; değerler maskeli dizilerdir
+        (faiz oranı <= -1 veya BD = 0 olan enstrümanlar maskelenir)
+    """
+    donemler, tutarlar, faiz_orani = dizi(donemler), dizi(tutarlar), dizi(faiz_orani)
+
+    with np.errstate(all='ignore'):
+        v = 1 / (1 + faiz_orani)
+        iskontolu = tutarlar * np.exp(-donemler * np.log1p(faiz_orani)[..., None])
+
+        bd = iskontolu.sum(axis=-1)
+        agirlikli_toplam = (donemler * iskontolu).sum(axis=-1)
+        convexity_sum = (donemler * (donemler + 1) * iskontolu).sum(axis=-1)
+
+        mac_dur = agirlikli_toplam / bd
+        mod_dur = mac_dur * v
+        convexity = convexity_sum * v * v / bd
+        dv01 = mod_dur * bd * 0.0001
+
+    gecersiz = (faiz_orani <= -1) | (bd == 0)
+
+    return {
+        'bugunku_deger': maskele(bd, faiz_orani <= -1),
+        'macaulay_duration': maskele(mac_dur, gecersiz),
+        'modified_duration': maskele(mod_dur, gecersiz),
+        'convexity': maskele(convexity, gecersiz),
+        'dv01': maskele(dv01, gecersiz),
+    }
+
+
+# ============================================================
+# TOPLU İÇ VERİM ORANI (CSR düzeninde düzensiz nakit akışları)
+# ============================================================
+
+def ic_verim_orani_toplu_ayrintili(ofsetler, donemler, tutarlar, baslangic_yatirim=0, tahmin=None,
+                                   tolerans=1e-6, max_iter=100, paralel=None, parca_boyu=50000):
+    """
+    Birçok projenin İç Verim Oranı (toplu Newton-Raphson + satır bazında geri dönüş)
+
+    Nakit akışları CSR düzeninde verilir: k. projenin akışları
+    donemler[ofsetler[k]:ofsetler[k+1]] ve tutarlar[ofsetler[k]:ofsetler[k+1]].
+    Tüm projeler aynı anda Newton iterasyonuna sokulur; yakınsamayan projeler
+    skaler `yardimci.ic_verim_orani_ayrintili` (aralıkla korunan Halley) ile
+    tek tek yeniden çözülür.
+
+    Args:
+        ofsetler: Proje başlangıç indeksleri, uzunluk proje sayısı + 1
+        donemler: Akış dönemleri (düz dizi)
+        tutarlar: Akış tutarları (düz dizi)
+        baslangic_yatirim: Projelerin başlangıç yatırımı (skaler veya proje başına)
+        tahmin: Başlangıç tahmini (None ise proje başına kapalı form tahmin)
+        tolerans: |NPV| < tolerans olduğunda proje yakınsamış sayılır
+        max_iter: Maksimum iterasyon sayısı
+        paralel: Süreç sayısı; verilirse projeler parçalara bölünüp süreç
+            havuzunda çözülür
+        parca_boyu: Paralel çalışmada parça başına proje sayısı
+
+    Returns:
+        {'oran', 'iterasyon', 'artik', 'yakinsadi', 'geri_donus'} anahtarlı
+        sözlük; geri_donus skaler çözücüye düşen projeler için True'dur
+    """
+    ofsetler = np.asarray(ofsetler, dtype=np.int64)
+    donemler, tutarlar = dizi(donemler), dizi(tutarlar)
+    proje_sayisi = ofsetler.size - 1
+    baslangic_yatirim = np.broadcast_to(dizi(baslangic_yatirim), (proje_sayisi,))
+    tahmin = None if tahmin is None else np.broadcast_to(dizi(tahmin), (proje_sayisi,))
+
+    if paralel and proje_sayisi > parca_boyu:
+        sonuc = _paralel_coz(ofsetler, donemler, tutarlar, baslangic_yatirim, tahmin,
+                             tolerans, max_iter, paralel, parca_boyu)
+    else:
+        sonuc = _toplu_irr(ofsetler, donemler, tutarlar, baslangic_yatirim, tahmin, tolerans,
+                           max_iter)
+
+    if _izleme.ETKIN:
+        _izleme.toplu_cozum_kaydet('np.yardimci.ic_verim_orani_toplu',
+                                   sonuc['iterasyon'], sonuc['artik'], sonuc['yakinsadi'])
+    return sonuc
+
+
+def ic_verim_orani_toplu(ofsetler, donemler, tutarlar, baslangic_yatirim=0, tahmin=None,
+                         tolerans=1e-6, max_iter=100, paralel=None):
+    """Toplu İç Verim Oranı (yakınsamayan veya tanımsız projeler maskeli)"""
+    sonuc = ic_verim_orani_toplu_ayrintili(ofsetler, donemler, tutarlar, baslangic_yatirim,
+                                           tahmin, tolerans, max_iter, paralel)
+    return maskele(sonuc['oran'], ~sonuc['yakinsadi'])
+
+
+def _toplu_irr(ofsetler, donemler, tutarlar, baslangic_yatirim, tahmin, tolerans, max_iter):
+    proje_sayisi = ofsetler.size - 1
+    satir = np.repeat(np.arange(proje_sayisi), np.diff(ofsetler))
+
+    def topla(agirlik):
+        return np.bincount(satir, weights=agirlik, minlength=proje_sayisi)
+
+    # İşaret değişimi olmayan projelerde IRR tanımsızdır
+    pozitif = (topla((tutarlar > 0).astype(float)) > 0) | (baslangic_yatirim > 0)
+    negatif = (topla((tutarlar < 0).astype(float)) > 0) | (baslangic_yatirim < 0)
+    gecersiz = ~(pozitif & negatif)
+
+    if tahmin is None:
+        tahmin = _baslangic_tahmini(topla, donemler, tutarlar, baslangic_yatirim)
+
+    # Aktif projelerin akışları; aktif küme küçüldükçe yalnızca kalan
+    # projelerin akışları süzülür, yakınsamış projeler yeniden taranmaz
+    akis = np.arange(donemler.size)
+    akis_aktif = np.arange(proje_sayisi)
+    konum = satir
+
+    def fonksiyon(i, aktif):
+        nonlocal akis, akis_aktif, konum
+        if aktif.size != akis_aktif.size:
+            kalan = np.zeros(proje_sayisi, dtype=bool)
+            kalan[aktif] = True
+            akis = akis[kalan[satir[akis]]]
+            akis_aktif = aktif
+            konum = np.searchsorted(aktif, satir[akis])
+
+        t = donemler[akis]
+        iskontolu = tutarlar[akis] * np.exp(-t * np.log1p(i)[konum])
+
+        npv = np.bincount(konum, weights=iskontolu, minlength=aktif.size) + baslangic_yatirim[aktif]
+        turev = -np.bincount(konum, weights=t * iskontolu, minlength=aktif.size) / (1 + i)
+        return npv, turev
+
+    sonuc = toplu_newton(fonksiyon, tahmin, gecersiz, tolerans, max_iter, alt_sinir=-0.99)
+    oran, yakinsadi = sonuc['kok'], sonuc['yakinsadi']
+    geri_donus = ~yakinsadi & ~gecersiz
+
+    for k in np.flatnonzero(geri_donus):
+        bas, son = ofsetler[k], ofsetler[k + 1]
+        akislar = NakitAkisi(donemler[bas:son], tutarlar[bas:son])
+
+        tek = ic_verim_orani_ayrintili(akislar, float(baslangic_yatirim[k]), None, tolerans, max_iter)
+        oran[k] = tek['oran']
+        sonuc['artik'][k] = tek['artik']
+        sonuc['iterasyon'][k] += tek['iterasyon']
+        yakinsadi[k] = tek['yakinsadi']
+
+    oran[~yakinsadi] = np.nan
+
+    return {
+        'oran': oran,
+        'iterasyon': sonuc['iterasyon'],
+        'artik': sonuc['artik'],
+        'yakinsadi': yakinsadi,
+        'geri_donus': geri_donus,
+    }
+
+
+def _baslangic_tahmini(topla, donemler, tutarlar, baslangic_yatirim):
+    """yardimci._irr_baslangic_tahmini'nin toplu karşılığı: (Σc / -C0)^(1/D) - 1"""
+    toplam = topla(tutarlar)
+    agirlik = topla(np.abs(tutarlar))
+
+    with np.errstate(all='ignore'):
+        ortalama_vade = topla(donemler * np.abs(tutarlar)) / agirlik
+        tahmin = (toplam / -baslangic_yatirim) ** (1 / ortalama_vade) - 1
+
+    uygun = (baslangic_yatirim < 0) & (toplam > 0) & (ortalama_vade > 0) & np.isfinite(tahmin)
+    return np.where(uygun, tahmin, 0.1)
+
+
+def _parca_coz(argumanlar):
+    return _toplu_irr(*argumanlar)
+
+
+def _paralel_coz(ofsetler, donemler, tutarlar, baslangic_yatirim, tahmin, tolerans, max_iter,
+                 paralel, parca_boyu):
+    """Projeleri parca_boyu'luk parçalara bölüp süreç havuzunda çözer"""
+    from concurrent.futures import ProcessPoolExecutor
+
+    proje_sayisi = ofsetler.size - 1
+    parcalar = []
+    for bas in range(0, proje_sayisi, parca_boyu):
+        son = min(bas + parca_boyu, proje_sayisi)
+        a, b = ofsetler[bas], ofsetler[son]
+        parcalar.append((
+            ofsetler[bas:son + 1] - a, donemler[a:b], tutarlar[a:b],
+            np.ascontiguousarray(baslangic_yatirim[bas:son]),
+            None if tahmin is None else np.ascontiguousarray(tahmin[bas:son]),
+            tolerans, max_iter,
+        ))
+
+    with ProcessPoolExecutor(max_workers=paralel) as havuz:
+        sonuclar = list(havuz.map(_parca_coz, parcalar))
+
+    return {anahtar: np.concatenate([sonuc[anahtar] for sonuc in sonuclar])
+            for anahtar in sonuclar[0]}
@@ -0,0 +1,203 @@
+"""
+İSTEĞE BAĞLI FAKTÖR ÖNBELLEĞİ (sınırlı, iş parçacığı güvenli LRU)
+
+İskonto/birikim faktörleri ve a(n,i), s(n,i) (devre sonu/başı) tüm modüllerin
+paylaştığı tek bir LRU önbellekte tutulur: aynı (i, n) çiftleri tekrar
+tekrar istendiğinde üs alma yeniden yapılmaz. Dolunca en uzun süredir
+kullanılmayan girdi atılır. Geometrik, aritmetik, ertelenmiş,
+çabuklaştırılmış ve sürekli anüite formüllerindeki (1+i)^n, (1+r)^n ve v^m
+kuvvetleri `birikim` / `v_kuvvet` üzerinden aynı girdileri kullanır. Faiz
+çözücülerinin iterasyon içi kuvvetleri (her adımda farklı i) önbelleğe
+alınmaz.
+
+Kapalıyken (varsayılan) faktör fonksiyonları girdi kontrolünden sonra
+yalnızca `ETKIN` bayrağını okur. Açıkken aynı formül önbellek üzerinden
+çalışır; sonuçlar önbelleksiz hesapla bire bir aynıdır. Hatalı girdiler
+kontrolde reddedilir, önbelleğe girmez.
+
+Önbellek süreç başınadır: `etkinlestir()` / `devre_disi_birak()` yalnızca
+çağıran süreci etkiler. `ANUITELER_ONBELLEK` ortam değişkeni içe aktarmada
+okunur (işçi süreçleri için): `1` / `true` varsayılan boyutla, 1'den büyük
+bir tamsayı o boyutla açar; `0` / `false` ve tanınmayan değerler yok
+sayılır.
+
+Kullanım:
+    from anuiteler import onbellek
+
+    onbellek.etkinlestir(boyut=4096)
+    ...
+    onbellek.istatistik()   # {'isabet': ..., 'iskalama': ..., 'isabet_orani': ...}
+    onbellek.devre_disi_birak()
+"""
+
+import os
+import threading
+from functools import lru_cache
+
+ETKIN = False
+VARSAYILAN_BOYUT = 1024
+
+_KILIT = threading.Lock()
+
+
+# ============================================================
+# FAKTÖR FORMÜLLERİ (kontrolsüz; modüllerdeki ifadelerle aynı)
+# ============================================================
+
+def _iskonto(i, n):
+    return (1 + i) ** (-n)
+
+
+def _birikim(i, n):
+    return (1 + i) ** n
+
+
+def _v_kuvvet(i, n):
+    v = 1 / (1 + i)
+    return v ** n
+
+
+def _pesin(i, n):
+    v = 1 / (1 + i)
+    return (1 - v**n) / i
+
+
+def _gelecek(i, n):
+    return ((1 + i)**n - 1) / i
+
+
+def _pesin_devre_basi(i, n):
+    v = 1 / (1 + i)
+    a_ni = (1 - v**n) / i
+    return a_ni * (1 + i)
+
+
+def _gelecek_devre_basi(i, n):
+    s_ni = ((1 + i)**n - 1) / i
+    return s_ni * (1 + i)
+
+
+_FORMULLER = {
+    'iskonto': _iskonto,
+    'birikim': _birikim,
+    'v_kuvvet': _v_kuvvet,
+    'pesin': _pesin,
+    'gelecek': _gelecek,
+    'pesin_devre_basi': _pesin_devre_basi,
+    'gelecek_devre_basi': _gelecek_devre_basi,
+}
+
+
+def _hesapla(tur, i, n):
+    """
+    Önbellekten faktör (yoksa hesaplayıp ekler)
+
+    Args:
+        tur: 'iskonto', 'birikim', 'v_kuvvet', 'pesin', 'gelecek',
+            'pesin_devre_basi' veya 'gelecek_devre_basi'
+        i: Faiz oranı (kontrol edilmiş)
+        n: Dönem sayısı
+
+    Returns:
+        Faktör değeri
+    """
+    return _FORMULLER[tur](i, n)
+
+
+def _yeni_onbellek(boyut):
+    # typed=True: 2 ve 2.0 ayrı girdiler (tamsayı girdide sonuç tipi korunur)
+    return lru_cache(maxsize=boyut, typed=True)(_hesapla)
+
+
+# Ara Python çağrısı olmasın diye doğrudan lru_cache nesnesi; boyut_ayarla yeniden bağlar
+faktor = _yeni_onbellek(VARSAYILAN_BOYUT)
+
+
+def birikim(i, n):
+    """(1+i)^n; açıksa önbellekten (modüllerin bileşik formülleri için, kontrolsüz)"""
+    if ETKIN:
+        return faktor('birikim', i, n)
+    return (1 + i) ** n
+
+
+def v_kuvvet(i, n):
+    """v^n, v = 1/(1+i); açıksa önbellekten (modüllerin bileşik formülleri için, kontrolsüz)"""
+    if ETKIN:
+        return faktor('v_kuvvet', i, n)
+    v = 1 / (1 + i)
+    return v ** n
+
+
+# ============================================================
+# AÇMA / KAPAMA VE İSTATİSTİK
+# ============================================================
+
+def etkinlestir(boyut=None):
+    """
+    Önbelleği bu süreç için açar
+
+    Args:
+        boyut: En çok girdi sayısı (None: mevcut boyut korunur)
+    """
+    global ETKIN
+
+    if boyut is not None:
+        boyut_ayarla(boyut)
+    ETKIN = True
+
+
+def devre_disi_birak():
+    """Önbelleği kapatır (girdiler ve sayaçlar silinmez)"""
+    global ETKIN
+
+    ETKIN = False
+
+
+def boyut_ayarla(boyut):
+    """Önbellek boyutunu değiştirir; mevcut girdiler ve sayaçlar silinir"""
+    global faktor
+
+    if boyut != int(boyut) or boyut < 1:
+        raise ValueError("Önbellek boyutu pozitif bir tamsayı olmalıdır.")
+
+    with _KILIT:
+        faktor = _yeni_onbellek(int(boyut))
+
+
+def temizle():
+    """Tüm girdileri ve sayaçları siler"""
+    faktor.cache_clear()
+
+
+def istatistik():
+    """
+    Önbellek durumunu döndürür
+
+    Returns:
+        {'etkin', 'boyut', 'dolu', 'isabet', 'iskalama', 'tahliye',
+         'isabet_orani'} sözlüğü; tahliye, yer açmak için atılan girdi sayısıdır
+    """
+    bilgi = faktor.cache_info()
+    toplam = bilgi.hits + bilgi.misses
+
+    return {
+        'etkin': ETKIN,
+        'boyut': bilgi.maxsize,
+        'dolu': bilgi.currsize,
+        'isabet': bilgi.hits,
+        'iskalama': bilgi.misses,
+        'tahliye': bilgi.misses - bilgi.currsize,
+        'isabet_orani': bilgi.hits / toplam if toplam else 0.0,
+    }
+
+
+def _ortamdan_ac(deger):
+    """ANUITELER_ONBELLEK değerine göre önbelleği açar; tanınmayan değer içe aktarmayı bozmaz"""
+    deger = deger.strip().lower()
+    if deger in ('1', 'true'):
+        etkinlestir()
+    elif deger.isdigit() and int(deger) > 1:
+        etkinlestir(int(deger))
+
+
+_ortamdan_ac(os.environ.get('ANUITELER_ONBELLEK', ''))
@@ -0,0 +1,211 @@
+"""
+ANÜİTE SÖZLEŞMESİ
+
+Aynı sözleşme için art arda sorulan BD, GD, taksit, tablo ve ortalama vade
+sorgularını tek nesneden yanıtlar. Girdiler oluşturulurken bir kez kontrol
+edilir ve sonradan değiştirilemez (farklı koşullar için yeni sözleşme
+oluşturulur); v, v^n, (1+i)^n ve erteleme/çabuklaştırma çarpanı ilk sorguda bir
+kez hesaplanıp saklanır, sonraki sorgular yalnızca bunları kullanır.
+
+Sözleşme türleri (m: erteleme, c: çabuklaştırma süresi):
+- devre sonu / devre başı: m = c = 0 (sonuçlar modül fonksiyonlarıyla aynı)
+- ertelenmiş: m > 0
+- çabuklaştırılmış: c > 0
+
+    BD = a × (1+i)^(c-m) × a(n,i)            [devre başında × (1+i)]
+    GD = a × s(n,i)                          [devre başında × (1+i)]
+    GD = a × (1+i)^c × s(n,i)                (c > 0, cabuklas_anuite ile aynı)
+"""
+
+from . import devre_basi_anuite as _db
+from . import devre_sonu_anuite as _ds
+from .nakit_akisi import NakitAkisi
+
+
+class AnuiteSozlesmesi:
+    """Sabit taksitli anüite sözleşmesi; ortak kuvvetler ilk sorguda hesaplanır"""
+
+    __slots__ = ('_odeme', '_n', '_i', '_devre_basi', '_m', '_c',
+                 '_v', '_v_n', '_pesin', '_bd_faktoru', '_gd_faktoru')
+
+    def __init__(self, odeme, n, i, devre_basi=False, m=0, c=0):
+        if i <= 0:
+            raise ValueError("Faiz oranı sıfırdan büyük olmalıdır.")
+        if n <= 0 or n != int(n):
+            raise ValueError("Dönem sayısı pozitif bir tamsayı olmalıdır.")
+        if m < 0 or m != int(m):
+            raise ValueError("Gecikme süresi negatif olmayan bir tamsayı olmalıdır.")
+        if c < 0 or c != int(c):
+            raise ValueError("Çabuklaştırma süresi negatif olmayan bir tamsayı olmalıdır.")
+        if odeme < 0:
+            raise ValueError("Taksit tutarı negatif olamaz.")
+
+        self._odeme = odeme
+        self._n = int(n)
+        self._i = i
+        self._devre_basi = devre_basi
+        self._m = int(m)
+        self._c = int(c)
+        self._pesin = None
+
+    # Girdiler salt okunur: değişselerdi saklanan faktörler eskirdi
+    @property
+    def odeme(self):
+        """Taksit tutarı"""
+        return self._odeme
+
+    @property
+    def n(self):
+        """Dönem sayısı"""
+        return self._n
+
+    @property
+    def i(self):
+        """Dönemlik faiz oranı"""
+        return self._i
+
+    @property
+    def devre_basi(self):
+        """Ödemeler devre başında mı"""
+        return self._devre_basi
+
+    @property
+    def m(self):
+        """Erteleme süresi"""
+        return self._m
+
+    @property
+    def c(self):
+        """Çabuklaştırma süresi"""
+        return self._c
+
+    @classmethod
+    def bugunku_degerden(cls, bugunku_deger, n, i, devre_basi=False, m=0, c=0):
+        """BD'si (kredi tutarı) verilen sözleşme; taksit aynı faktörlerden bulunur"""
+        if bugunku_deger < 0:
+            raise ValueError("Bugünkü değer negatif olamaz.")
+
+        sozlesme = cls(0, n, i, devre_basi, m, c)
+        sozlesme._odeme = sozlesme.odeme_bugunku_degerden(bugunku_deger)
+        return sozlesme
+
+    def _hazirla(self):
+        """v, v^n, a(n,i) ve BD/GD faktörleri (bir kez)"""
+        i, n = self.i, self.n
+        v = 1 / (1 + i)
+        v_n = v ** n
+        pesin = (1 - v_n) / i
+        gelecek = ((1 + i) ** n - 1) / i
+
+        bd_faktoru = pesin
+        if self.m or self.c:
+            bd_faktoru *= (1 + i) ** (self.c - self.m)
+        if self.devre_basi:
+            bd_faktoru *= (1 + i)
+
+        if self.c:
+            gelecek *= (1 + i) ** self.c
+        elif self.devre_basi:
+            gelecek *= (1 + i)
+
+        self._v = v
+        self._v_n = v_n
+        self._bd_faktoru = bd_faktoru
+        self._gd_faktoru = gelecek
+        self._pesin = pesin
+
+    @property
+    def bugunku_deger_faktoru(self):
+        """BD / taksit"""
+        if self._pesin is None:
+            self._hazirla()
+        return self._bd_faktoru
+
+    @property
+    def gelecek_deger_faktoru(self):
+        """GD / taksit"""
+        if self._pesin is None:
+            self._hazirla()
+        return self._gd_faktoru
+
+    def bugunku_deger(self):
+        """BD = a × BD faktörü"""
+        return self.odeme * self.bugunku_deger_faktoru
+
+    def gelecek_deger(self):
+        """GD = a × GD faktörü"""
+        return self.odeme * self.gelecek_deger_faktoru
+
+    def odeme_bugunku_degerden(self, bugunku_deger):
+        """Aynı koşullarda verilen BD'yi ödeyen taksit"""
+        return bugunku_deger / self.bugunku_deger_faktoru
+
+    def odeme_gelecek_degerden(self, gelecek_deger):
+        """Aynı koşullarda verilen GD'ye ulaşan taksit"""
+        return gelecek_deger / self.gelecek_deger_faktoru
+
+    def _ilk_odeme_zamani(self):
+        return self.m - self.c + (0 if self.devre_basi else 1)
+
+    def ortalama_sure(self):
+        """
+        Ortalama vade (Macaulay duration), kapalı formda O(1)
+
+        Σ t·v^t (t = 1..n) = (ä(n,i) - n·v^n) / i; ödemeler t0, ..., t0+n-1
+        zamanlarında olduğundan süre (t0 - 1) kadar kayar.
+        """
+        if self._pesin is None:
+            self._hazirla()
+        i, n = self.i, self.n
+        artan = ((1 + i) * self._pesin - n * self._v_n) / i
+        return self._ilk_odeme_zamani() - 1 + artan / self._pesin
+
+    def nakit_akisi(self):
+        """Ödeme akışı (yardimci.risk_olcumleri vb. için NakitAkisi)"""
+        t0 = self._ilk_odeme_zamani()
+        return NakitAkisi(range(t0, t0 + self.n), [self.odeme] * self.n)
+
+    def _modul(self):
+        if self.m or self.c:
+            raise ValueError("Amortisman tablosu yalnızca ertelemesiz ve "
+                             "çabuklaştırmasız sözleşmeler için oluşturulur.")
+        if self._pesin is None:
+            self._hazirla()
+        return _db if self.devre_basi else _ds
+
+    def tablo(self):
+        """Amortisman tablosu (sütunlu AnuiteTablosu)"""
+        return self._modul()._tablo(self.odeme, self.n, self.i, self._v)
+
+    def donem_satiri(self, k):
+        """k. dönemin tablo satırı (O(1))"""
+        modul = self._modul()
+        if not 1 <= k <= self.n:
+            raise ValueError("Dönem 1 ile n arasında olmalıdır.")
+        return modul._donem_satiri(self.odeme, self.n, self.i, self._v, k)
+
+    def kalan_bakiye(self, k):
+        """k. dönemden sonra kalan bakiye (k = 0 için BD)"""
+        self._modul()
+        if not 0 <= k <= self.n:
+            raise ValueError("Dönem 0 ile n arasında olmalıdır.")
+        kalan = self.odeme * (1 - self._v ** (self.n - k))
+        return kalan * (1 + self.i) / self.i if self.devre_basi else kalan / self.i
+
+    def ozet(self):
+        """Teklif ekranı için BD, GD, taksit, toplamlar ve ortalama vade"""
+        bugunku_deger = self.bugunku_deger()
+        toplam_odeme = self.odeme * self.n
+
+        return {
+            'odeme': self.odeme,
+            'bugunku_deger': bugunku_deger,
+            'gelecek_deger': self.gelecek_deger(),
+            'toplam_odeme': toplam_odeme,
+            'toplam_faiz': toplam_odeme - bugunku_deger,
+            'ortalama_sure': self.ortalama_sure(),
+        }
+
+    def __repr__(self):
+        return (f"AnuiteSozlesmesi(odeme={self.odeme!r}, n={self.n!r}, i={self.i!r}, "
+                f"devre_basi={self.devre_basi!r}, m={self.m!r}, c={self.c!r})")
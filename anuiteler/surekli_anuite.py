@@ -10,6 +10,8 @@ Temel Formüller:
 
 import math
 
+from . import onbellek as _onbellek
+
 
 # ============================================================
 # DEVRE SONU SÜREKLİ ANÜİTE
@@ -72,6 +74,5 @@ def ertelenmis_surekli_anuite(odeme, i, erteleme_suresi):
         raise ValueError("Erteleme süresi negatif olamaz.")
     
     bd_surekli = odeme / i
-    v = 1 / (1 + i)
     
-    return bd_surekli * (v ** erteleme_suresi)
\ No newline at end of file
+    return bd_surekli * _onbellek.v_kuvvet(i, erteleme_suresi)
\ No newline at end of file
@@ -0,0 +1,93 @@
+"""
+SÜTUNLU AMORTİSMAN TABLOSU
+
+Her dönem için ayrı bir sözlük tutmak yerine donem, odeme, faiz, anapara ve
+kalan değerlerini paralel sütunlarda saklar:
+- faiz, anapara, kalan: `array('d')`
+- donem: `range` (1..n)
+- sabit ödeme: `SabitSutun` (tek değer, n uzunluk)
+
+360 dönemlik bir tablo sözlük listesine göre yaklaşık on kat daha az bellek
+kullanır. Satırlar hâlâ sözlük olarak okunabilir:
+    for satir in tablo:
+        satir['faiz']
+
+Eski çağıranlar için `to_dicts()` sözlük listesini döndürür.
+"""
+
+from itertools import repeat
+
+
+class SabitSutun:
+    """Tüm elemanları aynı olan, bellekte tek değer tutan salt okunur sütun"""
+
+    __slots__ = ('deger', 'uzunluk')
+
+    def __init__(self, deger, uzunluk):
+        self.deger = deger
+        self.uzunluk = uzunluk
+
+    def __len__(self):
+        return self.uzunluk
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return SabitSutun(self.deger, len(range(*k.indices(self.uzunluk))))
+        if not -self.uzunluk <= k < self.uzunluk:
+            raise IndexError("Sütun indeksi aralık dışında.")
+        return self.deger
+
+    def __iter__(self):
+        return repeat(self.deger, self.uzunluk)
+
+    def __repr__(self):
+        return f"SabitSutun({self.deger!r}, {self.uzunluk})"
+
+
+class AnuiteTablosu:
+    """Paralel sütunlarla tutulan amortisman tablosu"""
+
+    __slots__ = ('donem', 'odeme', 'faiz', 'anapara', 'kalan')
+
+    def __init__(self, donem, odeme, faiz, anapara, kalan):
+        self.donem = donem
+        self.odeme = odeme
+        self.faiz = faiz
+        self.anapara = anapara
+        self.kalan = kalan
+
+    def __len__(self):
+        return len(self.donem)
+
+    def satir(self, k):
+        """k. sıradaki satırı (0 tabanlı) sözlük olarak döndürür"""
+        return {
+            'donem': self.donem[k],
+            'odeme': self.odeme[k],
+            'faiz': self.faiz[k],
+            'anapara': self.anapara[k],
+            'kalan': self.kalan[k],
+        }
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return [self.satir(j) for j in range(*k.indices(len(self)))]
+        return self.satir(k)
+
+    def __iter__(self):
+        for donem, odeme, faiz, anapara, kalan in zip(
+                self.donem, self.odeme, self.faiz, self.anapara, self.kalan):
+            yield {
+                'donem': donem,
+                'odeme': odeme,
+                'faiz': faiz,
+                'anapara': anapara,
+                'kalan': kalan,
+            }
+
+    def to_dicts(self):
+        """Eski `anuite_tablosu_olustur` çıktısı gibi sözlük listesi döndürür"""
+        return list(self)
+
+    def __repr__(self):
+        return f"AnuiteTablosu(donem_sayisi={len(self)})"
@@ -8,6 +8,8 @@ Temel Formüller:
 
 import math
 
+from . import onbellek as _onbellek
+
 
 def bugunku_deger(gelecek_deger, i, t):
     if i <= -1:
@@ -15,8 +17,7 @@ def bugunku_deger(gelecek_deger, i, t):
     if t < 0:
         raise ValueError("Dönem sayısı negatif olamaz.")
     
-    v = 1 / (1 + i)
-    return gelecek_deger * (v ** t)
+    return gelecek_deger * _onbellek.v_kuvvet(i, t)
 
 
 def gelecek_deger(bugunku_deger, i, t):
@@ -25,7 +26,7 @@ def gelecek_deger(bugunku_deger, i, t):
     if t < 0:
         raise ValueError("Dönem sayısı negatif olamaz.")
     
-    return bugunku_deger * ((1 + i) ** t)
+    return bugunku_deger * _onbellek.birikim(i, t)
 
 
 def faiz_orani_hesapla(bugunku_deger, gelecek_deger, t):
@@ -59,6 +60,8 @@ def sure_hesapla(bugunku_deger, gelecek_deger, i):
 def iskonto_faktoru_hesapla(i, t=1):
     if i <= -1:
         raise ValueError("Faiz oranı -1'den büyük olmalıdır.")
+    if _onbellek.ETKIN:
+        return _onbellek.faktor('iskonto', i, t)
     
     return (1 + i) ** (-t)
 
@@ -66,5 +69,7 @@ def iskonto_faktoru_hesapla(i, t=1):
 def birikim_faktoru_hesapla(i, t=1):
     if i <= -1:
         raise ValueError("Faiz oranı -1'den büyük olmalıdır.")
+    if _onbellek.ETKIN:
+        return _onbellek.faktor('birikim', i, t)
     
     return (1 + i) ** t
\ No newline at end of file
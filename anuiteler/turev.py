@@ -0,0 +1,232 @@
+"""
+İLERİ YÖNLÜ OTOMATİK TÜREV (DUAL SAYILAR)
+
+DualSayi(x, x') aritmetik işlemlerde türevi zincir kuralıyla taşır:
+(a, a')·(b, b') = (a·b, a'·b + a·b') vb. Kapalı formdaki değerleme
+fonksiyonları (tek_odeme, devre_sonu_anuite, devre_basi_anuite,
+ertelenmis_anuite, geometrik_anuite, aritmetik_anuite, cabuklas_anuite)
+yalnızca +, -, ×, /, ** ve karşılaştırma kullandığından, bir girdi DualSayi
+verildiğinde değer ve o girdiye göre tam türev tek değerlendirmede döner.
+Sonlu fark (girdiyi kaydırıp yeniden hesaplama) gerekmez.
+
+    from anuiteler.turev import turev_al, duyarliliklar
+
+    bd, dbd_di = turev_al(ds_bd_hesapla, 1000, 60, 0.01, degisken='i')
+    duyarliliklar(ert_ds_bd, 10000, 0.30, 8, 4)   # {'taksit': ..., 'i': ..., 'n': ..., 'm': ...}
+
+Karşılaştırmalar değer üzerinden yapılır; böylece girdi kontrolleri ve dal
+seçimleri (i = r gibi) aynen çalışır; dal noktasında dönen türev o dalın
+formülünün türevidir. `math` fonksiyonları DualSayi kabul
+etmez (türev sessizce kaybolmasın diye __float__ tanımlı değildir); bunun
+yerine bu modüldeki exp, log, log1p ve sqrt kullanılır.
+"""
+
+import inspect
+import math
+
+
+class DualSayi:
+    """Değer ve tek yöndeki türev: x + x'·ε (ε² = 0)"""
+
+    __slots__ = ('deger', 'turev')
+
+    def __init__(self, deger, turev=0.0):
+        self.deger = deger
+        self.turev = turev
+
+    # ---- Aritmetik -------------------------------------------------
+
+    def __add__(self, diger):
+        if isinstance(diger, DualSayi):
+            return DualSayi(self.deger + diger.deger, self.turev + diger.turev)
+        return DualSayi(self.deger + diger, self.turev)
+
+    __radd__ = __add__
+
+    def __sub__(self, diger):
+        if isinstance(diger, DualSayi):
+            return DualSayi(self.deger - diger.deger, self.turev - diger.turev)
+        return DualSayi(self.deger - diger, self.turev)
+
+    def __rsub__(self, diger):
+        return DualSayi(diger - self.deger, -self.turev)
+
+    def __mul__(self, diger):
+        if isinstance(diger, DualSayi):
+            return DualSayi(self.deger * diger.deger,
+                            self.turev * diger.deger + self.deger * diger.turev)
+        return DualSayi(self.deger * diger, self.turev * diger)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, diger):
+        if isinstance(diger, DualSayi):
+            bolum = self.deger / diger.deger
+            return DualSayi(bolum, (self.turev - bolum * diger.turev) / diger.deger)
+        return DualSayi(self.deger / diger, self.turev / diger)
+
+    def __rtruediv__(self, diger):
+        bolum = diger / self.deger
+        return DualSayi(bolum, -bolum * self.turev / self.deger)
+
+    def __pow__(self, us):
+        if isinstance(us, DualSayi) and not us.turev:
+            us = us.deger
+        if isinstance(us, DualSayi):
+            # a^b = exp(b·ln a): (a^b)' = a^b·(b'·ln a + b·a'/a)
+            deger = self.deger ** us.deger
+            turev = deger * (us.turev * math.log(self.deger) + us.deger * self.turev / self.deger)
+            return DualSayi(deger, turev)
+        if us == 0:
+            return DualSayi(1.0, 0.0)
+        return DualSayi(self.deger ** us, us * self.deger ** (us - 1) * self.turev)
+
+    def __rpow__(self, taban):
+        deger = taban ** self.deger
+        return DualSayi(deger, deger * math.log(taban) * self.turev if self.turev else 0.0)
+
+    def __neg__(self):
+        return DualSayi(-self.deger, -self.turev)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return -self if self.deger < 0 else self
+
+    # ---- Karşılaştırma (değer üzerinden) ---------------------------
+
+    def __eq__(self, diger):
+        if isinstance(diger, DualSayi):
+            return self.deger == diger.deger and self.turev == diger.turev
+        return self.deger == diger
+
+    def __hash__(self):
+        # Sabit (türevi sıfır) bir DualSayi, değeriyle aynı sayı gibi davranır
+        return hash(self.deger) if not self.turev else hash((self.deger, self.turev))
+
+    def __lt__(self, diger):
+        return self.deger < _deger(diger)
+
+    def __le__(self, diger):
+        return self.deger <= _deger(diger)
+
+    def __gt__(self, diger):
+        return self.deger > _deger(diger)
+
+    def __ge__(self, diger):
+        return self.deger >= _deger(diger)
+
+    def __bool__(self):
+        return bool(self.deger)
+
+    def __repr__(self):
+        return f"DualSayi({self.deger!r}, {self.turev!r})"
+
+
+def _deger(x):
+    return x.deger if isinstance(x, DualSayi) else x
+
+
+# ============================================================
+# TEMEL FONKSİYONLAR (sayı veya DualSayi)
+# ============================================================
+
+def exp(x):
+    if isinstance(x, DualSayi):
+        deger = math.exp(x.deger)
+        return DualSayi(deger, deger * x.turev)
+    return math.exp(x)
+
+
+def log(x):
+    if isinstance(x, DualSayi):
+        return DualSayi(math.log(x.deger), x.turev / x.deger)
+    return math.log(x)
+
+
+def log1p(x):
+    if isinstance(x, DualSayi):
+        return DualSayi(math.log1p(x.deger), x.turev / (1 + x.deger))
+    return math.log1p(x)
+
+
+def sqrt(x):
+    if isinstance(x, DualSayi):
+        kok = math.sqrt(x.deger)
+        return DualSayi(kok, x.turev / (2 * kok))
+    return math.sqrt(x)
+
+
+# ============================================================
+# TÜREV VE DUYARLILIK
+# ============================================================
+
+_PARAMETRELER = {}
+
+
+def _parametreler(fonksiyon):
+    """Parametre adları (imza çözümlemesi fonksiyon başına bir kez)"""
+    adlar = _PARAMETRELER.get(fonksiyon)
+    if adlar is None:
+        adlar = _PARAMETRELER[fonksiyon] = tuple(inspect.signature(fonksiyon).parameters)
+    return adlar
+
+
+def turev_al(fonksiyon, *args, degisken, **kwargs):
+    """
+    Fonksiyonun değeri ve bir girdiye göre tam türevi, tek değerlendirmede
+
+    Args:
+        fonksiyon: Kapalı formdaki değerleme fonksiyonu (ör. ds_bd_hesapla)
+        *args, **kwargs: Fonksiyonun girdileri
+        degisken: Türevi alınacak parametrenin adı (ör. 'i', 'n') veya
+            konumsal sırası
+
+    Returns:
+        (değer, türev) demeti
+    """
+    parametreler = _parametreler(fonksiyon)
+    if isinstance(degisken, int):
+        sira, ad = degisken, parametreler[degisken]
+    else:
+        ad = degisken
+        sira = parametreler.index(ad) if ad in parametreler else len(args)
+
+    if sira < len(args):
+        args = args[:sira] + (DualSayi(args[sira], 1.0),) + args[sira + 1:]
+    elif ad in kwargs:
+        kwargs[ad] = DualSayi(kwargs[ad], 1.0)
+    else:
+        raise ValueError(f"Bilinmeyen veya verilmemiş değişken: {ad}")
+
+    sonuc = fonksiyon(*args, **kwargs)
+
+    if isinstance(sonuc, DualSayi):
+        return sonuc.deger, sonuc.turev
+    return sonuc, 0.0
+
+
+def duyarliliklar(fonksiyon, *args, degiskenler=None, **kwargs):
+    """
+    Sayısal girdilerin her birine göre tam türevler (∂f/∂i, ∂f/∂n, ...)
+
+    Her türev için fonksiyon bir kez (sonlu farkta iki kez) değerlendirilir.
+
+    Args:
+        fonksiyon: Kapalı formdaki değerleme fonksiyonu
+        *args, **kwargs: Fonksiyonun girdileri
+        degiskenler: Parametre adları (None: verilen tüm sayısal girdiler)
+
+    Returns:
+        {parametre adı: türev} sözlüğü; 'deger' anahtarı fonksiyon değeridir
+    """
+    if degiskenler is None:
+        girdiler = dict(zip(_parametreler(fonksiyon), args), **kwargs)
+        degiskenler = [ad for ad, x in girdiler.items()
+                       if isinstance(x, (int, float)) and not isinstance(x, bool)]
+
+    sonuc = {}
+    for ad in degiskenler:
+        sonuc['deger'], sonuc[ad] = turev_al(fonksiyon, *args, degisken=ad, **kwargs)
+    return sonuc
@@ -6,6 +6,12 @@ duration, convexity ve diğer yardımcı hesaplamalar
 """
 
 import math
+from itertools import repeat
+from operator import mul
+
+from . import onbellek as _onbellek
+from ._kok import kok_bul, sicak_tahmin, sonuclandir
+from .nakit_akisi import NakitAkisi, nakit_akisi_olarak
 
 
 # ============================================================
@@ -152,6 +158,8 @@ def iskonto_faktoru(i, n=1):
     """
     if i <= -1:
         raise ValueError("Faiz oranı -1'den büyük olmalıdır.")
+    if _onbellek.ETKIN:
+        return _onbellek.faktor('iskonto', i, n)
     
     return (1 + i) ** (-n)
 
@@ -169,6 +177,8 @@ def birikim_faktoru(i, n=1):
     """
     if i <= -1:
         raise ValueError("Faiz oranı -1'den büyük olmalıdır.")
+    if _onbellek.ETKIN:
+        return _onbellek.faktor('birikim', i, n)
     
     return (1 + i) ** n
 
@@ -308,29 +318,78 @@ def yillik_ceyreklik_cevir(yillik_oran):
 # DURATION VE CONVEXITY
 # ============================================================
 
-def macaulay_duration(nakit_akislari, faiz_orani):
+def _iskontolu_toplamlar(akis, iskonto):
+    """NakitAkisi için Σ c·v^t, Σ t·c·v^t ve Σ t(t+1)·c·v^t"""
+    bd = agirlikli_toplam = kare_toplam = 0.0
+    for donem, tutar, v_t in zip(akis.donemler, akis.tutarlar, iskonto):
+        iskontolu = tutar * v_t
+        bd += iskontolu
+        agirlikli = donem * iskontolu
+        agirlikli_toplam += agirlikli
+        kare_toplam += donem * agirlikli
+    
+    return bd, agirlikli_toplam, agirlikli_toplam + kare_toplam
+
+
+def risk_olcumleri(nakit_akislari, faiz_orani):
     """
-    Macaulay Duration hesaplar
+    BD, Macaulay/Modified Duration, Convexity ve DV01'i tek geçişte hesaplar
+    
+    Her nakit akışı için iskonto faktörü bir kez hesaplanır; üç toplam
+    (Σ c·v^t, Σ t·c·v^t, Σ t(t+1)·c·v^t) aynı döngüde biriktirilir.
+    NakitAkisi verilirse iskonto faktörleri onun önbelleğinden alınır.
     
     Args:
-        nakit_akislari: [(dönem, tutar), ...] şeklinde liste
+        nakit_akislari: [(dönem, tutar), ...] şeklinde liste veya NakitAkisi
         faiz_orani: Dönemsel faiz oranı
     
     Returns:
-        Macaulay Duration
+        {'bugunku_deger', 'macaulay_duration', 'modified_duration',
+         'convexity', 'dv01'} anahtarlı sözlük
     """
     if faiz_orani <= -1:
         raise ValueError("Faiz oranı -1'den büyük olmalıdır.")
     
     v = 1 / (1 + faiz_orani)
     
-    bd = sum(tutar * (v ** donem) for donem, tutar in nakit_akislari)
-    agirlikli_toplam = sum(donem * tutar * (v ** donem) for donem, tutar in nakit_akislari)
+    if isinstance(nakit_akislari, NakitAkisi):
+        bd, agirlikli_toplam, convexity_sum = _iskontolu_toplamlar(
+            nakit_akislari, nakit_akislari.iskonto_faktorleri(faiz_orani))
+    else:
+        bd = agirlikli_toplam = convexity_sum = 0.0
+        for donem, tutar in nakit_akislari:
+            iskontolu = tutar * v ** donem
+            bd += iskontolu
+            agirlikli_toplam += donem * iskontolu
+            convexity_sum += donem * (donem + 1) * iskontolu
     
     if bd == 0:
         raise ValueError("Bugünkü değer sıfır olamaz.")
     
-    return agirlikli_toplam / bd
+    mac_dur = agirlikli_toplam / bd
+    mod_dur = mac_dur * v
+    
+    return {
+        'bugunku_deger': bd,
+        'macaulay_duration': mac_dur,
+        'modified_duration': mod_dur,
+        'convexity': convexity_sum * v * v / bd,
+        'dv01': mod_dur * bd * 0.0001  # 1 baz puan = 0.0001
+    }
+
+
+def macaulay_duration(nakit_akislari, faiz_orani):
+    """
+    Macaulay Duration hesaplar
+    
+    Args:
+        nakit_akislari: [(dönem, tutar), ...] şeklinde liste veya NakitAkisi
+        faiz_orani: Dönemsel faiz oranı
+    
+    Returns:
+        Macaulay Duration
+    """
+    return risk_olcumleri(nakit_akislari, faiz_orani)['macaulay_duration']
 
 
 def modified_duration(nakit_akislari, faiz_orani):
@@ -338,14 +397,13 @@ def modified_duration(nakit_akislari, faiz_orani):
     Modified Duration hesaplar
     
     Args:
-        nakit_akislari: [(dönem, tutar), ...] şeklinde liste
+        nakit_akislari: [(dönem, tutar), ...] şeklinde liste veya NakitAkisi
         faiz_orani: Dönemsel faiz oranı
     
     Returns:
         Modified Duration
     """
-    mac_dur = macaulay_duration(nakit_akislari, faiz_orani)
-    return mac_dur / (1 + faiz_orani)
+    return risk_olcumleri(nakit_akislari, faiz_orani)['modified_duration']
 
 
 def convexity(nakit_akislari, faiz_orani):
@@ -353,26 +411,13 @@ def convexity(nakit_akislari, faiz_orani):
     Convexity (dışbükeylik) hesaplar
     
     Args:
-        nakit_akislari: [(dönem, tutar), ...] şeklinde liste
+        nakit_akislari: [(dönem, tutar), ...] şeklinde liste veya NakitAkisi
         faiz_orani: Dönemsel faiz oranı
     
     Returns:
         Convexity
     """
-    if faiz_orani <= -1:
-        raise ValueError("Faiz oranı -1'den büyük olmalıdır.")
-    
-    v = 1 / (1 + faiz_orani)
-    
-    bd = sum(tutar * (v ** donem) for donem, tutar in nakit_akislari)
-    
-    if bd == 0:
-        raise ValueError("Bugünkü değer sıfır olamaz.")
-    
-    convexity_sum = sum(donem * (donem + 1) * tutar * (v ** (donem + 2)) 
-                        for donem, tutar in nakit_akislari)
-    
-    return convexity_sum / bd
+    return risk_olcumleri(nakit_akislari, faiz_orani)['convexity']
 
 
 def dv01(nakit_akislari, faiz_orani):
@@ -381,17 +426,13 @@ def dv01(nakit_akislari, faiz_orani):
     tahvilin değerindeki değişimi
     
     Args:
-        nakit_akislari: [(dönem, tutar), ...] şeklinde liste
+        nakit_akislari: [(dönem, tutar), ...] şeklinde liste veya NakitAkisi
         faiz_orani: Dönemsel faiz oranı
     
     Returns:
         DV01
     """
-    mod_dur = modified_duration(nakit_akislari, faiz_orani)
-    v = 1 / (1 + faiz_orani)
-    bd = sum(tutar * (v ** donem) for donem, tutar in nakit_akislari)
-    
-    return mod_dur * bd * 0.0001  # 1 baz puan = 0.0001
+    return risk_olcumleri(nakit_akislari, faiz_orani)['dv01']
 
 
 # ============================================================
@@ -403,7 +444,7 @@ def net_bugunku_deger(nakit_akislari, faiz_orani, baslangic_yatirim=0):
     Net Bugünkü Değer (NPV) hesaplar
     
     Args:
-        nakit_akislari: [(dönem, tutar), ...] şeklinde liste
+        nakit_akislari: [(dönem, tutar), ...] şeklinde liste veya NakitAkisi
         faiz_orani: İskonto oranı
         baslangic_yatirim: Başlangıçtaki yatırım (negatif olmalı)
     
@@ -413,54 +454,149 @@ def net_bugunku_deger(nakit_akislari, faiz_orani, baslangic_yatirim=0):
     if faiz_orani <= -1:
         raise ValueError("Faiz oranı -1'den büyük olmalıdır.")
     
+    if isinstance(nakit_akislari, NakitAkisi):
+        iskonto = nakit_akislari.iskonto_faktorleri(faiz_orani)
+        return sum(map(mul, nakit_akislari.tutarlar, iskonto)) + baslangic_yatirim
+    
     v = 1 / (1 + faiz_orani)
     bd = sum(tutar * (v ** donem) for donem, tutar in nakit_akislari)
     
     return bd + baslangic_yatirim
 
 
-def ic_verim_orani(nakit_akislari, baslangic_yatirim, tahmin=0.1, tolerans=1e-6, max_iter=100):
+def _npv_turevleri(akis, baslangic_yatirim, i):
+    """NPV(i), NPV'(i) ve NPV''(i) tek geçişte (akis: NakitAkisi)"""
+    if i <= -1:
+        return math.nan, math.nan, math.nan
+    
+    v = 1 / (1 + i)
+    
+    # Oran her iterasyonda değiştiği için önbellek kullanılmaz
+    bd, agirlikli_toplam, convexity_sum = _iskontolu_toplamlar(
+        akis, map(pow, repeat(v), akis.donemler))
+    
+    return bd + baslangic_yatirim, -agirlikli_toplam * v, convexity_sum * v * v
+
+
+def _irr_baslangic_tahmini(akis, baslangic_yatirim):
+    """
+    Kapalı form başlangıç tahmini: tüm girişler ortalama vadede (D) tek
+    ödeme gibi düşünülürse (Σc / -C0)^(1/D) - 1
+    """
+    mutlak = list(map(abs, akis.tutarlar))
+    toplam = sum(akis.tutarlar)
+    agirlik = sum(mutlak)
+    
+    if baslangic_yatirim >= 0 or toplam <= 0 or agirlik == 0:
+        return 0.1
+    
+    ortalama_vade = sum(map(mul, akis.donemler, mutlak)) / agirlik
+    if ortalama_vade <= 0:
+        return 0.1
+    
+    return (toplam / -baslangic_yatirim) ** (1 / ortalama_vade) - 1
+
+
+# İlk deneme yakınsamazsa işaret değişimi aranan oranlar
+_IRR_TARAMA = (-0.99, -0.9, -0.5, -0.2, 0.0, 0.05, 0.1, 0.2, 0.35, 0.5, 1.0, 2.0, 5.0, 10.0, 100.0)
+
+
+def ic_verim_orani_ayrintili(nakit_akislari, baslangic_yatirim, tahmin=None, tolerans=1e-6,
+                             max_iter=100):
+    """
+    İç Verim Oranı ve yakınsama tanılaması
+    
+    Analitik türevli Halley adımı kullanılır; her değerlendirme NPV ve iki
+    türevini tek geçişte hesaplar. İşaret değişimi bulunduğunda adımlar bu
+    aralıkta tutulur (gerekirse ikiye bölme). İlk deneme yakınsamazsa
+    oran ızgarasında işaret değişimi aranır ve aralıklı çözüme geçilir.
+    
+    Args:
+        nakit_akislari: [(dönem, tutar), ...] şeklinde liste veya NakitAkisi
+        baslangic_yatirim: Başlangıçtaki yatırım (negatif)
+        tahmin: Başlangıç tahmini (None ise sıcak başlangıçtaki son kök veya
+            kapalı form tahmin)
+        tolerans: Yakınsama toleransı
+        max_iter: Maksimum iterasyon sayısı
+    
+    Returns:
+        {'oran', 'iterasyon', 'degerlendirme', 'artik', 'yakinsadi',
+         'ikiye_bolme'} anahtarlı sözlük; degerlendirme NPV hesaplama sayısıdır
+    """
+    akis = nakit_akisi_olarak(nakit_akislari)
+    
+    pozitif = baslangic_yatirim > 0 or any(tutar > 0 for tutar in akis.tutarlar)
+    negatif = baslangic_yatirim < 0 or any(tutar < 0 for tutar in akis.tutarlar)
+    if not (pozitif and negatif):
+        raise ValueError("Nakit akışlarında işaret değişimi yok, iç verim oranı tanımsız.")
+    
+    ad = 'yardimci.ic_verim_orani'
+    tahmin = sicak_tahmin(ad, tahmin, None)
+    if tahmin is None:
+        tahmin = _irr_baslangic_tahmini(akis, baslangic_yatirim)
+    if tahmin <= -1:
+        raise ValueError("Tahmin -1'den büyük olmalıdır.")
+    
+    def fonksiyon(i):
+        return _npv_turevleri(akis, baslangic_yatirim, i)
+    
+    sonuc = kok_bul(fonksiyon, tahmin, tolerans, max_iter, alt_sinir=-1)
+    degerlendirme = sonuc['degerlendirme']
+    
+    if not sonuc['yakinsadi']:
+        # Tahmine en yakın işaret değişimini bul, aralıklı çözüme geç
+        noktalar = sorted(_IRR_TARAMA, key=lambda oran: abs(oran - tahmin))
+        degerler = {}
+        aralik = None
+        
+        for oran in noktalar:
+            degerler[oran] = fonksiyon(oran)[0]
+            degerlendirme += 1
+            
+            komsular = [k for k in degerler if k != oran]
+            for komsu in sorted(komsular, key=lambda k: abs(k - oran)):
+                if (degerler[komsu] < 0) != (degerler[oran] < 0):
+                    aralik = (komsu, degerler[komsu], oran, degerler[oran])
+                    break
+            if aralik is not None:
+                break
+        
+        if aralik is not None:
+            sonuc = kok_bul(fonksiyon, tahmin, tolerans, max_iter, alt_sinir=-1, aralik=aralik)
+            degerlendirme += sonuc['degerlendirme']
+    
+    return {
+        'oran': sonuclandir(ad, sonuc, max_iter, hata=False),
+        'iterasyon': sonuc['iterasyon'],
+        'degerlendirme': degerlendirme,
+        'artik': sonuc['artik'],
+        'yakinsadi': sonuc['yakinsadi'],
+        'ikiye_bolme': sonuc['ikiye_bolme'],
+    }
+
+
+def ic_verim_orani(nakit_akislari, baslangic_yatirim, tahmin=None, tolerans=1e-6, max_iter=100):
     """
     İç Verim Oranı (IRR - Internal Rate of Return) hesaplar
     NPV'yi sıfır yapan faiz oranı
     
     Args:
-        nakit_akislari: [(dönem, tutar), ...] şeklinde liste
+        nakit_akislari: [(dönem, tutar), ...] şeklinde liste veya NakitAkisi
         baslangic_yatirim: Başlangıçtaki yatırım (negatif)
-        tahmin: Başlangıç tahmini
+        tahmin: Başlangıç tahmini (None ise sıcak başlangıçtaki son kök veya
+            kapalı form tahmin)
         tolerans: Yakınsama toleransı
         max_iter: Maksimum iterasyon sayısı
     
     Returns:
         İç Verim Oranı
     """
-    i = tahmin
+    sonuc = ic_verim_orani_ayrintili(nakit_akislari, baslangic_yatirim, tahmin, tolerans, max_iter)
     
-    for _ in range(max_iter):
-        npv = net_bugunku_deger(nakit_akislari, i, baslangic_yatirim)
-        
-        if abs(npv) < tolerans:
-            return i
-        
-        # Sayısal türev
-        delta = 1e-8
-        npv_delta = net_bugunku_deger(nakit_akislari, i + delta, baslangic_yatirim)
-        turev = (npv_delta - npv) / delta
-        
-        if abs(turev) < 1e-10:
-            raise ValueError("Türev sıfıra çok yakın, yakınsama sağlanamadı.")
-        
-        i_yeni = i - npv / turev
-        
-        if i_yeni <= -1:
-            i_yeni = -0.99
-        
-        if abs(i_yeni - i) < tolerans:
-            return i_yeni
-        
-        i = i_yeni
+    if not sonuc['yakinsadi']:
+        raise ValueError(f"Yakınsama sağlanamadı ({max_iter} iterasyonda).")
     
-    raise ValueError(f"Yakınsama sağlanamadı ({max_iter} iterasyonda).")
+    return sonuc['oran']
 
 
 # ============================================================
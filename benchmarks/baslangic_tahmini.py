@@ -0,0 +1,126 @@
+"""
+BAŞLANGIÇ TAHMİNİ KIYASLAMASI
+
+Faiz çözücülerini gerçekçi bir parametre dağılımından (aylık konut/taşıt
+kredileri ve yıllık anüiteler) üretilen sözleşmelerle iki kez çalıştırır:
+sabit `tahmin=0.1` ile ve kapalı form başlangıçla (`tahmin=None`).
+Çözüm başına ortalama iterasyon ve fonksiyon değerlendirme sayısı `izleme`
+kayıtlarından, süre (izleme sarmalayıcısı dahil) `perf_counter` ile ölçülür.
+"Farklı" sütunu sözleşmeyi üreten orandan 1e-6'dan fazla uzaklaşan (veya hata
+veren) çözümleri sayar; çabuklaştırılmış anüite yüksek oranlarda monoton
+olmadığından orada aynı BD'yi veren ikinci bir kök bulunabilir.
+
+Kullanım:
+    python benchmarks/baslangic_tahmini.py [ornek_sayisi]
+"""
+
+import os
+import random
+import sys
+from time import perf_counter
+
+KOK = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, KOK)
+
+import anuiteler as a  # noqa: E402
+from anuiteler import izleme  # noqa: E402
+
+
+def _vade_ve_oran(rastgele):
+    """%60 aylık kredi (12-480 ay, aylık %0.2-%4), %40 yıllık (2-40 yıl, %1-%60)"""
+    if rastgele.random() < 0.6:
+        n = rastgele.choice((12, 24, 36, 48, 60, 120, 180, 240, 360, 480))
+        return n, rastgele.uniform(0.002, 0.04)
+    return rastgele.randint(2, 40), rastgele.uniform(0.01, 0.6)
+
+
+def _senaryolar(rastgele):
+    """ad -> (çözücü, sözleşme üreticisi); üretici (girdi demeti, gerçek oran) verir"""
+    def ds_bd():
+        n, i = _vade_ve_oran(rastgele)
+        return (a.ds_bd_hesapla(1000, n, i), 1000, n), i
+
+    def ds_gd():
+        n, i = _vade_ve_oran(rastgele)
+        return (a.ds_gd_hesapla(1000, n, i), 1000, n), i
+
+    def db_bd():
+        n, i = _vade_ve_oran(rastgele)
+        return (a.db_bd_hesapla(1000, n, i), 1000, n), i
+
+    def db_gd():
+        n, i = _vade_ve_oran(rastgele)
+        return (a.db_gd_hesapla(1000, n, i), 1000, n), i
+
+    def ert():
+        n, i = _vade_ve_oran(rastgele)
+        m = rastgele.randint(1, 12 if n >= 12 else 5)
+        return (a.ert_ds_bd(1000, i, n, m), 1000, n, m), i
+
+    def cab():
+        n, i = _vade_ve_oran(rastgele)
+        c = rastgele.randint(1, 3)
+        return (a.cab_ds_bd(1000, i, n, c), 1000, n, c), i
+
+    def geo():
+        n, i = _vade_ve_oran(rastgele)
+        r = rastgele.uniform(-0.02, 0.01) if n >= 12 else rastgele.uniform(-0.05, 0.10)
+        return (a.geo_ds_bd(1000, i, r, n), 1000, r, n), i
+
+    def arit():
+        n, i = _vade_ve_oran(rastgele)
+        degisim = rastgele.uniform(-0.5, 1.0) * 1000 / n
+        return (a.arit_ds_bd(1000, degisim, i, n), 1000, degisim, n), i
+
+    return {
+        'devre_sonu_anuite.faiz_bugunku_degerden': (a.ds_faiz_bd, ds_bd),
+        'devre_sonu_anuite.faiz_gelecek_degerden': (a.ds_faiz_gd, ds_gd),
+        'devre_basi_anuite.faiz_bugunku_degerden': (a.db_faiz_bd, db_bd),
+        'devre_basi_anuite.faiz_gelecek_degerden': (a.db_faiz_gd, db_gd),
+        'ertelenmis_anuite.faiz_orani_hesapla_bd': (a.ert_faiz_hesapla, ert),
+        'cabuklas_anuite.faiz_orani_hesapla_bd': (a.cab_faiz_hesapla, cab),
+        'geometrik_anuite.faiz_orani_hesapla_bd': (a.geo_faiz_hesapla, geo),
+        'aritmetik_anuite.faiz_orani_hesapla_bd': (a.arit_faiz_hesapla, arit),
+    }
+
+
+def olc(ad, cozucu, sozlesmeler, tahmin):
+    """Ortalama iterasyon, değerlendirme, µs/çözüm ve farklı çözüm sayısı"""
+    izleme.sifirla()
+    izleme.etkinlestir()
+    farkli = 0
+    try:
+        baslangic = perf_counter()
+        for girdi, oran in sozlesmeler:
+            try:
+                if abs(cozucu(*girdi, tahmin=tahmin) - oran) > 1e-6:
+                    farkli += 1
+            except ValueError:
+                farkli += 1
+        sure = perf_counter() - baslangic
+        kayit = izleme.anlik_goruntu()['cozuculer'][ad]
+    finally:
+        izleme.devre_disi_birak()
+        izleme.sifirla()
+
+    cozum = kayit['cozum']
+    return (kayit['iterasyon']['toplam'] / cozum, kayit['degerlendirme'] / cozum,
+            sure / len(sozlesmeler) * 1e6, farkli)
+
+
+def main():
+    ornek = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rastgele = random.Random(2025)
+
+    print(f"{'Çözücü':<42} {'Tahmin':>7} {'İter.':>6} {'Değ.':>6} {'µs':>7} {'Farklı':>7}")
+    print("-" * 80)
+    for ad, (cozucu, uretici) in _senaryolar(rastgele).items():
+        sozlesmeler = [uretici() for _ in range(ornek)]
+        for etiket, tahmin in (('0.1', 0.1), ('kapalı', None)):
+            iterasyon, degerlendirme, sure, farkli = olc(ad, cozucu, sozlesmeler, tahmin)
+            print(f"{ad:<42} {etiket:>7} {iterasyon:>6.2f} {degerlendirme:>6.2f} "
+                  f"{sure:>7.2f} {farkli:>7}")
+
+
+if __name__ == '__main__':
+    main()
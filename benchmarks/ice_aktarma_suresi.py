@@ -0,0 +1,55 @@
+"""
+İÇE AKTARMA SÜRESİ KIYASLAMASI
+
+Her senaryo ayrı (soğuk) bir Python sürecinde ölçülür; modül önbelleği
+(sys.modules) paylaşılmaz. `from anuiteler import *` tüm alt modülleri
+yükler ve gecikmeli yüklemeden önceki `import anuiteler` maliyetine eşittir.
+
+Kullanım:
+    python benchmarks/ice_aktarma_suresi.py [tekrar_sayisi]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+KOK = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+SENARYOLAR = {
+    'import anuiteler': 'import anuiteler',
+    'tek_odeme_bd': 'from anuiteler import tek_odeme_bd',
+    'ds_bd_hesapla': 'from anuiteler import ds_bd_hesapla',
+    'tümü (import *)': 'from anuiteler import *',
+}
+
+OLCUM = (
+    "import sys, time; sys.path.insert(0, {kok!r}); "
+    "t = time.perf_counter(); {kod}; print(time.perf_counter() - t)"
+)
+
+
+def olc(kod, tekrar):
+    """Kodu tekrar sayısı kadar yeni süreçte çalıştırıp süreleri (ms) döndürür"""
+    sureler = []
+    for _ in range(tekrar):
+        cikti = subprocess.run(
+            [sys.executable, '-c', OLCUM.format(kok=KOK, kod=kod)],
+            capture_output=True, text=True, check=True,
+        )
+        sureler.append(float(cikti.stdout) * 1000)
+    return sureler
+
+
+def main():
+    tekrar = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    print(f"{'Senaryo':<20} {'Medyan (ms)':>12} {'En az (ms)':>12}")
+    print("-" * 46)
+    for ad, kod in SENARYOLAR.items():
+        sureler = olc(kod, tekrar)
+        print(f"{ad:<20} {statistics.median(sureler):>12.3f} {min(sureler):>12.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,405 @@
+"""
+PERFORMANS KIYASLAMA PAKETİ
+
+Skaler hesaplamaları, amortisman tablolarını, ters çözücüleri (`faiz_*`,
+`sure_*`, `ic_verim_orani`), duration/convexity fonksiyonlarını ve (NumPy
+kuruluysa) `anuiteler.np` toplu fonksiyonlarını farklı girdi boyutlarında
+ölçer.
+
+Her kıyaslama `timeit` ile en az `--sure` saniye sürecek kadar tekrarlanır;
+`--tekrar` ölçümden en kısası çağrı başına süre (µs) olarak raporlanır.
+Sonuçlar JSON'a kaydedilir ve saklanan bir taban çizgisiyle karşılaştırılır;
+eşikten fazla yavaşlayan kıyaslama varsa çıkış kodu 1 olur.
+
+Kullanım:
+    python benchmarks/kiyaslama.py                               # ölç ve yazdır
+    python benchmarks/kiyaslama.py --kaydet sonuc.json            # sonucu kaydet
+    python benchmarks/kiyaslama.py --karsilastir                  # taban.json ile
+    python benchmarks/kiyaslama.py --karsilastir eski.json --esik 0.10
+    python benchmarks/kiyaslama.py --filtre ters. --tekrar 7
+    python benchmarks/kiyaslama.py --kaydet benchmarks/taban.json  # tabanı güncelle
+
+Taban çizgisi ölçüldüğü makineye bağlıdır; karşılaştırma aynı makinede
+alınmış bir tabanla yapılmalıdır.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import timeit
+import warnings
+from itertools import compress
+
+KOK = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, KOK)
+
+import anuiteler as a  # noqa: E402
+
+TABAN = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'taban.json')
+
+TABLO_BOYUTLARI = (12, 120, 360)
+AKIS_BOYUTLARI = (10, 100, 1000)
+DIZI_BOYUTLARI = (1000, 100000)
+
+
+# ============================================================
+# KIYASLAMALAR
+# ============================================================
+
+def _skaler():
+    yield 'skaler.tek_odeme_bd', lambda: a.tek_odeme_bd(1000, 0.10, 5)
+    yield 'skaler.ds_bd_hesapla', lambda: a.ds_bd_hesapla(1000, 60, 0.01)
+    yield 'skaler.ds_gd_hesapla', lambda: a.ds_gd_hesapla(1000, 60, 0.01)
+    yield 'skaler.ds_odeme_bd', lambda: a.ds_odeme_bd(50000, 60, 0.01)
+    yield 'skaler.db_bd_hesapla', lambda: a.db_bd_hesapla(1000, 60, 0.01)
+    yield 'skaler.surekli_ds_bd', lambda: a.surekli_ds_bd(1000, 0.05)
+    yield 'skaler.ert_ds_bd', lambda: a.ert_ds_bd(10000, 0.30, 8, 4)
+    yield 'skaler.geo_ds_bd', lambda: a.geo_ds_bd(5000, 0.05, 0.20, 6)
+    yield 'skaler.arit_ds_bd', lambda: a.arit_ds_bd(5000, 500, 0.30, 6)
+    yield 'skaler.cab_ds_bd', lambda: a.cab_ds_bd(10000, 0.30, 8, 2)
+    yield 'skaler.anuite_hesapla', lambda: a.anuite_hesapla(bugunku_deger=50000, n=24, i=0.015)
+
+
+def _tablo():
+    for n in TABLO_BOYUTLARI:
+        yield f'tablo.ds_tablo[{n}]', lambda n=n: a.ds_tablo(1000, n, 0.01)
+        yield f'tablo.db_tablo[{n}]', lambda n=n: a.db_tablo(1000, n, 0.01)
+        yield f'tablo.ds_tablo_akisi[{n}]', lambda n=n: sum(1 for _ in a.ds_tablo_akisi(1000, n, 0.01))
+        yield f'tablo.ds_kumulatif_faiz[{n}]', lambda n=n: a.ds_kumulatif_faiz(1000, n, 0.01, 1, n)
+        yield f'tablo.ds_faktor_serisi[{n}]', lambda n=n: a.ds_faktor_serisi(0.01, n)
+        yield (f'tablo.ds_faktor_dongusu[{n}]',
+               lambda n=n: [(a.ds_pesin_faktor(0.01, k), a.ds_gelecek_faktor(0.01, k))
+                            for k in range(1, n + 1)])
+
+
+def _ters():
+    for n in TABLO_BOYUTLARI:
+        bd = a.ds_bd_hesapla(1000, n, 0.01)
+        gd = a.ds_gd_hesapla(1000, n, 0.01)
+        yield f'ters.ds_faiz_bd[{n}]', lambda bd=bd, n=n: a.ds_faiz_bd(bd, 1000, n)
+        yield f'ters.ds_faiz_gd[{n}]', lambda gd=gd, n=n: a.ds_faiz_gd(gd, 1000, n)
+        yield f'ters.db_faiz_bd[{n}]', lambda n=n: a.db_faiz_bd(a.db_bd_hesapla(1000, n, 0.01), 1000, n)
+        yield f'ters.ds_sure_bd[{n}]', lambda bd=bd: a.ds_sure_bd(bd, 1000, 0.01)
+        yield f'ters.ds_sure_gd[{n}]', lambda gd=gd: a.ds_sure_gd(gd, 1000, 0.01)
+        yield f'ters.db_sure_bd[{n}]', lambda bd=bd: a.db_sure_bd(bd, 1000, 0.01)
+
+    bd = a.geo_ds_bd(5000, 0.05, 0.20, 6)
+    yield 'ters.geo_faiz_hesapla', lambda: a.geo_faiz_hesapla(bd, 5000, 0.20, 6)
+    bd_arit = a.arit_ds_bd(5000, 500, 0.30, 6)
+    yield 'ters.arit_faiz_hesapla', lambda: a.arit_faiz_hesapla(bd_arit, 5000, 500, 6)
+    bd_cab = a.cab_ds_bd(10000, 0.30, 8, 2)
+    yield 'ters.cab_faiz_hesapla', lambda: a.cab_faiz_hesapla(bd_cab, 10000, 8, 2)
+    bd_ert = a.ert_ds_bd(10000, 0.30, 8, 4)
+    yield 'ters.ert_faiz_hesapla', lambda: a.ert_faiz_hesapla(bd_ert, 10000, 8, 4)
+
+    gd_geo = a.geo_ds_gd(5000, 0.05, 0.03, 120)
+    yield 'ters.geo_sure_hesapla', lambda: a.geo_sure_hesapla(gd_geo, 5000, 0.05, 0.03)
+    bd_arit = a.arit_ds_bd(5000, 50, 0.01, 120)
+    yield 'ters.arit_sure_hesapla', lambda: a.arit_sure_hesapla(bd_arit, 5000, 50, 0.01)
+    yield 'ters.cab_donem_hesapla', lambda: a.cab_donem_hesapla(bd_cab, 10000, 0.30, 2)
+    yield 'ters.ert_sure_hesapla', lambda: a.ert_sure_hesapla(bd_ert, 10000, 0.30, 4)
+
+    for boyut in AKIS_BOYUTLARI:
+        akis = _akis(boyut)
+        yatirim = -0.8 * sum(tutar for _, tutar in akis)
+        yield f'ters.ic_verim_orani[{boyut}]', lambda akis=akis, y=yatirim: a.ic_verim_orani(akis, y)
+
+    # 100 benzer sözleşme: her biri varsayılan tahminden / bir öncekinin kökünden
+    portfoy = [a.ds_bd_hesapla(1000, 60, 0.01 + k * 1e-5) for k in range(100)]
+
+    def soguk():
+        return [a.ds_faiz_bd(bd, 1000, 60) for bd in portfoy]
+
+    def sicak():
+        with a.sicak_baslangic():
+            return [a.ds_faiz_bd(bd, 1000, 60) for bd in portfoy]
+
+    yield 'ters.ds_faiz_bd_portfoy[100]', soguk
+    yield 'ters.ds_faiz_bd_portfoy_sicak[100]', sicak
+
+
+def _yardimci():
+    for boyut in AKIS_BOYUTLARI:
+        akis = _akis(boyut)
+        dizi_akis = a.NakitAkisi.listeden(akis)
+        yield f'yardimci.macaulay_duration[{boyut}]', lambda akis=akis: a.yardimci.macaulay_duration(akis, 0.05)
+        yield f'yardimci.convexity[{boyut}]', lambda akis=akis: a.yardimci.convexity(akis, 0.05)
+        yield f'yardimci.dv01[{boyut}]', lambda akis=akis: a.yardimci.dv01(akis, 0.05)
+        yield f'yardimci.risk_olcumleri[{boyut}]', lambda akis=akis: a.risk_olcumleri(akis, 0.05)
+        yield (f'yardimci.risk_olcumleri_nakit_akisi[{boyut}]',
+               lambda akis=dizi_akis: a.risk_olcumleri(akis, 0.05))
+
+
+def _numpy():
+    try:
+        import numpy as np
+        import anuiteler.np as anp
+    except ImportError:
+        return
+
+    rng = np.random.default_rng(0)
+    for boyut in DIZI_BOYUTLARI:
+        odeme = rng.uniform(500, 5000, boyut)
+        n = rng.integers(6, 360, boyut).astype(float)
+        i = rng.uniform(0.001, 0.03, boyut)
+        bd = anp.ds_bd_hesapla(odeme, n, i).data
+        eksik = np.where(np.arange(boyut) % 2 == 0, np.nan, odeme)
+
+        yield f'numpy.ds_bd_hesapla[{boyut}]', lambda o=odeme, n=n, i=i: anp.ds_bd_hesapla(o, n, i)
+        yield f'numpy.ds_faiz_bd[{boyut}]', lambda bd=bd, o=odeme, n=n: anp.ds_faiz_bd(bd, o, n)
+        yield (f'numpy.anuite_hesapla_toplu[{boyut}]',
+               lambda o=eksik, bd=bd, n=n, i=i: anp.anuite_hesapla_toplu(o, bd, None, n, i))
+
+        r = rng.uniform(0.0, 0.05, boyut)
+        bd_geo = anp.geo_ds_bd(odeme, i, r, n).data
+        bd_arit = anp.arit_ds_bd(odeme, 10.0, i, n).data
+        yield (f'numpy.geo_faiz_hesapla[{boyut}]',
+               lambda bd=bd_geo, o=odeme, r=r, n=n: anp.geo_faiz_hesapla(bd, o, r, n))
+        yield (f'numpy.arit_faiz_hesapla[{boyut}]',
+               lambda bd=bd_arit, o=odeme, n=n: anp.arit_faiz_hesapla(bd, o, 10.0, n))
+
+        gd_geo = anp.geo_ds_gd(odeme, i, r, n).data
+        yield (f'numpy.geo_sure_hesapla[{boyut}]',
+               lambda gd=gd_geo, o=odeme, i=i, r=r: anp.geo_sure_hesapla(gd, o, i, r))
+        yield (f'numpy.arit_sure_hesapla[{boyut}]',
+               lambda bd=bd_arit, o=odeme, i=i: anp.arit_sure_hesapla(bd, o, 10.0, i))
+
+    oranlar = np.arange(1, 1001) / 10000
+    yield 'numpy.ds_faktor_serisi[1000x480]', lambda: anp.ds_faktor_serisi(oranlar, 480)
+
+
+def _faktor_tablosu():
+    dosya = os.path.join(tempfile.gettempdir(), f'anuiteler_kiyaslama_{os.getpid()}.bin')
+    a.faktor_tablosu_olustur(dosya, baslangic=0.0001, bitis=0.10, adim=0.0001, n_max=480)
+    tablo = a.FaktorTablosu(dosya)
+    os.remove(dosya)  # eşleme açık kaldıkça veri erişilebilir (POSIX)
+
+    yield 'faktor_tablosu.pesin[tablo]', lambda: tablo.pesin_deger_faktoru(0.0125, 360)
+    yield 'faktor_tablosu.pesin[hesap]', lambda: a.ds_pesin_faktor(0.0125, 360)
+    yield ('faktor_tablosu.pesin_interpolasyon',
+           lambda: tablo.pesin_deger_faktoru(0.01234, 360, interpolasyon=True))
+    yield ('faktor_tablosu.ertelenmis_db[tablo]',
+           lambda: tablo.pesin_deger_faktoru(0.0125, 360, devre_basi=True, m=6))
+
+    try:
+        import numpy as np
+        import anuiteler.np as anp
+    except ImportError:
+        return
+
+    rng = np.random.default_rng(0)
+    for boyut in DIZI_BOYUTLARI:
+        i = rng.integers(1, 1001, boyut) / 10000
+        n = rng.integers(1, 481, boyut).astype(float)
+        yield (f'faktor_tablosu.numpy_pesin[tablo,{boyut}]',
+               lambda i=i, n=n: anp.tablo_pesin_faktor(tablo, i, n))
+        yield (f'faktor_tablosu.numpy_pesin[hesap,{boyut}]',
+               lambda i=i, n=n: anp.ds_pesin_faktor(i, n))
+
+
+def _onbellek():
+    # Az sayıda (i, n) çiftinin tekrar tekrar istendiği iş yükü
+    ciftler = [(0.0025 * k, n) for k in range(1, 9) for n in (12, 60, 120, 240, 360, 480)]
+
+    def yuk():
+        for i, n in ciftler:
+            a.ds_bd_hesapla(1000, n, i)
+            a.db_gd_hesapla(1000, n, i)
+            a.yardimci.iskonto_faktoru(i, n)
+
+    def onbellekli():
+        a.onbellek.etkinlestir()
+        try:
+            yuk()
+        finally:
+            a.onbellek.devre_disi_birak()
+
+    yield f'onbellek.kapali[{len(ciftler)}]', yuk
+    yield f'onbellek.acik[{len(ciftler)}]', onbellekli
+    yield 'onbellek.ds_pesin_faktor[kapali]', lambda: a.ds_pesin_faktor(0.0125, 360)
+
+
+def _sozlesme():
+    # Teklif ekranı: aynı sözleşme için taksit, BD, GD, tablo ve ortalama vade
+    def moduller(n):
+        odeme = a.ds_odeme_bd(50000, n, 0.015)
+        a.ds_bd_hesapla(odeme, n, 0.015)
+        a.ds_gd_hesapla(odeme, n, 0.015)
+        a.ds_tablo(odeme, n, 0.015)
+        a.devre_sonu_anuite.ortalama_sure_hesapla(odeme, n, 0.015)
+
+    def sozlesme(n):
+        sozlesme = a.AnuiteSozlesmesi.bugunku_degerden(50000, n, 0.015)
+        sozlesme.bugunku_deger()
+        sozlesme.gelecek_deger()
+        sozlesme.tablo()
+        sozlesme.ortalama_sure()
+
+    for n in TABLO_BOYUTLARI:
+        yield f'sozlesme.teklif[moduller,{n}]', lambda n=n: moduller(n)
+        yield f'sozlesme.teklif[sozlesme,{n}]', lambda n=n: sozlesme(n)
+    yield 'sozlesme.ozet', lambda: a.AnuiteSozlesmesi(1000, 360, 0.0125).ozet()
+
+
+def _hizli():
+    yield 'hizli.ds_bd_hesapla', lambda: a.hizli.ds_bd_hesapla(1000, 60, 0.01)
+    yield 'hizli.ert_ds_bd', lambda: a.hizli.ert_ds_bd(10000, 0.30, 8, 4)
+    yield 'hizli.geo_ds_bd', lambda: a.hizli.geo_ds_bd(5000, 0.05, 0.20, 6)
+    yield 'hizli.cab_ds_bd', lambda: a.hizli.cab_ds_bd(10000, 0.30, 8, 2)
+
+    # Değerleme döngüsü: kontrollü fonksiyonlar / bir kez doğrulama + çekirdekler
+    odemeler = [500 + 3 * k for k in range(1000)]
+    vadeler = [12 + k % 348 for k in range(1000)]
+    oranlar = [0.001 + (k % 29) / 1000 for k in range(1000)]
+    satirlar = list(zip(odemeler, vadeler, oranlar))
+
+    def kontrollu():
+        ds_bd = a.ds_bd_hesapla
+        return [ds_bd(odeme, n, i) for odeme, n, i in satirlar]
+
+    def dogrulanmis():
+        ds_bd = a.hizli.ds_bd_hesapla
+        maske = a.hizli.dogrula(odeme=odemeler, n=vadeler, i=oranlar)['gecerli']
+        return [ds_bd(odeme, n, i) for odeme, n, i in compress(satirlar, maske)]
+
+    def cekirdek():
+        ds_bd = a.hizli.ds_bd_hesapla
+        return [ds_bd(odeme, n, i) for odeme, n, i in satirlar]
+
+    yield 'hizli.dongu[kontrollu,1000]', kontrollu
+    yield 'hizli.dongu[cekirdek,1000]', cekirdek
+    yield 'hizli.dongu[dogrula+cekirdek,1000]', dogrulanmis
+    yield 'hizli.dogrula[1000]', lambda: a.hizli.dogrula(odeme=odemeler, n=vadeler, i=oranlar)
+
+    try:
+        import numpy as np
+    except ImportError:
+        return
+    sutunlar = {'odeme': np.array(odemeler), 'n': np.array(vadeler), 'i': np.array(oranlar)}
+    yield 'hizli.dogrula[numpy,1000]', lambda: a.hizli.dogrula(**sutunlar)
+
+
+def _turev():
+    # Duyarlılık: dual sayıyla tek değerlendirme / merkezi sonlu farkla iki
+    h = 1e-6
+    yield 'turev.turev_al[ds_bd,i]', lambda: a.turev_al(a.ds_bd_hesapla, 1000, 60, 0.01,
+                                                         degisken='i')
+    yield 'turev.sonlu_fark[ds_bd,i]', lambda: (a.ds_bd_hesapla(1000, 60, 0.01 + h)
+                                                - a.ds_bd_hesapla(1000, 60, 0.01 - h)) / (2 * h)
+    yield 'turev.duyarliliklar[ert_ds_bd]', lambda: a.duyarliliklar(a.ert_ds_bd, 10000, 0.30, 8, 4)
+
+
+def _akis(boyut):
+    """Dönem başına yumuşak değişen pozitif nakit akışı"""
+    return [(t, 100 + (t % 12) * 5) for t in range(1, boyut + 1)]
+
+
+GRUPLAR = (_skaler, _tablo, _ters, _yardimci, _numpy, _faktor_tablosu, _onbellek,
+           _sozlesme, _hizli, _turev)
+
+
+def kiyaslamalar(filtre=None):
+    """(ad, fonksiyon) listesi; filtre verilirse adında filtre geçenler"""
+    return [(ad, fonksiyon) for grup in GRUPLAR for ad, fonksiyon in grup()
+            if filtre is None or filtre in ad]
+
+
+# ============================================================
+# ÖLÇÜM VE KARŞILAŞTIRMA
+# ============================================================
+
+def olc(fonksiyon, tekrar=5, sure=0.1):
+    """Çağrı başına en kısa ve ortanca süreyi (µs) döndürür"""
+    zamanlayici = timeit.Timer(fonksiyon)
+    sayi = 1
+    while zamanlayici.timeit(sayi) < sure:
+        sayi *= 2
+    sureler = [t / sayi * 1e6 for t in zamanlayici.repeat(tekrar, sayi)]
+    return {'en_az_us': min(sureler), 'medyan_us': statistics.median(sureler), 'cagri': sayi}
+
+
+def calistir(filtre=None, tekrar=5, sure=0.1, yazdir=True):
+    """Kıyaslamaları çalıştırıp JSON'a yazılabilir sonuç sözlüğü döndürür"""
+    sonuclar = {}
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        for ad, fonksiyon in kiyaslamalar(filtre):
+            sonuclar[ad] = olc(fonksiyon, tekrar, sure)
+            if yazdir:
+                print(f"{ad:<48} {sonuclar[ad]['en_az_us']:>14.3f} µs")
+
+    return {
+        'ortam': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'islemci': platform.processor() or platform.machine(),
+            'anuiteler': a.__version__,
+        },
+        'sonuclar': sonuclar,
+    }
+
+
+def karsilastir(sonuc, taban, esik=0.20):
+    """
+    Sonucu taban çizgisiyle karşılaştırır
+
+    Args:
+        sonuc: `calistir` çıktısı
+        taban: Aynı biçimde saklanmış taban çizgisi
+        esik: İzin verilen göreli yavaşlama (0.20 = %20)
+
+    Returns:
+        (ad, taban µs, yeni µs, oran) listesi; yalnızca eşiği aşanlar
+    """
+    gerilemeler = []
+    for ad, yeni in sonuc['sonuclar'].items():
+        eski = taban['sonuclar'].get(ad)
+        if eski is None:
+            continue
+        oran = yeni['en_az_us'] / eski['en_az_us']
+        if oran > 1 + esik:
+            gerilemeler.append((ad, eski['en_az_us'], yeni['en_az_us'], oran))
+    return gerilemeler
+
+
+def main(argv=None):
+    ayristirici = argparse.ArgumentParser(description="anuiteler performans kıyaslamaları")
+    ayristirici.add_argument('--kaydet', metavar='DOSYA', help="sonuçları JSON olarak kaydet")
+    ayristirici.add_argument('--karsilastir', metavar='DOSYA', nargs='?', const=TABAN,
+                             help="taban çizgisiyle karşılaştır (varsayılan: benchmarks/taban.json)")
+    ayristirici.add_argument('--esik', type=float, default=0.20,
+                             help="izin verilen göreli yavaşlama (varsayılan: 0.20)")
+    ayristirici.add_argument('--filtre', help="yalnızca adında bu metin geçen kıyaslamalar")
+    ayristirici.add_argument('--tekrar', type=int, default=5, help="ölçüm tekrarı (varsayılan: 5)")
+    ayristirici.add_argument('--sure', type=float, default=0.1,
+                             help="ölçüm başına en az süre, saniye (varsayılan: 0.1)")
+    secenekler = ayristirici.parse_args(argv)
+
+    sonuc = calistir(secenekler.filtre, secenekler.tekrar, secenekler.sure)
+
+    if secenekler.kaydet:
+        with open(secenekler.kaydet, 'w', encoding='utf-8') as dosya:
+            json.dump(sonuc, dosya, indent=2, ensure_ascii=False, sort_keys=True)
+            dosya.write('\n')
+
+    if secenekler.karsilastir:
+        with open(secenekler.karsilastir, encoding='utf-8') as dosya:
+            taban = json.load(dosya)
+
+        gerilemeler = karsilastir(sonuc, taban, secenekler.esik)
+        if gerilemeler:
+            print(f"\n%{secenekler.esik * 100:.0f} eşiğini aşan yavaşlamalar:")
+            for ad, eski, yeni, oran in gerilemeler:
+                print(f"  {ad:<46} {eski:>12.3f} -> {yeni:>12.3f} µs  (x{oran:.2f})")
+            return 1
+        print(f"\nTaban çizgisine göre %{secenekler.esik * 100:.0f}'den fazla yavaşlama yok.")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1 +0,0 @@
-touch tests/__init__.py
\ No newline at end of file
@@ -12,6 +12,8 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+import pytest
+
 from anuiteler import *
 
 
@@ -497,6 +499,52 @@ def test_aritmetik_ters():
     assert abs(ilk_taksit - ilk_taksit_ters) < 0.01
 
 
+def test_degisken_taksit_faiz():
+    # Analitik türevli çözücü: i = r dahil, devre başı dahil
+    for i, r, n in [(0.05, 0.20, 6), (0.10, 0.10, 10), (0.01, 0.03, 360), (-0.2, 0.05, 5)]:
+        bd = geo_ds_bd(5000, i, r, n)
+        assert abs(geo_faiz_hesapla(bd, 5000, r, n) - i) < 1e-9
+
+    for degisim, i, n in [(500, 0.30, 6), (-20, 0.01, 30), (5, 0.005, 360)]:
+        bd = arit_ds_bd(1000, degisim, i, n)
+        assert abs(arit_faiz_hesapla(bd, 1000, degisim, n) - i) < 1e-9
+        bd = arit_db_bd(1000, degisim, i, n)
+        assert abs(arit_faiz_hesapla(bd, 1000, degisim, n, devre_basi=True) - i) < 1e-9
+
+    # i > -1 (geometrik) veya i > 0 (aritmetik) aralığında kök yok
+    for hatali in (lambda: geo_faiz_hesapla(5000, 5000, 0.20, 6),
+                   lambda: arit_faiz_hesapla(1000, 1000, 0, 6)):
+        with pytest.raises(ValueError):
+            hatali()
+
+
+def test_sure_cozuculer():
+    # Tamsayı süreler tam, kesirli süreler tolerans içinde bulunur
+    for n in (1, 7, 30, 12.5):
+        gd = geo_ds_gd(100, 0.05, 0.03, n)
+        assert abs(geo_sure_hesapla(gd, 100, 0.05, 0.03) - n) < 1e-6
+        bd = arit_ds_bd(100, 5, 0.04, n)
+        assert abs(arit_sure_hesapla(bd, 100, 5, 0.04) - n) < 1e-6
+        bd = arit_db_bd(100, -2, 0.04, n)
+        assert abs(arit_sure_hesapla(bd, 100, -2, 0.04, devre_basi=True) - n) < 1e-6
+    assert geo_sure_hesapla(geo_ds_gd(100, 0.05, 0.03, 7), 100, 0.05, 0.03) == 7
+
+    # Kapalı formlar (i = r, r = 0, sabit taksit, çabuklaştırılmış, ertelenmiş)
+    assert abs(geo_sure_hesapla(500, 100, 0.05, 0.05) - 5) < 1e-12
+    assert abs(geo_sure_hesapla(geo_ds_gd(100, 0.05, 0, 9), 100, 0.05, 0) - 9) < 1e-9
+    assert abs(arit_sure_hesapla(arit_ds_bd(100, 0, 0.04, 9), 100, 0, 0.04) - 9) < 1e-9
+    assert abs(cab_donem_hesapla(cab_ds_bd(100, 0.04, 9, 2), 100, 0.04, 2) - 9) < 1e-9
+    bd = ert_db_bd(100, 0.04, 9, 3)
+    assert abs(ert_sure_hesapla(bd, 100, 0.04, 3, devre_basi=True) - 9) < 1e-9
+
+    # Hiçbir sürede ulaşılamayan değerler
+    for hatali in (lambda: cab_donem_hesapla(5000, 100, 0.04, 2),
+                   lambda: ert_sure_hesapla(5000, 100, 0.04, 2),
+                   lambda: arit_sure_hesapla(5000, 100, -20, 0.04)):
+        with pytest.raises(ValueError):
+            hatali()
+
+
 def test_cabuklas_ters():
     taksit = 10000
     i = 0.30
@@ -524,6 +572,135 @@ def test_tablo():
               f"{satir['anapara']:<12.2f} {satir['kalan']:<12.2f}")
 
 
+def test_tablo_sutunlu():
+    """Sütunlu tablo eski sözlük listesiyle uyumlu olmalı"""
+    tablo = ds_tablo(1000, 5, 0.10)
+    satirlar = tablo.to_dicts()
+    
+    assert len(tablo) == 5
+    assert satirlar[0] == tablo[0]
+    assert [satir['donem'] for satir in tablo] == [1, 2, 3, 4, 5]
+    assert abs(sum(tablo.anapara) - ds_bd_hesapla(1000, 5, 0.10)) < 1e-8
+    assert abs(tablo[-1]['kalan']) < 1e-8
+    
+    tablo_db = db_tablo(1000, 5, 0.10)
+    assert abs(tablo_db[0]['kalan'] - (db_bd_hesapla(1000, 5, 0.10) - 1000) * 1.10) < 1e-8
+    assert abs(tablo_db[-1]['kalan']) < 1e-8
+
+
+def test_tablo_akisi():
+    """Akış modu tabloyla aynı satırları üretmeli, k. dönemden başlayabilmeli"""
+    for tablo_fonksiyonu, akis_fonksiyonu in [(ds_tablo, ds_tablo_akisi), (db_tablo, db_tablo_akisi)]:
+        tablo = tablo_fonksiyonu(250, 360, 0.01)
+        
+        assert list(akis_fonksiyonu(250, 360, 0.01)) == tablo.to_dicts()
+        
+        akis = akis_fonksiyonu(250, 360, 0.01, baslangic=300)
+        assert next(akis) == tablo[299]
+        assert len(list(akis)) == 60
+
+
+def test_donem_satiri():
+    """Tek dönem fonksiyonları tablonun ilgili satırını vermeli"""
+    for tablo_fonksiyonu, satir_fonksiyonu, faiz_fonksiyonu, kalan_fonksiyonu in [
+            (ds_tablo, ds_donem_satiri, ds_donem_faizi, ds_kalan_bakiye),
+            (db_tablo, db_donem_satiri, db_donem_faizi, db_kalan_bakiye)]:
+        tablo = tablo_fonksiyonu(250, 360, 0.01)
+        
+        for k in [1, 180, 360]:
+            assert satir_fonksiyonu(250, 360, 0.01, k) == tablo[k - 1]
+            assert abs(faiz_fonksiyonu(250, 360, 0.01, k) - tablo[k - 1]['faiz']) < 1e-8
+            assert abs(kalan_fonksiyonu(250, 360, 0.01, k) - tablo[k - 1]['kalan']) < 1e-8
+        
+        # n'den büyük dönem reddedilir
+        with pytest.raises(ValueError):
+            satir_fonksiyonu(250, 360, 0.01, 361)
+    
+    assert abs(ds_kalan_bakiye(1000, 5, 0.10, 0) - ds_bd_hesapla(1000, 5, 0.10)) < 1e-8
+    assert abs(ds_donem_anaparasi(1000, 5, 0.10, 5) - 1000 / 1.1) < 1e-8
+
+
+def test_kumulatif():
+    """Kümülatif faiz/anapara tablodaki satırların toplamına eşit olmalı"""
+    for tablo_fonksiyonu, faiz_fonksiyonu, anapara_fonksiyonu in [
+            (ds_tablo, ds_kumulatif_faiz, ds_kumulatif_anapara),
+            (db_tablo, db_kumulatif_faiz, db_kumulatif_anapara)]:
+        tablo = tablo_fonksiyonu(250, 360, 0.01)
+        
+        for a, b in [(1, 12), (13, 24), (100, 100), (1, 360)]:
+            assert abs(faiz_fonksiyonu(250, 360, 0.01, a, b) - sum(tablo.faiz[a - 1:b])) < 1e-6
+            assert abs(anapara_fonksiyonu(250, 360, 0.01, a, b) - sum(tablo.anapara[a - 1:b])) < 1e-6
+        
+        # Ters aralık reddedilir
+        with pytest.raises(ValueError):
+            faiz_fonksiyonu(250, 360, 0.01, 24, 13)
+
+
+def test_risk_olcumleri():
+    """Tek geçişli risk ölçüleri tekil fonksiyonlarla aynı olmalı"""
+    from anuiteler.yardimci import macaulay_duration, convexity, dv01
+    
+    nakit_akislari = [(1, 1000), (2, 1000), (3, 1000), (4, 1000), (5, 101000)]
+    olcumler = risk_olcumleri(nakit_akislari, 0.05)
+    
+    assert abs(olcumler['macaulay_duration'] - macaulay_duration(nakit_akislari, 0.05)) < 1e-12
+    assert abs(olcumler['convexity'] - convexity(nakit_akislari, 0.05)) < 1e-12
+    assert abs(olcumler['dv01'] - dv01(nakit_akislari, 0.05)) < 1e-12
+    assert abs(olcumler['modified_duration'] - olcumler['macaulay_duration'] / 1.05) < 1e-12
+
+
+def test_ic_verim_orani():
+    """IRR: analitik türevli çözücü az NPV değerlendirmesiyle yakınsamalı"""
+    nakit_akislari = [(1, 3000), (2, 4000), (3, 5000), (4, 2000)]
+    sonuc = ic_verim_orani_ayrintili(nakit_akislari, -10000)
+    
+    assert sonuc['yakinsadi']
+    assert sonuc['degerlendirme'] <= 5
+    assert abs(sonuc['artik']) < 1e-6
+    assert abs(ic_verim_orani(nakit_akislari, -10000, tahmin=50) - sonuc['oran']) < 1e-8
+    
+    # Geleneksel olmayan akış: ara dönemde negatif nakit
+    oran = ic_verim_orani([(1, 230), (2, -132)], -100)
+    assert abs(oran - 0.10) < 1e-6
+    
+    # İşaret değişimi olmayan akış reddedilir
+    with pytest.raises(ValueError):
+        ic_verim_orani([(1, 100), (2, 100)], 50)
+
+
+def test_nakit_akisi():
+    """NakitAkisi demet listesiyle aynı sonuçları vermeli"""
+    from anuiteler.yardimci import net_bugunku_deger, macaulay_duration
+    
+    nakit_akislari = [(1, 1000), (2, 1000), (3, 1000), (4, 1000), (5, 101000)]
+    akis = NakitAkisi.listeden(nakit_akislari)
+    
+    assert len(akis) == 5
+    assert list(akis) == nakit_akislari
+    assert abs(net_bugunku_deger(akis, 0.05) - net_bugunku_deger(nakit_akislari, 0.05)) < 1e-8
+    assert abs(macaulay_duration(akis, 0.05) - macaulay_duration(nakit_akislari, 0.05)) < 1e-12
+    assert abs(ic_verim_orani(akis, -90000) - ic_verim_orani(nakit_akislari, -90000)) < 1e-12
+    
+    # Aynı oran için iskonto faktörleri önbellekten gelir
+    assert akis.iskonto_faktorleri(0.05) is akis.iskonto_faktorleri(0.05)
+
+
+def test_gecikmeli_yukleme():
+    """import anuiteler alt modülleri yüklememeli; kısa isimler erişimde yüklenmeli"""
+    import subprocess
+    
+    kod = (
+        "import sys; sys.path.insert(0, %r); import anuiteler; "
+        "once = [m for m in sys.modules if m.startswith('anuiteler.')]; "
+        "anuiteler.tek_odeme_bd; "
+        "sonra = sorted(m for m in sys.modules if m.startswith('anuiteler.')); "
+        "print(len(once), sonra, 'geo_faiz_hesapla' in dir(anuiteler))"
+    ) % os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    cikti = subprocess.run([sys.executable, '-c', kod], capture_output=True, text=True, check=True)
+    
+    assert cikti.stdout.strip() == "0 ['anuiteler.onbellek', 'anuiteler.tek_odeme'] True"
+
+
 def test_hizli_hesapla():
     """Hızlı hesaplama fonksiyonu testi"""
     print("\n" + "="*60)
@@ -537,6 +714,449 @@ def test_hizli_hesapla():
     print(f"Hesaplanan ödeme: {sonuc['odeme']:.2f} TL")
 
 
+def test_anuite_hesapla_tipler():
+    # Eksik değişkenler tipin kendi fonksiyonlarıyla doldurulur
+    sonuc = anuite_hesapla(bugunku_deger=50000, n=24, i=0.015)
+    assert abs(sonuc['odeme'] - ds_odeme_bd(50000, 24, 0.015)) < 1e-9
+    assert abs(sonuc['gelecek_deger'] - ds_gd_hesapla(sonuc['odeme'], 24, 0.015)) < 1e-6
+
+    sonuc = anuite_hesapla(gelecek_deger=20000, n=10, i=0.05, tip='devre_basi')
+    assert abs(sonuc['odeme'] - db_odeme_gd(20000, 10, 0.05)) < 1e-9
+
+    bd = ert_ds_bd(10000, 0.30, 8, 4)
+    sonuc = anuite_hesapla(bugunku_deger=bd, n=8, i=0.30, m=4, tip='ertelenmis')
+    assert abs(sonuc['odeme'] - 10000) < 0.01
+
+    sonuc = anuite_hesapla(odeme=5000, n=6, i=0.05, r=0.20, tip='geometrik')
+    assert abs(sonuc['bugunku_deger'] - geo_ds_bd(5000, 0.05, 0.20, 6)) < 1e-6
+
+    bd = arit_ds_bd(5000, 500, 0.30, 6)
+    sonuc = anuite_hesapla(bugunku_deger=bd, odeme=5000, n=6, i=0.30, tip='aritmetik')
+    assert abs(sonuc['degisim'] - 500) < 0.01
+
+    bd = cab_ds_bd(10000, 0.30, 8, 2)
+    sonuc = anuite_hesapla(bugunku_deger=bd, odeme=10000, n=8, i=0.30, tip='cabuklas')
+    assert abs(sonuc['c'] - 2) < 1e-6
+
+    sonuc = anuite_hesapla(bugunku_deger=10000, odeme=1000, tip='surekli')
+    assert abs(sonuc['i'] - 0.10) < 1e-12
+
+    # Aynı imza için plan önbellekten gelir
+    anahtar = ('cabuklas', False, False, True, False, False, True, True, True, True)
+    assert anahtar in cozucu._PLANLAR
+
+    with pytest.raises(ValueError):
+        anuite_hesapla(n=24, i=0.015)
+
+    with pytest.raises(ValueError):
+        anuite_hesapla(odeme=1000, n=10, i=0.05, tip='bilinmeyen')
+
+
+def test_izleme():
+    izleme.sifirla()
+    izleme.etkinlestir()
+    try:
+        bd = ds_bd_hesapla(1000, 10, 0.08)
+        devre_sonu_anuite.faiz_bugunku_degerden(bd, 1000, 10)
+        sonuc = anuite_hesapla(bugunku_deger=geo_ds_bd(5000, 0.05, 0.20, 6), odeme=5000,
+                               n=6, r=0.20, tip='geometrik')
+        try:
+            devre_sonu_anuite.faiz_bugunku_degerden(bd, 1000, 0)
+        except ValueError:
+            pass
+    finally:
+        izleme.devre_disi_birak()
+
+    assert abs(sonuc['i'] - 0.05) < 1e-6
+
+    goruntu = izleme.anlik_goruntu()
+    assert not goruntu['etkin']
+    cagrilar = goruntu['fonksiyonlar']['devre_sonu_anuite.faiz_bugunku_degerden']
+    assert cagrilar['cagri'] == 2 and cagrilar['hata'] == 1 and cagrilar['sure_s'] > 0
+    assert goruntu['fonksiyonlar']['geometrik_anuite.faiz_orani_hesapla_bd']['cagri'] == 1
+
+    assert goruntu['cozuculer']['devre_sonu_anuite.faiz_bugunku_degerden']['cozum'] == 1
+    cozucu_kaydi = goruntu['cozuculer']['geometrik_anuite.faiz_orani_hesapla_bd']
+    assert cozucu_kaydi['cozum'] == 1 and cozucu_kaydi['yakinsamayan'] == 0
+    assert sum(cozucu_kaydi['iterasyon']['kovalar'].values()) == 1
+    assert sum(cozucu_kaydi['artik']['kovalar'].values()) == 1
+
+    metin = izleme.prometheus_metni()
+    assert 'anuiteler_cagri_total{fonksiyon="devre_sonu_anuite.faiz_bugunku_degerden"} 2' in metin
+    assert 'le="+Inf"' in metin and '_cozucu_iterasyon_count' in metin
+
+    # Kapalıyken özgün fonksiyonlar yerinde, kayıt tutulmaz
+    assert not hasattr(devre_sonu_anuite.faiz_bugunku_degerden, '__wrapped__')
+    devre_sonu_anuite.faiz_bugunku_degerden(bd, 1000, 10)
+    assert izleme.anlik_goruntu() == goruntu
+
+    izleme.sifirla()
+    assert izleme.anlik_goruntu()['fonksiyonlar'] == {}
+
+
+def test_izleme_gecikmeli_yukleme():
+    """Alt modüller yüklenmeden etkinleştirilen izleme sonradan erişilen fonksiyonları da saymalı"""
+    import subprocess
+    
+    kod = (
+        "import sys; sys.path.insert(0, %r); import anuiteler; "
+        "from anuiteler import izleme; izleme.etkinlestir(); "
+        "bd = anuiteler.ds_bd_hesapla(1000, 10, 0.08); anuiteler.ds_faiz_bd(bd, 1000, 10); "
+        "f = izleme.anlik_goruntu()['fonksiyonlar']; "
+        "print(f['devre_sonu_anuite.bugunku_deger_hesapla']['cagri'], "
+        "f['devre_sonu_anuite.faiz_bugunku_degerden']['cagri'])"
+    ) % os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    cikti = subprocess.run([sys.executable, '-c', kod], capture_output=True, text=True, check=True)
+    
+    assert cikti.stdout.strip() == "1 1"
+
+
+def test_onbellek():
+    girdiler = [(0.0125, 12), (0.08, 10), (0.25, 360), (0.03, 2)]
+    beklenen = [(tek_odeme.iskonto_faktoru_hesapla(i, n), yardimci.birikim_faktoru(i, n),
+                 ds_pesin_faktor(i, n), ds_gelecek_faktor(i, n),
+                 db_pesin_faktor(i, n), db_gelecek_faktor(i, n)) for i, n in girdiler]
+    bd = ds_bd_hesapla(1000, 12, 0.0125)
+    bilesik = [(geo_ds_bd, (5000, 0.05, 0.20, 6)), (ert_ds_bd, (1000, 0.3, 8, 4)),
+               (ertelenmis_surekli_anuite, (1000, 0.03, 3))]
+    bilesik_beklenen = [f(*girdi) for f, girdi in bilesik]
+
+    onbellek.etkinlestir(boyut=64)
+    try:
+        assert onbellek.istatistik()['dolu'] == 0
+        for _ in range(3):
+            for (i, n), degerler in zip(girdiler, beklenen):
+                assert (tek_odeme.iskonto_faktoru_hesapla(i, n), yardimci.birikim_faktoru(i, n),
+                        ds_pesin_faktor(i, n), ds_gelecek_faktor(i, n),
+                        db_pesin_faktor(i, n), db_gelecek_faktor(i, n)) == degerler
+        # İç çağrılar ve aynı faktörü hesaplayan farklı modüller ortak girdileri kullanır
+        assert ds_bd_hesapla(1000, 12, 0.0125) == bd
+        assert yardimci.iskonto_faktoru(0.0125, 12) == beklenen[0][0]
+
+        with pytest.raises(ValueError):
+            ds_pesin_faktor(0, 12)
+
+        istatistik = onbellek.istatistik()
+        assert istatistik['etkin'] and istatistik['boyut'] == 64 and istatistik['dolu'] == 24
+        assert istatistik['iskalama'] == 24 and istatistik['isabet'] == 2 * 24 + 2
+        assert istatistik['tahliye'] == 0 and abs(istatistik['isabet_orani'] - 50 / 74) < 1e-12
+
+        # En uzun süredir kullanılmayan girdi atılır
+        onbellek.boyut_ayarla(2)
+        for i in (0.01, 0.02, 0.01, 0.03, 0.01, 0.02):
+            ds_pesin_faktor(i, 12)
+        istatistik = onbellek.istatistik()
+        assert (istatistik['isabet'], istatistik['iskalama'], istatistik['tahliye']) == (2, 4, 2)
+
+        onbellek.temizle()
+        assert onbellek.istatistik()['dolu'] == 0
+        with pytest.raises(ValueError):
+            onbellek.boyut_ayarla(0)
+
+        # Bileşik formüllerdeki (1+i)^n, (1+r)^n, v^m kuvvetleri de önbellekten
+        onbellek.boyut_ayarla(64)
+        for _ in range(2):
+            assert [f(*girdi) for f, girdi in bilesik] == bilesik_beklenen
+        istatistik = onbellek.istatistik()
+        assert (istatistik['iskalama'], istatistik['isabet']) == (5, 5)
+    finally:
+        onbellek.devre_disi_birak()
+        onbellek.boyut_ayarla(onbellek.VARSAYILAN_BOYUT)
+
+    # ANUITELER_ONBELLEK: tanınmayan değer içe aktarmayı bozmaz
+    for deger, etkin in (('yes', False), ('0', False), ('false', False), ('TRUE', True)):
+        onbellek._ortamdan_ac(deger)
+        assert onbellek.ETKIN is etkin
+        onbellek.devre_disi_birak()
+
+    ds_pesin_faktor(0.08, 10)
+    assert not onbellek.istatistik()['etkin'] and onbellek.istatistik()['iskalama'] == 0
+
+
+def test_sozlesme():
+    for devre_basi, modul in ((False, devre_sonu_anuite), (True, devre_basi_anuite)):
+        sozlesme = AnuiteSozlesmesi(1000, 24, 0.015, devre_basi=devre_basi)
+        assert sozlesme.bugunku_deger() == modul.bugunku_deger_hesapla(1000, 24, 0.015)
+        assert sozlesme.gelecek_deger() == modul.gelecek_deger_hesapla(1000, 24, 0.015)
+        assert sozlesme.odeme_bugunku_degerden(5e4) == modul.odeme_bugunku_degerden(5e4, 24, 0.015)
+        assert list(sozlesme.tablo()) == list(modul.anuite_tablosu_olustur(1000, 24, 0.015))
+        assert sozlesme.donem_satiri(7) == modul.donem_satiri_hesapla(1000, 24, 0.015, 7)
+        assert sozlesme.kalan_bakiye(7) == modul.kalan_bakiye_hesapla(1000, 24, 0.015, 7)
+        assert abs(sozlesme.ortalama_sure() - modul.ortalama_sure_hesapla(1000, 24, 0.015)) < 1e-10
+
+        ozet = sozlesme.ozet()
+        assert ozet['toplam_faiz'] == 24000 - ozet['bugunku_deger']
+
+    # Ertelenmiş ve çabuklaştırılmış sözleşmeler modül fonksiyonlarıyla aynı
+    ertelenmis = AnuiteSozlesmesi(10000, 8, 0.30, m=4)
+    assert abs(ertelenmis.bugunku_deger() - ert_ds_bd(10000, 0.30, 8, 4)) < 1e-8
+    assert abs(ertelenmis.gelecek_deger() - ertelenmis_anuite.gelecek_deger(10000, 0.30, 8)) < 1e-8
+    for devre_basi in (False, True):
+        cabuklas = AnuiteSozlesmesi(10000, 8, 0.30, devre_basi=devre_basi, c=2)
+        bd = cab_ds_bd(10000, 0.30, 8, 2) * (1.30 if devre_basi else 1)
+        assert abs(cabuklas.bugunku_deger() / bd - 1) < 1e-14
+        assert abs(cabuklas.odeme_bugunku_degerden(bd) - 10000) < 1e-8
+        assert abs(cabuklas.ortalama_sure()
+                   - yardimci.macaulay_duration(list(cabuklas.nakit_akisi()), 0.30)) < 1e-10
+
+    kredi = AnuiteSozlesmesi.bugunku_degerden(50000, 24, 0.015)
+    assert kredi.odeme == ds_odeme_bd(50000, 24, 0.015)
+    assert not hasattr(kredi, '__dict__')
+
+    for hatali in (lambda: AnuiteSozlesmesi(1000, 24, 0), lambda: AnuiteSozlesmesi(1000, 0, 0.01),
+                   lambda: AnuiteSozlesmesi(1000, 24, 0.01, m=-1), lambda: ertelenmis.tablo(),
+                   lambda: kredi.donem_satiri(25), lambda: AnuiteSozlesmesi(1000, 24.5, 0.01),
+                   lambda: AnuiteSozlesmesi(1000, 24, 0.01, m=1.5),
+                   lambda: AnuiteSozlesmesi(1000, 24, 0.01, c=0.5)):
+        with pytest.raises(ValueError):
+            hatali()
+
+    # Girdiler salt okunur; saklanan faktörler eskimez
+    sozlesme = AnuiteSozlesmesi(100, 12, 0.01)
+    bugunku_deger = sozlesme.bugunku_deger()
+    for ad, deger in (('i', 0.05), ('i', -1), ('n', 24), ('odeme', 200), ('m', 1), ('c', 1),
+                      ('devre_basi', True)):
+        with pytest.raises(AttributeError):
+            setattr(sozlesme, ad, deger)
+    assert sozlesme.bugunku_deger() == bugunku_deger
+    assert AnuiteSozlesmesi(100, 12.0, 0.01).tablo().donem[-1] == 12
+
+
+def test_hizli():
+    import inspect
+
+    import anuiteler
+
+    ornek = {'odeme': 1000, 'taksit': 1000, 'ilk_taksit': 5000, 'bugunku_deger': 40000,
+             'gelecek_deger': 90000, 'i': 0.03, 'n': 12, 'm': 4, 'c': 2, 'r': 0.02,
+             'degisim': 250, 'erteleme_suresi': 3, 't': 5}
+    cekirdekler = [(ad, f) for ad, f in inspect.getmembers(hizli, inspect.isfunction)
+                   if not ad.startswith('_') and ad != 'dogrula']
+    assert len(cekirdekler) > 40
+    # İçe aktarılan yardımcılar genel isim alanına sızmaz
+    assert not {'reduce', 'repeat', 'and_', 'le', 'lt'} & set(dir(hizli))
+
+    # Çekirdekler kontrollü fonksiyonlarla bire bir aynı sonucu verir
+    for r in (0.02, 0.03):
+        ornek['r'] = r
+        for ad, cekirdek in cekirdekler:
+            zorunlu = [p.name for p in inspect.signature(cekirdek).parameters.values()
+                       if p.default is inspect.Parameter.empty]
+            girdi = [ornek[p] for p in zorunlu]
+            assert cekirdek(*girdi) == getattr(anuiteler, ad)(*girdi), ad
+    bd = geo_ilk_taksit_bd(40000, 0.03, 0.02, 12, devre_basi=True)
+    assert hizli.geo_ilk_taksit_bd(40000, 0.03, 0.02, 12, True) == bd
+
+    maskeler = hizli.dogrula(odeme=[1000, -1, 1000, 1000], n=[12, 12, 0, 12],
+                             i=[0.01, 0.01, 0.01, float('nan')], m=0)
+    assert maskeler['gecerli'] == [True, False, False, False]
+    assert maskeler['odeme'] == [True, False, True, True]
+    assert maskeler['n'] == [True, True, False, True]
+    assert maskeler['m'] == [True] * 4
+
+    tek_odeme_kurali = dict(hizli.KURALLAR, i=(-1, True))
+    assert hizli.dogrula(tek_odeme_kurali, i=[-0.5, -1])['gecerli'] == [True, False]
+
+    for hatali in (lambda: hizli.dogrula(i=[0.01], n=[1, 2]), lambda: hizli.dogrula(x=[1])):
+        with pytest.raises(ValueError):
+            hatali()
+
+
+def test_turev():
+    import math
+
+    # Dual sayı türevi merkezi sonlu farkla ve analitik türevle uyuşur
+    h = 1e-6
+    for fonksiyon, girdi in ((ds_bd_hesapla, (1000, 60, 0.01)), (db_gd_hesapla, (1000, 60, 0.01)),
+                             (tek_odeme_bd, (1000, 0.10, 5)), (ert_db_bd, (10000, 0.30, 8, 4)),
+                             (geo_ds_bd, (5000, 0.05, 0.02, 6)), (arit_db_gd, (5000, 500, 0.30, 6)),
+                             (cab_ds_bd, (10000, 0.30, 8, 2))):
+        sonuc = duyarliliklar(fonksiyon, *girdi)
+        assert sonuc['deger'] == fonksiyon(*girdi)
+        assert len(sonuc) == len(girdi) + 1
+        for k, ad in enumerate(list(sonuc)[1:]):
+            ileri = list(girdi)
+            geri = list(girdi)
+            ileri[k] += h
+            geri[k] -= h
+            fark = (fonksiyon(*ileri) - fonksiyon(*geri)) / (2 * h)
+            assert abs(sonuc[ad] - fark) < 1e-6 * max(1, abs(fark)), (fonksiyon.__name__, ad)
+
+    bd, dbd_di = turev_al(ds_bd_hesapla, 1000, 60, 0.01, degisken='i')
+    v = 1 / 1.01
+    assert abs(dbd_di - 1000 * (60 * v ** 61 - (1 - v ** 60) / 0.01) / 0.01) < 1e-6
+    assert turev_al(ds_bd_hesapla, 1000, 60, 0.01, degisken=2) == (bd, dbd_di)
+    assert turev_al(tek_odeme_bd, 1000, 0.10, 5, degisken=0)[1] == tek_odeme_bd(1, 0.10, 5)
+
+    # Çözücülerin analitik türevleri dual sayı türeviyle aynı
+    from anuiteler._kok import pesin_turevleri
+    for us, fonksiyon, girdi in ((-4, ert_ds_bd, (10000, 0.30, 8, 4)),
+                                 (-3, ert_db_bd, (10000, 0.30, 8, 4)),
+                                 (2, cab_ds_bd, (10000, 0.30, 8, 2)),
+                                 (1, db_bd_hesapla, (10000, 8, 0.30))):
+        beklenen = turev_al(fonksiyon, *girdi, degisken='i')
+        bulunan = [10000 * x for x in pesin_turevleri(0.30, 8, us)]
+        assert all(abs(x / y - 1) < 1e-12 for x, y in zip(bulunan, beklenen))
+
+    x = DualSayi(2.0, 1.0)
+    assert (x ** x).turev == 4 * (math.log(2) + 1)
+    assert (turev.log(x).turev, turev.exp(x).turev) == (0.5, math.exp(2))
+    assert x > 1 and x == 2.0 and not hasattr(x, '__dict__')
+
+    for hatali in (lambda: turev_al(ds_bd_hesapla, 1000, 60, 0.01, degisken='x'),
+                   lambda: math.exp(x)):
+        with pytest.raises((ValueError, TypeError)):
+            hatali()
+
+
+def test_kok():
+    from anuiteler import _kok
+
+    # Dört yöntem aynı köke iner; aralıklı yöntemler aralık ister
+    fonksiyon = lambda x: (x * x - 2, 2 * x, 2.0)
+    for yontem in _kok.YONTEMLER:
+        sonuc = _kok.kok_bul(fonksiyon, 1.0, 1e-12, aralik=(1.0, -1.0, 2.0, 2.0), yontem=yontem)
+        assert sonuc['yakinsadi'] and abs(sonuc['kok'] - 2 ** 0.5) < 1e-10, yontem
+    for yontem in ('brent', 'ikiye_bolme', 'secant'):
+        with pytest.raises(ValueError):
+            _kok.kok_bul(fonksiyon, 1.0, yontem=yontem)
+
+    # Tüm faiz çözücüleri ortak çekirdekle geri dönüşü sağlar
+    for bulunan in (ds_faiz_bd(ds_bd_hesapla(1000, 60, 0.01), 1000, 60),
+                    db_faiz_gd(db_gd_hesapla(1000, 360, 0.01), 1000, 360),
+                    ert_faiz_hesapla(ert_ds_bd(1000, 0.01, 60, 12), 1000, 60, 12),
+                    cab_faiz_hesapla(cab_ds_bd(1000, 0.01, 60, 3), 1000, 60, 3)):
+        assert abs(bulunan - 0.01) < 1e-6
+
+    # Çabuklaştırılmış a(n,i)·(1+i)^c büyük c'de monoton değil; Newton alt
+    # sınıra yığılırsa Brent yedeği kökü bulur
+    assert abs(cab_faiz_hesapla(cab_ds_bd(1000, 0.9, 12, 4), 1000, 12, 4) - 0.9) < 1e-6
+
+    # Durağan noktada (i = 1/(c-1)) Halley adımı söner; artık büyükken
+    # yakınsama sayılmaz, Brent yedeği gerçek köke gider
+    bd = cab_ds_bd(624.1344, 0.5684, 241, 11)
+    fonksiyon = lambda x: tuple(f - h for f, h in zip(_kok.pesin_turevleri(x, 241, 11),
+                                                      (bd / 624.1344, 0, 0)))
+    assert not _kok.guvenli_kok(fonksiyon, 0.1, alt_sinir=0)['yakinsadi']
+    for tahmin in (None, 0.1):
+        bulunan = cab_faiz_hesapla(bd, 624.1344, 241, 11, tahmin=tahmin)
+        assert abs(bulunan - 0.5684) < 1e-6
+        assert abs(cab_ds_bd(624.1344, bulunan, 241, 11) / bd - 1) < 1e-6
+
+    # Kapalı form başlangıçlar gerçek orana yakın; tipik bir kredide tek Halley adımı yeter
+    for i, n in ((0.005, 360), (0.01, 60), (0.03, 12), (0.08, 30), (0.40, 5)):
+        assert abs(_kok.pesin_tahmini(_kok.pesin_turevleri(i, n)[0], n) / i - 1) < 0.05
+        assert abs(_kok.birikim_tahmini(_kok.birikim_turevleri(i, n)[0], n) / i - 1) < 0.05
+        for us in ((1, -6, 2) if i < 0.1 else ()):
+            hedef = _kok.pesin_turevleri(i, n, us)[0]
+            assert abs(_kok.pesin_tahmini(hedef, n, us) / i - 1) < 0.05
+    assert -0.2 < _kok.birikim_tahmini(_kok.birikim_turevleri(-0.1, 10)[0], 10, alt_sinir=-1) < 0
+    assert abs(_kok.birikim_tahmini(_kok.birikim_turevleri(-0.3, 5)[0], 5, alt_sinir=-1) + 0.3) < 1e-3
+
+    # Kullanılamayan kapalı form sabit oran yerine None verir; çözücü alt
+    # sınırdan (gerekirse tanım sınırının hemen içinden) aralık arar
+    assert _kok.pesin_tahmini(61.0, 60) is None
+    assert _kok.pesin_tahmini(_kok.pesin_turevleri(0.5684, 241, 11)[0], 241, 11) is None
+    assert _kok.birikim_tahmini(_kok.birikim_turevleri(-0.9, 3)[0], 3, alt_sinir=-1) is None
+    assert abs(geo_faiz_hesapla(geo_ds_bd(5000, -0.9, 0.05, 3), 5000, 0.05, 3) + 0.9) < 1e-6
+
+    izleme.sifirla()
+    izleme.etkinlestir()
+    try:
+        ds_faiz_bd(ds_bd_hesapla(1000, 360, 0.0075), 1000, 360)
+        kayit = izleme.anlik_goruntu()['cozuculer']['devre_sonu_anuite.faiz_bugunku_degerden']
+    finally:
+        izleme.devre_disi_birak()
+        izleme.sifirla()
+    assert kayit['iterasyon']['toplam'] == 1 and kayit['degerlendirme'] == 2
+
+    # Kök yoksa sınırdaki oran yerine hata
+    for hatali in (lambda: ds_faiz_bd(61000, 1000, 60), lambda: db_faiz_gd(50000, 1000, 60),
+                   lambda: ert_faiz_hesapla(60000, 1000, 60, 12)):
+        with pytest.raises(ValueError):
+            hatali()
+
+    # Sıcak başlangıç: önceki kökten başlanır; aynı sözleşme tekrarlanırsa
+    # yalnızca ilk çözüm iterasyon yapar
+    sozlesmeler = [(ds_bd_hesapla(1000, 60, 0.01), 60)] * 20
+    izleme.sifirla()
+    izleme.etkinlestir()
+    try:
+        soguk = [ds_faiz_bd(bd, 1000, n) for bd, n in sozlesmeler]
+        ad = 'devre_sonu_anuite.faiz_bugunku_degerden'
+        soguk_iterasyon = izleme.anlik_goruntu()['cozuculer'][ad]['iterasyon']['toplam']
+        izleme.sifirla()
+        with sicak_baslangic() as kokler:
+            sicak = [ds_faiz_bd(bd, 1000, n) for bd, n in sozlesmeler]
+            assert kokler[ad] == sicak[-1]
+        sicak_iterasyon = izleme.anlik_goruntu()['cozuculer'][ad]['iterasyon']['toplam']
+    finally:
+        izleme.devre_disi_birak()
+        izleme.sifirla()
+    assert all(abs(x - y) < 1e-9 for x, y in zip(soguk, sicak))
+    assert sicak_iterasyon * 10 < soguk_iterasyon
+    assert _kok.sicak_tahmin(ad, None) == _kok.VARSAYILAN_TAHMIN
+
+
+def test_faktor_serisi():
+    for i in (0.0001, 0.0125, 0.25):
+        seri = ds_faktor_serisi(i, 480)
+        assert len(seri['pesin']) == 480
+        for n in (1, 2, 12, 360, 480):
+            assert abs(seri['pesin'][n - 1] / ds_pesin_faktor(i, n) - 1) < 1e-12
+            assert abs(seri['gelecek'][n - 1] / ds_gelecek_faktor(i, n) - 1) < 1e-12
+            assert abs(seri['pesin_devre_basi'][n - 1] / db_pesin_faktor(i, n) - 1) < 1e-12
+            assert abs(seri['gelecek_devre_basi'][n - 1] / db_gelecek_faktor(i, n) - 1) < 1e-12
+
+    for hatali in (lambda: ds_faktor_serisi(0, 12), lambda: ds_faktor_serisi(0.01, 0)):
+        with pytest.raises(ValueError):
+            hatali()
+
+
+def test_faktor_tablosu():
+    import pickle
+    import tempfile
+    from anuiteler.faktor_tablosu import FaktorTablosu, faktor_tablosu_olustur
+
+    with tempfile.TemporaryDirectory() as dizin:
+        dosya = os.path.join(dizin, 'faktorler.bin')
+        faktor_tablosu_olustur(dosya, baslangic=0.0025, bitis=0.05, adim=0.0025, n_max=24)
+
+        with FaktorTablosu(dosya) as tablo:
+            assert tablo.oran_sayisi == 20 and tablo.n_max == 24
+
+            # Izgara oranlarında skaler faktörlerle bire bir aynı
+            for i in (0.0025, 0.0075, 0.0125, 0.05):
+                for n in (1, 12, 24):
+                    assert tablo.pesin_deger_faktoru(i, n) == ds_pesin_faktor(i, n)
+                    assert tablo.gelecek_deger_faktoru(i, n) == ds_gelecek_faktor(i, n)
+                    assert tablo.pesin_deger_faktoru(i, n, devre_basi=True) == db_pesin_faktor(i, n)
+                    assert (tablo.gelecek_deger_faktoru(i, n, devre_basi=True)
+                            == db_gelecek_faktor(i, n))
+
+            bd = 1000 * tablo.pesin_deger_faktoru(0.01, 12, m=3)
+            assert abs(bd - ert_ds_bd(1000, 0.01, 12, 3)) < 1e-9
+            assert abs(tablo.erteleme_faktoru(0.01, 3) - 1.01 ** -3) < 1e-15
+
+            # Ara oranlar komşu iki ızgara değeri arasında doğrusal
+            ara = tablo.pesin_deger_faktoru(0.011, 12, interpolasyon=True)
+            alt, ust = tablo.pesin_deger_faktoru(0.01, 12), tablo.pesin_deger_faktoru(0.0125, 12)
+            assert abs(ara - (alt + 0.4 * (ust - alt))) < 1e-12
+            assert abs(ara - ds_pesin_faktor(0.011, 12)) < 1e-3
+
+            # Süreçlere veri değil dosya yolu gider
+            kopya = pickle.loads(pickle.dumps(tablo))
+            assert kopya.pesin_deger_faktoru(0.01, 12) == tablo.pesin_deger_faktoru(0.01, 12)
+            kopya.kapat()
+
+            for hatali in (lambda: tablo.pesin_deger_faktoru(0.011, 12),
+                           lambda: tablo.pesin_deger_faktoru(0.06, 12, interpolasyon=True),
+                           lambda: tablo.pesin_deger_faktoru(0.01, 25),
+                           lambda: tablo.pesin_deger_faktoru(0.01, 2.5)):
+                with pytest.raises(ValueError):
+                    hatali()
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("ANÜİTELER KÜTÜPHANESİ - KAPSAMLI TEST PROGRAMI")
@@ -0,0 +1,367 @@
+"""
+ANÜİTELER Kütüphanesi - NumPy Arka Ucu Testleri
+
+anuiteler.np fonksiyonlarını skaler karşılıklarıyla karşılaştırır ve geçersiz
+satırların hata yerine maskelendiğini kontrol eder.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import anuiteler
+import anuiteler.np as anp
+
+
+def _karsilastir(vektorel_fonksiyon, skaler_fonksiyon, satirlar):
+    """Her satır için vektörel sonucu skaler sonuçla (veya ValueError ile maskeyle) karşılaştırır"""
+    sutunlar = [np.array(sutun, dtype=float) for sutun in zip(*satirlar)]
+    sonuc = vektorel_fonksiyon(*sutunlar)
+
+    for k, satir in enumerate(satirlar):
+        try:
+            beklenen = skaler_fonksiyon(*satir)
+        except (ValueError, ZeroDivisionError):
+            assert sonuc.mask[k], f"{skaler_fonksiyon.__name__}{satir} maskelenmeliydi"
+            continue
+        assert not sonuc.mask[k]
+        assert sonuc.data[k] == pytest.approx(beklenen, rel=1e-9)
+
+
+def test_np_devre_sonu_ve_basi():
+    satirlar = [(1000, 5, 0.10), (250, 360, 0.01), (1000, 5, 0), (1000, 0, 0.1), (-50, 12, 0.02)]
+
+    for ad in ['bugunku_deger_hesapla', 'gelecek_deger_hesapla',
+               'odeme_bugunku_degerden', 'odeme_gelecek_degerden']:
+        for modul, skaler in [(anp.devre_sonu_anuite, anuiteler.devre_sonu_anuite),
+                              (anp.devre_basi_anuite, anuiteler.devre_basi_anuite)]:
+            _karsilastir(getattr(modul, ad), getattr(skaler, ad), satirlar)
+
+    sure_satirlari = [(3790.79, 1000, 0.10), (50000, 100, 0.01), (5000, 0, 0.1), (1000, 100, -0.1)]
+    _karsilastir(anp.ds_sure_bd, anuiteler.ds_sure_bd, sure_satirlari)
+    _karsilastir(anp.db_sure_bd, anuiteler.db_sure_bd, sure_satirlari)
+    _karsilastir(anp.ds_sure_gd, anuiteler.ds_sure_gd, sure_satirlari)
+
+
+def test_np_ortalama_sure():
+    satirlar = [(1000, 5, 0.10), (100, 36, 0.015), (100, 12, 0)]
+
+    _karsilastir(anp.devre_sonu_anuite.ortalama_sure_hesapla,
+                 anuiteler.devre_sonu_anuite.ortalama_sure_hesapla, satirlar)
+    _karsilastir(anp.devre_basi_anuite.ortalama_sure_hesapla,
+                 anuiteler.devre_basi_anuite.ortalama_sure_hesapla, satirlar)
+
+
+def test_np_diger_aileler():
+    _karsilastir(anp.tek_odeme_bd, anuiteler.tek_odeme_bd, [(1610.51, 0.10, 5), (100, -1, 2)])
+    _karsilastir(anp.tek_odeme_sure, anuiteler.tek_odeme_sure, [(1000, 1610.51, 0.1), (1, 2, 0)])
+    _karsilastir(anp.surekli_db_faiz, anuiteler.surekli_db_faiz, [(11000, 1000), (100, 200)])
+    _karsilastir(anp.ert_ds_bd, anuiteler.ert_ds_bd, [(10000, 0.3, 8, 4), (10000, 0.3, 8, -1)])
+    _karsilastir(anp.ert_gecikme_hesapla, anuiteler.ert_gecikme_hesapla,
+                 [(31249.41, 10000, 0.3, 8), (32000, 10367.87, 0.3, 8)])
+    _karsilastir(anp.geo_ds_bd, anuiteler.geo_ds_bd,
+                 [(5000, 0.05, 0.20, 6), (5000, 0.10, 0.10, 6), (5000, 0.1, 0.1, 0)])
+    _karsilastir(anp.geo_ilk_taksit_bd, anuiteler.geo_ilk_taksit_bd,
+                 [(30000, 0.05, 0.20, 6), (30000, 0.10, 0.10, 6), (30000, -1, 0.20, 6)])
+    _karsilastir(anp.arit_ds_degisim, anuiteler.arit_ds_degisim, [(18000, 1101, 0.40, 5)])
+    _karsilastir(anp.arit_db_bd, anuiteler.arit_db_bd, [(5000, 500, 0.30, 6), (5000, 500, 0, 6)])
+    for ad in ['bugunku_deger', 'gelecek_deger', 'ilk_taksit_hesapla_bd', 'ilk_taksit_hesapla_gd',
+               'degisim_hesapla_bd']:
+        _karsilastir(getattr(anp.aritmetik_anuite, ad), getattr(anuiteler.aritmetik_anuite, ad),
+                     [(18000, 500, 0.30, 6), (18000, 500, 0, 6)])
+    _karsilastir(anp.cab_ds_bd, anuiteler.cab_ds_bd, [(10000, 0.30, 8, 2), (10000, 0.3, 8, -2)])
+    _karsilastir(anp.cab_sure_hesapla, anuiteler.cab_sure_hesapla, [(51815.69, 10000, 0.30, 8)])
+
+
+def test_np_yayinlama():
+    # Skaler i ile vade vektörü yayınlanır
+    bd = anp.ds_bd_hesapla(1000, np.arange(1, 6), 0.10)
+
+    assert bd.shape == (5,)
+    assert not bd.mask.any()
+    assert bd[-1] == pytest.approx(anuiteler.ds_bd_hesapla(1000, 5, 0.10))
+
+
+def test_np_toplu_faiz_cozucu():
+    i = np.array([0.005, 0.01, 0.10, 0.25])
+    n = np.array([360, 120, 5, 20])
+    odeme = np.array([100.0, 250.0, 1000.0, 50.0])
+
+    for modul in [anp.devre_sonu_anuite, anp.devre_basi_anuite]:
+        bd = modul.bugunku_deger_hesapla(odeme, n, i).data
+        gd = modul.gelecek_deger_hesapla(odeme, n, i).data
+
+        for sonuc in [modul.faiz_bugunku_degerden_ayrintili(bd, odeme, n),
+                      modul.faiz_gelecek_degerden_ayrintili(gd, odeme, n)]:
+            assert sonuc['yakinsadi'].all()
+            assert (sonuc['iterasyon'] <= 3).all()     # kapalı form başlangıç
+            assert np.all(np.abs(sonuc['artik']) < 1e-6)
+            assert sonuc['i'] == pytest.approx(i, abs=1e-5)
+
+    # Kapalı form başlangıçlar skaler sürümle aynı; skalerin None verdiği
+    # satırlarda toplu Newton VARSAYILAN_TAHMIN'den başlar
+    from anuiteler import _kok
+    from anuiteler.np import _newton
+
+    def _skaler(tahmin):
+        return _kok.VARSAYILAN_TAHMIN if tahmin is None else tahmin
+
+    for us in (0, 1, -4):
+        hedef = np.array([_kok.pesin_turevleri(x, k, us)[0] for x, k in zip(i, n)])
+        beklenen = [_skaler(_kok.pesin_tahmini(h, k, us)) for h, k in zip(hedef, n)]
+        assert _newton.pesin_tahmini(hedef, n, us) == pytest.approx(beklenen, rel=1e-12)
+        hedef = np.array([_kok.birikim_turevleri(x, k)[0] * (1 + x) ** us for x, k in zip(i, n)])
+        beklenen = [_skaler(_kok.birikim_tahmini(h, k, us)) for h, k in zip(hedef, n)]
+        assert _newton.birikim_tahmini(hedef, n, us) == pytest.approx(beklenen, rel=1e-12)
+    hedef = np.array([_kok.birikim_turevleri(x, 5)[0] for x in (-0.6, -0.3, -0.1)])
+    beklenen = [_kok.birikim_tahmini(h, 5, alt_sinir=-1) for h in hedef]
+    assert _newton.birikim_tahmini(hedef, 5, alt_sinir=-1) == pytest.approx(beklenen, rel=1e-12)
+
+    # Geçersiz satırlar (n <= 0, ödeme <= 0) maskelenir
+    sonuc = anp.ds_faiz_bd([3790.79, 3790.79, 3790.79], [1000, 0, 1000], [5, 5, 0])
+    assert sonuc.mask.tolist() == [False, True, True]
+    assert sonuc[0] == pytest.approx(0.10, abs=1e-5)
+
+
+def test_np_donem_fonksiyonlari():
+    satirlar = [(250, 360, 0.01, 1), (250, 360, 0.01, 360), (1000, 5, 0.10, 3),
+                (1000, 5, 0.10, 0), (1000, 5, 0.10, 6), (1000, 5, 0, 2)]
+
+    for ad in ['kalan_bakiye_hesapla', 'donem_faizi_hesapla', 'donem_anaparasi_hesapla']:
+        for modul, skaler in [(anp.devre_sonu_anuite, anuiteler.devre_sonu_anuite),
+                              (anp.devre_basi_anuite, anuiteler.devre_basi_anuite)]:
+            _karsilastir(getattr(modul, ad), getattr(skaler, ad), satirlar)
+
+    satir = anp.ds_donem_satiri(250, 360, 0.01, np.arange(1, 361))
+    tablo = anuiteler.ds_tablo(250, 360, 0.01)
+    assert satir['faiz'].data == pytest.approx(list(tablo.faiz))
+    assert satir['kalan'].data == pytest.approx(list(tablo.kalan), abs=1e-6)
+
+
+def test_np_kumulatif_ve_yillik_ozet():
+    satirlar = [(250, 360, 0.01, 1, 12), (250, 360, 0.01, 349, 360), (1000, 5, 0.10, 2, 4),
+                (1000, 5, 0.10, 4, 2), (1000, 5, 0.10, 1, 6), (1000, 5, 0, 1, 2)]
+
+    for ad in ['kumulatif_faiz_hesapla', 'kumulatif_anapara_hesapla']:
+        for modul, skaler in [(anp.devre_sonu_anuite, anuiteler.devre_sonu_anuite),
+                              (anp.devre_basi_anuite, anuiteler.devre_basi_anuite)]:
+            _karsilastir(getattr(modul, ad), getattr(skaler, ad), satirlar)
+
+    ozet = anp.ds_yillik_ozet([250, 1000, 500], [360, 30, 12], [0.01, 0.02, 0])
+
+    assert ozet['faiz'].shape == (3, 30)
+    assert ozet['faiz'].mask.tolist()[1] == [False] * 3 + [True] * 27
+    assert ozet['faiz'].mask[2].all()
+    assert ozet['faiz'][1, 2] == pytest.approx(anuiteler.ds_kumulatif_faiz(1000, 30, 0.02, 25, 30))
+    assert ozet['anapara'][0].sum() == pytest.approx(anuiteler.ds_bd_hesapla(250, 360, 0.01))
+
+
+def test_np_risk_olcumleri():
+    from anuiteler import yardimci
+
+    tahvil = [(1, 1000), (2, 1000), (3, 1000), (4, 1000), (5, 101000)]
+    kredi = [(1, 500), (2, 500), (3, 500)]
+
+    donemler = np.array([1, 2, 3, 4, 5])
+    tutarlar = np.array([[1000, 1000, 1000, 1000, 101000],
+                         [500, 500, 500, 0, 0],
+                         [0, 0, 0, 0, 0]])
+    sonuc = anp.risk_olcumleri(donemler, tutarlar, [0.05, 0.01, 0.05])
+
+    for k, akislar, oran in [(0, tahvil, 0.05), (1, kredi, 0.01)]:
+        beklenen = yardimci.risk_olcumleri(akislar, oran)
+        for anahtar, deger in beklenen.items():
+            assert sonuc[anahtar][k] == pytest.approx(deger, rel=1e-12)
+
+    # BD = 0 olan enstrüman maskelenir
+    assert sonuc['macaulay_duration'].mask.tolist() == [False, False, True]
+
+
+def test_np_toplu_ic_verim_orani():
+    projeler = [
+        ([(1, 3000), (2, 4000), (3, 5000), (4, 2000)], -10000),
+        ([(1, 230), (2, -132)], -100),
+        ([(1, 100), (2, 100)], 50),                     # işaret değişimi yok
+        ([(k, 1000) for k in range(1, 31)], -12000),
+    ]
+    ofsetler = np.cumsum([0] + [len(akislar) for akislar, _ in projeler])
+    donemler = [donem for akislar, _ in projeler for donem, _ in akislar]
+    tutarlar = [tutar for akislar, _ in projeler for _, tutar in akislar]
+    baslangic = [yatirim for _, yatirim in projeler]
+
+    sonuc = anp.ic_verim_orani_toplu(ofsetler, donemler, tutarlar, baslangic)
+
+    assert sonuc.mask.tolist() == [False, False, True, False]
+    for k in [0, 1, 3]:
+        akislar, yatirim = projeler[k]
+        assert sonuc[k] == pytest.approx(anuiteler.ic_verim_orani(akislar, yatirim), abs=1e-6)
+
+    # Süreç havuzunda parçalı çözüm aynı sonucu verir
+    paralel = anp.ic_verim_orani_toplu_ayrintili(ofsetler, donemler, tutarlar, baslangic,
+                                                 paralel=2, parca_boyu=2)
+    assert np.allclose(paralel['oran'], sonuc.data, equal_nan=True)
+
+
+def test_np_anuite_hesapla_toplu():
+    satirlar = [
+        dict(odeme=1000, n=24, i=0.015),
+        dict(bugunku_deger=50000, n=36, i=0.01),
+        dict(odeme=1000, bugunku_deger=20000, i=0.01),
+        dict(odeme=1000, n=24, i=0.015),
+        dict(bugunku_deger=50000, i=0.01),              # yetersiz parametre
+    ]
+    sutunlar = {ad: [satir.get(ad) for satir in satirlar] for ad in ('odeme', 'bugunku_deger', 'n', 'i')}
+    sonuc = anp.anuite_hesapla_toplu(**sutunlar)
+
+    for k, satir in enumerate(satirlar[:4]):
+        beklenen = anuiteler.anuite_hesapla(**satir)
+        for ad in ('odeme', 'bugunku_deger', 'gelecek_deger', 'n', 'i'):
+            assert sonuc[ad][k] == pytest.approx(beklenen[ad], rel=1e-9)
+    assert sonuc['odeme'].mask[4] and sonuc['n'].mask[4]
+
+    # Satır başına tip; NumPy karşılığı olmayan çözücü satır satır çalışır
+    bd = anuiteler.geo_ds_bd(5000, 0.05, 0.20, 6)
+    sonuc = anp.anuite_hesapla_toplu(odeme=[5000, 1000], bugunku_deger=[bd, np.nan], n=6,
+                                     i=[np.nan, 0.05], r=[0.20, np.nan],
+                                     tip=['geometrik', 'devre_sonu'])
+    assert sonuc['i'][0] == pytest.approx(0.05, abs=1e-6)
+    assert sonuc['bugunku_deger'][1] == pytest.approx(anuiteler.ds_bd_hesapla(1000, 6, 0.05))
+    assert sonuc['r'].mask[1]
+
+    with pytest.raises(ValueError):
+        anp.anuite_hesapla_toplu(odeme=[1000], n=[10], i=[0.05], tip='bilinmeyen')
+
+
+def test_np_degisken_taksit_faiz():
+    i = np.array([0.05, 0.10, 0.01, 0.30, 0.02])
+    r = np.array([0.20, 0.10, 0.03, 0.02, 0.0])
+    n = np.array([6, 10, 360, 300, 12])
+    bd = anp.geo_ds_bd(5000, i, r, n).data
+
+    sonuc = anp.geometrik_anuite.faiz_orani_hesapla_bd_ayrintili(bd, 5000, r, n)
+    assert sonuc['yakinsadi'].all()
+    assert sonuc['i'] == pytest.approx(i, abs=1e-6)
+    for k in range(i.size):
+        skaler = anuiteler.geo_faiz_hesapla(bd[k], 5000, r[k], n[k])
+        assert sonuc['i'][k] == pytest.approx(skaler, abs=1e-6)
+
+    # Kökü olmayan ve geçersiz satırlar maskelenir
+    maskeli = anp.geo_faiz_hesapla([bd[0], 5000, -1], 5000, 0.20, 6)
+    assert maskeli.mask.tolist() == [False, True, True]
+
+    for devre_basi in (False, True):
+        fonksiyon = anp.arit_db_bd if devre_basi else anp.arit_ds_bd
+        bd = fonksiyon(1000, [500, -20, 5, 0], i[:4], n[:4]).data
+        sonuc = anp.arit_faiz_hesapla(bd, 1000, [500, -20, 5, 0], n[:4], devre_basi)
+        assert not sonuc.mask.any()
+        assert sonuc.data == pytest.approx(i[:4], abs=1e-6)
+
+    assert anp.arit_faiz_hesapla(1000, 1000, 0, 6).mask.all()
+
+
+def test_np_sure_cozuculer():
+    n = np.array([1, 7, 30, 12.5])
+    gd = anp.geo_ds_gd(100, 0.05, 0.03, n).data
+    sonuc = anp.geometrik_anuite.sure_hesapla_gd_ayrintili(gd, 100, 0.05, 0.03)
+    assert sonuc['yakinsadi'].all()
+    assert sonuc['n'] == pytest.approx(n, abs=1e-6)
+
+    # Kapalı form ve arama satırları karışık; skaler sonuçla aynı
+    _karsilastir(anp.geo_sure_hesapla, anuiteler.geo_sure_hesapla,
+                 [(500, 100, 0.05, 0.05), (500, 100, 0.0, 0.03), (500, 100, 0.04, 0.0),
+                  (500, 100, 0.05, 0.03), (-1, 100, 0.05, 0.03)])
+    for devre_basi in (False, True):
+        satirlar = [(800, 100, 0, 0.04), (800, 100, 5, 0.04), (800, 100, -20, 0.04),
+                    (800, 100, 5, -0.01)]
+        sutunlar = [np.array(sutun, dtype=float) for sutun in zip(*satirlar)]
+        sonuc = anp.arit_sure_hesapla(*sutunlar, devre_basi=devre_basi)
+        for k, satir in enumerate(satirlar):
+            try:
+                beklenen = anuiteler.arit_sure_hesapla(*satir, devre_basi=devre_basi)
+            except ValueError:
+                assert sonuc.mask[k]
+                continue
+            assert sonuc[k] == pytest.approx(beklenen, abs=1e-6)
+
+    _karsilastir(anp.cab_donem_hesapla, anuiteler.cab_donem_hesapla,
+                 [(800, 100, 0.04, 2), (5000, 100, 0.04, 2), (800, 100, 0, 2)])
+    _karsilastir(anp.ert_sure_hesapla, anuiteler.ert_sure_hesapla,
+                 [(800, 100, 0.04, 2), (5000, 100, 0.04, 2), (800, 100, 0.04, -1)])
+
+
+def test_np_faktor_serisi():
+    oranlar = np.array([0.0125, 0.0, 0.25])
+    seri = anp.ds_faktor_serisi(oranlar, 360)
+    assert seri['pesin'].shape == (3, 360)
+    assert seri['pesin'].mask[1].all() and not seri['pesin'].mask[[0, 2]].any()
+
+    for k in (0, 2):
+        skaler = anuiteler.ds_faktor_serisi(oranlar[k], 360)
+        for ad in ('pesin', 'gelecek', 'pesin_devre_basi', 'gelecek_devre_basi'):
+            assert seri[ad][k].data == pytest.approx(np.array(skaler[ad]), rel=1e-12)
+
+
+def test_np_faktor_tablosu(tmp_path):
+    from anuiteler.faktor_tablosu import FaktorTablosu, faktor_tablosu_olustur
+
+    dosya = tmp_path / 'faktorler.bin'
+    faktor_tablosu_olustur(dosya, baslangic=0.0025, bitis=0.05, adim=0.0025, n_max=24)
+
+    with FaktorTablosu(dosya) as tablo:
+        i = np.array([0.0025, 0.01, 0.05, 0.011, 0.06, 0.01])
+        n = np.array([1, 12, 24, 12, 12, 25])
+        sonuc = anp.tablo_pesin_faktor(tablo, i, n)
+        assert sonuc.mask.tolist() == [False, False, False, True, True, True]
+        for k in range(3):
+            assert sonuc[k] == tablo.pesin_deger_faktoru(i[k], n[k])
+
+        ara = anp.tablo_pesin_faktor(tablo, i, n, devre_basi=True, m=3, interpolasyon=True)
+        assert ara.mask.tolist() == [False, False, False, False, True, True]
+        for k in range(4):
+            beklenen = tablo.pesin_deger_faktoru(i[k], n[k], True, 3, interpolasyon=True)
+            assert ara[k] == pytest.approx(beklenen, rel=1e-14)
+
+        gelecek = anp.tablo_gelecek_faktor(tablo, 0.01, [12, 24], devre_basi=True)
+        assert gelecek.tolist() == [tablo.gelecek_deger_faktoru(0.01, n, True) for n in (12, 24)]
+        assert anp.tablo_erteleme_faktor(tablo, 0.01, [0, 3]).tolist() == [1.0, 1.01 ** -3]
+
+
+def test_np_izleme():
+    from anuiteler import izleme
+
+    odeme = np.array([1000.0, 1000.0, -1.0])
+    bd = anp.devre_sonu_anuite.bugunku_deger_hesapla(odeme, 10, 0.08)
+
+    izleme.sifirla()
+    izleme.etkinlestir()
+    try:
+        sonuc = anp.devre_sonu_anuite.faiz_bugunku_degerden(bd, odeme, 10)
+    finally:
+        izleme.devre_disi_birak()
+
+    assert sonuc.mask.tolist() == [False, False, True]
+    goruntu = izleme.anlik_goruntu()
+    assert goruntu['fonksiyonlar']['np.devre_sonu_anuite.faiz_bugunku_degerden']['cagri'] == 1
+
+    # Geçersiz satır histograma girmez
+    kayit = goruntu['cozuculer']['np.devre_sonu_anuite.faiz_bugunku_degerden']
+    assert kayit['cozum'] == 2 and kayit['yakinsamayan'] == 0
+    assert sum(kayit['iterasyon']['kovalar'].values()) == 2
+    assert kayit['degerlendirme'] == kayit['iterasyon']['toplam'] + 2
+    izleme.sifirla()
+
+
+def test_hizli_dogrula_dizi():
+    odeme = np.array([1000.0, -1.0, 1000.0, 1000.0])
+    n = np.array([12, 12, 0, 12])
+    i = np.array([0.01, 0.01, 0.01, np.nan])
+    maskeler = anuiteler.hizli.dogrula(odeme=odeme, n=n, i=i, m=0)
+
+    assert isinstance(maskeler['gecerli'], np.ndarray)
+    assert maskeler['gecerli'].tolist() == [True, False, False, False]
+    assert maskeler['gecerli'].tolist() == anuiteler.hizli.dogrula(
+        odeme=odeme.tolist(), n=n.tolist(), i=i.tolist(), m=0)['gecerli']